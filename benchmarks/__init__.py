@@ -0,0 +1 @@
+# Copyright 2026 Marimo. All rights reserved.
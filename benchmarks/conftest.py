@@ -0,0 +1,75 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Shared fixtures for the Python benchmark suite.
+
+Notebooks are synthetic: cell `i` defines `v{i}` from up to three earlier
+cells (`i - 1`, `i // 2`, `i // 3`), so the dependency graph has both long
+chains and fan-in, similar to a real analysis notebook.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from marimo._ast.compiler import compile_cell
+from marimo._runtime.dataflow import DirectedGraph
+from marimo._types.ids import CellId_t
+from tests.conftest import MockedKernel
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from marimo._ast.cell import CellImpl
+
+NOTEBOOK_SIZES = [10, 100, 1000]
+
+
+def synthetic_notebook(n_cells: int) -> dict[CellId_t, str]:
+    """Code for a notebook of `n_cells` cells, keyed by cell id."""
+    codes: dict[CellId_t, str] = {}
+    for i in range(n_cells):
+        parents = sorted({p for p in (i - 1, i // 2, i // 3) if 0 <= p < i})
+        total = " + ".join(f"v{p}" for p in parents) or "0"
+        codes[CellId_t(f"c{i}")] = "\n".join(
+            [
+                f"v{i} = ({total} + 1) % 1_000_003",
+                f"_squares = [j * j for j in range({i % 10 + 1})]",
+                f"w{i} = sum(_squares)",
+            ]
+        )
+    return codes
+
+
+def compile_notebook(codes: dict[CellId_t, str]) -> dict[CellId_t, CellImpl]:
+    return {
+        cell_id: compile_cell(code, cell_id=cell_id)
+        for cell_id, code in codes.items()
+    }
+
+
+def build_graph(cells: dict[CellId_t, CellImpl]) -> DirectedGraph:
+    graph = DirectedGraph()
+    for cell_id, cell in cells.items():
+        graph.register_cell(cell_id, cell)
+    return graph
+
+
+@pytest.fixture(params=NOTEBOOK_SIZES, ids=lambda n: f"{n}-cells")
+def notebook(request: pytest.FixtureRequest) -> dict[CellId_t, str]:
+    return synthetic_notebook(request.param)
+
+
+@pytest.fixture
+def compiled_notebook(
+    notebook: dict[CellId_t, str],
+) -> dict[CellId_t, CellImpl]:
+    return compile_notebook(notebook)
+
+
+@pytest.fixture
+def runtime_context() -> Generator[None, None, None]:
+    """Install a kernel runtime context, for code that runs cells."""
+    mocked = MockedKernel.open()
+    yield
+    mocked.teardown()
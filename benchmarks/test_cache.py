@@ -0,0 +1,107 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import ast
+from typing import TYPE_CHECKING
+
+import pytest
+
+from marimo._ast.compiler import compile_cell
+from marimo._runtime.dataflow import DirectedGraph
+from marimo._save.cache import Cache
+from marimo._save.hash import BlockHasher, HashKey
+from marimo._save.loaders import LazyLoader
+from marimo._save.stores.file import FileStore
+from marimo._types.ids import CellId_t
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+np = pytest.importorskip("numpy")
+
+ARRAY_SIZES = [10_000, 1_000_000, 10_000_000]
+
+
+@pytest.fixture(params=ARRAY_SIZES, ids=lambda n: f"{n}-floats")
+def array(request: pytest.FixtureRequest) -> object:
+    return np.random.default_rng(0).random(request.param)
+
+
+def test_block_hasher_content_hash(
+    benchmark: BenchmarkFixture, array: object
+) -> None:
+    graph = DirectedGraph()
+    graph.register_cell(
+        CellId_t("0"), compile_cell("arr = make()", cell_id=CellId_t("0"))
+    )
+    graph.register_cell(
+        CellId_t("1"),
+        compile_cell("total = arr.sum()", cell_id=CellId_t("1")),
+    )
+    module = ast.parse("total = arr.sum()")
+
+    hasher = benchmark(
+        BlockHasher,
+        module=module,
+        graph=graph,
+        cell_id=CellId_t("1"),
+        scope={"arr": array},
+    )
+    assert hasher.cache_type == "ContentAddressed"
+
+
+def _lazy_loader(tmp_path: Path) -> LazyLoader:
+    return LazyLoader(
+        "bench",
+        store=FileStore(save_path=str(tmp_path)),
+        signer=None,
+        verification="off",
+    )
+
+
+def _cache(key: HashKey, defs: dict[str, object]) -> Cache:
+    cache = Cache(
+        defs=dict(defs),
+        hash=key.hash,
+        cache_type=key.cache_type,
+        stateful_refs=set(),
+        hit=False,
+        meta={},
+    )
+    cache.update(dict(defs))
+    return cache
+
+
+def test_lazy_loader_save(
+    benchmark: BenchmarkFixture, array: object, tmp_path: Path
+) -> None:
+    loader = _lazy_loader(tmp_path)
+    key = HashKey(hash="bench", cache_type="Pure")
+    defs = {"a": array, "b": array[::2], "n": 1}
+
+    def save() -> None:
+        assert loader.save_cache(_cache(key, defs))
+        loader.flush()
+
+    benchmark(save)
+
+
+def test_lazy_loader_restore(
+    benchmark: BenchmarkFixture, array: object, tmp_path: Path
+) -> None:
+    loader = _lazy_loader(tmp_path)
+    key = HashKey(hash="bench", cache_type="Pure")
+    assert loader.save_cache(_cache(key, {"a": array, "n": 1}))
+    loader.flush()
+
+    def restore() -> dict[str, object]:
+        cache = loader.load_cache(key)
+        assert cache is not None
+        scope: dict[str, object] = {}
+        cache.restore(scope)
+        return scope
+
+    scope = benchmark(restore)
+    assert scope["a"].shape == array.shape  # type: ignore[attr-defined]
@@ -0,0 +1,73 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from marimo._ast import bytecode_cache
+from marimo._ast.compiler import compile_cell
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+    from marimo._types.ids import CellId_t
+
+
+@pytest.fixture
+def compiled_cell_cache(tmp_path: Path) -> Generator[Path, None, None]:
+    """An empty on-disk cache of compiled cells."""
+    with (
+        patch.object(
+            bytecode_cache, "bytecode_cache_dir", return_value=tmp_path
+        ),
+        patch.object(sys, "dont_write_bytecode", False),
+    ):
+        yield tmp_path
+
+
+def test_compile_cell(
+    benchmark: BenchmarkFixture, notebook: dict[CellId_t, str]
+) -> None:
+    def compile_all() -> None:
+        for cell_id, code in notebook.items():
+            compile_cell(code, cell_id=cell_id)
+
+    benchmark(compile_all)
+
+
+def test_compile_cell_cold_cache(
+    benchmark: BenchmarkFixture,
+    notebook: dict[CellId_t, str],
+    compiled_cell_cache: Path,
+) -> None:
+    def clear_cache() -> None:
+        for entry in compiled_cell_cache.iterdir():
+            entry.unlink()
+
+    def compile_all() -> None:
+        for cell_id, code in notebook.items():
+            compile_cell(code, cell_id=cell_id, use_bytecode_cache=True)
+
+    benchmark.pedantic(compile_all, setup=clear_cache, rounds=5)
+
+
+def test_compile_cell_warm_cache(
+    benchmark: BenchmarkFixture,
+    notebook: dict[CellId_t, str],
+    compiled_cell_cache: Path,
+) -> None:
+    del compiled_cell_cache
+
+    def compile_all() -> None:
+        for cell_id, code in notebook.items():
+            compile_cell(code, cell_id=cell_id, use_bytecode_cache=True)
+
+    # Populate the cache, as a previous run of the notebook would
+    compile_all()
+    benchmark(compile_all)
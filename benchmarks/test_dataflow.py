@@ -0,0 +1,51 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from benchmarks.conftest import build_graph
+from marimo._runtime.dataflow import DirectedGraph, topological_sort
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+    from marimo._ast.cell import CellImpl
+    from marimo._types.ids import CellId_t
+
+
+def test_register_cell(
+    benchmark: BenchmarkFixture,
+    compiled_notebook: dict[CellId_t, CellImpl],
+) -> None:
+    def setup() -> tuple[tuple[DirectedGraph], dict[str, object]]:
+        return (DirectedGraph(),), {}
+
+    def register_all(graph: DirectedGraph) -> None:
+        for cell_id, cell in compiled_notebook.items():
+            graph.register_cell(cell_id, cell)
+
+    benchmark.pedantic(register_all, setup=setup, rounds=20)
+
+
+def test_topological_sort(
+    benchmark: BenchmarkFixture,
+    compiled_notebook: dict[CellId_t, CellImpl],
+) -> None:
+    graph = build_graph(compiled_notebook)
+    # Reverse the input so the sort can't take a fast path on
+    # already-ordered ids.
+    cell_ids = list(reversed(graph.cells.keys()))
+
+    result = benchmark(topological_sort, graph, cell_ids)
+    assert len(result) == len(cell_ids)
+
+
+def test_descendants(
+    benchmark: BenchmarkFixture,
+    compiled_notebook: dict[CellId_t, CellImpl],
+) -> None:
+    graph = build_graph(compiled_notebook)
+    root = next(iter(graph.cells))
+
+    result = benchmark(graph.descendants, root)
+    assert len(result) == len(graph.cells) - 1
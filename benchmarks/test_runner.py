@@ -0,0 +1,70 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from benchmarks.conftest import build_graph
+from marimo._runtime.commands import ExecuteCellCommand
+from marimo._runtime.runner.cell_runner import Runner
+from marimo._runtime.runner.hooks import NotebookCellHooks
+from tests.conftest import MockedKernel
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+    from marimo._ast.cell import CellImpl
+    from marimo._types.ids import CellId_t
+
+
+def test_runner_run_all(
+    benchmark: BenchmarkFixture,
+    compiled_notebook: dict[CellId_t, CellImpl],
+    runtime_context: None,
+) -> None:
+    """Scheduling and execution alone, without kernel hooks."""
+    del runtime_context
+    graph = build_graph(compiled_notebook)
+
+    def run_all() -> dict[str, object]:
+        glbls: dict[str, object] = {}
+        runner = Runner(
+            roots=set(graph.cells),
+            graph=graph,
+            glbls=glbls,
+            debugger=None,
+            hooks=NotebookCellHooks(),
+        )
+        asyncio.run(runner.run_all())
+        return glbls
+
+    glbls = benchmark(run_all)
+    assert all(f"w{i}" in glbls for i in range(len(compiled_notebook)))
+
+
+def test_kernel_run(
+    benchmark: BenchmarkFixture, notebook: dict[CellId_t, str]
+) -> None:
+    """A full kernel run: registration, execution, and all runtime hooks
+    (status updates, output formatting, variable broadcasts)."""
+    requests = [
+        ExecuteCellCommand(cell_id=cell_id, code=code)
+        for cell_id, code in notebook.items()
+    ]
+    mocked: list[MockedKernel] = []
+
+    def setup() -> tuple[tuple[MockedKernel], dict[str, object]]:
+        # Only one runtime context may be installed at a time.
+        while mocked:
+            mocked.pop().teardown()
+        mocked.append(MockedKernel.open())
+        return (mocked[-1],), {}
+
+    def run(kernel: MockedKernel) -> None:
+        asyncio.run(kernel.k.run(requests))
+
+    try:
+        benchmark.pedantic(run, setup=setup, rounds=5)
+    finally:
+        for kernel in mocked:
+            kernel.teardown()
@@ -0,0 +1,98 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from marimo._messaging.cell_output import CellChannel, CellOutput
+from marimo._messaging.notification import (
+    CellNotification,
+    VariableDeclarationNotification,
+    VariablesNotification,
+    VariableValue,
+    VariableValuesNotification,
+)
+from marimo._messaging.serde import (
+    deserialize_kernel_message,
+    serialize_kernel_message,
+)
+from marimo._types.ids import CellId_t, VariableName
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+    from marimo._messaging.notification import NotificationMessage
+
+COUNTS = [10, 100, 1000]
+
+
+def _cell_notification(n_rows: int) -> CellNotification:
+    rows = "".join(
+        f"<tr><td>{i}</td><td>{i * i}</td></tr>" for i in range(n_rows)
+    )
+    return CellNotification(
+        cell_id=CellId_t("c0"),
+        output=CellOutput(
+            channel=CellChannel.OUTPUT,
+            mimetype="text/html",
+            data=f"<table>{rows}</table>",
+        ),
+        status="idle",
+    )
+
+
+def _variables_notification(n_variables: int) -> VariablesNotification:
+    return VariablesNotification(
+        variables=[
+            VariableDeclarationNotification(
+                name=VariableName(f"v{i}"),
+                declared_by=[CellId_t(f"c{i}")],
+                used_by=[CellId_t(f"c{j}") for j in range(i + 1, i + 4)],
+            )
+            for i in range(n_variables)
+        ]
+    )
+
+
+def _variable_values_notification(
+    n_variables: int,
+) -> VariableValuesNotification:
+    return VariableValuesNotification(
+        variables=[
+            VariableValue(
+                name=VariableName(f"v{i}"), value=str(i), datatype="int"
+            )
+            for i in range(n_variables)
+        ]
+    )
+
+
+@pytest.fixture(
+    params=[
+        _cell_notification,
+        _variables_notification,
+        _variable_values_notification,
+    ],
+    ids=["cell-op", "variables", "variable-values"],
+)
+def make_notification(request: pytest.FixtureRequest) -> object:
+    return request.param
+
+
+@pytest.mark.parametrize("count", COUNTS)
+def test_encode_notification(
+    benchmark: BenchmarkFixture, make_notification: object, count: int
+) -> None:
+    notification: NotificationMessage = make_notification(count)  # type: ignore[operator]
+    benchmark(serialize_kernel_message, notification)
+
+
+@pytest.mark.parametrize("count", COUNTS)
+def test_decode_notification(
+    benchmark: BenchmarkFixture, make_notification: object, count: int
+) -> None:
+    notification: NotificationMessage = make_notification(count)  # type: ignore[operator]
+    message = serialize_kernel_message(notification)
+    decoded = benchmark(deserialize_kernel_message, message)
+    assert decoded == notification
@@ -0,0 +1,51 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from marimo._plugins import ui
+from marimo._plugins.ui._impl.table import SearchTableArgs
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+pd = pytest.importorskip("pandas")
+
+ROW_COUNTS = [1_000, 100_000]
+
+
+@pytest.fixture(params=ROW_COUNTS, ids=lambda n: f"{n}-rows")
+def table(request: pytest.FixtureRequest) -> ui.table:
+    n_rows = request.param
+    df = pd.DataFrame(
+        {
+            "id": range(n_rows),
+            "name": [f"name-{i % 997}" for i in range(n_rows)],
+            "value": [i * 0.5 for i in range(n_rows)],
+        }
+    )
+    return ui.table(df)
+
+
+def test_search_page(benchmark: BenchmarkFixture, table: ui.table) -> None:
+    """Page through the middle of an unfiltered table."""
+    page_number = [0]
+
+    def next_page() -> None:
+        page_number[0] = (page_number[0] + 1) % 50
+        table._search(
+            SearchTableArgs(page_size=10, page_number=page_number[0])
+        )
+
+    benchmark(next_page)
+
+
+def test_search_query(benchmark: BenchmarkFixture, table: ui.table) -> None:
+    """A full-text query, the most expensive search path."""
+    response = benchmark(
+        table._search,
+        SearchTableArgs(page_size=10, page_number=0, query="name-99"),
+    )
+    assert response.total_rows != 0
@@ -36,6 +36,8 @@ export const MockRequestClient = {
       sendInstallMissingPackages: vi.fn().mockResolvedValue({}),
       readCode: vi.fn().mockResolvedValue({ contents: "" }),
       readSnippets: vi.fn().mockResolvedValue({ snippets: [] }),
+      previewVariables: vi.fn().mockResolvedValue({}),
+      getMemoryUsage: vi.fn().mockResolvedValue({}),
       previewDatasetColumn: vi.fn().mockResolvedValue({}),
       previewSQLTable: vi.fn().mockResolvedValue({}),
       previewSQLTableList: vi.fn().mockResolvedValue({ tables: [] }),
@@ -56,6 +56,7 @@ export const SQL_OUTPUT_SELECT_OPTIONS: {
 }[] = [
   { label: "Auto (Default)", value: "auto" },
   { label: "Native", value: "native" },
+  { label: "DuckDB table", value: "duckdb-table" },
   { label: "Polars", value: "polars" },
   { label: "Lazy Polars", value: "lazy-polars" },
   { label: "Pandas", value: "pandas" },
@@ -1366,6 +1366,113 @@ export const UserConfigForm: React.FC = () => {
                 </div>
               )}
             />
+            <OverriddenFormField
+              control={form.control}
+              name="experimental.profiler"
+              render={({ field, override }) => (
+                <div className="flex flex-col gap-y-1">
+                  <FormItem className={formItemClasses}>
+                    <FormLabel className="font-normal">Profiler</FormLabel>
+                    <FormControl>
+                      <Checkbox
+                        data-testid="profiler-checkbox"
+                        checked={override.value === true}
+                        disabled={override.isOverridden}
+                        onCheckedChange={field.onChange}
+                      />
+                    </FormControl>
+                  </FormItem>
+                  <IsOverridden override={override} />
+                  <FormDescription>
+                    Record a profile of every cell run, attributing time to
+                    your code, runtime hooks, and output formatting. Profiles
+                    can be downloaded as a flamegraph or a Chrome trace with{" "}
+                    <Kbd className="inline">marimo export profile</Kbd>.
+                  </FormDescription>
+                </div>
+              )}
+            />
+            <OverriddenFormField
+              control={form.control}
+              name="experimental.image_virtual_files"
+              render={({ field, override }) => (
+                <div className="flex flex-col gap-y-1">
+                  <FormItem className={formItemClasses}>
+                    <FormLabel className="font-normal">
+                      Serve plots as files
+                    </FormLabel>
+                    <FormControl>
+                      <Checkbox
+                        data-testid="image-virtual-files-checkbox"
+                        checked={override.value === true}
+                        disabled={override.isOverridden}
+                        onCheckedChange={field.onChange}
+                      />
+                    </FormControl>
+                  </FormItem>
+                  <IsOverridden override={override} />
+                  <FormDescription>
+                    Send matplotlib figures to the browser as files instead of
+                    embedding them in cell outputs, which keeps notebooks with
+                    many plots quick to reconnect to.
+                  </FormDescription>
+                </div>
+              )}
+            />
+            <OverriddenFormField
+              control={form.control}
+              name="experimental.background_output_formatting"
+              render={({ field, override }) => (
+                <div className="flex flex-col gap-y-1">
+                  <FormItem className={formItemClasses}>
+                    <FormLabel className="font-normal">
+                      Format outputs in the background
+                    </FormLabel>
+                    <FormControl>
+                      <Checkbox
+                        data-testid="background-output-formatting-checkbox"
+                        checked={override.value === true}
+                        disabled={override.isOverridden}
+                        onCheckedChange={field.onChange}
+                      />
+                    </FormControl>
+                  </FormItem>
+                  <IsOverridden override={override} />
+                  <FormDescription>
+                    Render charts, plots, and tables while the next cell runs,
+                    instead of before it starts. Outputs may show changes that
+                    later cells make to the displayed objects.
+                  </FormDescription>
+                </div>
+              )}
+            />
+            <OverriddenFormField
+              control={form.control}
+              name="experimental.spill_globals"
+              render={({ field, override }) => (
+                <div className="flex flex-col gap-y-1">
+                  <FormItem className={formItemClasses}>
+                    <FormLabel className="font-normal">
+                      Spill unused variables to disk
+                    </FormLabel>
+                    <FormControl>
+                      <Checkbox
+                        data-testid="spill-globals-checkbox"
+                        checked={override.value === true}
+                        disabled={override.isOverridden}
+                        onCheckedChange={field.onChange}
+                      />
+                    </FormControl>
+                  </FormItem>
+                  <IsOverridden override={override} />
+                  <FormDescription>
+                    Move large variables out of memory once every cell that
+                    uses them has run. They are loaded back when a cell that
+                    uses them runs again.
+                  </FormDescription>
+                </div>
+              )}
+            />
           </SettingGroup>
         );
     }
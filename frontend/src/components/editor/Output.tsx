@@ -137,6 +137,7 @@ export const OutputRenderer: React.FC<{
     case "image/bmp":
     case "image/gif":
     case "image/jpeg":
+    case "image/webp":
     case "image/svg+xml":
       invariant(
         typeof data === "string",
@@ -13,6 +13,7 @@ export function renderMimeIcon(mime: string) {
     case "image/bmp":
     case "image/gif":
     case "image/jpeg":
+    case "image/webp":
       return "🖼️";
     case "image/svg+xml":
       return "🎨";
@@ -61,6 +61,13 @@ interface SelectListProps<V> {
   virtualizeThreshold?: number;
   /** Fixed pixel height of the virtualized viewport. */
   virtualizedHeight?: number;
+  /**
+   * Match predicate over `(label, query)`. Pass `() => 1` when `options`
+   * are already filtered elsewhere (e.g. searched on the server).
+   */
+  filterFn?: (label: string, query: string) => number;
+  /** Called with the search query as the user types. */
+  onSearchChange?: (query: string) => void;
 }
 
 export function SelectList<V>(props: SelectListProps<V>): React.JSX.Element {
@@ -82,6 +89,8 @@ export function SelectList<V>(props: SelectListProps<V>): React.JSX.Element {
     renderEmpty = "Nothing found.",
     virtualizeThreshold = VIRTUALIZE_THRESHOLD,
     virtualizedHeight = VIRTUALIZED_LIST_HEIGHT,
+    filterFn,
+    onSearchChange,
   } = props;
 
   const list = useSelectList<V>({
@@ -92,6 +101,7 @@ export function SelectList<V>(props: SelectListProps<V>): React.JSX.Element {
     maxSelections,
     allowSelectNone,
     pinSelected,
+    filterFn,
   });
 
   const handleComboChange = (next: V[] | V | null): void => {
@@ -218,7 +228,10 @@ export function SelectList<V>(props: SelectListProps<V>): React.JSX.Element {
     className: cn({ "w-full": fullWidth }, className),
     shouldFilter: false as const,
     search: list.searchQuery,
-    onSearchChange: list.setSearchQuery,
+    onSearchChange: (query: string) => {
+      list.setSearchQuery(query);
+      onSearchChange?.(query);
+    },
     open: list.open,
     onOpenChange: list.setOpen,
     emptyState: renderSlot(renderEmpty),
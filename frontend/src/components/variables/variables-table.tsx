@@ -11,7 +11,11 @@ import {
   type SortingState,
   useReactTable,
 } from "@tanstack/react-table";
-import { SquareEqualIcon, WorkflowIcon } from "lucide-react";
+import {
+  MemoryStickIcon,
+  SquareEqualIcon,
+  WorkflowIcon,
+} from "lucide-react";
 import React, { memo, useMemo } from "react";
 import { useLocale } from "react-aria";
 import { CellLink } from "@/components/editor/links/cell-link";
@@ -20,8 +24,11 @@ import type { CellId } from "@/core/cells/ids";
 import { isInternalCellName } from "@/core/cells/names";
 import { goToVariableDefinition } from "@/core/codemirror/go-to-definition/commands";
 import type { Variable, Variables } from "@/core/variables/types";
+import { useMemoryUsage } from "@/core/variables/useMemoryUsage";
+import { usePendingPreviews } from "@/core/variables/usePendingPreviews";
 import { sortBy } from "@/utils/arrays";
 import { cn } from "@/utils/cn";
+import { formatBytes } from "@/utils/formatting";
 import { DataTableColumnHeader } from "../data-table/column-header";
 import { CellLinkList } from "../editor/links/cell-link-list";
 import { SearchInput } from "../ui/input";
@@ -33,6 +40,8 @@ import {
   TableHeader,
   TableRow,
 } from "../ui/table";
+import { Toggle } from "../ui/toggle";
+import { Tooltip } from "../ui/tooltip";
 import { VariableName } from "./common";
 
 interface Props {
@@ -58,9 +67,24 @@ function columnDefOf<T>(columnDef: ColumnDef<ResolvedVariable, T>) {
 const ColumnIds = {
   name: "name",
   type: "type-value",
+  memory: "memory",
   defs: "defs-refs",
 };
 
+const MemoryCell: React.FC<{ bytes: number | null | undefined }> = ({
+  bytes,
+}) => {
+  const { locale } = useLocale();
+  if (bytes == null) {
+    return null;
+  }
+  return (
+    <div className="text-muted-foreground font-mono text-xs whitespace-nowrap">
+      {formatBytes(bytes, locale)}
+    </div>
+  );
+};
+
 const COLUMNS = [
   columnDefOf({
     id: ColumnIds.name,
@@ -77,7 +101,8 @@ const COLUMNS = [
   }),
   columnDefOf({
     id: ColumnIds.type,
-    accessorFn: (v) => [v.dataType, v.value] as const,
+    accessorFn: (v) =>
+      [v.dataType, v.value, v.size, v.previewPending] as const,
     enableSorting: true,
     sortingFn: "alphanumeric",
     header: ({ column }) => (
@@ -92,22 +117,38 @@ const COLUMNS = [
       />
     ),
     cell: ({ getValue }) => {
-      const [dataType, value] = getValue();
+      const [dataType, value, size, previewPending] = getValue();
       return (
         <div className="max-w-[150px]">
           <div className="text-ellipsis overflow-hidden whitespace-nowrap text-muted-foreground font-mono text-xs">
             {dataType}
+            {size != null && ` (${size})`}
           </div>
-          <div
-            className="text-ellipsis overflow-hidden whitespace-nowrap"
-            title={value ?? ""}
-          >
-            {value}
-          </div>
+          {previewPending ? (
+            <div className="text-muted-foreground italic">loading…</div>
+          ) : (
+            <div
+              className="text-ellipsis overflow-hidden whitespace-nowrap"
+              title={value ?? ""}
+            >
+              {value}
+            </div>
+          )}
         </div>
       );
     },
   }),
+  columnDefOf({
+    id: ColumnIds.memory,
+    accessorFn: (v) => v.memory,
+    enableSorting: true,
+    enableGlobalFilter: false,
+    sortingFn: "basic",
+    header: ({ column }) => (
+      <DataTableColumnHeader header={"Memory"} column={column} />
+    ),
+    cell: ({ getValue }) => <MemoryCell bytes={getValue()} />,
+  }),
   columnDefOf({
     id: ColumnIds.defs,
     // Include declaredByNames and usedByNames for filtering
@@ -219,6 +260,9 @@ function sortData({
     case ColumnIds.type:
       sortedVariables = sortBy(variables, (v) => v.dataType);
       break;
+    case ColumnIds.memory:
+      sortedVariables = sortBy(variables, (v) => v.memory);
+      break;
     case ColumnIds.defs:
       sortedVariables = sortBy(variables, (v) =>
         cellIdToIndex.get(v.declaredBy[0]),
@@ -233,8 +277,12 @@ export const VariableTable: React.FC<Props> = memo(
   ({ className, cellIds, variables }) => {
     const [sorting, setSorting] = React.useState<SortingState>([]);
     const [globalFilter, setGlobalFilter] = React.useState("");
+    // Memory estimates are computed by the kernel, so they are opt-in
+    const [showMemory, setShowMemory] = React.useState(false);
     const cellNames = useCellNames();
     const { locale } = useLocale();
+    usePendingPreviews(variables);
+    useMemoryUsage(variables, showMemory);
 
     const resolvedVariables: ResolvedVariable[] = useMemo(() => {
       const getName = (id: CellId) => {
@@ -287,17 +335,31 @@ export const VariableTable: React.FC<Props> = memo(
       state: {
         sorting,
         globalFilter,
+        columnVisibility: { [ColumnIds.memory]: showMemory },
       },
     });
 
     return (
       <>
-        <SearchInput
-          className="w-full"
-          placeholder="Search"
-          value={globalFilter}
-          onChange={(e) => setGlobalFilter(e.target.value)}
-        />
+        <div className="flex items-center border-b pr-1">
+          <SearchInput
+            rootClassName="flex-1 border-b-0"
+            className="w-full"
+            placeholder="Search"
+            value={globalFilter}
+            onChange={(e) => setGlobalFilter(e.target.value)}
+          />
+          <Tooltip content={showMemory ? "Hide memory" : "Estimate memory"}>
+            <Toggle
+              size="sm"
+              pressed={showMemory}
+              onPressedChange={setShowMemory}
+              aria-label="Estimate memory"
+            >
+              <MemoryStickIcon className="w-4 h-4" />
+            </Toggle>
+          </Tooltip>
+        </div>
         <Table
           className={cn(
             "w-full text-sm flex-1 border-separate border-spacing-0",
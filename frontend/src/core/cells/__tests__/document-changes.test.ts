@@ -39,6 +39,7 @@ import {
   type CellAction,
   coalesceChanges,
   type DocumentChange,
+  DocumentVersionTracker,
   exportedForTesting as middlewareExports,
   toDocumentChanges,
 } from "../document-changes";
@@ -783,3 +784,39 @@ describe("flush path coalescing", () => {
     expect(sent[1]).toEqual([{ type: "delete-cell", cellId: x }]);
   });
 });
+
+describe("DocumentVersionTracker", () => {
+  it("is unknown until the full document is received", () => {
+    const tracker = new DocumentVersionTracker();
+    tracker.seen(1);
+    expect(tracker.current).toBeNull();
+
+    tracker.reset(3);
+    expect(tracker.current).toBe(3);
+  });
+
+  it("only advances past versions that have all been seen", () => {
+    const tracker = new DocumentVersionTracker();
+    tracker.reset(0);
+
+    // The client's own transaction is acknowledged before the one that
+    // preceded it arrives over the connection.
+    tracker.seen(2);
+    expect(tracker.current).toBe(0);
+    tracker.seen(1);
+    expect(tracker.current).toBe(2);
+
+    tracker.seen(2);
+    tracker.seen(undefined);
+    expect(tracker.current).toBe(2);
+  });
+
+  it("drops versions seen ahead when reset", () => {
+    const tracker = new DocumentVersionTracker();
+    tracker.reset(0);
+    tracker.seen(2);
+    tracker.reset(5);
+    tracker.seen(6);
+    expect(tracker.current).toBe(6);
+  });
+});
@@ -12,6 +12,7 @@
  * Impure wrappers (for use by the reducer middleware and websocket):
  * - documentTransactionMiddleware: debounces and sends changes to the server
  * - applyTransactionChanges: dispatches actions from incoming changes
+ * - documentVersion: the server document version this client is synced to
  */
 
 import { debounce } from "lodash-es";
@@ -639,7 +640,9 @@ const flushChanges = debounce(() => {
   if (changes.length === 0) {
     return;
   }
-  void getRequestClient().sendDocumentTransaction({ changes });
+  void getRequestClient()
+    .sendDocumentTransaction({ changes })
+    .then((response) => documentVersion.seen(response?.version));
 }, 400);
 
 function isScratchChange(change: DocumentChange): boolean {
@@ -739,6 +742,51 @@ export function applyTransactionChanges(
   }
 }
 
+// ---------------------------------------------------------------------------
+// Document version
+// ---------------------------------------------------------------------------
+
+/**
+ * Tracks the latest version of the server's document that this client has
+ * applied, so that a reconnecting client is sent only the transactions it
+ * missed.
+ *
+ * Versions are seen out of order: the client's own transactions are
+ * acknowledged by the request that sent them, everyone else's arrive over
+ * the connection. The tracked version only moves past versions that have
+ * all been seen.
+ */
+export class DocumentVersionTracker {
+  private version: number | null = null;
+  private ahead = new Set<number>();
+
+  /** The version of the document this client is synced to, if known. */
+  get current(): number | null {
+    return this.version;
+  }
+
+  /** Start over from a full copy of the document at `version`. */
+  reset(version: number): void {
+    this.version = version;
+    this.ahead.clear();
+  }
+
+  /** Record that the transaction stamped with `version` was applied. */
+  seen(version: number | null | undefined): void {
+    if (version == null || this.version === null || version <= this.version) {
+      return;
+    }
+    this.ahead.add(version);
+    let current = this.version;
+    while (this.ahead.delete(current + 1)) {
+      current += 1;
+    }
+    this.version = current;
+  }
+}
+
+export const documentVersion = new DocumentVersionTracker();
+
 // ---------------------------------------------------------------------------
 // Test helpers
 // ---------------------------------------------------------------------------
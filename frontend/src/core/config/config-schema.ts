@@ -31,6 +31,7 @@ const VALID_APP_WIDTHS = [
 const VALID_SQL_OUTPUT_FORMATS = [
   "auto",
   "native",
+  "duckdb-table",
   "polars",
   "lazy-polars",
   "pandas",
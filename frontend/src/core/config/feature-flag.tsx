@@ -13,6 +13,10 @@ export interface ExperimentalFeatures {
   external_agents: boolean;
   debugger: boolean; // Live frame-watching debugger (gutter breakpoints + pdb)
   line_timing: boolean; // Green active-line highlight + per-line elapsed timer
+  profiler: boolean; // Per-cell profiles (phase timings + sampled stacks)
+  image_virtual_files: boolean; // Serve matplotlib figures by URL, not inline
+  background_output_formatting: boolean; // Format outputs off the kernel thread
+  spill_globals: boolean; // Write large globals no cell needs to disk
   // Add new feature flags here
 }
 
@@ -24,6 +28,10 @@ const defaultValues: ExperimentalFeatures = {
   external_agents: import.meta.env.DEV,
   debugger: false,
   line_timing: false,
+  profiler: false,
+  image_virtual_files: false,
+  background_output_formatting: false,
+  spill_globals: false,
 };
 
 export function getFeatureFlag<T extends keyof ExperimentalFeatures>(
@@ -103,7 +103,9 @@ function updateSchemaAtPath(
  * schema holding a set of tables. For nested namespaces this is the
  * `schemaPath`; otherwise it is the single (possibly schemaless) schema name.
  */
-function tableSchemaPath(sqlTableContext: SQLTableContext): string[] {
+function tableSchemaPath(
+  sqlTableContext: Pick<SQLTableContext, "schema" | "schemaPath">,
+): string[] {
   const { schemaPath, schema } = sqlTableContext;
   return schemaPath && schemaPath.length > 0 ? schemaPath : [schema];
 }
@@ -247,7 +249,10 @@ const {
     state: DataSourceState,
     opts: {
       tables: DataTable[];
-      sqlTableContext: SQLTableContext;
+      sqlTableContext: Pick<
+        SQLTableContext,
+        "engine" | "database" | "schema" | "schemaPath"
+      >;
     },
   ): DataSourceState => {
     const { tables, sqlTableContext } = opts;
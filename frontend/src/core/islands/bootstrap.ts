@@ -188,12 +188,14 @@ function handleMessage(
       case "active-line":
       case "variables":
       case "variable-values":
+      case "memory-usage":
       case "data-column-preview":
       case "sql-table-preview":
       case "sql-table-list-preview":
       case "sql-schema-list-preview":
       case "datasets":
       case "data-source-connections":
+      case "data-source-tables":
       case "data-source-discovery-result":
       case "validate-sql-result":
       case "storage-namespaces":
@@ -203,8 +205,11 @@ function handleMessage(
       case "startup-logs":
       case "interrupted":
       case "reconnected":
+      case "session-snapshot":
       case "cache-cleared":
       case "cache-info":
+      case "cell-profile":
+      case "kernel-metrics":
       case "kernel-startup-error":
       case "notebook-document-transaction":
         return;
@@ -336,6 +336,8 @@ export class IslandsPyodideBridge implements RunRequests, EditRequests {
   sendDocumentTransaction = throwNotImplemented;
   readCode = throwNotImplemented;
   readSnippets = throwNotImplemented;
+  previewVariables = throwNotImplemented;
+  getMemoryUsage = throwNotImplemented;
   previewDatasetColumn = throwNotImplemented;
   previewSQLTable = throwNotImplemented;
   previewSQLTableList = throwNotImplemented;
@@ -130,6 +130,8 @@ const ACTIONS: Record<keyof AllRequests, Action> = {
   sendSetBreakpoints: "waitForConnectionOpen",
   sendInstallMissingPackages: "waitForConnectionOpen",
   readSnippets: "waitForConnectionOpen",
+  previewVariables: "waitForConnectionOpen",
+  getMemoryUsage: "waitForConnectionOpen",
   previewDatasetColumn: "waitForConnectionOpen",
   previewSQLTable: "waitForConnectionOpen",
   previewSQLTableList: "waitForConnectionOpen",
@@ -76,7 +76,7 @@ export function createNetworkRequests(): EditRequests & RunRequests {
           body: request,
           params: getParams(),
         })
-        .then(handleResponseReturnNull);
+        .then(handleResponse);
     },
     sendRename: (request) => {
       return getClient()
@@ -231,6 +231,22 @@ export function createNetworkRequests(): EditRequests & RunRequests {
         })
         .then(handleResponse);
     },
+    previewVariables: (request) => {
+      return getClient()
+        .POST("/api/kernel/preview_variables", {
+          body: request,
+          params: getParams(),
+        })
+        .then(handleResponseReturnNull);
+    },
+    getMemoryUsage: (request) => {
+      return getClient()
+        .POST("/api/kernel/memory_usage", {
+          body: request,
+          params: getParams(),
+        })
+        .then(handleResponseReturnNull);
+    },
     previewDatasetColumn: (request) => {
       return getClient()
         .POST("/api/datasources/preview_column", {
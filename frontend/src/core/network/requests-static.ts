@@ -57,6 +57,11 @@ export function createStaticRequests(): EditRequests & RunRequests {
     sendStdin: throwNotInEditMode,
     readCode: throwNotInEditMode,
     readSnippets: throwNotInEditMode,
+    previewVariables: async () => {
+      Logger.log("Variable previews are not supported in static mode");
+      return null;
+    },
+    getMemoryUsage: throwNotInEditMode,
     previewDatasetColumn: throwNotInEditMode,
     previewSQLTable: throwNotInEditMode,
     previewSQLTableList: throwNotInEditMode,
@@ -38,6 +38,8 @@ export function createErrorToastingRequests(
     sendStdin: "Failed to send stdin",
     readCode: "Failed to read code",
     readSnippets: "Failed to fetch snippets",
+    previewVariables: "", // No toast
+    getMemoryUsage: "", // No toast
     previewDatasetColumn: "Failed to fetch data sources",
     previewSQLTable: "Failed to fetch SQL table",
     previewSQLTableList: "Failed to fetch SQL table list",
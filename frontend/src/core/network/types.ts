@@ -75,6 +75,8 @@ export type ListSecretKeysRequest = schemas["ListSecretKeysRequest"];
 export type CreateSecretRequest = schemas["CreateSecretRequest"];
 export type PreviewDatasetColumnRequest =
   schemas["PreviewDatasetColumnRequest"];
+export type PreviewVariablesRequest = schemas["PreviewVariablesRequest"];
+export type GetMemoryUsageRequest = schemas["GetMemoryUsageRequest"];
 export type PreviewSQLTableRequest = schemas["PreviewSQLTableRequest"];
 export type ListSQLTablesRequest = schemas["ListSQLTablesRequest"];
 export type ListSQLSchemasRequest = schemas["ListSQLSchemasRequest"];
@@ -113,6 +115,8 @@ export type UpdateUIElementRequest = schemas["UpdateUIElementRequest"];
 export type ModelRequest = schemas["ModelRequest"];
 export type NotebookDocumentTransactionRequest =
   schemas["NotebookDocumentTransactionRequest"];
+export type NotebookDocumentTransactionResponse =
+  schemas["NotebookDocumentTransactionResponse"];
 export type UpdateUserConfigRequest = schemas["UpdateUserConfigRequest"];
 export type ShutdownSessionRequest = schemas["ShutdownSessionRequest"];
 export type Snippet = schemas["Snippet"];
@@ -175,12 +179,14 @@ export interface EditRequests {
   sendRestart: () => Promise<null>;
   sendDocumentTransaction: (
     request: NotebookDocumentTransactionRequest,
-  ) => Promise<null>;
+  ) => Promise<NotebookDocumentTransactionResponse | null>;
   sendInstallMissingPackages: (
     request: InstallPackagesRequest,
   ) => Promise<null>;
   readCode: () => Promise<{ contents: string }>;
   readSnippets: () => Promise<Snippets>;
+  previewVariables: (request: PreviewVariablesRequest) => Promise<null>;
+  getMemoryUsage: (request: GetMemoryUsageRequest) => Promise<null>;
   previewDatasetColumn: (request: PreviewDatasetColumnRequest) => Promise<null>;
   previewSQLTable: (request: PreviewSQLTableRequest) => Promise<null>;
   previewSQLTableList: (request: ListSQLTablesRequest) => Promise<null>;
@@ -394,6 +394,14 @@ describe("resolveVirtualFileURL", () => {
     expect(result).toBe("http://example.com/widget.js");
   });
 
+  it("should resolve sidecar files against the page", () => {
+    const virtualFiles = { "/@file/widget.js": "assets/widget.js" };
+
+    const result = resolveVirtualFileURL("/@file/widget.js", virtualFiles);
+
+    expect(result).toBe(new URL("assets/widget.js", document.baseURI).href);
+  });
+
   it("should handle various URL formats", () => {
     const virtualFiles = {
       "/@file/module.js":
@@ -136,6 +136,11 @@ export function resolveVirtualFileURL(
   if (!vfile) {
     return url;
   }
+  if (!vfile.startsWith("data:")) {
+    // Exported as a file next to the notebook (`--assets-dir`); import()
+    // resolves relative URLs against the importing module, not the page
+    return new URL(vfile, document.baseURI).href;
+  }
   const blob = deserializeBlob(vfile as DataURLString);
   return URL.createObjectURL(blob);
 }
@@ -1,8 +1,11 @@
 /* Copyright 2026 Marimo. All rights reserved. */
-import type { DataURLString } from "@/utils/json/base64";
 import type { ModelLifecycle } from "../kernel/messages";
 
-export type StaticVirtualFiles = Record<string, DataURLString>;
+/**
+ * Virtual files by URL: data URLs, or URLs relative to the page for files
+ * exported next to the notebook (`marimo export html --assets-dir`).
+ */
+export type StaticVirtualFiles = Record<string, string>;
 
 export interface MarimoStaticState {
   files: StaticVirtualFiles;
@@ -145,4 +145,26 @@ describe("cell reducer", () => {
       },
     });
   });
+
+  it("should set memory", () => {
+    const x = {
+      name: Names.x,
+      declaredBy: [CellIds.a],
+      usedBy: [CellIds.b],
+    };
+    actions.setVariables([x]);
+
+    // unknown variables are dropped
+    actions.setMemory([
+      { name: Names.x, memory: 1024 },
+      { name: Names.y, memory: 2048 },
+    ]);
+    expect(state).toEqual({
+      [Names.x]: { ...x, memory: 1024 },
+    });
+
+    // kept across variable updates
+    actions.setVariables([x]);
+    expect(state[Names.x].memory).toBe(1024);
+  });
 });
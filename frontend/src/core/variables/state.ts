@@ -42,10 +42,12 @@ const {
       name: VariableName;
       value?: string | null;
       dataType?: string | null;
+      size?: number | null;
+      previewPending?: boolean;
     }[],
   ) => {
     const newVariables = { ...state };
-    for (const { name, value, dataType } of metadata) {
+    for (const { name, value, dataType, size, previewPending } of metadata) {
       if (!newVariables[name]) {
         continue;
       }
@@ -54,6 +56,28 @@ const {
         ...newVariables[name],
         value,
         dataType: dataType,
+        size,
+        previewPending,
+      };
+    }
+    return newVariables;
+  },
+  setMemory: (
+    state,
+    memory: {
+      name: VariableName;
+      memory: number;
+    }[],
+  ) => {
+    const newVariables = { ...state };
+    for (const { name, memory: bytes } of memory) {
+      if (!newVariables[name]) {
+        continue;
+      }
+
+      newVariables[name] = {
+        ...newVariables[name],
+        memory: bytes,
       };
     }
     return newVariables;
@@ -17,6 +17,18 @@ export interface Variable {
    * Type of the value.
    */
   dataType?: string | null;
+  /**
+   * Length of the value, for containers and tables.
+   */
+  size?: number | null;
+  /**
+   * Whether the preview (`value`) has yet to be requested from the kernel.
+   */
+  previewPending?: boolean;
+  /**
+   * Estimated memory held by the value, in bytes.
+   */
+  memory?: number | null;
 }
 
 export type Variables = Record<VariableName, Variable>;
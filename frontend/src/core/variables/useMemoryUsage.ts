@@ -0,0 +1,62 @@
+/* Copyright 2026 Marimo. All rights reserved. */
+
+import { useEffect, useRef } from "react";
+import { useRequestClient } from "@/core/network/requests";
+import { Logger } from "@/utils/Logger";
+import type { Variable, VariableName, Variables } from "./types";
+
+const DEBOUNCE_MS = 500;
+
+function signatureOf(variable: Variable): string {
+  return [variable.dataType, variable.size, variable.value].join("\0");
+}
+
+/**
+ * Request memory estimates for the variables, while `enabled`.
+ *
+ * Estimating walks each variable's objects on the kernel, so it is opt-in,
+ * and only variables that changed since they were last estimated (or were
+ * never estimated) are requested. Requests wait for variables to settle,
+ * since each run updates them several times, and skip variables whose
+ * preview is pending: they are estimated once it arrives.
+ */
+export function useMemoryUsage(variables: Variables, enabled: boolean) {
+  const { getMemoryUsage } = useRequestClient();
+  // Each variable's signature when its estimate was last requested
+  const estimated = useRef(new Map<VariableName, string>());
+
+  useEffect(() => {
+    if (!enabled) {
+      return;
+    }
+    const timeout = setTimeout(() => {
+      const names: VariableName[] = [];
+      for (const variable of Object.values(variables)) {
+        if (variable.previewPending) {
+          continue;
+        }
+        const signature = signatureOf(variable);
+        if (estimated.current.get(variable.name) !== signature) {
+          estimated.current.set(variable.name, signature);
+          names.push(variable.name);
+        }
+      }
+      for (const name of estimated.current.keys()) {
+        if (!(name in variables)) {
+          estimated.current.delete(name);
+        }
+      }
+      if (names.length === 0) {
+        return;
+      }
+
+      getMemoryUsage({ names }).catch((error) => {
+        Logger.warn("Failed to request memory usage", error);
+        for (const name of names) {
+          estimated.current.delete(name);
+        }
+      });
+    }, DEBOUNCE_MS);
+    return () => clearTimeout(timeout);
+  }, [variables, enabled, getMemoryUsage]);
+}
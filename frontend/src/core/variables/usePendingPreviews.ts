@@ -0,0 +1,50 @@
+/* Copyright 2026 Marimo. All rights reserved. */
+
+import { useEffect, useRef } from "react";
+import { isIslands } from "@/core/islands/utils";
+import { useRequestClient } from "@/core/network/requests";
+import { isStaticNotebook } from "@/core/static/static-state";
+import { Logger } from "@/utils/Logger";
+import type { VariableName, Variables } from "./types";
+
+/**
+ * Request previews for variables whose preview has not been computed yet.
+ *
+ * The kernel only sends a type and size for non-scalar variables after a
+ * run; the preview itself is computed when something (such as the
+ * variables panel) asks for it. Each pending variable is requested once,
+ * until the kernel marks it pending again; failed requests are not retried.
+ *
+ * Static notebooks and islands have no kernel to compute previews, so
+ * nothing is requested.
+ */
+export function usePendingPreviews(variables: Variables) {
+  const { previewVariables } = useRequestClient();
+  const requested = useRef(new Set<VariableName>());
+
+  useEffect(() => {
+    if (isStaticNotebook() || isIslands()) {
+      return;
+    }
+    const names: VariableName[] = [];
+    for (const variable of Object.values(variables)) {
+      if (!variable.previewPending) {
+        requested.current.delete(variable.name);
+        continue;
+      }
+      if (!requested.current.has(variable.name)) {
+        requested.current.add(variable.name);
+        names.push(variable.name);
+      }
+    }
+    if (names.length === 0) {
+      return;
+    }
+
+    previewVariables({ names }).catch((error) => {
+      // The names stay requested: retrying on every change of the
+      // variables would flood a kernel that cannot answer.
+      Logger.warn("Failed to request variable previews", error);
+    });
+  }, [variables, previewVariables]);
+}
@@ -555,6 +555,22 @@ export class PyodideBridge implements RunRequests, EditRequests {
     return response as ExportedFile<string>;
   };
 
+  previewVariables: EditRequests["previewVariables"] = async (request) => {
+    await this.putControlRequest({
+      type: "preview-variables",
+      ...request,
+    });
+    return null;
+  };
+
+  getMemoryUsage: EditRequests["getMemoryUsage"] = async (request) => {
+    await this.putControlRequest({
+      type: "get-memory-usage",
+      ...request,
+    });
+    return null;
+  };
+
   previewDatasetColumn: EditRequests["previewDatasetColumn"] = async (
     request,
   ) => {
@@ -5,9 +5,13 @@ import { useRef } from "react";
 import { useErrorBoundary } from "react-error-boundary";
 import { toast } from "@/components/ui/use-toast";
 import { getNotebook, useCellActions } from "@/core/cells/cells";
-import { applyTransactionChanges } from "@/core/cells/document-changes";
+import {
+  applyTransactionChanges,
+  documentVersion,
+} from "@/core/cells/document-changes";
 import { AUTOCOMPLETER } from "@/core/codemirror/completion/Autocompleter";
 import type {
+  NotificationMessage,
   NotificationMessageData,
   NotificationPayload,
 } from "@/core/kernel/messages";
@@ -209,15 +213,19 @@ export function useMarimoKernelConnection(opts: {
       actionsWithoutMiddleware,
       () => getNotebook().cellIds.inOrderIds,
     );
+    documentVersion.seen(transaction.version);
   };
   const { addCellNotification } = useRunsActions();
   const setKernelState = useSetAtom(kernelStateAtom);
   const setAppConfig = useSetAppConfig();
-  const { setVariables, setMetadata } = useVariablesActions();
+  const { setVariables, setMetadata, setMemory } = useVariablesActions();
   const { addColumnPreview } = useDatasetsActions();
   const { addDatasets, filterDatasetsFromVariables } = useDatasetsActions();
-  const { addDataSourceConnection, filterDataSourcesFromVariables } =
-    useDataSourceActions();
+  const {
+    addDataSourceConnection,
+    addTableList,
+    filterDataSourcesFromVariables,
+  } = useDataSourceActions();
   const { setLayoutData } = useLayoutActions();
   const [connection, setConnection] = useAtom(connectionAtom);
   const { addBanner } = useBannersActions();
@@ -233,16 +241,15 @@ export function useMarimoKernelConnection(opts: {
     filterFromVariables: filterStorageFromVariables,
   } = useStorageActions();
 
-  const handleMessage = (e: MessageEvent<JsonString<NotificationPayload>>) => {
-    const msg = jsonParseWithSpecialChar(e.data);
-    switch (msg.data.op) {
+  const handleNotification = (data: NotificationMessage) => {
+    switch (data.op) {
       case "reload":
         reloadSafe();
         return;
       case "kernel-ready": {
         const existingCells = getExistingCells();
 
-        handleKernelReady(msg.data, {
+        handleKernelReady(data, {
           autoInstantiate,
           setCells,
           setLayoutData,
@@ -252,13 +259,14 @@ export function useMarimoKernelConnection(opts: {
           onError: showBoundary,
           existingCells,
         });
-        if (!msg.data.resumed) {
+        documentVersion.reset(data.document_version ?? 0);
+        if (!data.resumed) {
           // A freshly started kernel may expose a different environment
           // (e.g. new env vars); re-run discovery instead of reusing stale
           // suggestions from the previous kernel instance.
           invalidateDataSourceDiscovery();
         }
-        setKioskMode(msg.data.kiosk);
+        setKioskMode(data.kiosk);
         // A freshly started kernel has no breakpoints of its own; re-push
         // the client's set so they still apply, and clear the stale
         // highlighted line from the previous kernel instance.
@@ -274,16 +282,16 @@ export function useMarimoKernelConnection(opts: {
 
       case "kernel-startup-error":
         // Full error received via message before websocket close
-        setKernelStartupError(msg.data.error);
+        setKernelStartupError(data.error);
         return;
 
       case "send-ui-element-message": {
-        const uiElement = msg.data.ui_element;
+        const uiElement = data.ui_element;
         if (uiElement) {
-          const buffers = safeExtractSetUIElementMessageBuffers(msg.data);
+          const buffers = safeExtractSetUIElementMessageBuffers(data);
           UI_ELEMENT_REGISTRY.broadcastMessage(
             uiElement,
-            msg.data.message,
+            data.message,
             buffers,
           );
         }
@@ -291,36 +299,36 @@ export function useMarimoKernelConnection(opts: {
       }
 
       case "model-lifecycle":
-        handleWidgetMessage(WIDGET_REGISTRY, msg.data);
+        handleWidgetMessage(WIDGET_REGISTRY, data);
         return;
 
       case "remove-ui-elements":
-        handleRemoveUIElements(msg.data);
+        handleRemoveUIElements(data);
         return;
 
       case "completion-result":
-        AUTOCOMPLETER.resolve(msg.data.completion_id, msg.data);
+        AUTOCOMPLETER.resolve(data.completion_id, data);
         return;
       case "function-call-result":
-        FUNCTIONS_REGISTRY.resolve(msg.data.function_call_id, msg.data);
+        FUNCTIONS_REGISTRY.resolve(data.function_call_id, data);
         return;
       case "cell-op": {
-        handleCellNotificationeration(msg.data, handleCellMessage);
-        const cellData = getNotebook().cellData[msg.data.cell_id];
+        handleCellNotificationeration(data, handleCellMessage);
+        const cellData = getNotebook().cellData[data.cell_id];
         if (!cellData) {
           return;
         }
         addCellNotification({
-          cellNotification: msg.data,
+          cellNotification: data,
           code: cellData.code,
         });
         return;
       }
 
       case "variables":
-        const variableNames = msg.data.variables.map((v) => v.name);
+        const variableNames = data.variables.map((v) => v.name);
         setVariables(
-          msg.data.variables.map((v) => ({
+          data.variables.map((v) => ({
             name: v.name,
             declaredBy: v.declared_by,
             usedBy: v.used_by,
@@ -332,53 +340,63 @@ export function useMarimoKernelConnection(opts: {
         return;
       case "variable-values":
         setMetadata(
-          msg.data.variables.map((v) => ({
+          data.variables.map((v) => ({
             name: v.name as VariableName,
             dataType: v.datatype,
             value: v.value,
+            size: v.size,
+            previewPending: v.preview_pending,
+          })),
+        );
+        return;
+      case "memory-usage":
+        setMemory(
+          data.variables.map((v) => ({
+            name: v.name as VariableName,
+            memory: v.size_bytes,
           })),
         );
         return;
       case "alert":
         toast({
-          title: msg.data.title,
+          title: data.title,
           description: renderHTML({
-            html: msg.data.description,
+            html: data.description,
           }),
-          variant: msg.data.variant,
+          variant: data.variant,
         });
         return;
       case "banner":
-        addBanner(msg.data);
+        addBanner(data);
         return;
       case "missing-package-alert":
         addPackageAlert({
-          ...msg.data,
+          ...data,
           kind: "missing",
         });
         return;
       case "installing-package-alert":
         addPackageAlert({
-          ...msg.data,
+          ...data,
           kind: "installing",
         });
         return;
       case "startup-logs":
         addStartupLog({
-          content: msg.data.content,
-          status: msg.data.status,
+          content: data.content,
+          status: data.status,
         });
         return;
       case "query-params-append":
-        queryParamHandlers.append(msg.data);
+        queryParamHandlers.append(data);
         return;
 
       case "query-params-set":
-        queryParamHandlers.set(msg.data);
+        queryParamHandlers.set(data);
         return;
 
       case "query-params-delete":
-        queryParamHandlers.delete(msg.data);
+        queryParamHandlers.delete(data);
         return;
 
       case "query-params-clear":
@@ -386,77 +404,105 @@ export function useMarimoKernelConnection(opts: {
         return;
 
       case "datasets":
-        addDatasets(msg.data);
+        addDatasets(data);
         return;
       case "data-column-preview":
-        addColumnPreview(msg.data);
+        addColumnPreview(data);
         return;
       case "sql-table-preview":
-        PreviewSQLTable.resolve(msg.data.request_id, msg.data);
+        PreviewSQLTable.resolve(data.request_id, data);
         return;
       case "sql-table-list-preview":
-        PreviewSQLTableList.resolve(msg.data.request_id, msg.data);
+        PreviewSQLTableList.resolve(data.request_id, data);
         return;
       case "sql-schema-list-preview":
-        PreviewSQLSchemaList.resolve(msg.data.request_id, msg.data);
+        PreviewSQLSchemaList.resolve(data.request_id, data);
         return;
       case "validate-sql-result":
-        ValidateSQL.resolve(msg.data.request_id as RequestId, msg.data);
+        ValidateSQL.resolve(data.request_id as RequestId, data);
         return;
       case "data-source-discovery-result":
-        DiscoverDataSources.resolve(msg.data.request_id as RequestId, msg.data);
+        DiscoverDataSources.resolve(data.request_id as RequestId, data);
         return;
       case "secret-keys-result":
-        SECRETS_REGISTRY.resolve(msg.data.request_id, msg.data);
+        SECRETS_REGISTRY.resolve(data.request_id, data);
         return;
       case "cache-info":
-        setCacheInfo(msg.data);
+        setCacheInfo(data);
         return;
       case "cache-cleared":
         // Cache cleared, could refresh cache info if needed
         return;
+      case "cell-profile":
+        // Profiles are collected by the server; see /api/export/profile
+        return;
+      case "kernel-metrics":
+        // Metrics are aggregated by the server; see /api/metrics
+        return;
       case "data-source-connections":
         addDataSourceConnection({
-          connections: msg.data.connections.map((conn) => ({
+          connections: data.connections.map((conn) => ({
             ...conn,
             name: conn.name as ConnectionName,
           })),
         });
         return;
+      case "data-source-tables":
+        addTableList({
+          tables: data.tables,
+          sqlTableContext: {
+            engine: data.metadata.connection,
+            database: data.metadata.database,
+            schema: data.metadata.schema,
+            schemaPath: data.metadata.schema_path,
+          },
+        });
+        return;
       case "storage-namespaces":
-        setStorageNamespaces(msg.data);
+        setStorageNamespaces(data);
         return;
       case "storage-entries":
-        ListStorageEntries.resolve(msg.data.request_id as RequestId, msg.data);
+        ListStorageEntries.resolve(data.request_id as RequestId, data);
         return;
       case "storage-download-ready":
-        DownloadStorage.resolve(msg.data.request_id as RequestId, msg.data);
+        DownloadStorage.resolve(data.request_id as RequestId, data);
         return;
 
       case "reconnected":
         return;
+      case "session-snapshot":
+        // Replayed state for a (re)connecting session, sent as one frame
+        for (const notification of data.notifications) {
+          handleNotification(notification as NotificationMessage);
+        }
+        return;
 
       case "focus-cell":
-        focusAndScrollCellOutputIntoView(msg.data.cell_id);
+        focusAndScrollCellOutputIntoView(data.cell_id);
         return;
       case "active-line":
         setActiveLine(
-          msg.data.line == null
+          data.line == null
             ? null
-            : { cellId: msg.data.cell_id, line: msg.data.line },
+            : { cellId: data.cell_id, line: data.line },
         );
         return;
       case "notebook-document-transaction":
-        handleDocumentTransaction(msg.data.transaction);
+        handleDocumentTransaction(data.transaction);
         return;
       case "consumer-capabilities":
-        setKioskMode(!msg.data.consumer_capabilities.edit);
+        setKioskMode(!data.consumer_capabilities.edit);
         return;
       default:
-        logNever(msg.data);
+        logNever(data);
     }
   };
 
+  const handleMessage = (e: MessageEvent<JsonString<NotificationPayload>>) => {
+    const msg = jsonParseWithSpecialChar(e.data);
+    handleNotification(msg.data);
+  };
+
   const tryReconnecting = (code?: number, reason?: string) => {
     // If not properly gated, we could try reconnecting forever if the
     // issue is not transient. So we want to try reconnecting only once after an
@@ -497,10 +543,18 @@ export function useMarimoKernelConnection(opts: {
     /**
      * Unique URL for this session.
      */
-    url: () =>
-      transportType === "sse"
-        ? runtimeManager.getSseURL(sessionId).toString()
-        : runtimeManager.getWsURL(sessionId).toString(),
+    url: () => {
+      const url =
+        transportType === "sse"
+          ? runtimeManager.getSseURL(sessionId)
+          : runtimeManager.getWsURL(sessionId);
+      // On reconnect, ask for just the document changes missed meanwhile
+      const version = documentVersion.current;
+      if (version !== null) {
+        url.searchParams.set("document_version", String(version));
+      }
+      return url.toString();
+    },
     /**
      * Auth headers for the SSE transport. WebSockets cannot send headers
      * and instead put the access token in the URL.
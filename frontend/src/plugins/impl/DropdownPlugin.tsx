@@ -6,6 +6,10 @@ import { cn } from "../../utils/cn";
 import type { IPlugin, IPluginProps } from "../types";
 import { Labeled } from "./common/labeled";
 import { SearchableSelect } from "./SearchableSelect";
+import {
+  type SearchOptionsFunction,
+  searchOptionsSchema,
+} from "./useServerSearchOptions";
 
 interface Data {
   label: string | null;
@@ -13,10 +17,16 @@ interface Data {
   allowSelectNone: boolean;
   fullWidth: boolean;
   searchable: boolean;
+  serverSearch?: boolean | undefined;
   disabled: boolean;
 }
 
-export class DropdownPlugin implements IPlugin<string[], Data> {
+// oxlint-disable-next-line typescript/consistent-type-definitions
+type Functions = {
+  search_options: SearchOptionsFunction;
+};
+
+export class DropdownPlugin implements IPlugin<string[], Data, Functions> {
   tagName = "marimo-dropdown";
 
   validator = z.object({
@@ -26,16 +36,28 @@ export class DropdownPlugin implements IPlugin<string[], Data> {
     allowSelectNone: z.boolean(),
     fullWidth: z.boolean().default(false),
     searchable: z.boolean().default(false),
+    serverSearch: z.boolean().optional(),
     disabled: z.boolean().default(false),
   });
 
-  render(props: IPluginProps<string[], Data>): JSX.Element {
+  functions = {
+    search_options: searchOptionsSchema,
+  };
+
+  render(
+    props: IPluginProps<string[], Data, Partial<Functions>>,
+  ): JSX.Element {
     if (props.data.searchable) {
       const value = props.value.length > 0 ? props.value[0] : null;
       const setValue = (newValue: string | null) =>
         props.setValue(newValue ? [newValue] : []);
       return (
-        <SearchableSelect {...props.data} value={value} setValue={setValue} />
+        <SearchableSelect
+          {...props.data}
+          value={value}
+          setValue={setValue}
+          searchOptions={props.functions.search_options}
+        />
       );
     }
     return (
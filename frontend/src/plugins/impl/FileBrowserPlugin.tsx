@@ -64,10 +64,11 @@ interface FileInfo {
 
 // oxlint-disable-next-line typescript/consistent-type-definitions
 type PluginFunctions = {
-  list_directory: (req: { path: string }) => Promise<{
+  list_directory: (req: { path: string; offset?: number }) => Promise<{
     files: FileInfo[];
     total_count: number;
     is_truncated: boolean;
+    next_offset?: number | null;
   }>;
 };
 
@@ -89,6 +90,7 @@ export const FileBrowserPlugin = createPlugin<S>("marimo-file-browser")
       .input(
         z.object({
           path: z.string(),
+          offset: z.number().optional(),
         }),
       )
       .output(
@@ -103,6 +105,7 @@ export const FileBrowserPlugin = createPlugin<S>("marimo-file-browser")
           ),
           total_count: z.number(),
           is_truncated: z.boolean(),
+          next_offset: z.number().nullish(),
         }),
       ),
   })
@@ -171,6 +174,12 @@ function CheckboxOrIcon({
   return <Icon size={16} className="mr-2" />;
 }
 
+/** Entries loaded with "Load more", after the first page. */
+interface LoadedPages {
+  files: FileInfo[];
+  nextOffset: number | null;
+}
+
 interface RowModel {
   key: string;
   name: string;
@@ -239,9 +248,16 @@ export const FileBrowser = ({
   // same-path refresh) so activeIndex never points past the current rows.
   const listingKey = `${path}::${randomId}`;
   const [prevListingKey, setPrevListingKey] = useState(listingKey);
+  const [morePages, setMorePages] = useState<LoadedPages | null>(null);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
+  const listingKeyRef = useRef(listingKey);
+  useEffect(() => {
+    listingKeyRef.current = listingKey;
+  }, [listingKey]);
   if (prevListingKey !== listingKey) {
     setPrevListingKey(listingKey);
     setActiveIndex(0);
+    setMorePages(null);
   }
 
   useLayoutEffect(() => {
@@ -251,7 +267,10 @@ export const FileBrowser = ({
     }
   }, [listingKey]);
 
-  const files = data?.files ?? [];
+  const files = [...(data?.files ?? []), ...(morePages?.files ?? [])];
+  const nextOffset = morePages
+    ? morePages.nextOffset
+    : (data?.next_offset ?? null);
   const selectedPaths = new Set(value.map((x) => x.path));
   const canSelectDirectories =
     selectionMode === "directory" || selectionMode === "all";
@@ -274,6 +293,33 @@ export const FileBrowser = ({
 
   const selectedFiles = value.map((x) => <li key={x.id}>{x.path}</li>);
 
+  async function loadMore() {
+    if (nextOffset === null || isLoadingMore) {
+      return;
+    }
+    const requestKey = listingKey;
+    setIsLoadingMore(true);
+    try {
+      const page = await list_directory({ path, offset: nextOffset });
+      // Drop the page if the user navigated away in the meantime
+      if (listingKeyRef.current !== requestKey) {
+        return;
+      }
+      setMorePages((prev) => ({
+        files: [...(prev?.files ?? []), ...page.files],
+        nextOffset: page.next_offset ?? null,
+      }));
+    } catch (error) {
+      toast({
+        title: "Failed to load more files",
+        description: error instanceof Error ? error.message : String(error),
+        variant: "danger",
+      });
+    } finally {
+      setIsLoadingMore(false);
+    }
+  }
+
   function setNewPath(newPath: string) {
     // Prevent updating path while updating
     if (isUpdatingPath) {
@@ -523,10 +569,21 @@ export const FileBrowser = ({
       </NativeSelect>
 
       {data && typeof data.total_count === "number" && (
-        <div className="text-xs text-muted-foreground mt-1 px-1">
-          {data.is_truncated
+        <div className="flex items-center gap-2 text-xs text-muted-foreground mt-1 px-1">
+          {nextOffset !== null
             ? `Showing ${files.length} of ${data.total_count} items`
             : `${data.total_count} ${data.total_count === 1 ? "item" : "items"}`}
+          {nextOffset !== null && (
+            <Button
+              size="xs"
+              variant="link"
+              className="h-auto p-0"
+              disabled={isLoadingMore}
+              onClick={() => void loadMore()}
+            >
+              {isLoadingMore ? "Loading..." : "Load more"}
+            </Button>
+          )}
         </div>
       )}
 
@@ -5,6 +5,12 @@ import type { Option } from "@/components/ui/select-core";
 import { SelectList } from "@/components/ui/select-core";
 import type { IPlugin, IPluginProps, Setter } from "../types";
 import { Labeled } from "./common/labeled";
+import {
+  matchAll,
+  type SearchOptionsFunction,
+  searchOptionsSchema,
+  useServerSearchOptions,
+} from "./useServerSearchOptions";
 
 interface Data {
   label: string | null;
@@ -12,11 +18,17 @@ interface Data {
   fullWidth: boolean;
   maxSelections?: number | undefined;
   disabled: boolean;
+  serverSearch?: boolean | undefined;
 }
 
 type T = string[];
 
-export class MultiselectPlugin implements IPlugin<T, Data> {
+// oxlint-disable-next-line typescript/consistent-type-definitions
+type Functions = {
+  search_options: SearchOptionsFunction;
+};
+
+export class MultiselectPlugin implements IPlugin<T, Data, Functions> {
   tagName = "marimo-multiselect";
 
   validator = z.object({
@@ -26,14 +38,22 @@ export class MultiselectPlugin implements IPlugin<T, Data> {
     fullWidth: z.boolean().default(false),
     maxSelections: z.number().optional(),
     disabled: z.boolean().default(false),
+    serverSearch: z.boolean().optional(),
   });
 
-  render(props: IPluginProps<string[], Data>): JSX.Element {
+  functions = {
+    search_options: searchOptionsSchema,
+  };
+
+  render(
+    props: IPluginProps<string[], Data, Partial<Functions>>,
+  ): JSX.Element {
     return (
       <Multiselect
         {...props.data}
         value={props.value}
         setValue={props.setValue}
+        searchOptions={props.functions.search_options}
       />
     );
   }
@@ -50,6 +70,7 @@ export class MultiselectPlugin implements IPlugin<T, Data> {
 interface MultiselectProps extends Data {
   value: T;
   setValue: Setter<T>;
+  searchOptions?: SearchOptionsFunction;
 }
 
 export const Multiselect = ({
@@ -60,11 +81,19 @@ export const Multiselect = ({
   fullWidth,
   maxSelections,
   disabled,
+  serverSearch = false,
+  searchOptions,
 }: MultiselectProps): JSX.Element => {
   const id = useId();
+  const server = useServerSearchOptions({
+    enabled: serverSearch,
+    searchOptions,
+    options,
+    selected: value,
+  });
   const items = useMemo<Array<Option<string>>>(
-    () => options.map((option) => ({ value: option, label: option })),
-    [options],
+    () => server.options.map((option) => ({ value: option, label: option })),
+    [server.options],
   );
 
   return (
@@ -82,6 +111,8 @@ export const Multiselect = ({
         compactChipTrigger={true}
         fullWidth={fullWidth}
         disabled={disabled}
+        filterFn={serverSearch ? matchAll : undefined}
+        onSearchChange={serverSearch ? server.onSearchChange : undefined}
       />
     </Labeled>
   );
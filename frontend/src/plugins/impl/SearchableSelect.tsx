@@ -4,6 +4,11 @@ import type { Option } from "@/components/ui/select-core";
 import { SelectList } from "@/components/ui/select-core";
 import { cn } from "../../utils/cn";
 import { Labeled } from "./common/labeled";
+import {
+  matchAll,
+  type SearchOptionsFunction,
+  useServerSearchOptions,
+} from "./useServerSearchOptions";
 
 interface SearchableSelectProps {
   options: string[];
@@ -13,6 +18,9 @@ interface SearchableSelectProps {
   allowSelectNone: boolean;
   fullWidth: boolean;
   disabled: boolean;
+  /** Search the kernel for options instead of filtering `options`. */
+  serverSearch?: boolean | undefined;
+  searchOptions?: SearchOptionsFunction;
 }
 
 export const SearchableSelect = (props: SearchableSelectProps): JSX.Element => {
@@ -24,12 +32,21 @@ export const SearchableSelect = (props: SearchableSelectProps): JSX.Element => {
     allowSelectNone,
     fullWidth,
     disabled,
+    serverSearch = false,
+    searchOptions,
   } = props;
   const id = useId();
 
+  const server = useServerSearchOptions({
+    enabled: serverSearch,
+    searchOptions,
+    options,
+    selected: value == null ? [] : [value],
+  });
+
   const items = useMemo<Array<Option<string>>>(
-    () => options.map((option) => ({ value: option, label: option })),
-    [options],
+    () => server.options.map((option) => ({ value: option, label: option })),
+    [server.options],
   );
 
   return (
@@ -44,6 +61,8 @@ export const SearchableSelect = (props: SearchableSelectProps): JSX.Element => {
         fullWidth={fullWidth}
         disabled={disabled}
         className={cn({ "w-full": fullWidth })}
+        filterFn={serverSearch ? matchAll : undefined}
+        onSearchChange={serverSearch ? server.onSearchChange : undefined}
         data-testid="marimo-plugin-searchable-dropdown"
       />
     </Labeled>
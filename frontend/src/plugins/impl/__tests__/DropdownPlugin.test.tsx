@@ -1,6 +1,6 @@
 /* Copyright 2026 Marimo. All rights reserved. */
 
-import { fireEvent, render, screen } from "@testing-library/react";
+import { fireEvent, render, screen, waitFor } from "@testing-library/react";
 import { beforeAll, describe, expect, it, vi } from "vitest";
 import type { z } from "zod";
 import { SetupMocks } from "@/__mocks__/common";
@@ -169,6 +169,47 @@ describe("DropdownPlugin", () => {
       expect(setValue).toHaveBeenCalledWith(["Apple"]);
     });
 
+    it("asks the kernel for options when serverSearch is set", async () => {
+      const plugin = new DropdownPlugin();
+      const host = document.createElement("div");
+      const searchOptions = vi.fn().mockResolvedValue({
+        options: ["Apple", "Apricot"],
+        has_more: false,
+      });
+      const props: IPluginProps<
+        string[],
+        z.infer<(typeof plugin)["validator"]>
+      > = {
+        data: {
+          label: "Test Label",
+          options: [],
+          allowSelectNone: true,
+          fullWidth: false,
+          searchable: true,
+          serverSearch: true,
+          initialValue: [],
+          disabled: false,
+        },
+        value: [],
+        setValue: vi.fn(),
+        host,
+        functions: { search_options: searchOptions },
+      };
+      render(plugin.render(props));
+
+      fireEvent.click(
+        screen.getByTestId("marimo-plugin-searchable-dropdown").firstChild!,
+      );
+      fireEvent.change(screen.getByRole("combobox"), {
+        target: { value: "ap" },
+      });
+
+      await waitFor(() =>
+        expect(searchOptions).toHaveBeenCalledWith({ query: "ap", limit: 100 }),
+      );
+      expect(await screen.findByText("Apricot")).toBeInTheDocument();
+    });
+
     it("supports single selection only", async () => {
       const plugin = new DropdownPlugin();
       const host = document.createElement("div");
@@ -309,6 +309,40 @@ describe("FileBrowserPlugin keyboard accessibility", () => {
   });
 });
 
+describe("FileBrowserPlugin pagination", () => {
+  it("appends the next page when clicking Load more", async () => {
+    const list_directory = vi
+      .fn()
+      .mockResolvedValueOnce({
+        files: FILES.slice(0, 2),
+        total_count: FILES.length,
+        is_truncated: true,
+        next_offset: 2,
+      })
+      .mockResolvedValueOnce({
+        files: FILES.slice(2),
+        total_count: FILES.length,
+        is_truncated: false,
+        next_offset: null,
+      });
+    renderBrowser({ list_directory });
+    await screen.findByText("a.txt");
+    expect(screen.queryByText("b.txt")).not.toBeInTheDocument();
+
+    fireEvent.click(screen.getByRole("button", { name: "Load more" }));
+
+    expect(await screen.findByText("b.txt")).toBeInTheDocument();
+    expect(list_directory).toHaveBeenLastCalledWith({
+      path: "/home/user",
+      offset: 2,
+    });
+    expect(screen.getAllByRole("row")).toHaveLength(4);
+    expect(
+      screen.queryByRole("button", { name: "Load more" }),
+    ).not.toBeInTheDocument();
+  });
+});
+
 function rowFor(name: string): HTMLElement {
   return screen.getByText(name).closest('[role="row"]') as HTMLElement;
 }
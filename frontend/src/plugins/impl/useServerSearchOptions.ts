@@ -0,0 +1,69 @@
+/* Copyright 2026 Marimo. All rights reserved. */
+import { useMemo, useState } from "react";
+import { z } from "zod";
+import { useAsyncData } from "@/hooks/useAsyncData";
+import { useDebounce } from "@/hooks/useDebounce";
+import { rpc } from "../core/rpc";
+
+/** Number of matches requested per search. */
+const SEARCH_LIMIT = 100;
+
+export type SearchOptionsFunction = (req: {
+  query: string;
+  limit?: number;
+}) => Promise<{ options: string[]; has_more: boolean }>;
+
+export const searchOptionsSchema = rpc
+  .input(
+    z.object({
+      query: z.string(),
+      limit: z.number().optional(),
+    }),
+  )
+  .output(
+    z.object({
+      options: z.array(z.string()),
+      has_more: z.boolean(),
+    }),
+  );
+
+/** Matches everything; the kernel has already filtered the options. */
+export const matchAll = () => 1;
+
+/**
+ * Options for a select whose options live in the kernel (`server_search`).
+ *
+ * Returns the kernel's matches for the current (debounced) query, with the
+ * selected options merged in so the selection always has labels.
+ */
+export function useServerSearchOptions({
+  enabled,
+  searchOptions,
+  options,
+  selected,
+}: {
+  enabled: boolean;
+  searchOptions: SearchOptionsFunction | undefined;
+  /** The options sent with the element. */
+  options: string[];
+  selected: string[];
+}): { options: string[]; onSearchChange: (query: string) => void } {
+  const [query, setQuery] = useState("");
+  const debouncedQuery = useDebounce(query, 150);
+
+  const { data } = useAsyncData(async () => {
+    if (!enabled || !searchOptions) {
+      return null;
+    }
+    return searchOptions({ query: debouncedQuery, limit: SEARCH_LIMIT });
+  }, [enabled, searchOptions, debouncedQuery]);
+
+  const merged = useMemo(() => {
+    if (!enabled) {
+      return options;
+    }
+    return [...new Set([...selected, ...(data?.options ?? options)])];
+  }, [enabled, options, selected, data]);
+
+  return { options: merged, onSearchChange: setQuery };
+}
@@ -73,7 +73,12 @@ export function createMimeConfig(input: {
  * - Vega charts should remain visible as they provide interactivity
  */
 export const getDefaultMimeConfig = once((): MimeTypeConfig => {
-  const IMAGE_FALLBACKS: MimeType[] = ["image/png", "image/jpeg", "image/gif"];
+  const IMAGE_FALLBACKS: MimeType[] = [
+    "image/png",
+    "image/jpeg",
+    "image/webp",
+    "image/gif",
+  ];
 
   return createMimeConfig({
     precedence: [
@@ -85,6 +90,7 @@ export const getDefaultMimeConfig = once((): MimeTypeConfig => {
       "image/svg+xml",
       "image/png",
       "image/jpeg",
+      "image/webp",
       "image/gif",
       "text/markdown",
       "text/latex",
@@ -17,9 +17,10 @@ marimo is designed to be:
 from sys import platform as _platform
 
 if _platform == "emscripten":
-    # Runtime modules imported below capture `threading.Thread` and
-    # `threading.local`. Install the Pyodide concurrency patch first so public
-    # imports and runtime context storage share the same stdlib view.
+    # Runtime modules (imported when the public names below are first
+    # accessed) capture `threading.Thread` and `threading.local`. Install the
+    # Pyodide concurrency patch first so public imports and runtime context
+    # storage share the same stdlib view.
     from marimo._runtime._wasm import (
         ensure_wasm_runtime_bootstrapped as _ensure_wasm_runtime_bootstrapped,
     )
@@ -101,65 +102,178 @@ __all__ = [  # noqa: RUF022
     "watch",
     "__version__",
 ]
-import marimo._ai as ai
-import marimo._islands as islands
-from marimo._ast.app import App
-from marimo._ast.cell import Cell
-from marimo._islands._island_generator import MarimoIslandGenerator
-from marimo._output.doc import doc
-from marimo._output.formatting import as_html, iframe, plain
-from marimo._output.hypertext import Html
-from marimo._output.justify import center, left, right
-from marimo._output.md import latex, md
-from marimo._output.outline import outline
-from marimo._output.show_code import show_code
-from marimo._plugins import ui
-from marimo._plugins.stateless import mpl, status
-from marimo._plugins.stateless.accordion import accordion
-from marimo._plugins.stateless.audio import audio
-from marimo._plugins.stateless.callout import callout
-from marimo._plugins.stateless.carousel import carousel
-from marimo._plugins.stateless.download import download
-from marimo._plugins.stateless.flex import hstack, vstack
-from marimo._plugins.stateless.icon import icon
-from marimo._plugins.stateless.image import image
-from marimo._plugins.stateless.image_compare import image_compare
-from marimo._plugins.stateless.inspect import inspect
-from marimo._plugins.stateless.json_component import json
-from marimo._plugins.stateless.lazy import lazy
-from marimo._plugins.stateless.mermaid import mermaid
-from marimo._plugins.stateless.nav_menu import nav_menu
-from marimo._plugins.stateless.pdf import pdf
-from marimo._plugins.stateless.plain_text import plain_text
-from marimo._plugins.stateless.routes import routes
-from marimo._plugins.stateless.sidebar import sidebar
-from marimo._plugins.stateless.stat import stat
-from marimo._plugins.stateless.style import style
-from marimo._plugins.stateless.tabs import tabs
-from marimo._plugins.stateless.tree import tree
-from marimo._plugins.stateless.video import video
-from marimo._runtime import output, watch
-from marimo._runtime.app_meta import AppMeta
-from marimo._runtime.capture import (
-    capture_stderr,
-    capture_stdout,
-    redirect_stderr,
-    redirect_stdout,
-)
-from marimo._runtime.context.utils import running_in_notebook
-from marimo._runtime.control_flow import MarimoStopError, stop
-from marimo._runtime.runtime import (
-    app_meta,
-    cli_args,
-    defs,
-    notebook_dir,
-    notebook_location,
-    query_params,
-    refs,
-)
-from marimo._runtime.state import state
-from marimo._runtime.threads import Thread, current_thread
-from marimo._save.save import cache, lru_cache, persistent_cache
-from marimo._server.asgi import create_asgi_app
-from marimo._sql.sql import sql
+from typing import TYPE_CHECKING as _TYPE_CHECKING, Any as _Any
+
 from marimo._version import __version__
+
+if _TYPE_CHECKING:
+    import marimo._ai as ai
+    import marimo._islands as islands
+    from marimo._ast.app import App
+    from marimo._ast.cell import Cell
+    from marimo._islands._island_generator import MarimoIslandGenerator
+    from marimo._output.doc import doc
+    from marimo._output.formatting import as_html, iframe, plain
+    from marimo._output.hypertext import Html
+    from marimo._output.justify import center, left, right
+    from marimo._output.md import latex, md
+    from marimo._output.outline import outline
+    from marimo._output.show_code import show_code
+    from marimo._plugins import ui
+    from marimo._plugins.stateless import mpl, status
+    from marimo._plugins.stateless.accordion import accordion
+    from marimo._plugins.stateless.audio import audio
+    from marimo._plugins.stateless.callout import callout
+    from marimo._plugins.stateless.carousel import carousel
+    from marimo._plugins.stateless.download import download
+    from marimo._plugins.stateless.flex import hstack, vstack
+    from marimo._plugins.stateless.icon import icon
+    from marimo._plugins.stateless.image import image
+    from marimo._plugins.stateless.image_compare import image_compare
+    from marimo._plugins.stateless.inspect import inspect
+    from marimo._plugins.stateless.json_component import json
+    from marimo._plugins.stateless.lazy import lazy
+    from marimo._plugins.stateless.mermaid import mermaid
+    from marimo._plugins.stateless.nav_menu import nav_menu
+    from marimo._plugins.stateless.pdf import pdf
+    from marimo._plugins.stateless.plain_text import plain_text
+    from marimo._plugins.stateless.routes import routes
+    from marimo._plugins.stateless.sidebar import sidebar
+    from marimo._plugins.stateless.stat import stat
+    from marimo._plugins.stateless.style import style
+    from marimo._plugins.stateless.tabs import tabs
+    from marimo._plugins.stateless.tree import tree
+    from marimo._plugins.stateless.video import video
+    from marimo._runtime import output, watch
+    from marimo._runtime.app_meta import AppMeta
+    from marimo._runtime.capture import (
+        capture_stderr,
+        capture_stdout,
+        redirect_stderr,
+        redirect_stdout,
+    )
+    from marimo._runtime.context.utils import running_in_notebook
+    from marimo._runtime.control_flow import MarimoStopError, stop
+    from marimo._runtime.runtime import (
+        app_meta,
+        cli_args,
+        defs,
+        notebook_dir,
+        notebook_location,
+        query_params,
+        refs,
+    )
+    from marimo._runtime.state import state
+    from marimo._runtime.threads import Thread, current_thread
+    from marimo._save.save import cache, lru_cache, persistent_cache
+    from marimo._server.asgi import create_asgi_app
+    from marimo._sql.sql import sql
+
+# Public names are imported on first access (PEP 562), so that
+# `import marimo` stays cheap for scripts and kernels that only use a
+# few of them. Maps each name to the module defining it, and the
+# attribute to take from that module (None for the module itself).
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str | None]] = {
+    # Core API
+    "App": ("marimo._ast.app", "App"),
+    "Cell": ("marimo._ast.cell", "Cell"),
+    "AppMeta": ("marimo._runtime.app_meta", "AppMeta"),
+    "create_asgi_app": ("marimo._server.asgi", "create_asgi_app"),
+    "MarimoIslandGenerator": (
+        "marimo._islands._island_generator",
+        "MarimoIslandGenerator",
+    ),
+    "MarimoStopError": ("marimo._runtime.control_flow", "MarimoStopError"),
+    "Thread": ("marimo._runtime.threads", "Thread"),
+    "current_thread": ("marimo._runtime.threads", "current_thread"),
+    # Other namespaces
+    "ai": ("marimo._ai", None),
+    "ui": ("marimo._plugins.ui", None),
+    "islands": ("marimo._islands", None),
+    # Application elements
+    "accordion": ("marimo._plugins.stateless.accordion", "accordion"),
+    "app_meta": ("marimo._runtime.runtime", "app_meta"),
+    "as_html": ("marimo._output.formatting", "as_html"),
+    "audio": ("marimo._plugins.stateless.audio", "audio"),
+    "cache": ("marimo._save.save", "cache"),
+    "callout": ("marimo._plugins.stateless.callout", "callout"),
+    "capture_stderr": ("marimo._runtime.capture", "capture_stderr"),
+    "capture_stdout": ("marimo._runtime.capture", "capture_stdout"),
+    "carousel": ("marimo._plugins.stateless.carousel", "carousel"),
+    "center": ("marimo._output.justify", "center"),
+    "cli_args": ("marimo._runtime.runtime", "cli_args"),
+    "defs": ("marimo._runtime.runtime", "defs"),
+    "doc": ("marimo._output.doc", "doc"),
+    "download": ("marimo._plugins.stateless.download", "download"),
+    "hstack": ("marimo._plugins.stateless.flex", "hstack"),
+    "Html": ("marimo._output.hypertext", "Html"),
+    "icon": ("marimo._plugins.stateless.icon", "icon"),
+    "iframe": ("marimo._output.formatting", "iframe"),
+    "image": ("marimo._plugins.stateless.image", "image"),
+    "image_compare": (
+        "marimo._plugins.stateless.image_compare",
+        "image_compare",
+    ),
+    "inspect": ("marimo._plugins.stateless.inspect", "inspect"),
+    "json": ("marimo._plugins.stateless.json_component", "json"),
+    "latex": ("marimo._output.md", "latex"),
+    "lazy": ("marimo._plugins.stateless.lazy", "lazy"),
+    "left": ("marimo._output.justify", "left"),
+    "lru_cache": ("marimo._save.save", "lru_cache"),
+    "md": ("marimo._output.md", "md"),
+    "mermaid": ("marimo._plugins.stateless.mermaid", "mermaid"),
+    "mpl": ("marimo._plugins.stateless.mpl", None),
+    "nav_menu": ("marimo._plugins.stateless.nav_menu", "nav_menu"),
+    "notebook_dir": ("marimo._runtime.runtime", "notebook_dir"),
+    "notebook_location": ("marimo._runtime.runtime", "notebook_location"),
+    "outline": ("marimo._output.outline", "outline"),
+    "output": ("marimo._runtime.output", None),
+    "pdf": ("marimo._plugins.stateless.pdf", "pdf"),
+    "persistent_cache": ("marimo._save.save", "persistent_cache"),
+    "plain": ("marimo._output.formatting", "plain"),
+    "plain_text": ("marimo._plugins.stateless.plain_text", "plain_text"),
+    "query_params": ("marimo._runtime.runtime", "query_params"),
+    "redirect_stderr": ("marimo._runtime.capture", "redirect_stderr"),
+    "redirect_stdout": ("marimo._runtime.capture", "redirect_stdout"),
+    "refs": ("marimo._runtime.runtime", "refs"),
+    "right": ("marimo._output.justify", "right"),
+    "routes": ("marimo._plugins.stateless.routes", "routes"),
+    "running_in_notebook": (
+        "marimo._runtime.context.utils",
+        "running_in_notebook",
+    ),
+    "show_code": ("marimo._output.show_code", "show_code"),
+    "sidebar": ("marimo._plugins.stateless.sidebar", "sidebar"),
+    "sql": ("marimo._sql.sql", "sql"),
+    "stat": ("marimo._plugins.stateless.stat", "stat"),
+    "state": ("marimo._runtime.state", "state"),
+    "status": ("marimo._plugins.stateless.status", None),
+    "stop": ("marimo._runtime.control_flow", "stop"),
+    "style": ("marimo._plugins.stateless.style", "style"),
+    "tabs": ("marimo._plugins.stateless.tabs", "tabs"),
+    "tree": ("marimo._plugins.stateless.tree", "tree"),
+    "video": ("marimo._plugins.stateless.video", "video"),
+    "vstack": ("marimo._plugins.stateless.flex", "vstack"),
+    "watch": ("marimo._runtime.watch", None),
+}
+
+
+def __getattr__(name: str) -> _Any:
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    from importlib import import_module
+
+    module = import_module(module_name)
+    value = module if attribute is None else getattr(module, attribute)
+    # Cache, so that later lookups don't go through this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
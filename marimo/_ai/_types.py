@@ -4,7 +4,7 @@ from __future__ import annotations
 import abc
 import mimetypes
 from dataclasses import asdict, dataclass, is_dataclass
-from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
+from typing import TYPE_CHECKING, Any, Final, Literal, TypedDict, cast
 
 import msgspec
 
@@ -14,6 +14,10 @@ from marimo._utils.parse_dataclass import parse_raw
 
 LOGGER = _loggers.marimo_logger()
 
+# The version of the Vercel AI SDK we use.
+AI_SDK_VERSION: Final[Literal[5, 6, 7]] = 7
+DONE_CHUNK: Final[str] = "[DONE]"
+
 
 class ChatAttachmentDict(TypedDict):
     url: str
@@ -8,7 +8,6 @@ from typing import TYPE_CHECKING, Any, cast
 
 from marimo import _loggers
 from marimo._ai._pydantic_ai_utils import generate_id, sanitize_part
-from marimo._plugins.ui._impl.chat.chat import AI_SDK_VERSION, DONE_CHUNK
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator, Callable, Generator
@@ -25,6 +24,8 @@ from marimo._ai._convert import (
     convert_to_openai_messages,
 )
 from marimo._ai._types import (
+    AI_SDK_VERSION,
+    DONE_CHUNK,
     ChatMessage,
     ChatModel,
     ChatModelConfig,
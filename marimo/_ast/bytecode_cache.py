@@ -0,0 +1,223 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""On-disk cache of compiled cells, the cell analogue of `__pycache__`.
+
+Cells are compiled from source every time a notebook is loaded, since they
+are not imported as modules. Compiling a cell means parsing it, analyzing
+its definitions and references, and compiling its code objects; the
+analysis costs more than the rest combined. This cache stores each cell's
+analysis and marshalled code objects under the marimo cache directory, so
+running the same notebook again (as a script, an embedded app, or a new
+kernel) only has to parse each cell.
+
+Entries are keyed by everything that affects the result: the cell's
+source, id and filename, its position in the file, the interpreter's
+bytecode magic number and optimization level, the marimo version, and the
+versions of the packages used to analyze SQL. Like Python's own bytecode
+cache, entries are not written when `sys.dont_write_bytecode` is set (e.g.
+`PYTHONDONTWRITEBYTECODE=1`).
+
+Unlike `__pycache__`, entries are never overwritten by newer versions of
+the same file, so the cache is pruned: the first store in each process
+deletes entries unused for `MAX_AGE_S`, and all but the `MAX_ENTRIES` most
+recently used. Loading an entry refreshes its modification time.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import marshal
+import os
+import pickle
+import sys
+import time
+from dataclasses import dataclass, fields
+from importlib.util import MAGIC_NUMBER
+from typing import TYPE_CHECKING
+
+from marimo import _loggers
+from marimo._dependencies.dependencies import DependencyManager
+from marimo._utils.platform import is_pyodide
+from marimo._version import __version__
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import CodeType
+
+    from marimo._ast.cell import SourcePosition
+    from marimo._ast.sql_visitor import SQLRef
+    from marimo._ast.visitor import Language, Name, VariableData
+    from marimo._types.ids import CellId_t
+
+LOGGER = _loggers.marimo_logger()
+
+# Entries are a few KB each
+MAX_ENTRIES = 20_000
+MAX_AGE_S = 30 * 24 * 60 * 60
+
+# Bumped when the layout of entries changes
+_FORMAT_VERSION = "2"
+
+_pruned = False
+
+
+@dataclass
+class CompiledCell:
+    """A cell's code objects and the analysis of its source."""
+
+    body: CodeType
+    last_expr: CodeType
+    defs: set[Name]
+    refs: set[Name]
+    sql_refs: dict[Name, SQLRef]
+    temporaries: set[Name]
+    closed_over_temporaries: set[Name]
+    variable_data: dict[Name, list[VariableData]]
+    deleted_refs: set[Name]
+    language: Language
+    is_import_block: bool
+    markdown: str | None
+
+
+def bytecode_cache_dir() -> Path:
+    from marimo._utils.xdg import marimo_cache_dir
+
+    return marimo_cache_dir() / "bytecode"
+
+
+@functools.cache
+def _sql_analysis_versions() -> str:
+    # SQL in cells is analyzed with duckdb, or sqlglot as a fallback
+    return repr(
+        (
+            DependencyManager.duckdb.get_version(),
+            DependencyManager.sqlglot.get_version(),
+        )
+    )
+
+
+def cache_key(
+    code: str,
+    cell_id: CellId_t,
+    filename: str,
+    source_position: SourcePosition | None,
+) -> str:
+    digest = hashlib.sha256()
+    for part in (
+        _FORMAT_VERSION,
+        MAGIC_NUMBER.hex(),
+        str(sys.flags.optimize),
+        __version__,
+        _sql_analysis_versions(),
+        cell_id,
+        filename,
+        repr(
+            (source_position.lineno, source_position.col_offset)
+            if source_position is not None
+            else None
+        ),
+        code,
+    ):
+        digest.update(part.encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _dumps(cell: CompiledCell) -> bytes:
+    # Code objects can't be pickled, only marshalled
+    code = marshal.dumps((cell.body, cell.last_expr))
+    analysis = {
+        field.name: getattr(cell, field.name)
+        for field in fields(cell)
+        if field.name not in ("body", "last_expr")
+    }
+    return pickle.dumps((code, analysis), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _loads(data: bytes) -> CompiledCell:
+    code, analysis = pickle.loads(data)
+    body, last_expr = marshal.loads(code)
+    return CompiledCell(body=body, last_expr=last_expr, **analysis)
+
+
+def load(key: str) -> CompiledCell | None:
+    """Return the cached compiled cell, if any."""
+    if is_pyodide():
+        return None
+    path = bytecode_cache_dir() / key
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    try:
+        cell = _loads(data)
+    except Exception as e:
+        # Corrupt or truncated entry; it is overwritten on the next store
+        LOGGER.debug("Ignoring bytecode cache entry %s: %s", key, e)
+        return None
+    try:
+        # Mark the entry as recently used, for `prune`
+        os.utime(path)
+    except OSError:
+        pass
+    return cell
+
+
+def store(key: str, cell: CompiledCell) -> None:
+    if is_pyodide() or sys.dont_write_bytecode:
+        return
+    directory = bytecode_cache_dir()
+    path = directory / key
+    tmp_path = directory / f"{key}.{os.getpid()}.tmp"
+    try:
+        data = _dumps(cell)
+    except Exception as e:
+        LOGGER.debug("Failed to serialize bytecode cache entry %s: %s", key, e)
+        return
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(data)
+        # Atomic, so concurrent processes never read a partial entry
+        os.replace(tmp_path, path)
+    except OSError as e:
+        LOGGER.debug("Failed to write bytecode cache entry %s: %s", key, e)
+        return
+
+    global _pruned
+    if not _pruned:
+        _pruned = True
+        prune(directory)
+
+
+def prune(
+    directory: Path,
+    max_entries: int = MAX_ENTRIES,
+    max_age_s: float = MAX_AGE_S,
+) -> None:
+    """Delete entries (and leftover temporary files) unused for
+    `max_age_s`, then all but the `max_entries` most recently used."""
+    cutoff = time.time() - max_age_s
+    entries: list[tuple[float, str]] = []
+    stale: list[str] = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                if mtime < cutoff:
+                    stale.append(entry.name)
+                elif not entry.name.endswith(".tmp"):
+                    entries.append((mtime, entry.name))
+    except OSError:
+        return
+    if len(entries) > max_entries:
+        entries.sort()
+        stale.extend(name for _, name in entries[: len(entries) - max_entries])
+    for name in stale:
+        try:
+            os.unlink(directory / name)
+        except OSError:
+            # Removed by a concurrent process
+            pass
@@ -34,8 +34,11 @@ from marimo._utils.marimo_path import MarimoPath
 from marimo._version import __version__
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
     from pathlib import Path
 
+    from marimo._ast.codegen_cache import CodegenCache
+
 from typing import TypeAlias
 
 Cls: TypeAlias = type
@@ -295,6 +298,43 @@ def to_functiondef(
     fn: Literal["cell"] = "cell",
     variable_data: dict[str, VariableData] | None = None,
 ) -> str:
+    refs, defs = _functiondef_arguments(
+        cell, allowed_refs, used_refs, variable_data
+    )
+    decorator = to_decorator(cell.config, fn=fn)
+    prefix = "" if not cell.is_coroutine() else "async "
+    signature = format_tuple_elements(f"{prefix}def {name}(...):", refs)
+
+    definition_body = [decorator, signature]
+    # Handle markdown cells with formatting
+    if cell.markdown:
+        definition_body.append(indent_text(format_markdown(cell)))
+    elif body := indent_text(cell.code):
+        definition_body.append(body)
+
+    returns = format_tuple_elements(
+        "return (...)",
+        defs,
+        indent=True,
+        allowed_naked=True,
+        # maybe consider "return Edges(...)"
+        # Such that the return type can simply be 'Edges'
+    )
+    # Add blank line before return for ruff compatibility when last statement
+    # is an import, function def, or class def
+    if _needs_trailing_blank_line(cell.mod, cell.code):
+        definition_body.append("")
+    definition_body.append(returns)
+    return "\n".join(definition_body)
+
+
+def _functiondef_arguments(
+    cell: CellImpl,
+    allowed_refs: set[Name] | None,
+    used_refs: set[Name] | None,
+    variable_data: dict[str, VariableData] | None,
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """The (possibly annotated) parameters and the returns of a cell."""
     # allowed refs are a combination of top level imports and unshadowed
     # builtins.
     # unshadowed builtins is the set of builtins that haven't been
@@ -351,32 +391,7 @@ def to_functiondef(
         )
         if used_refs is not None:
             defs = tuple(name for name in defs if name in used_refs)
-
-    decorator = to_decorator(cell.config, fn=fn)
-    prefix = "" if not cell.is_coroutine() else "async "
-    signature = format_tuple_elements(f"{prefix}def {name}(...):", refs)
-
-    definition_body = [decorator, signature]
-    # Handle markdown cells with formatting
-    if cell.markdown:
-        definition_body.append(indent_text(format_markdown(cell)))
-    elif body := indent_text(cell.code):
-        definition_body.append(body)
-
-    returns = format_tuple_elements(
-        "return (...)",
-        defs,
-        indent=True,
-        allowed_naked=True,
-        # maybe consider "return Edges(...)"
-        # Such that the return type can simply be 'Edges'
-    )
-    # Add blank line before return for ruff compatibility when last statement
-    # is an import, function def, or class def
-    if _needs_trailing_blank_line(cell.mod, cell.code):
-        definition_body.append("")
-    definition_body.append(returns)
-    return "\n".join(definition_body)
+    return refs, defs
 
 
 def to_top_functiondef(
@@ -462,10 +477,39 @@ def serialize_cell(
         raise ValueError("Unknown cell status, please report this issue.")
 
 
-def safe_serialize_cell(
+def _serialized_cell_key(
     extraction: TopLevelExtraction, status: TopLevelStatus
+) -> Hashable:
+    """Every input that `serialize_cell` output depends on."""
+    config = tuple(status.cell_config.asdict().items())
+    if status.is_unparsable:
+        return ("unparsable", status.code, status.name, config)
+    cell = status._cell
+    assert cell is not None
+    if status.is_cell:
+        refs, defs = _functiondef_arguments(
+            cell,
+            extraction.allowed_refs | cell.defs,
+            extraction.used_refs,
+            extraction.variables,
+        )
+        return ("cell", status.code, status.name, config, refs, defs)
+    # Toplevel definitions are rendered from their code and config only
+    return ("toplevel", status.code, status.name, config)
+
+
+def safe_serialize_cell(
+    extraction: TopLevelExtraction,
+    status: TopLevelStatus,
+    cache: CodegenCache | None = None,
 ) -> str:
     """Additional defensive layer- we should _never_ generate invalid code."""
+    if cache is not None:
+        return cache.fragment(
+            _serialized_cell_key(extraction, status),
+            lambda: safe_serialize_cell(extraction, status),
+        )
+
     code = serialize_cell(extraction, status)
     try:
         ast_parse(code)
@@ -494,7 +538,9 @@ def generate_app_constructor(config: _AppConfig | None) -> str:
     return format_tuple_elements("app = marimo.App(...)", kwargs)
 
 
-def generate_filecontents_from_ir(ir: NotebookSerializationV1) -> str:
+def generate_filecontents_from_ir(
+    ir: NotebookSerializationV1, cache: CodegenCache | None = None
+) -> str:
     # Markdown frontmatter may contain non-config metadata (e.g., author,
     # description). Suppress warnings for unrecognized keys from markdown.
     silent = (
@@ -518,6 +564,7 @@ def generate_filecontents_from_ir(ir: NotebookSerializationV1) -> str:
         cell_configs=[CellConfig.from_dict(cell.options) for cell in ir.cells],
         config=_AppConfig.from_untrusted_dict(ir.app.options, silent=silent),
         header_comments=header_comments,
+        cache=cache,
     )
 
 
@@ -557,8 +604,15 @@ def generate_filecontents(
     cell_configs: list[CellConfig],
     config: _AppConfig | None = None,
     header_comments: str | None = None,
+    cache: CodegenCache | None = None,
 ) -> str:
-    """Translates a sequences of codes (cells) to a Python file"""
+    """Translates a sequences of codes (cells) to a Python file
+
+    Pass the same `cache` across calls to only recompile and re-render the
+    cells that changed since the previous call.
+    """
+    if cache is not None:
+        cache.next_generation()
 
     # Normalize internal cell names. Empty names would emit ``def ():``
     # (invalid Python) and fall back to the unparsable-cell path;
@@ -571,9 +625,12 @@ def generate_filecontents(
     toplevel_defs: set[Name] = set()
     if setup_cell:
         toplevel_defs = set(setup_cell.defs)
-    extraction = TopLevelExtraction(codes, names, cell_configs, toplevel_defs)
+    extraction = TopLevelExtraction(
+        codes, names, cell_configs, toplevel_defs, cache=cache
+    )
     cell_blocks = [
-        safe_serialize_cell(extraction, status) for status in extraction
+        safe_serialize_cell(extraction, status, cache=cache)
+        for status in extraction
     ]
 
     filecontents = []
@@ -0,0 +1,93 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from marimo._ast.compiler import compile_cell
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from marimo._ast.cell import CellConfig, CellImpl
+    from marimo._types.ids import CellId_t
+
+V = TypeVar("V")
+
+
+class CodegenCache:
+    """Reuses per-cell work across calls to `generate_filecontents`.
+
+    Saving a notebook compiles every cell (to find its defs and refs) and
+    renders each one to a function definition. Between two saves of the
+    same notebook most cells are unchanged, so both results are cached:
+
+    - compiled cells, keyed by code;
+    - rendered cells, keyed by every input that affects the rendering
+      (code, name, config, and the cell's signature and returns).
+
+    Since keys cover all inputs, the generated file is byte-identical to
+    one generated without a cache. Entries are dropped once a generation
+    doesn't use them, so the cache stays proportional to the notebook's
+    size.
+
+    Not thread-safe; callers serialize access (e.g., `AppFileManager`
+    saves under a lock).
+    """
+
+    def __init__(self) -> None:
+        self._compiled: _Generations[CellImpl | SyntaxError] = _Generations()
+        self._fragments: _Generations[str] = _Generations()
+
+    def next_generation(self) -> None:
+        self._compiled.rotate()
+        self._fragments.rotate()
+
+    def compile_cell(
+        self, code: str, cell_id: CellId_t, config: CellConfig
+    ) -> CellImpl:
+        """Like `compile_cell(code, cell_id).configure(config)`."""
+        compiled = self._compiled.get(code)
+        if compiled is None:
+            try:
+                compiled = compile_cell(code, cell_id=cell_id)
+            except SyntaxError as e:
+                compiled = e
+            self._compiled.set(code, compiled)
+        if isinstance(compiled, SyntaxError):
+            raise compiled
+        # The config is mutable, so each caller gets its own
+        return dataclasses.replace(
+            compiled, cell_id=cell_id, config=type(config)()
+        ).configure(config)
+
+    def fragment(self, key: Hashable, render: Callable[[], str]) -> str:
+        fragment = self._fragments.get(key)
+        if fragment is None:
+            fragment = render()
+            self._fragments.set(key, fragment)
+        return fragment
+
+
+class _Generations(Generic[V]):
+    """Two-generation map: entries survive one unused generation."""
+
+    def __init__(self) -> None:
+        self._current: dict[Hashable, V] = {}
+        self._previous: dict[Hashable, V] = {}
+
+    def rotate(self) -> None:
+        self._previous = self._current
+        self._current = {}
+
+    def get(self, key: Hashable) -> V | None:
+        if key in self._current:
+            return self._current[key]
+        if key in self._previous:
+            value = self._previous.pop(key)
+            self._current[key] = value
+            return value
+        return None
+
+    def set(self, key: Hashable, value: V) -> None:
+        self._current[key] = value
@@ -17,7 +17,7 @@ from types import CodeType, FrameType
 from typing import TYPE_CHECKING, Any, TypeAlias, cast
 
 from marimo import _loggers
-from marimo._ast import parse
+from marimo._ast import bytecode_cache, parse
 from marimo._ast.cell import (
     Cell,
     CellImpl,
@@ -261,7 +261,16 @@ def compile_cell(
     carried_imports: list[ImportData] | None = None,
     test_rewrite: bool = False,
     filename: str | None = None,
+    use_bytecode_cache: bool = False,
 ) -> CellImpl:
+    """Compile a cell's code and analyze its definitions and references.
+
+    With `use_bytecode_cache`, the analysis and compiled code objects are
+    read from and written to the on-disk cache of compiled cells (see
+    `marimo._ast.bytecode_cache`); on a hit, the cell is only parsed. Use it
+    for code loaded from a notebook file, which is likely to be compiled
+    again by a later process; not for code being edited.
+    """
     if filename is not None and source_position is None:
         source_position = solve_source_position(
             code,
@@ -297,6 +306,29 @@ def compile_cell(
         )
 
     is_test = contains_only_tests(module)
+
+    if source_position:
+        filename = source_position.filename
+    else:
+        # store the cell's code in Python's linecache so debuggers can find it
+        filename = get_filename(cell_id)
+        # cache the entire cell's code, doesn't need to be done in source case
+        # since there is an actual file to read from.
+        cache(filename, code)
+
+    # Assertion rewriting depends on the installed pytest, so rewritten
+    # cells are not cached.
+    key = None
+    if use_bytecode_cache and not (is_test or test_rewrite):
+        key = bytecode_cache.cache_key(
+            code, cell_id, filename, source_position
+        )
+        cached = bytecode_cache.load(key)
+        if cached is not None:
+            return _make_cell_impl(
+                code, cell_id, module, cached, carried_imports, is_test
+            )
+
     is_import_block = all(
         isinstance(stmt, (ast.Import, ast.ImportFrom)) for stmt in module.body
     )
@@ -331,13 +363,6 @@ def compile_cell(
         # Modify the "source" position for meaningful stacktraces
         fix_source_position(module, source_position)
         fix_source_position(expr, source_position)
-        filename = source_position.filename
-    else:
-        # store the cell's code in Python's linecache so debuggers can find it
-        filename = get_filename(cell_id)
-        # cache the entire cell's code, doesn't need to be done in source case
-        # since there is an actual file to read from.
-        cache(filename, code)
 
     # pytest assertion rewriting, gives more context for assertion failures.
     if is_test or test_rewrite:
@@ -364,23 +389,51 @@ def compile_cell(
 
     nonlocals = {name for name in v.defs if not is_local(name)}
     temporaries = v.defs - nonlocals
-    variable_data = {
-        name: v.variable_data[name]
-        for name in nonlocals
-        if name in v.variable_data
-    }
     # Temporaries that closures depend on (transitively) must be retained even
     # though they would otherwise be deleted after the cell runs. We use the
     # unfiltered `v.variable_data` here so that references reachable only
     # through private (temporary) closures are still found.
     closed_over_temporaries = get_closure_refs(v.variable_data) & temporaries
 
+    compiled = bytecode_cache.CompiledCell(
+        body=body,
+        last_expr=last_expr,
+        defs=nonlocals,
+        refs=v.refs,
+        sql_refs=v.sql_refs,
+        temporaries=temporaries,
+        closed_over_temporaries=closed_over_temporaries,
+        variable_data={
+            name: v.variable_data[name]
+            for name in nonlocals
+            if name in v.variable_data
+        },
+        deleted_refs=v.deleted_refs,
+        language=v.language,
+        is_import_block=is_import_block,
+        markdown=_extract_markdown(original_module),
+    )
+    if key is not None:
+        bytecode_cache.store(key, compiled)
+    return _make_cell_impl(
+        code, cell_id, original_module, compiled, carried_imports, is_test
+    )
+
+
+def _make_cell_impl(
+    code: str,
+    cell_id: CellId_t,
+    mod: ast.Module,
+    compiled: bytecode_cache.CompiledCell,
+    carried_imports: list[ImportData] | None,
+    is_test: bool,
+) -> CellImpl:
     # If this cell is an import cell, we carry over any imports in
     # `carried_imports` that are also in this cell to the import workspace's
     # definitions.
     imported_defs: set[Name] = set()
-    if is_import_block and carried_imports is not None:
-        for data in variable_data.values():
+    if compiled.is_import_block and carried_imports is not None:
+        for data in compiled.variable_data.values():
             for datum in data:
                 import_data = datum.import_data
                 if import_data is None:
@@ -389,29 +442,27 @@ def compile_cell(
                     if previous_import_data == import_data:
                         imported_defs.add(import_data.definition)
 
-    maybe_md = _extract_markdown(original_module)
-
     return CellImpl(
         # keyed by original (user) code, for cache lookups
         key=code_key(code),
         code=code,
-        mod=original_module,
-        defs=nonlocals,
-        refs=v.refs,
-        sql_refs=v.sql_refs,
-        temporaries=temporaries,
-        closed_over_temporaries=closed_over_temporaries,
-        variable_data=variable_data,
+        mod=mod,
+        defs=compiled.defs,
+        refs=compiled.refs,
+        sql_refs=compiled.sql_refs,
+        temporaries=compiled.temporaries,
+        closed_over_temporaries=compiled.closed_over_temporaries,
+        variable_data=compiled.variable_data,
         import_workspace=ImportWorkspace(
-            is_import_block=is_import_block,
+            is_import_block=compiled.is_import_block,
             imported_defs=imported_defs,
         ),
-        deleted_refs=v.deleted_refs,
-        language=v.language,
-        body=body,
-        last_expr=last_expr,
+        deleted_refs=compiled.deleted_refs,
+        language=compiled.language,
+        body=compiled.body,
+        last_expr=compiled.last_expr,
         cell_id=cell_id,
-        markdown=maybe_md,
+        markdown=compiled.markdown,
         _test=is_test,
     )
 
@@ -546,6 +597,7 @@ def context_cell_factory(
             cell_id=cell_id,
             source_position=source_position,
             test_rewrite=False,
+            use_bytecode_cache=True,
         ),
     )
 
@@ -590,6 +642,7 @@ def toplevel_cell_factory(
         cell_id=cell_id,
         source_position=source_position,
         test_rewrite=test_rewrite,
+        use_bytecode_cache=True,
     )
     if isinstance(obj, Cls):
         is_test = obj.__name__.startswith("Test")
@@ -627,6 +680,7 @@ def ir_cell_factory(
             cell_def.code,
             cell_id=cell_id,
             source_position=source_position,
+            use_bytecode_cache=True,
         ),
     )
 
@@ -662,6 +716,7 @@ def cell_factory(
         cell_id=cell_id,
         source_position=source_position,
         test_rewrite=test_rewrite,
+        use_bytecode_cache=True,
     )
     return Cell(
         _name=f.__name__,
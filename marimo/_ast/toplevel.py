@@ -24,6 +24,8 @@ from marimo._types.ids import CellId_t
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    from marimo._ast.codegen_cache import CodegenCache
+
 # Constant for easy reuse in tests.
 # The formatting here affects how the error is rendered in the frontend.
 # This is a hack but fine for now ...
@@ -90,6 +92,7 @@ class TopLevelStatus:
         name: Name,
         cell_config: CellConfig,
         allowed_refs: set[Name],
+        cache: CodegenCache | None = None,
     ):
         self.cell_id = cell_id
         self.name = name
@@ -101,6 +104,7 @@ class TopLevelStatus:
 
         self.code = code
         self.cell_config = cell_config
+        self._cache = cache
 
         self.update(allowed_refs)
 
@@ -126,9 +130,14 @@ class TopLevelStatus:
 
         if self._cell is None:
             try:
-                self._cell = compile_cell(
-                    self.code, cell_id=self.cell_id
-                ).configure(self.cell_config)
+                if self._cache is not None:
+                    self._cell = self._cache.compile_cell(
+                        self.code, self.cell_id, self.cell_config
+                    )
+                else:
+                    self._cell = compile_cell(
+                        self.code, cell_id=self.cell_id
+                    ).configure(self.cell_config)
             except SyntaxError:
                 # Keep default
                 self.type = TopLevelType.UNPARSABLE
@@ -237,6 +246,7 @@ class TopLevelExtraction:
         names: list[str],
         cell_configs: list[CellConfig],
         toplevel_defs: set[Name],
+        cache: CodegenCache | None = None,
     ):
         self.statuses: list[TopLevelStatus] = []
 
@@ -264,7 +274,12 @@ class TopLevelExtraction:
             zip(codes, names, cell_configs, strict=False)
         ):
             status = TopLevelStatus(
-                CellId_t(str(idx)), code, name, config, self.allowed_refs
+                CellId_t(str(idx)),
+                code,
+                name,
+                config,
+                self.allowed_refs,
+                cache=cache,
             )
             self._statuses[status.type][status.name] = status
 
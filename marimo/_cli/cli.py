@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import atexit
+import functools
 import json
 import os
 import shutil
@@ -47,7 +48,7 @@ from marimo._lint import run_check
 from marimo._mcp.setup import McpType
 from marimo._server.files.directory_scanner import DirectoryScanner
 from marimo._server.models.home import MarimoFile
-from marimo._server.start import start
+from marimo._server.start import start, start_workers
 from marimo._server.workspace import (
     DirectoryWorkspace,
     EmptyWorkspace,
@@ -437,6 +438,12 @@ class _OptionalValueOption(click.Option):
     type=int,
     help="Seconds to wait before closing a session on websocket disconnect. If None is provided, sessions are not automatically closed.",
 )
+@click.option(
+    "--hibernate-ttl",
+    default=None,
+    type=int,
+    help="Seconds a session can go without a connected client before its kernel is checkpointed to disk and stopped, freeing its memory. The kernel is restored when a client reconnects. If None is provided, kernels don't hibernate.",
+)
 @click.argument(
     "name",
     required=False,
@@ -467,6 +474,7 @@ def edit(
     asset_url: str | None,
     timeout: float | None,
     session_ttl: int | None,
+    hibernate_ttl: int | None,
     name: str | None,
     args: tuple[str, ...],
 ) -> None:
@@ -618,6 +626,7 @@ def edit(
         timeout=timeout,
         sandbox_mode=sandbox_mode,
         startup_tip=choose_startup_tip(click.get_current_context()),
+        hibernate_ttl_seconds=hibernate_ttl,
     )
 
 
@@ -1114,6 +1123,15 @@ Example:
     type=bool,
     help="Show detailed error tracebacks in a modal when exceptions occur.",
 )
+@click.option(
+    "--workers",
+    default=1,
+    type=click.IntRange(min=1),
+    help=(
+        "Number of server processes. Each session is pinned to one worker, "
+        "so apps with many concurrent users aren't limited to one core."
+    ),
+)
 @click.pass_context
 @click.argument(
     "name",
@@ -1144,6 +1162,7 @@ def run(
     asset_url: str | None,
     execute_opengraph_generators: bool,
     show_tracebacks: bool | None,
+    workers: int,
     name: str,
     args: tuple[str, ...],
 ) -> None:
@@ -1260,7 +1279,8 @@ def run(
 
     base_url = validators.check_proxy_base_url(proxy, base_url)
 
-    start(
+    start_server = functools.partial(
+        start,
         workspace=workspace,
         development_mode=GLOBAL_SETTINGS.DEVELOPMENT_MODE,
         quiet=GLOBAL_SETTINGS.QUIET,
@@ -1290,6 +1310,10 @@ def run(
         show_tracebacks=show_tracebacks,
         execute_opengraph_generators=execute_opengraph_generators,
     )
+    if workers > 1:
+        start_workers(start_server, workers=workers)
+    else:
+        start_server()
 
 
 @main.command(
@@ -1547,6 +1571,23 @@ def shell_completion() -> None:
         "e.g. --ignore MF004,MF007"
     ),
 )
+@click.option(
+    "-j",
+    "--jobs",
+    default=1,
+    type=click.IntRange(min=0),
+    help=(
+        "Number of worker processes to check files with. "
+        "Use 0 for one per CPU."
+    ),
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    type=bool,
+    help="Re-check all files instead of reusing results for unchanged files.",
+)
 @click.argument("files", nargs=-1, type=click.UNPROCESSED)
 def check(
     fix: bool,
@@ -1557,6 +1598,8 @@ def check(
     formatter: str,
     select_rules: str | None,
     ignore_rules: str | None,
+    jobs: int,
+    no_cache: bool,
     files: tuple[str, ...],
 ) -> None:
     if not files:
@@ -1577,6 +1620,8 @@ def check(
         ignore_scripts=ignore_scripts,
         formatter=formatter,
         lint_config=lint_config,
+        jobs=jobs,
+        cache=not no_cache,
     )
 
     if formatter == "json":
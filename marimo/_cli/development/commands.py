@@ -314,16 +314,22 @@ def _generate_server_api_schema() -> dict[str, Any]:
         notifications.VariableValue,
         notifications.VariablesNotification,
         notifications.VariableValuesNotification,
+        notifications.VariableMemory,
+        notifications.MemorySample,
+        notifications.MemoryUsageNotification,
         notifications.DatasetsNotification,
         notifications.DataColumnPreviewNotification,
         notifications.SQLTablePreviewNotification,
         notifications.SQLTableListPreviewNotification,
         notifications.SQLSchemaListPreviewNotification,
         notifications.DataSourceConnectionsNotification,
+        notifications.DataSourceTablesNotification,
         notifications.StorageNamespacesNotification,
         notifications.SecretKeysResultNotification,
         notifications.CacheClearedNotification,
         notifications.CacheInfoNotification,
+        notifications.CellProfileSpan,
+        notifications.CellProfileNotification,
         notifications.QueryParamsSetNotification,
         notifications.QueryParamsAppendNotification,
         notifications.QueryParamsDeleteNotification,
@@ -360,6 +366,7 @@ def _generate_server_api_schema() -> dict[str, Any]:
         export.ExportAsIPYNBRequest,
         export.ExportAsPDFRequest,
         export.ExportAvailabilityResponse,
+        export.ExportProfileRequest,
         export.InstallExportRequirementsRequest,
         export.UpdateCellOutputsRequest,
         files.FileCreateMultipartRequest,
@@ -408,6 +415,7 @@ def _generate_server_api_schema() -> dict[str, Any]:
         commands.ExecuteStaleCellsCommand,
         commands.ExecuteCellCommand,
         commands.GetCacheInfoCommand,
+        commands.GetMemoryUsageCommand,
         commands.HTTPRequest,
         commands.InstallPackagesCommand,
         commands.InvokeFunctionCommand,
@@ -418,6 +426,7 @@ def _generate_server_api_schema() -> dict[str, Any]:
         commands.ModelMessage,
         commands.PreviewDatasetColumnCommand,
         commands.PreviewSQLTableCommand,
+        commands.PreviewVariablesCommand,
         commands.RenameNotebookCommand,
         commands.StopKernelCommand,
         commands.UpdateCellConfigCommand,
@@ -435,6 +444,7 @@ def _generate_server_api_schema() -> dict[str, Any]:
         models.FormatCellsRequest,
         models.FormatResponse,
         models.GetCacheInfoRequest,
+        models.GetMemoryUsageRequest,
         models.InstallPackagesRequest,
         session_requests.InstantiateNotebookRequest,
         models.InvokeAiToolRequest,
@@ -449,6 +459,7 @@ def _generate_server_api_schema() -> dict[str, Any]:
         models.MCPStatusResponse,
         models.PreviewDatasetColumnRequest,
         models.PreviewSQLTableRequest,
+        models.PreviewVariablesRequest,
         models.SetBreakpointsRequest,
         models.StorageListEntriesRequest,
         models.StorageDownloadRequest,
@@ -463,6 +474,7 @@ def _generate_server_api_schema() -> dict[str, Any]:
         models.SuccessResponse,
         models.UpdateCellConfigRequest,
         models.NotebookDocumentTransactionRequest,
+        models.NotebookDocumentTransactionResponse,
         models.FocusCellRequest,
         session_requests.UpdateUIElementValuesRequest,
         models.UpdateUIElementRequest,
@@ -37,6 +37,7 @@ from marimo._export.file import (
     export_ipynb,
     export_markdown,
     export_pdf,
+    export_profile,
     export_script,
     export_wasm,
     notebook_uses_slides_layout,
@@ -62,6 +63,7 @@ from marimo._export.requests import (
     MarkdownFileExportRequest,
     NotebookExecutionOptions,
     PDFFileExportRequest,
+    ProfileFileExportRequest,
     ScriptFileExportRequest,
     WASMFileExportRequest,
 )
@@ -75,6 +77,7 @@ from marimo._schemas.export_options import (
     PDFExportOptions,
     PDFRasterizationOptions,
     PDFRasterServer,
+    ProfileFormat,
     WASMExportOptions,
     WASMMode,
 )
@@ -153,6 +156,9 @@ def watch_and_export(
         )
 
     def write_result(result: ExportResult) -> None:
+        if result.output_path is not None:
+            # Already streamed to the output file
+            return
         if output:
             # Make dirs if needed
             maybe_make_dirs(output)
@@ -236,6 +242,11 @@ Example:
 Optionally pass CLI args to the notebook:
 
     marimo export html notebook.py -o notebook.html -- -arg1 foo -arg2 bar
+
+Write images, audio, and other files next to the HTML instead of
+inlining them:
+
+    marimo export html notebook.py -o site/index.html --assets-dir site/assets
 """,
 )
 @click.option(
@@ -244,6 +255,17 @@ Optionally pass CLI args to the notebook:
     type=bool,
     help="Include notebook code in the exported HTML file.",
 )
+@click.option(
+    "--assets-dir",
+    type=click.Path(path_type=Path, file_okay=False),
+    default=None,
+    help=(
+        "Write files that outputs reference (images, audio, video, widget "
+        "code) to this directory and link to them by relative URL, instead "
+        "of inlining them in the HTML. Requires --output. The HTML must be "
+        "shared together with the directory."
+    ),
+)
 @click.option(
     "--watch/--no-watch",
     default=False,
@@ -283,6 +305,7 @@ Optionally pass CLI args to the notebook:
 def html(
     name: str,
     include_code: bool,
+    assets_dir: Path | None,
     output: Path,
     watch: bool,
     sandbox: bool | None,
@@ -290,6 +313,12 @@ def html(
     args: tuple[str],
 ) -> None:
     """Run a notebook and export it as an HTML file."""
+    if assets_dir is not None and not output:
+        raise click.UsageError(
+            "Cannot use --assets-dir without providing "
+            + "an output file with --output."
+        )
+
     # Set default, if not provided
     if sandbox is None:
         sandbox = maybe_prompt_run_in_sandbox(name)
@@ -314,6 +343,8 @@ def html(
                         argv=list(args),
                         stderr=STDERR,
                     ),
+                    output=output,
+                    assets_dir=assets_dir,
                 )
             )
         )
@@ -323,6 +354,98 @@ def html(
     )
 
 
+@click.command(
+    cls=ColoredCommand,
+    help="""Run a notebook with the profiler on and export its profile.
+
+The default format is a Chrome trace of every cell's run, broken down
+into user code, runtime hooks, and output formatting; open it in
+https://ui.perfetto.dev or chrome://tracing. The `folded` format emits
+sampled call stacks per cell, for flamegraph.pl or speedscope.
+
+Example:
+
+    marimo export profile notebook.py -o notebook.trace.json
+
+    marimo export profile notebook.py --format folded -o notebook.folded.txt
+""",
+)
+@click.option(
+    "--format",
+    "profile_format",
+    type=click.Choice(get_args(ProfileFormat)),
+    default="chrome-trace",
+    show_default=True,
+    help="Profile format to export.",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(path_type=Path),
+    default=None,
+    help=(
+        "Output file to save the profile to. "
+        "If not provided, the profile will be printed to stdout."
+    ),
+)
+@click.option(
+    "--sandbox/--no-sandbox",
+    is_flag=True,
+    default=None,
+    type=bool,
+    help=_sandbox_message,
+)
+@click.option(
+    "-f",
+    "--force",
+    is_flag=True,
+    default=False,
+    help="Force overwrite of the output file if it already exists.",
+)
+@click.argument(
+    "name",
+    required=True,
+    type=click.Path(exists=True, file_okay=True, dir_okay=False),
+)
+@click.argument("args", nargs=-1, type=click.UNPROCESSED)
+def profile(
+    name: str,
+    profile_format: ProfileFormat,
+    output: Path,
+    sandbox: bool | None,
+    force: bool,
+    args: tuple[str],
+) -> None:
+    """Run a notebook with the profiler on and export its profile."""
+    if sandbox is None:
+        sandbox = maybe_prompt_run_in_sandbox(name)
+
+    if sandbox:
+        run_in_sandbox(sys.argv[1:], name=name)
+        return
+
+    cli_args = parse_args(args)
+
+    def export_callback(file_path: MarimoPath) -> ExportResult:
+        return asyncio_run(
+            export_profile(
+                ProfileFileExportRequest(
+                    path=file_path,
+                    format=profile_format,
+                    execution=NotebookExecutionOptions(
+                        cli_args=cli_args,
+                        argv=list(args),
+                        stderr=STDERR,
+                    ),
+                )
+            )
+        )
+
+    return watch_and_export(
+        MarimoPath(name), output, False, export_callback, force
+    )
+
+
 @click.command(
     cls=ColoredCommand,
     help="""
@@ -1200,3 +1323,4 @@ export.add_command(pdf)
 export.add_command(html_wasm)
 export.add_command(thumbnail)
 export.add_command(session)
+export.add_command(profile)
@@ -123,7 +123,9 @@ class VenvConfig(TypedDict, total=False):
 WidthType = Literal["normal", "compact", "medium", "full", "columns"]
 Theme = Literal["light", "dark", "system"]
 ExportType = Literal["html", "markdown", "ipynb"]
-SqlOutputType = Literal["polars", "lazy-polars", "pandas", "native", "auto"]
+SqlOutputType = Literal[
+    "polars", "lazy-polars", "pandas", "native", "duckdb-table", "auto"
+]
 StoreKey = Literal["file", "redis", "rest", "tiered"]
 
 
@@ -165,8 +167,8 @@ class RuntimeConfig(TypedDict):
         If the file does not exist, it will be silently ignored.
         The default is `[".env"]` if a pyproject.toml is found, otherwise `[]`.
     - `default_sql_output`: the default output format for SQL queries. Can be one of:
-        `"auto"`, `"native"`, `"polars"`, `"lazy-polars"`, or `"pandas"`.
-        The default is `"auto"`.
+        `"auto"`, `"native"`, `"duckdb-table"`, `"polars"`, `"lazy-polars"`,
+        or `"pandas"`. The default is `"auto"`.
     - `default_auto_download`: an Optional list of export types to automatically snapshot your notebook as:
        `html`, `markdown`, `ipynb`.
        The default is None.
@@ -641,6 +643,10 @@ class ExperimentalConfig(TypedDict, total=False):
     isolate_apps: bool
     debugger: bool  # Live frame-watching debugger (gutter breakpoints + pdb)
     line_timing: bool  # Active-line highlight + per-line timer (sys.settrace)
+    profiler: bool  # Per-cell profiles (phase timings + sampled stacks)
+    image_virtual_files: bool  # Serve matplotlib figures by URL, not inline
+    background_output_formatting: bool  # Format outputs off the kernel thread
+    spill_globals: bool  # Write large globals no cell needs to disk
 
     # Internal features
     execution_type: ExecutionType
@@ -39,6 +39,9 @@ class GlobalSettings:
     # boundary -- exported HTML still embeds source and endpoints still serve
     # code. Pair with network egress filtering for defence-in-depth.
     RESTRICT_SHARING: bool = is_env_true("MARIMO_RESTRICT_SHARING")
+    # Id of this process within a `marimo run --workers` pool; None when
+    # the server runs in a single process.
+    WORKER_ID: int | None = None
 
 
 GLOBAL_SETTINGS = GlobalSettings()
@@ -348,6 +348,50 @@ def replace_virtual_files_with_data_uris(
     return processed_html, replaced_files
 
 
+def replace_virtual_files_with_urls(
+    html: str,
+    url_for: Callable[[int, str], str | None],
+    allowed_tags: set[str],
+    allowed_attributes: set[str] | None = None,
+) -> tuple[str, set[str]]:
+    """Replace virtual file URLs in HTML with URLs computed by `url_for`.
+
+    Args:
+        html: The HTML string to process
+        url_for: Function that takes a virtual file's byte length and
+            filename and returns the URL to reference it by, or None to
+            keep the original
+        allowed_tags: Set of HTML tag names to process
+        allowed_attributes: Set of attribute names to process. Defaults to
+            {"src", "href", "data"}
+
+    Returns:
+        Tuple of (processed_html, replaced_files), as for
+        `replace_virtual_files_with_data_uris`
+    """
+    if allowed_attributes is None:
+        allowed_attributes = {"src", "href", "data"}
+
+    replaced_files: set[str] = set()
+
+    def replacer(value: str) -> str | None:
+        parsed = _parse_virtual_file_url(value)
+        if parsed is None:
+            return None
+        result = url_for(*parsed)
+        if result is not None:
+            replaced_files.add(value)
+        return result
+
+    processed_html = replace_html_attributes(
+        html=html,
+        allowed_tags=allowed_tags,
+        allowed_attributes=allowed_attributes,
+        replacer_fn=replacer,
+    )
+    return processed_html, replaced_files
+
+
 # Public folder file pattern: public/{path} or ./public/{path}
 _PUBLIC_FILE_PATTERN = re.compile(r"^(?:\./)?public/(.+)$")
 
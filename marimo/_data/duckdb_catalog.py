@@ -0,0 +1,216 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Incremental introspection of the internal DuckDB catalog.
+
+After a SQL cell runs DDL, the kernel used to re-introspect every table of
+every attached database. `DuckDBCatalog` remembers which schemas existed
+when the frontend last received the full catalog, so that a statement like
+`CREATE TABLE sales.orders ...` only re-lists the tables of `sales`.
+Anything that may have added, removed, or renamed a schema or database
+falls back to a full refresh.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from marimo._data.get_datasets import execute_duckdb_query
+from marimo._dependencies.dependencies import DependencyManager
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import duckdb
+
+    from marimo._data.models import Database
+
+# (database, schema)
+SchemaKey = tuple[str, str]
+
+# Where DuckDB keeps temporary tables and views.
+_TEMP_SCHEMA: SchemaKey = ("temp", "main")
+
+# Object kinds whose DDL only changes the table list of their own schema.
+_TABLE_KINDS = frozenset({"TABLE", "VIEW"})
+# Object kinds that don't appear in the catalog shown to the user.
+_UNLISTED_KINDS = frozenset(
+    {"INDEX", "SEQUENCE", "MACRO", "FUNCTION", "TYPE", "SECRET"}
+)
+
+
+@dataclass(frozen=True)
+class TableTarget:
+    """The table or view a DDL statement changed, as written.
+
+    Unqualified parts are None; `temporary` marks `CREATE TEMP ...`.
+    """
+
+    name: str
+    schema: str | None = None
+    database: str | None = None
+    temporary: bool = False
+
+
+def get_ddl_table_targets(query: str) -> list[TableTarget] | None:
+    """Find the tables and views whose definitions `query` changes.
+
+    Returns None when the query may change the catalog in some other way
+    (attaching a database, creating a schema, or any statement that can't
+    be parsed), in which case the whole catalog needs to be refreshed.
+    """
+    if not DependencyManager.sqlglot.has():
+        return None
+
+    import sqlglot
+    from sqlglot import exp
+
+    try:
+        statements = sqlglot.parse(query, dialect="duckdb")
+    except Exception:
+        return None
+
+    targets: list[TableTarget] = []
+    for statement in statements:
+        if statement is None:
+            continue
+        if isinstance(
+            statement, (exp.Query, exp.Insert, exp.Update, exp.Delete)
+        ):
+            # Changes data, not the catalog
+            continue
+        if not isinstance(statement, (exp.Create, exp.Drop, exp.Alter)):
+            return None
+
+        kind = str(statement.args.get("kind") or "").upper()
+        if kind in _UNLISTED_KINDS:
+            continue
+        if kind not in _TABLE_KINDS:
+            return None
+
+        temporary = (
+            isinstance(statement, exp.Create)
+            and statement.find(exp.TemporaryProperty) is not None
+        )
+        # `DROP TABLE a, b` lists several tables; other statements name
+        # their target first (e.g. before the body of a CREATE ... AS).
+        if isinstance(statement, exp.Drop):
+            tables = list(statement.find_all(exp.Table))
+        else:
+            target = statement.find(exp.Table)
+            if target is None:
+                return None
+            tables = [target]
+        for table in tables:
+            if not table.name:
+                return None
+            targets.append(
+                TableTarget(
+                    name=table.name,
+                    schema=table.db or None,
+                    database=table.catalog or None,
+                    temporary=temporary,
+                )
+            )
+    return targets
+
+
+class DuckDBCatalog:
+    """The shape of a DuckDB catalog as last sent to the frontend.
+
+    Tracks every schema in the catalog (its "version": if the set of
+    schemas changes, so does the tree shown to the user) and the schemas
+    that were listed with their tables. Owned by the kernel; one instance
+    per connection.
+    """
+
+    def __init__(
+        self, connection: duckdb.DuckDBPyConnection | None = None
+    ) -> None:
+        self._connection = connection
+        self._schemas: frozenset[SchemaKey] | None = None
+        self._listed: set[SchemaKey] = set()
+
+    def record_full_refresh(self, databases: Iterable[Database]) -> None:
+        """Record the catalog after it was introspected in full."""
+        self._schemas = self._get_schemas()
+        self._listed = {
+            (database.name, schema.name)
+            for database in databases
+            for schema in database.schemas
+        }
+
+    def invalidate(self) -> None:
+        self._schemas = None
+        self._listed = set()
+
+    def schemas_to_refresh(self, sqls: Iterable[str]) -> set[SchemaKey] | None:
+        """Schemas whose table lists `sqls` may have changed.
+
+        Returns None if a full refresh is needed: the catalog was never
+        introspected, its set of schemas changed, or a statement touches a
+        schema that isn't listed yet.
+        """
+        if self._schemas is None:
+            return None
+
+        targets: list[TableTarget] = []
+        for sql in sqls:
+            sql_targets = get_ddl_table_targets(sql)
+            if sql_targets is None:
+                return None
+            targets.extend(sql_targets)
+
+        if self._get_schemas() != self._schemas:
+            return None
+
+        current = self._get_current_schema()
+        if current is None:
+            return None
+
+        to_refresh: set[SchemaKey] = set()
+        for target in targets:
+            key = self._resolve(target, current)
+            if key is None or key not in self._listed:
+                return None
+            to_refresh.add(key)
+            # Unqualified names are looked up in temporary tables first.
+            if target.database is None and target.schema is None:
+                if _TEMP_SCHEMA in self._listed:
+                    to_refresh.add(_TEMP_SCHEMA)
+        return to_refresh
+
+    def _resolve(
+        self, target: TableTarget, current: SchemaKey
+    ) -> SchemaKey | None:
+        """Resolve a table name to its schema, as DuckDB would."""
+        assert self._schemas is not None
+        current_database, current_schema = current
+        if target.temporary:
+            return _TEMP_SCHEMA
+        if target.database is not None and target.schema is not None:
+            return (target.database, target.schema)
+        if target.schema is not None:
+            # `a.t` is schema `a` of the current database if there is one,
+            # else the default schema of database `a`.
+            if (current_database, target.schema) in self._schemas:
+                return (current_database, target.schema)
+            if (target.schema, "main") in self._schemas:
+                return (target.schema, "main")
+            return None
+        return (current_database, current_schema)
+
+    def _get_schemas(self) -> frozenset[SchemaKey]:
+        rows = execute_duckdb_query(
+            self._connection,
+            "SELECT database_name, schema_name FROM duckdb_schemas()",
+        )
+        return frozenset((str(row[0]), str(row[1])) for row in rows)
+
+    def _get_current_schema(self) -> SchemaKey | None:
+        rows = execute_duckdb_query(
+            self._connection,
+            "SELECT current_database(), current_schema()",
+        )
+        if not rows or rows[0][0] is None or rows[0][1] is None:
+            return None
+        return (str(rows[0][0]), str(rows[0][1]))
@@ -12,7 +12,7 @@ from marimo._data.models import (
     Schema,
 )
 from marimo._dependencies.dependencies import DependencyManager
-from marimo._plugins.ui._impl.tables.utils import get_table_manager_or_none
+from marimo._sql.result_table import is_result_table_name
 from marimo._types.ids import VariableName
 
 LOGGER = _loggers.marimo_logger()
@@ -36,6 +36,11 @@ def get_datasets_from_variables(
 def _get_data_table(
     value: object, variable_name: VariableName
 ) -> DataTable | None:
+    # Imported here: the table managers import the whole `ui` package
+    from marimo._plugins.ui._impl.tables.utils import (
+        get_table_manager_or_none,
+    )
+
     try:
         table = get_table_manager_or_none(value)
         if table is None:
@@ -84,6 +89,8 @@ _STATEMENT_TYPES = frozenset(
         # This may catch some false positives for other CREATE statements
         "CREATE_STATEMENT",
         "CREATE",
+        "DROP_STATEMENT",
+        "DROP",
     }
 )
 
@@ -104,16 +111,18 @@ def has_updates_to_datasource(query: str) -> bool:
 
 
 def execute_duckdb_query(
-    connection: duckdb.DuckDBPyConnection | None, query: str
+    connection: duckdb.DuckDBPyConnection | None,
+    query: str,
+    params: list[Any] | dict[str, Any] | None = None,
 ) -> list[Any]:
     """Execute a DuckDB query and return the result. Uses connection if provided, otherwise uses duckdb."""
     try:
         if connection is None:
             import duckdb
 
-            return duckdb.execute(query).fetchall()
+            return duckdb.execute(query, params).fetchall()
 
-        return connection.execute(query).fetchall()
+        return connection.execute(query, params).fetchall()
     except Exception as e:
         if DependencyManager.duckdb.has():
             import duckdb
@@ -214,7 +223,7 @@ def _get_databases_from_duckdb_internal(
         column_types,
         *_rest,
     ) in tables_result:
-        if name in _SKIP_TABLES:
+        if name in _SKIP_TABLES or is_result_table_name(name):
             continue
 
         assert len(column_names) == len(column_types)
@@ -338,23 +347,19 @@ def form_databases_from_dict(
     return databases
 
 
-def get_duckdb_databases_agg_query(
-    connection: duckdb.DuckDBPyConnection | None,
-    engine_name: VariableName | None,
-) -> list[Database]:
-    """Uses a different query to get database information, which has wider support but has some aggregation overhead"""
+# Cols will be in the form of [{"col": "column_name", "dtype": "data_type"}]
+_AGG_NAME_KEY = "col"
+_AGG_DTYPE_KEY = "dtype"
 
-    # Cols will be in the form of [{"col": "column_name", "dtype": "data_type"}]
-    NAME_KEY = "col"
-    DTYPE_KEY = "dtype"
 
-    QUERY = f"""
+def _duckdb_columns_agg_query(where: str = "") -> str:
+    return f"""
     SELECT
         database_name,
         schema_name,
         table_name,
         ARRAY_AGG(
-            struct_pack({NAME_KEY} := column_name, {DTYPE_KEY} := data_type)
+            struct_pack({_AGG_NAME_KEY} := column_name, {_AGG_DTYPE_KEY} := data_type)
             ORDER BY
                 column_index
         ) AS cols
@@ -363,6 +368,7 @@ def get_duckdb_databases_agg_query(
     WHERE
         internal = false
         AND table_name NOT IN ('duckdb_functions()', 'duckdb_types()', 'duckdb_settings()')
+        {where}
     GROUP BY
         database_name,
         schema_name,
@@ -370,7 +376,52 @@ def get_duckdb_databases_agg_query(
     ORDER BY database_name, schema_name, table_name
     """
 
-    tables_result = execute_duckdb_query(connection, QUERY)
+
+def _agg_row_to_data_table(
+    database_name: str,
+    table_name: str,
+    cols: object,
+    engine_name: VariableName | None,
+) -> DataTable:
+    columns: list[DataTableColumn] = []
+    assert isinstance(cols, list)
+    for col in cols:
+        assert isinstance(col, dict)
+        assert _AGG_NAME_KEY in col
+        assert _AGG_DTYPE_KEY in col
+        dtype = col[_AGG_DTYPE_KEY]
+        columns.append(
+            DataTableColumn(
+                name=col[_AGG_NAME_KEY],
+                type=_db_type_to_data_type(dtype),
+                external_type=dtype,
+                sample_values=[],
+            )
+        )
+
+    return DataTable(
+        name=table_name,
+        columns=columns,
+        source_type="duckdb" if engine_name is None else "connection",
+        source=database_name,
+        num_rows=None,
+        num_columns=len(columns),
+        variable_name=None,
+        engine=engine_name,
+        type="table",
+        primary_keys=None,
+        indexes=None,
+    )
+
+
+def get_duckdb_databases_agg_query(
+    connection: duckdb.DuckDBPyConnection | None,
+    engine_name: VariableName | None,
+) -> list[Database]:
+    """Uses a different query to get database information, which has wider support but has some aggregation overhead"""
+    tables_result = execute_duckdb_query(
+        connection, _duckdb_columns_agg_query()
+    )
     if len(tables_result) == 0:
         return _get_empty_databases(connection, engine_name)
 
@@ -384,34 +435,8 @@ def get_duckdb_databases_agg_query(
         table_name,
         cols,
     ) in tables_result:
-        columns: list[DataTableColumn] = []
-        assert isinstance(cols, list)
-        for col in cols:
-            assert isinstance(col, dict)
-            assert NAME_KEY in col
-            assert DTYPE_KEY in col
-            dtype = col[DTYPE_KEY]
-            columns.append(
-                DataTableColumn(
-                    name=col[NAME_KEY],
-                    type=_db_type_to_data_type(dtype),
-                    external_type=dtype,
-                    sample_values=[],
-                )
-            )
-
-        table = DataTable(
-            name=table_name,
-            columns=columns,
-            source_type="duckdb" if engine_name is None else "connection",
-            source=database_name,
-            num_rows=None,
-            num_columns=len(columns),
-            variable_name=None,
-            engine=engine_name,
-            type="table",
-            primary_keys=None,
-            indexes=None,
+        table = _agg_row_to_data_table(
+            database_name, table_name, cols, engine_name
         )
 
         if database_name not in databases_dict:
@@ -429,6 +454,32 @@ def get_duckdb_databases_agg_query(
     )
 
 
+def get_duckdb_schema_tables(
+    connection: duckdb.DuckDBPyConnection | None,
+    database: str,
+    schema: str,
+    engine_name: VariableName | None = None,
+) -> list[DataTable]:
+    """Get the tables and views in a single schema.
+
+    Unlike `get_databases_from_duckdb`, this only scans the catalog entries
+    of one schema, so it stays cheap when other attached databases have
+    many tables.
+    """
+    tables_result = execute_duckdb_query(
+        connection,
+        _duckdb_columns_agg_query(
+            "AND database_name = $database AND schema_name = $schema"
+        ),
+        {"database": database, "schema": schema},
+    )
+    return [
+        _agg_row_to_data_table(database_name, table_name, cols, engine_name)
+        for database_name, _schema_name, table_name, cols in tables_result
+        if not is_result_table_name(table_name)
+    ]
+
+
 def _get_duckdb_database_names(
     connection: duckdb.DuckDBPyConnection | None,
 ) -> list[str]:
@@ -4,7 +4,9 @@ from __future__ import annotations
 import asyncio
 import base64
 import mimetypes
+import os
 import sys
+from collections.abc import Mapping
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
@@ -22,6 +24,7 @@ from marimo._config.utils import deep_copy
 from marimo._convert.common.dom_traversal import (
     replace_public_files_with_data_uris,
     replace_virtual_files_with_data_uris,
+    replace_virtual_files_with_urls,
 )
 from marimo._convert.common.filename import (
     get_download_filename,
@@ -50,13 +53,14 @@ from marimo._export.requests import (
 )
 from marimo._messaging.mimetypes import KnownMimeType
 from marimo._messaging.notification import ModelOpen
+from marimo._output.utils import uri_encode_component
 from marimo._runtime.virtual_file import read_virtual_file
 from marimo._schemas.export_options import IPYNBExportOptions
 from marimo._schemas.notebook import NotebookV1
 from marimo._schemas.session import NotebookSessionV1
 from marimo._server.tokens import SkewProtectionToken
 from marimo._templates import (
-    static_notebook_template,
+    iter_static_notebook_template,
     wasm_notebook_template,
 )
 from marimo._utils import async_path
@@ -67,7 +71,7 @@ from marimo._utils.paths import marimo_package_path, notebook_output_dir
 from marimo._version import __version__
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
 
     from traitlets.config import Config
 
@@ -197,6 +201,54 @@ def export_markdown(request: MarkdownExportRequest) -> ExportResult:
     )
 
 
+class _LazyVirtualFiles(Mapping[str, "str | None"]):
+    """Virtual files by URL, read when accessed, so that an export holds at
+    most one of them in memory at a time."""
+
+    def __init__(
+        self, file_urls: dict[str, str], load: Callable[[str], str | None]
+    ) -> None:
+        self._file_urls = file_urls
+        self._load = load
+
+    def __getitem__(self, key: str) -> str | None:
+        return self._load(self._file_urls[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._file_urls)
+
+    def __len__(self) -> int:
+        return len(self._file_urls)
+
+
+class _SidecarAssets:
+    """Writes virtual files to a directory next to an exported document."""
+
+    def __init__(self, directory: Path, base_url: str) -> None:
+        self._directory = directory
+        self._base_url = base_url
+        self._written: set[str] = set()
+
+    def url_for(self, byte_length: int, filename: str) -> str | None:
+        """Write the virtual file, if not yet written, and return its URL
+        relative to the document."""
+        name = Path(filename).name
+        if name not in self._written:
+            try:
+                contents = read_virtual_file(filename, byte_length)
+                self._directory.mkdir(parents=True, exist_ok=True)
+                (self._directory / name).write_bytes(contents)
+            except Exception as e:
+                LOGGER.warning(
+                    "Failed to write virtual file %s in export: %s",
+                    filename,
+                    e,
+                )
+                return None
+            self._written.add(name)
+        return f"{self._base_url}/{uri_encode_component(name)}"
+
+
 class Exporter:
     # Virtual file URL format constants
     _VIRTUAL_FILE_PATTERN = "./@file/"
@@ -206,6 +258,50 @@ class Exporter:
         self,
         request: HTMLExportRequest,
     ) -> tuple[str, str]:
+        chunks, download_filename = self._iter_html(request)
+        return "".join(chunks), download_filename
+
+    def write_html(
+        self,
+        request: HTMLExportRequest,
+        output: Path,
+        assets_dir: Path | None = None,
+    ) -> str:
+        """Export the notebook as HTML, streaming it to `output`.
+
+        Unlike `export_as_html`, the document is never held in memory
+        whole. With `assets_dir`, virtual files (images, audio, widget
+        code, ...) are written to that directory and referenced by relative
+        URL instead of inlined as data URIs; the HTML must then be shared
+        together with the directory.
+
+        Returns:
+            The download filename
+        """
+        assets = None
+        if assets_dir is not None:
+            base_url = Path(
+                os.path.relpath(assets_dir.resolve(), output.resolve().parent)
+            ).as_posix()
+            assets = _SidecarAssets(assets_dir, base_url)
+        chunks, download_filename = self._iter_html(request, assets)
+
+        output.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = output.with_name(f".{output.name}.{os.getpid()}.tmp")
+        try:
+            with tmp_path.open("w", encoding="utf-8") as f:
+                f.writelines(chunks)
+            # Atomic, so a failed export doesn't leave a truncated file
+            os.replace(tmp_path, output)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return download_filename
+
+    def _iter_html(
+        self,
+        request: HTMLExportRequest,
+        assets: _SidecarAssets | None = None,
+    ) -> tuple[Iterator[str], str]:
         index_html = get_html_contents()
         filename = get_filename(request.filename)
 
@@ -218,10 +314,14 @@ class Exporter:
         session_snapshot = deep_copy(request.snapshot.session)
         notebook_snapshot = deep_copy(request.snapshot.notebook)
 
-        # Replace virtual files in HTML outputs with data URIs
-        session_snapshot, replaced_files = self._inline_virtual_files(
-            session_snapshot
-        )
+        # Replace virtual files in HTML outputs with data URIs, or links to
+        # sidecar files
+        if assets is None:
+            session_snapshot, replaced_files = self._inline_virtual_files(
+                session_snapshot
+            )
+        else:
+            replaced_files = self._link_virtual_files(session_snapshot, assets)
 
         # Inline references to files in the notebook's `public/` folder so
         # the exported HTML is self-contained. Without this, `mo.md` images
@@ -255,11 +355,12 @@ class Exporter:
             [*request.options.files, *esm_urls],
             replaced_files,
             max_inline_bytes=MAX_VIRTUAL_FILE_INLINE_BYTES,
+            assets=assets,
         )
 
         # Generate final HTML
         code_hash = hash_code(app_code)
-        html = static_notebook_template(
+        chunks = iter_static_notebook_template(
             html=index_html,
             user_config=config,
             config_overrides={},
@@ -276,7 +377,7 @@ class Exporter:
         )
 
         download_filename = get_download_filename(filename, "html")
-        return html, download_filename
+        return chunks, download_filename
 
     def _prepare_display_config(
         self,
@@ -337,6 +438,33 @@ class Exporter:
 
         return session_snapshot, replaced_files
 
+    def _link_virtual_files(
+        self, session_snapshot: NotebookSessionV1, assets: _SidecarAssets
+    ) -> set[str]:
+        """Replace virtual file URLs in session outputs with links to
+        sidecar files. Mutates `session_snapshot` in-place.
+
+        Returns:
+            Set of replaced files
+        """
+        replaced_files: set[str] = set()
+
+        for data_dict, mime_type, data in self._iter_html_data_strings(
+            session_snapshot
+        ):
+            if self._VIRTUAL_FILE_PATTERN not in data:
+                continue
+            processed, files = replace_virtual_files_with_urls(
+                data,
+                assets.url_for,
+                allowed_tags=VIRTUAL_FILE_ALLOWED_TAGS,
+                allowed_attributes=VIRTUAL_FILE_ALLOWED_ATTRIBUTES,
+            )
+            replaced_files.update(files)
+            data_dict[mime_type] = processed
+
+        return replaced_files
+
     def _inline_public_files(
         self,
         session_snapshot: NotebookSessionV1,
@@ -395,7 +523,8 @@ class Exporter:
         file_urls: list[str],
         replaced_files: set[str],
         max_inline_bytes: int | None = None,
-    ) -> dict[str, str]:
+        assets: _SidecarAssets | None = None,
+    ) -> Mapping[str, str | None]:
         """Build dict of virtual files not already inlined in HTML.
 
         Args:
@@ -403,9 +532,13 @@ class Exporter:
             replaced_files: Set of URLs already replaced in HTML outputs
             max_inline_bytes: Maximum file size in bytes to inline.
                 Files larger than this are skipped. None means no limit.
+            assets: Where to write the files, to link to them instead
+                of inlining them.
 
         Returns:
-            Dict mapping file URLs to data URIs
+            Mapping from file URLs to data URIs (or links), which reads
+            each file when it is accessed; files that can't be read map
+            to None
         """
         virtual_files: dict[str, str] = {}
 
@@ -430,31 +563,22 @@ class Exporter:
             ):
                 continue
 
-            data_uri = self._read_virtual_file_as_data_uri(
-                file_url, max_inline_bytes=max_inline_bytes
-            )
-            if data_uri:
-                virtual_files[normalized_url.removeprefix(".")] = data_uri
+            virtual_files[normalized_url.removeprefix(".")] = file_url
 
-        return virtual_files
+        def load(file_url: str) -> str | None:
+            if assets is None:
+                return self._read_virtual_file_as_data_uri(
+                    file_url, max_inline_bytes=max_inline_bytes
+                )
+            parsed = self._parse_virtual_file_url(file_url)
+            return assets.url_for(*parsed) if parsed else None
 
-    def _read_virtual_file_as_data_uri(
-        self,
-        file_url: str,
-        max_inline_bytes: int | None = None,
-    ) -> str | None:
-        """Read a virtual file and convert it to a data URI.
+        return _LazyVirtualFiles(virtual_files, load)
 
-        Args:
-            file_url: Virtual file URL in `/@file/{byte_length}-{filename}`
-                or `./@file/{byte_length}-{filename}` format.
-            max_inline_bytes: Maximum file size in bytes to inline.
-                Files larger than this are skipped. None means no limit.
-
-        Returns:
-            Data URI string, or None if file cannot be read
+    def _parse_virtual_file_url(self, file_url: str) -> tuple[int, str] | None:
+        """Parse `/@file/{byte_length}-{filename}` or
+        `./@file/{byte_length}-{filename}` into its byte length and filename.
         """
-        # Extract byte_length and filename from either URL form.
         if file_url.startswith(self._VIRTUAL_FILE_PATTERN):
             virtual_file = file_url[len(self._VIRTUAL_FILE_PATTERN) :]
         elif file_url.startswith(self._VIRTUAL_FILE_PREFIX_WITH_SLASH):
@@ -467,7 +591,7 @@ class Exporter:
 
         try:
             byte_length_str, basename = virtual_file.split("-", 1)
-            byte_length = int(byte_length_str)
+            return int(byte_length_str), basename
         except Exception as e:
             LOGGER.warning(
                 "Invalid virtual file URL in export: %s. Error: %s",
@@ -476,6 +600,27 @@ class Exporter:
             )
             return None
 
+    def _read_virtual_file_as_data_uri(
+        self,
+        file_url: str,
+        max_inline_bytes: int | None = None,
+    ) -> str | None:
+        """Read a virtual file and convert it to a data URI.
+
+        Args:
+            file_url: Virtual file URL in `/@file/{byte_length}-{filename}`
+                or `./@file/{byte_length}-{filename}` format.
+            max_inline_bytes: Maximum file size in bytes to inline.
+                Files larger than this are skipped. None means no limit.
+
+        Returns:
+            Data URI string, or None if file cannot be read
+        """
+        parsed = self._parse_virtual_file_url(file_url)
+        if parsed is None:
+            return None
+        byte_length, basename = parsed
+
         if max_inline_bytes is not None and byte_length > max_inline_bytes:
             LOGGER.info(
                 "Skipping virtual file %s (%d bytes exceeds"
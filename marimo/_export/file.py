@@ -12,7 +12,7 @@ from marimo import _loggers
 from marimo._ast.app import InternalApp
 from marimo._ast.errors import CycleError, MultipleDefinitionError
 from marimo._ast.load import load_app
-from marimo._config.config import RuntimeConfig
+from marimo._config.config import PartialMarimoConfig, RuntimeConfig
 from marimo._config.manager import (
     get_default_config_manager,
 )
@@ -25,6 +25,10 @@ from marimo._export.exporter import (
     export_script as render_script,
     render_pdf,
 )
+from marimo._export.profile import (
+    profile_to_chrome_trace,
+    profile_to_folded,
+)
 from marimo._export.requests import (
     CacheBundleRequest,
     ExportResult,
@@ -37,6 +41,7 @@ from marimo._export.requests import (
     PDFExportRequest,
     PDFFileExportRequest,
     PDFRasterizationRequest,
+    ProfileFileExportRequest,
     ReactiveHTMLFileExportRequest,
     RunNotebookRequest,
     ScriptExportRequest,
@@ -345,26 +350,34 @@ async def export_html(
     resolved = config.get_config()
     display_config = resolved["display"]
     # Export the session as HTML
-    html, filename = Exporter().export_as_html(
-        HTMLExportRequest(
-            filename=file_manager.filename,
-            app_code=file_manager.app.to_py(),
-            app_config=file_manager.app.config,
-            snapshot=serialize_notebook_snapshot(
-                file_manager.app,
-                session_view,
-                drop_virtual_file_outputs=False,
-                include_model_notifications=True,
-            ),
-            display_config=display_config,
-            options=request.options,
-            sharing_config=(
-                resolved.get("sharing")
-                if request.execution is not None
-                else None
-            ),
-        )
+    html_request = HTMLExportRequest(
+        filename=file_manager.filename,
+        app_code=file_manager.app.to_py(),
+        app_config=file_manager.app.config,
+        snapshot=serialize_notebook_snapshot(
+            file_manager.app,
+            session_view,
+            drop_virtual_file_outputs=False,
+            include_model_notifications=True,
+        ),
+        display_config=display_config,
+        options=request.options,
+        sharing_config=(
+            resolved.get("sharing") if request.execution is not None else None
+        ),
     )
+    if request.output is not None:
+        filename = Exporter().write_html(
+            html_request, request.output, assets_dir=request.assets_dir
+        )
+        return ExportResult(
+            contents=b"",
+            download_filename=filename,
+            did_error=did_error,
+            output_path=request.output,
+        )
+
+    html, filename = Exporter().export_as_html(html_request)
     return ExportResult(
         contents=html,
         download_filename=filename,
@@ -372,6 +385,39 @@ async def export_html(
     )
 
 
+async def export_profile(request: ProfileFileExportRequest) -> ExportResult:
+    """Run a notebook with the profiler enabled and export its profile."""
+    import json
+
+    file_manager = load_notebook(request.path.absolute_name)
+    session_view, did_error = await run_notebook(
+        RunNotebookRequest(
+            file_manager=file_manager,
+            options=replace(
+                request.execution, profile=True, persist_session=False
+            ),
+        )
+    )
+    profiles = list(session_view.cell_profiles.values())
+    cell_names = {
+        cell_data.cell_id: cell_data.name
+        for cell_data in file_manager.app.cell_manager.cell_data()
+    }
+    if request.format == "folded":
+        contents = profile_to_folded(profiles, cell_names)
+        extension = "folded.txt"
+    else:
+        contents = json.dumps(profile_to_chrome_trace(profiles, cell_names))
+        extension = "trace.json"
+    return ExportResult(
+        contents=contents,
+        download_filename=get_download_filename(
+            request.path.short_name, extension
+        ),
+        did_error=did_error,
+    )
+
+
 def bundle_cache_export(request: CacheBundleRequest) -> None:
     """Copy an executed session's cached blobs into `<out_dir>/public/cache/`.
 
@@ -614,17 +660,23 @@ async def run_notebook(
         "auto_instantiate": True,
         "auto_reload": "off",
         "watcher_on_save": "lazy",
+        # There is no frontend to request variable previews, so the
+        # session view must hold them
+        "eager_variable_previews": True,
     }
     if options.cache_export:
         # Cache every executed cell so the export can bundle the results;
         # this same flag gates the kernel's export-manifest dump on teardown.
         runtime_overrides["cache_cells"] = True
+    overrides: PartialMarimoConfig = {
+        # We cast because we don't want to override the other config values.
+        "runtime": cast(RuntimeConfig, runtime_overrides)
+    }
+    if options.profile:
+        overrides["experimental"] = {"profiler": True}
     config_manager = get_default_config_manager(
         current_path=file_manager.path
-    ).with_overrides(
-        # We cast because we don't want to override the other config values.
-        {"runtime": cast(RuntimeConfig, runtime_overrides)}
-    )
+    ).with_overrides(overrides)
 
     # Create a session
     session_consumer = RunUntilCompletionSessionConsumer()
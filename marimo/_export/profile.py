@@ -0,0 +1,133 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Render cell profiles as flamegraphs and timelines.
+
+Profiles are recorded by the kernel when the `profiler` experimental flag
+is on (see `marimo._runtime.runner.profiler`) and collected per cell by the
+`SessionView`. Two output formats are supported:
+
+- `folded`: collapsed stacks, one `frame;frame;frame count` line per stack,
+  readable by flamegraph.pl, speedscope, and most flamegraph viewers.
+- `chrome-trace`: the Chrome Trace Event format, viewable in Perfetto or
+  `chrome://tracing`, with one event per cell and per phase.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from marimo._schemas.export_options import ProfileFormat
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from marimo._messaging.notification import CellProfileNotification
+    from marimo._types.ids import CellId_t
+
+__all__ = [
+    "ProfileFormat",
+    "profile_to_chrome_trace",
+    "profile_to_folded",
+]
+
+# Microseconds, the Trace Event format's unit.
+_US = 1_000_000
+
+
+def _cell_label(
+    cell_id: CellId_t, cell_names: Mapping[CellId_t, str] | None
+) -> str:
+    name = cell_names.get(cell_id) if cell_names is not None else None
+    if name and name != "_":
+        return name
+    return f"cell-{cell_id}"
+
+
+def _in_run_order(
+    profiles: Sequence[CellProfileNotification],
+) -> list[CellProfileNotification]:
+    return sorted(profiles, key=lambda profile: profile.start)
+
+
+def profile_to_folded(
+    profiles: Sequence[CellProfileNotification],
+    cell_names: Mapping[CellId_t, str] | None = None,
+) -> str:
+    """Collapsed stacks for the given profiles, rooted at each cell."""
+    lines: list[str] = []
+    for profile in _in_run_order(profiles):
+        label = _cell_label(profile.cell_id, cell_names)
+        for stack, count in sorted(profile.stacks.items()):
+            lines.append(f"{label};{stack} {count}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def profile_to_chrome_trace(
+    profiles: Sequence[CellProfileNotification],
+    cell_names: Mapping[CellId_t, str] | None = None,
+) -> dict[str, Any]:
+    """A Chrome trace of the given profiles, as a JSON-serializable dict.
+
+    Each cell is a complete ("X") event spanning its phases; timestamps are
+    relative to the first profiled cell.
+    """
+    ordered = _in_run_order(profiles)
+    origin = ordered[0].start if ordered else 0.0
+
+    def us(seconds: float) -> int:
+        return round(seconds * _US)
+
+    events: list[dict[str, Any]] = [
+        {
+            "name": "process_name",
+            "ph": "M",
+            "pid": 1,
+            "tid": 1,
+            "args": {"name": "marimo kernel"},
+        },
+        {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": 1,
+            "tid": 1,
+            "args": {"name": "cells"},
+        },
+    ]
+    for profile in ordered:
+        totals: dict[str, float] = {}
+        for span in profile.spans:
+            totals[span.category] = (
+                totals.get(span.category, 0.0) + span.duration
+            )
+        events.append(
+            {
+                "name": _cell_label(profile.cell_id, cell_names),
+                "cat": "cell",
+                "ph": "X",
+                "ts": us(profile.start - origin),
+                "dur": us(profile.duration),
+                "pid": 1,
+                "tid": 1,
+                "args": {
+                    "cell_id": profile.cell_id,
+                    "samples": sum(profile.stacks.values()),
+                    **{
+                        f"{category}_ms": round(total * 1000, 3)
+                        for category, total in totals.items()
+                    },
+                },
+            }
+        )
+        for span in profile.spans:
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": us(span.start - origin),
+                    "dur": us(span.duration),
+                    "pid": 1,
+                    "tid": 1,
+                    "args": {"cell_id": profile.cell_id},
+                }
+            )
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
@@ -20,6 +20,7 @@ from marimo._schemas.export_options import (
     NotebookExportSnapshot,
     PDFExportOptions,
     PDFRasterizationOptions,
+    ProfileFormat,
     WASMExportOptions,
 )
 from marimo._schemas.notebook import NotebookV1
@@ -42,6 +43,9 @@ class ExportResult:
     contents: bytes | str
     download_filename: str
     did_error: bool
+    # Set when the export was streamed to this file, instead of returned as
+    # `contents`
+    output_path: Path | None = None
 
     @cached_property
     def bytez(self) -> bytes:
@@ -115,6 +119,7 @@ class NotebookExecutionOptions:
     quiet: bool = False
     persist_session: bool = True
     cache_export: bool = False
+    profile: bool = False
     stderr: TextWriter | None = None
 
 
@@ -148,6 +153,11 @@ class HTMLFileExportRequest:
     path: MarimoPath
     options: HTMLExportOptions
     execution: NotebookExecutionOptions | None = None
+    # Stream the export to this file, rather than returning it
+    output: Path | None = None
+    # Write virtual files to this directory rather than inlining them;
+    # requires `output`
+    assets_dir: Path | None = None
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -170,6 +180,13 @@ class PDFFileExportRequest:
     status_callback: PDFExportStatusCallback | None = None
 
 
+@dataclass(frozen=True, kw_only=True)
+class ProfileFileExportRequest:
+    path: MarimoPath
+    format: ProfileFormat
+    execution: NotebookExecutionOptions
+
+
 @dataclass(frozen=True, kw_only=True)
 class PDFRasterizationRequest:
     app: InternalApp
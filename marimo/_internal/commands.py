@@ -16,6 +16,7 @@ from marimo._runtime.commands import (
     ExecuteScratchpadCommand,
     ExecuteStaleCellsCommand,
     GetCacheInfoCommand,
+    GetMemoryUsageCommand,
     HTTPRequest,
     InstallPackagesCommand,
     InvokeFunctionCommand,
@@ -28,6 +29,7 @@ from marimo._runtime.commands import (
     ModelMessage,
     PreviewDatasetColumnCommand,
     PreviewSQLTableCommand,
+    PreviewVariablesCommand,
     Primitive,
     RefreshSecretsCommand,
     RenameNotebookCommand,
@@ -57,6 +59,7 @@ __all__ = [
     "ExecuteScratchpadCommand",
     "ExecuteStaleCellsCommand",
     "GetCacheInfoCommand",
+    "GetMemoryUsageCommand",
     "HTTPRequest",
     "InstallPackagesCommand",
     "InvokeFunctionCommand",
@@ -69,6 +72,7 @@ __all__ = [
     "ModelMessage",
     "PreviewDatasetColumnCommand",
     "PreviewSQLTableCommand",
+    "PreviewVariablesCommand",
     "Primitive",
     "RefreshSecretsCommand",
     "RenameNotebookCommand",
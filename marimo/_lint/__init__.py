@@ -64,6 +64,8 @@ def run_check(
     ignore_scripts: bool = False,
     formatter: str = "full",
     lint_config: LintConfig | None = None,
+    jobs: int = 1,
+    cache: bool = False,
 ) -> Linter:
     """Run linting checks on files matching patterns (CLI entry point).
 
@@ -78,6 +80,10 @@ def run_check(
         ignore_scripts: Whether to ignore files not recognizable as marimo notebooks
         formatter: Output format for diagnostics ("full" or "json")
         lint_config: Optional lint rule selection config
+        jobs: Number of worker processes to check files with (0 for one per
+            CPU)
+        cache: Whether to reuse results for unchanged files from the on-disk
+            lint cache (ignored when fixing)
 
     Returns:
         Linter with per-file status and diagnostics
@@ -92,8 +98,18 @@ def run_check(
         ignore_scripts=ignore_scripts,
         formatter=formatter,
         lint_config=lint_config,
+        jobs=jobs,
     )
+    if cache and not fix:
+        from marimo._lint.cache import LintCache
+
+        linter.cache = LintCache(
+            rule_codes=(rule.code for rule in linter.rule_engine.rules),
+            ignore_scripts=ignore_scripts,
+        )
     linter.run_streaming(files_to_check)
+    if linter.cache is not None:
+        linter.cache.prune()
     return linter
 
 
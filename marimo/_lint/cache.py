@@ -0,0 +1,167 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""On-disk cache of lint results, keyed by file contents."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+from marimo import _loggers
+from marimo._lint.diagnostic import Diagnostic, Severity
+from marimo._version import __version__
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from marimo._lint.linter import FileStatus
+
+LOGGER = _loggers.marimo_logger()
+
+# Entries kept by `LintCache.prune`; roughly 1KB each
+MAX_ENTRIES = 10_000
+
+
+def default_lint_cache_dir() -> Path:
+    from marimo._utils.xdg import marimo_cache_dir
+
+    return marimo_cache_dir() / "lint"
+
+
+class LintCache:
+    """Stores the lint result of each file, keyed by its contents.
+
+    A key covers the file path and contents, the marimo version, and the
+    lint settings (selected rule codes, `ignore_scripts`), so a cached
+    result is only reused when linting the file again would produce the
+    same result. File-level lint config lives in the file contents, so it
+    is covered as well.
+
+    Only the diagnostics and status are cached, not the parsed notebook, so
+    cached results can't be used to fix files. Failures (unreadable or
+    unparsable files) aren't cached, since they may not be caused by the
+    file's contents.
+
+    Reading an entry refreshes its modification time; `prune` drops the
+    least recently used entries.
+    """
+
+    def __init__(
+        self,
+        rule_codes: Iterable[str],
+        ignore_scripts: bool = False,
+        directory: Path | None = None,
+    ) -> None:
+        self.directory = directory or default_lint_cache_dir()
+        self._settings = json.dumps(
+            {
+                "version": __version__,
+                "rules": sorted(rule_codes),
+                "ignore_scripts": ignore_scripts,
+            },
+            sort_keys=True,
+        )
+
+    def key(self, file_path: str, contents: bytes) -> str:
+        digest = hashlib.sha256()
+        digest.update(self._settings.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(file_path.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(contents)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> FileStatus | None:
+        from marimo._lint.linter import FileStatus
+
+        path = self.directory / f"{key}.json"
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            file_status = FileStatus(
+                file=data["file"],
+                diagnostics=[
+                    _diagnostic_from_json(d) for d in data["diagnostics"]
+                ],
+                skipped=data["skipped"],
+                failed=data["failed"],
+                message=data["message"],
+                details=data["details"],
+            )
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # A corrupt or outdated entry is just a cache miss
+            LOGGER.debug("Ignoring lint cache entry %s: %s", key, e)
+            return None
+        try:
+            # Mark the entry as recently used, for `prune`
+            os.utime(path)
+        except OSError:
+            pass
+        return file_status
+
+    def set(self, key: str, file_status: FileStatus) -> None:
+        if file_status.failed:
+            return
+        data = {
+            "file": file_status.file,
+            "diagnostics": [
+                _diagnostic_to_json(d) for d in file_status.diagnostics
+            ],
+            "skipped": file_status.skipped,
+            "failed": file_status.failed,
+            "message": file_status.message,
+            "details": file_status.details,
+        }
+        path = self.directory / f"{key}.json"
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            # Atomic, so concurrent `marimo check` runs never read a
+            # partially written entry
+            os.replace(tmp_path, path)
+        except OSError as e:
+            LOGGER.debug("Failed to write lint cache entry %s: %s", key, e)
+
+    def prune(self, max_entries: int = MAX_ENTRIES) -> None:
+        """Delete all but the `max_entries` most recently used entries."""
+        entries: list[tuple[float, Path]] = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    try:
+                        mtime = entry.stat().st_mtime
+                    except OSError:
+                        continue
+                    entries.append((mtime, self.directory / entry.name))
+        except OSError:
+            return
+        if len(entries) <= max_entries:
+            return
+        entries.sort()
+        for _, path in entries[: len(entries) - max_entries]:
+            try:
+                path.unlink()
+            except OSError:
+                # Removed by a concurrent run
+                pass
+
+
+def _diagnostic_to_json(diagnostic: Diagnostic) -> dict[str, Any]:
+    data = asdict(diagnostic)
+    if diagnostic.severity is not None:
+        data["severity"] = diagnostic.severity.value
+    return data
+
+
+def _diagnostic_from_json(data: dict[str, Any]) -> Diagnostic:
+    diagnostic = Diagnostic(**data)
+    if diagnostic.severity is not None:
+        diagnostic.severity = Severity(diagnostic.severity)
+    return diagnostic
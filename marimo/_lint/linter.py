@@ -2,6 +2,9 @@
 from __future__ import annotations
 
 import asyncio
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -24,6 +27,7 @@ if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Callable, Iterator
 
     from marimo._config.config import LintConfig
+    from marimo._lint.cache import LintCache
     from marimo._lint.rules.base import LintRule
 
 
@@ -41,6 +45,31 @@ async def _to_async_iterator(
             yield file_path
 
 
+# Linter used by each worker process when checking files in parallel;
+# created once per process by `_init_worker`.
+_WORKER_LINTER: Linter | None = None
+
+
+def _init_worker(
+    early_stopping: EarlyStoppingConfig | None,
+    rules: list[LintRule] | None,
+    ignore_scripts: bool,
+    lint_config: LintConfig | None,
+) -> None:
+    global _WORKER_LINTER
+    _WORKER_LINTER = Linter(
+        early_stopping=early_stopping,
+        rules=rules,
+        ignore_scripts=ignore_scripts,
+        lint_config=lint_config,
+    )
+
+
+def _process_file_in_worker(file: Path) -> FileStatus:
+    assert _WORKER_LINTER is not None
+    return asyncio.run(_WORKER_LINTER._process_single_file(file))
+
+
 @dataclass
 class FileStatus:
     """Processing status and results for a single file."""
@@ -73,6 +102,8 @@ class Linter:
         ignore_scripts: bool = False,
         formatter: str = "full",
         lint_config: LintConfig | None = None,
+        jobs: int = 1,
+        cache: LintCache | None = None,
     ):
         if rules is not None:
             self.rule_engine = RuleEngine(rules, early_stopping)
@@ -89,6 +120,10 @@ class Linter:
         self._lint_config = lint_config
         self._early_stopping = early_stopping
         self._explicit_rules = rules is not None
+        # Number of worker processes; 0 means one per CPU
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        # Cached results can't be fixed: they don't include the notebook
+        self.cache = None if fix_files else cache
 
         # Create rule lookup for unsafe fixes
         self.rule_lookup = {rule.code: rule for rule in self.rule_engine.rules}
@@ -235,6 +270,93 @@ class Linter:
 
         return file_status
 
+    async def _process_files(
+        self, files_to_check: AsyncIterator[Path] | Iterator[Path]
+    ) -> AsyncIterator[FileStatus]:
+        """Check files one at a time, in order."""
+        async for file_path in _to_async_iterator(files_to_check):
+            cache_key = await self._cache_key(file_path)
+            file_status = self._cache_get(cache_key)
+            if file_status is None:
+                file_status = await self._process_single_file(file_path)
+                self._cache_set(cache_key, file_status)
+            yield file_status
+
+    async def _process_files_parallel(
+        self, files_to_check: AsyncIterator[Path] | Iterator[Path]
+    ) -> AsyncIterator[FileStatus]:
+        """Check files in a pool of worker processes.
+
+        Parsing and linting are CPU-bound, so files are checked in separate
+        processes. Results are still yielded in input order, so output is
+        the same as when checking serially.
+        """
+        loop = asyncio.get_running_loop()
+        # Bound the number of files in flight, so results are streamed
+        # while files are still being discovered
+        max_pending = self.jobs * 4
+        pending: deque[tuple[str | None, asyncio.Future[FileStatus]]] = deque()
+
+        async def next_result() -> FileStatus:
+            cache_key, future = pending.popleft()
+            file_status = await future
+            self._cache_set(cache_key, file_status)
+            return file_status
+
+        with ProcessPoolExecutor(
+            max_workers=self.jobs,
+            initializer=_init_worker,
+            initargs=(
+                self._early_stopping,
+                self.rule_engine.rules if self._explicit_rules else None,
+                self.ignore_scripts,
+                self._lint_config,
+            ),
+        ) as executor:
+            async for file_path in _to_async_iterator(files_to_check):
+                cache_key = await self._cache_key(file_path)
+                cached = self._cache_get(cache_key)
+                if cached is not None:
+                    future: asyncio.Future[FileStatus] = loop.create_future()
+                    future.set_result(cached)
+                    # No result to store again
+                    cache_key = None
+                else:
+                    future = loop.run_in_executor(
+                        executor, _process_file_in_worker, file_path
+                    )
+                pending.append((cache_key, future))
+
+                while pending and (
+                    pending[0][1].done() or len(pending) > max_pending
+                ):
+                    yield await next_result()
+
+            while pending:
+                yield await next_result()
+
+    async def _cache_key(self, file: Path) -> str | None:
+        if self.cache is None:
+            return None
+        try:
+            contents = await asyncio.to_thread(file.read_bytes)
+        except OSError:
+            # Let processing report the error
+            return None
+        return self.cache.key(str(file), contents)
+
+    def _cache_get(self, cache_key: str | None) -> FileStatus | None:
+        if self.cache is None or cache_key is None:
+            return None
+        return self.cache.get(cache_key)
+
+    def _cache_set(
+        self, cache_key: str | None, file_status: FileStatus
+    ) -> None:
+        if self.cache is None or cache_key is None:
+            return
+        self.cache.set(cache_key, file_status)
+
     async def _run_stream(
         self, files_to_check: list[Path]
     ) -> AsyncIterator[FileStatus]:
@@ -319,9 +441,12 @@ class Linter:
         # Process files as they complete
         fixed_count = 0
 
-        # Convert to async iterator and process
-        async for file_path in _to_async_iterator(files_to_check):
-            file_status = await self._process_single_file(file_path)
+        if self.jobs > 1:
+            file_statuses = self._process_files_parallel(files_to_check)
+        else:
+            file_statuses = self._process_files(files_to_check)
+
+        async for file_status in file_statuses:
             self.files.append(file_status)
 
             # Stream output via pipe if available
@@ -18,8 +18,13 @@ if TYPE_CHECKING:
 
 StreamT = Literal[CellChannel.STDERR, CellChannel.STDOUT, CellChannel.STDIN]
 
-# Flush console outputs every 10ms
+# Flush console outputs every 10ms ...
 TIMEOUT_S = 0.01
+# ... backing off to every 250ms while a cell prints continuously
+MAX_TIMEOUT_S = 0.25
+# Lines of console output flushed per cell at a time; older lines are
+# elided. Matches the number of lines the frontend keeps per cell.
+MAX_LINES = 5000
 
 
 @dataclass
@@ -78,12 +83,101 @@ def _add_output_to_buffer(
         outputs_buffered_per_cell[cell_id] = [console_output]
 
 
+def collapse_carriage_returns(data: str) -> str:
+    """Drop progress updates that a later carriage return overwrites.
+
+    Progress bars redraw a line by writing "\r" followed by the new text.
+    Each line is reduced to the text before its first "\r", the overlay of
+    the text after it, and the last update (which also places the cursor),
+    so the frontend renders the same line with at most two redraws.
+    """
+    if "\r" not in data:
+        return data
+    lines = data.split("\n")
+    for i, line in enumerate(lines):
+        segments = line.split("\r")
+        # ANSI escapes don't take up columns, so overlaying would be wrong
+        if len(segments) <= 3 or "\x1b" in line:
+            continue
+        overlay = ""
+        for segment in segments[1:]:
+            overlay = segment + overlay[len(segment) :]
+        last = segments[-1]
+        lines[i] = "\r".join(
+            [segments[0], overlay, last]
+            if overlay != last
+            else [segments[0], last]
+        )
+    return "\n".join(lines)
+
+
+def _elide_lines(
+    buffer: list[ConsoleMsg], max_lines: int = MAX_LINES
+) -> list[ConsoleMsg]:
+    """Keep the last `max_lines` lines of a cell's buffered output.
+
+    Non-text outputs count as a single line. Elided output is replaced by
+    a marker stating how many lines were dropped.
+    """
+    n_lines = 0
+    for i in range(len(buffer) - 1, -1, -1):
+        output = buffer[i]
+        if output.mimetype == "text/plain":
+            n_lines += output.data.count("\n") + 1
+        else:
+            n_lines += 1
+        if n_lines > max_lines:
+            break
+    else:
+        return buffer
+
+    # buffer[i] holds the oldest line that is kept, possibly partially
+    output = buffer[i]
+    n_elided = sum(
+        msg.data.count("\n") + 1 if msg.mimetype == "text/plain" else 1
+        for msg in buffer[:i]
+    )
+    kept = buffer[i + 1 :]
+    if output.mimetype == "text/plain":
+        lines = output.data.split("\n")
+        n_keep = max_lines - (n_lines - len(lines))
+        n_elided += len(lines) - n_keep
+        if n_keep > 0:
+            kept.insert(
+                0,
+                ConsoleMsg(
+                    stream=output.stream,
+                    cell_id=output.cell_id,
+                    data="\n".join(lines[len(lines) - n_keep :]),
+                    mimetype=output.mimetype,
+                ),
+            )
+    else:
+        n_elided += 1
+    marker = ConsoleMsg(
+        stream=kept[0].stream if kept else output.stream,
+        cell_id=output.cell_id,
+        data=f"... {n_elided} lines elided ...\n",
+        mimetype="text/plain",
+    )
+    if kept and _can_merge_outputs(marker, kept[0]):
+        kept[0].data = marker.data + kept[0].data
+    else:
+        kept.insert(0, marker)
+    return kept
+
+
 def _flush_outputs(
     outputs_buffered_per_cell: dict[CellId_t, list[ConsoleMsg]],
     stream: Stream,
 ) -> None:
     for cell_id, buffer in outputs_buffered_per_cell.items():
-        for output in buffer:
+        for output in _elide_lines(buffer):
+            if (
+                output.mimetype == "text/plain"
+                and output.stream != CellChannel.STDIN
+            ):
+                output.data = collapse_carriage_returns(output.data)
             _write_console_output(
                 stream,
                 output.stream,
@@ -107,6 +201,10 @@ def buffered_writer(
     notifications when messages have been added. (A deque + condition variable
     was noticeably faster than the builtin queue.Queue in testing.)
 
+    The flush interval adapts to the output rate: it starts at `TIMEOUT_S`
+    and doubles, up to `MAX_TIMEOUT_S`, each time output arrives within one
+    interval of the previous flush. It resets once output pauses.
+
     A `None` passed to `msg_queue` signals the writer should terminate.
     A `FlushMarker` forces an immediate flush and signals the caller.
     """
@@ -115,6 +213,9 @@ def buffered_writer(
     #
     # when the timer expires, all buffered outputs are flushed
     timer: float | None = None
+    timeout = TIMEOUT_S
+    # time of the last timed flush, if output may still be streaming
+    last_flush: float | None = None
 
     outputs_buffered_per_cell: dict[CellId_t, list[ConsoleMsg]] = {}
     while True:
@@ -139,8 +240,16 @@ def buffered_writer(
                 if flush_marker is not None:
                     break
                 if outputs_buffered_per_cell and timer is None:
-                    # start the timeout timer
-                    timer = TIMEOUT_S
+                    # start the timeout timer, backing off if output is
+                    # arriving as fast as it is flushed
+                    if (
+                        last_flush is not None
+                        and time.time() - last_flush < timeout
+                    ):
+                        timeout = min(timeout * 2, MAX_TIMEOUT_S)
+                    else:
+                        timeout = TIMEOUT_S
+                    timer = timeout
                 elif timer is not None:
                     time_waited = time.time() - time_started_waiting
                     timer -= time_waited
@@ -149,4 +258,9 @@ def buffered_writer(
         _flush_outputs(outputs_buffered_per_cell, stream)
         if flush_marker is not None:
             flush_marker.done.set()
+            # Explicit flushes mark the end of a run; start the next
+            # one responsive again
+            last_flush = None
+        else:
+            last_flush = time.time()
         timer = None
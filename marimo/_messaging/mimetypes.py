@@ -27,6 +27,7 @@ KnownMimeType = Literal[
     "image/bmp",
     "image/gif",
     "image/jpeg",
+    "image/webp",
     "video/mp4",
     "video/mpeg",
     "text/html",
@@ -13,6 +13,11 @@ that goes through this model is last-write-wins with intra-transaction
 conflict detection (`_validate` catches contradictions like delete +
 update on the same cell within one batch).
 
+Cells are indexed by ID, so lookups and `SetCode`/`SetName`/`SetConfig`
+changes are O(1) regardless of notebook size. Applied transactions are
+kept in a bounded log, so a client that last saw version *v* can catch
+up with `transactions_since(v)` instead of receiving the full document.
+
 `SetCode` is a wholesale replacement without character-level
 merge. Loro CRDT may handle real-time collaborative text editing in
 the future, but cell code would then live outside this model entirely.
@@ -20,6 +25,7 @@ the future, but cell code would then live outside this model entirely.
 
 from __future__ import annotations
 
+from collections import deque
 from contextlib import contextmanager
 from contextvars import ContextVar
 from typing import TYPE_CHECKING
@@ -46,6 +52,9 @@ from marimo._messaging.notebook.changes import (
 )
 from marimo._types.ids import CellId_t
 
+#: Default number of applied transactions kept for `transactions_since`.
+DEFAULT_MAX_LOG_SIZE = 1000
+
 
 class NotebookCell(msgspec.Struct):
     """A single cell in the document. Mutable — owned by the document.
@@ -92,9 +101,21 @@ class NotebookDocument:
         assert doc.get_cell(CellId_t("a")).code == "x = 2"
     """
 
-    def __init__(self, cells: Iterable[NotebookCell] | None = None) -> None:
+    def __init__(
+        self,
+        cells: Iterable[NotebookCell] | None = None,
+        max_log_size: int = DEFAULT_MAX_LOG_SIZE,
+    ) -> None:
         self._cells: list[NotebookCell] = list(cells) if cells else []
+        # Position of each cell in `_cells`, kept in sync by every change
+        self._index: dict[CellId_t, int] = {}
+        self._reindex()
         self._version: int = 0
+        # Applied transactions, oldest first, with contiguous versions
+        # ending at `_version`. Trimmed in batches once it exceeds
+        # `_max_log_size`, so appending stays amortized O(1).
+        self._log: deque[Transaction] = deque()
+        self._max_log_size = max_log_size
 
     # ------------------------------------------------------------------
     # Read-only accessors
@@ -116,17 +137,12 @@ class NotebookDocument:
 
     def get_cell(self, cell_id: CellId_t) -> NotebookCell:
         """Lookup by ID. Raises `KeyError` if not found."""
-        for cell in self._cells:
-            if cell.id == cell_id:
-                return cell
-        raise KeyError(f"Cell {cell_id!r} not found in document")
+        return self._find_cell(cell_id)
 
     def get(self, cell_id: CellId_t) -> NotebookCell | None:
         """Lookup by ID, returning `None` if not found."""
-        for cell in self._cells:
-            if cell.id == cell_id:
-                return cell
-        return None
+        idx = self._index.get(cell_id)
+        return self._cells[idx] if idx is not None else None
 
     def get_cell_version(self, cell_id: CellId_t) -> int | None:
         """Return the cell's version counter, or `None` if not found."""
@@ -134,7 +150,7 @@ class NotebookDocument:
         return cell.version if cell is not None else None
 
     def __contains__(self, cell_id: object) -> bool:
-        return any(c.id == cell_id for c in self._cells)
+        return cell_id in self._index
 
     def __len__(self) -> int:
         return len(self._cells)
@@ -142,6 +158,24 @@ class NotebookDocument:
     def __iter__(self) -> Iterator[CellId_t]:
         return (c.id for c in self._cells)
 
+    def transactions_since(self, version: int) -> list[Transaction] | None:
+        """Applied transactions with a version greater than *version*.
+
+        Replaying them, in order, on a copy of the document at *version*
+        brings it up to date. Returns `None` when the log no longer reaches
+        back to *version* (or *version* is from the future); the caller
+        must then send the full document instead.
+        """
+        if version == self._version:
+            return []
+        if not self._log or version > self._version:
+            return None
+        oldest = self._log[0].version
+        assert oldest is not None
+        if version < oldest - 1:
+            return None
+        return list(self._log)[version - oldest + 1 :]
+
     # ------------------------------------------------------------------
     # Transaction application
     # ------------------------------------------------------------------
@@ -157,7 +191,9 @@ class NotebookDocument:
 
         _validate(tx.changes, self._cells)
 
-        staged = NotebookDocument(self._cells)
+        staged = NotebookDocument(max_log_size=0)
+        staged._cells = list(self._cells)
+        staged._index = dict(self._index)
         owned_cell_ids: set[CellId_t] = set()
         for change in tx.changes:
             if isinstance(change, (SetCode, SetName, SetConfig)):
@@ -175,9 +211,19 @@ class NotebookDocument:
 
         # Commit only after staging and result construction both succeed.
         self._cells = staged._cells
+        self._index = staged._index
         self._version = next_version
+        self._append_to_log(applied)
         return applied
 
+    def _append_to_log(self, tx: Transaction) -> None:
+        self._log.append(tx)
+        if len(self._log) > self._max_log_size:
+            # Drop down to half the limit, so trimming is amortized
+            keep = self._max_log_size // 2
+            while len(self._log) > keep:
+                self._log.popleft()
+
     def _apply_change(self, change: DocumentChange) -> None:
         # TODO: refactor to use match/case (min Python is 3.10) once
         # ruff target-version is bumped from py39.
@@ -191,29 +237,34 @@ class NotebookDocument:
                 config=structs_replace(change.config),
             )
             if change.after is not None:
-                idx = self._find_index(change.after)
-                self._cells.insert(idx + 1, cell)
+                idx = self._find_index(change.after) + 1
             elif change.before is not None:
                 idx = self._find_index(change.before)
-                self._cells.insert(idx, cell)
             else:
-                self._cells.append(cell)
+                idx = len(self._cells)
+            self._cells.insert(idx, cell)
+            self._reindex(idx)
 
         elif isinstance(change, DeleteCell):
             idx = self._find_index(change.cell_id)
             del self._cells[idx]
+            del self._index[change.cell_id]
+            self._reindex(idx)
 
         elif isinstance(change, MoveCell):
             idx = self._find_index(change.cell_id)
-            cell = self._cells.pop(idx)
             if change.after is not None:
-                target = self._find_index(change.after)
-                self._cells.insert(target + 1, cell)
+                target = self._find_index(change.after) + 1
             elif change.before is not None:
                 target = self._find_index(change.before)
-                self._cells.insert(target, cell)
             else:
                 raise ValueError("MoveCell requires 'before' or 'after'")
+            cell = self._cells.pop(idx)
+            # Popping the cell shifts later anchors down by one
+            if target > idx:
+                target -= 1
+            self._cells.insert(target, cell)
+            self._reindex(min(idx, target), max(idx, target) + 1)
 
         elif isinstance(change, ReorderCells):
             by_id = {c.id: c for c in self._cells}
@@ -228,6 +279,7 @@ class NotebookDocument:
                 if c.id not in seen:
                     reordered.append(c)
             self._cells = reordered
+            self._reindex()
 
         elif isinstance(change, SetCode):
             cell = self._find_cell(change.cell_id)
@@ -277,13 +329,25 @@ class NotebookDocument:
             structs_replace(c, id=mapping[c.id]) if c.id in mapping else c
             for c in self._cells
         ]
+        self._index = {}
+        self._reindex()
         self._version += 1
+        # A rekey is not a transaction, so it can't be replayed: clients
+        # behind this version need the full document.
+        self._log.clear()
+
+    def _reindex(self, start: int = 0, stop: int | None = None) -> None:
+        """Refresh the index for the cells in `_cells[start:stop]`."""
+        cells = self._cells
+        stop = len(cells) if stop is None else stop
+        for i in range(start, stop):
+            self._index[cells[i].id] = i
 
     def _find_index(self, cell_id: CellId_t) -> int:
-        for i, cell in enumerate(self._cells):
-            if cell.id == cell_id:
-                return i
-        raise KeyError(f"Cell {cell_id!r} not found in document")
+        try:
+            return self._index[cell_id]
+        except KeyError:
+            raise KeyError(f"Cell {cell_id!r} not found in document") from None
 
     def _clone_cell(self, cell_id: CellId_t) -> None:
         idx = self._find_index(cell_id)
@@ -294,10 +358,7 @@ class NotebookDocument:
         )
 
     def _find_cell(self, cell_id: CellId_t) -> NotebookCell:
-        for cell in self._cells:
-            if cell.id == cell_id:
-                return cell
-        raise KeyError(f"Cell {cell_id!r} not found in document")
+        return self._cells[self._find_index(cell_id)]
 
     def __repr__(self) -> str:
         lines = [f"NotebookDocument({len(self._cells)} cells):"]
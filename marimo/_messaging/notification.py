@@ -406,6 +406,8 @@ class KernelReadyNotification(Notification, tag="kernel-ready"):
         kiosk: Whether running in kiosk mode.
         capabilities: Available kernel capabilities.
         auto_instantiated: Whether cells already executed (run mode).
+        document_version: Version of the notebook document the cells
+            reflect.
     """
 
     name: ClassVar[str] = "kernel-ready"
@@ -423,6 +425,7 @@ class KernelReadyNotification(Notification, tag="kernel-ready"):
     capabilities: KernelCapabilitiesNotification
     consumer_capabilities: ConsumerCapabilities
     auto_instantiated: bool = False
+    document_version: int = 0
 
 
 class CompletionResultNotification(Notification, tag="completion-result"):
@@ -507,6 +510,22 @@ class ReconnectedNotification(Notification, tag="reconnected"):
     name: ClassVar[str] = "reconnected"
 
 
+class SessionSnapshotNotification(Notification, tag="session-snapshot"):
+    """Current session state, replayed to a connecting frontend.
+
+    Bundles the notifications needed to restore a session view into a
+    single frame instead of sending each one separately.
+
+    Attributes:
+        version: Snapshot format version.
+        notifications: Serialized notifications, applied in order.
+    """
+
+    name: ClassVar[str] = "session-snapshot"
+    version: int
+    notifications: list[msgspec.Raw]
+
+
 class StartupLogsNotification(Notification, tag="startup-logs"):
     """Streaming kernel startup logs.
 
@@ -571,15 +590,23 @@ class VariableDeclarationNotification(msgspec.Struct):
 class VariableValue(BaseStruct):
     """Variable value and type for variables panel.
 
+    Previews of non-scalar values are computed on demand: after a run, only
+    the name, type, and size are sent, with `preview_pending` set, and the
+    preview follows in response to a `PreviewVariablesCommand`.
+
     Attributes:
         name: Variable name.
         value: String representation of value.
         datatype: Data type as string.
+        size: Length of the value, for sized containers and tables.
+        preview_pending: Whether `value` has yet to be computed.
     """
 
     name: str
     value: str | None
     datatype: str | None
+    size: int | None = None
+    preview_pending: bool = False
 
 
 class VariablesNotification(Notification, tag="variables"):
@@ -604,6 +631,49 @@ class VariableValuesNotification(Notification, tag="variable-values"):
     variables: list[VariableValue]
 
 
+class VariableMemory(BaseStruct):
+    """Estimated memory held by a variable.
+
+    Attributes:
+        name: Variable name.
+        size_bytes: Estimated deep size of the value, in bytes. Memory shared
+            with other variables is counted for only one of them.
+    """
+
+    name: str
+    size_bytes: int
+
+
+class MemorySample(BaseStruct):
+    """Resident set size of the kernel at a point in time.
+
+    Attributes:
+        timestamp: Unix timestamp of the sample (seconds).
+        rss_bytes: Resident set size, in bytes.
+    """
+
+    timestamp: float
+    rss_bytes: int
+
+
+class MemoryUsageNotification(Notification, tag="memory-usage"):
+    """Memory used by the kernel and its variables.
+
+    Attributes:
+        variables: Estimated memory of each global variable, largest first.
+        total_bytes: Sum of the variables' estimated memory.
+        rss_bytes: Current resident set size of the kernel, if known.
+        rss_history: Recent samples of the kernel's resident set size,
+            oldest first.
+    """
+
+    name: ClassVar[str] = "memory-usage"
+    variables: list[VariableMemory]
+    total_bytes: int
+    rss_bytes: int | None
+    rss_history: list[MemorySample]
+
+
 class DatasetsNotification(Notification, tag="datasets"):
     """Available datasets for data explorer.
 
@@ -752,6 +822,22 @@ class DataSourceConnectionsNotification(
     connections: list[DataSourceConnection]
 
 
+class DataSourceTablesNotification(Notification, tag="data-source-tables"):
+    """Tables of one schema of a data source connection.
+
+    Sent instead of a full `DataSourceConnectionsNotification` when a SQL
+    cell only changed the tables of some schemas.
+
+    Attributes:
+        metadata: Connection, database, and schema the tables belong to.
+        tables: All tables and views now in the schema.
+    """
+
+    name: ClassVar[str] = "data-source-tables"
+    metadata: SQLMetadata
+    tables: list[DataTable]
+
+
 class DataSourceDiscoveryResultNotification(
     Notification, tag="data-source-discovery-result"
 ):
@@ -956,6 +1042,103 @@ class CacheInfoNotification(Notification, tag="cache-info"):
     disk_total: int
 
 
+ProfileCategory = Literal["execution", "hook", "formatting"]
+
+
+class CellProfileSpan(msgspec.Struct):
+    """A timed phase of a single cell run.
+
+    Attributes:
+        name: Phase name (`execute`, or the name of a hook).
+        category: What the time is attributed to: user code
+            (`execution`), runtime bookkeeping (`hook`), or output
+            formatting/serialization (`formatting`).
+        start: Wall-clock start time (seconds since the epoch).
+        duration: Duration in seconds.
+    """
+
+    name: str
+    category: ProfileCategory
+    start: float
+    duration: float
+
+
+class CellProfileNotification(Notification, tag="cell-profile"):
+    """Execution profile of a cell, sent when the profiler is enabled.
+
+    Attributes:
+        cell_id: The profiled cell.
+        start: Wall-clock start time (seconds since the epoch).
+        duration: Total time spent on the cell, hooks included (seconds).
+        spans: Timed phases of the run, in execution order.
+        stacks: Sampled call stacks in collapsed ("folded") form, mapping
+            `phase;frame;frame` to the number of samples observed.
+        sample_interval: Seconds between stack samples.
+    """
+
+    name: ClassVar[str] = "cell-profile"
+    cell_id: CellId_t
+    start: float
+    duration: float
+    spans: list[CellProfileSpan]
+    stacks: dict[str, int]
+    sample_interval: float
+
+
+HookPhase = Literal[
+    "preparation", "pre_execution", "post_execution", "on_finish"
+]
+
+
+class MetricHistogram(msgspec.Struct):
+    """Observations counted in fixed buckets.
+
+    Attributes:
+        counts: Number of observations in each bucket. The bucket bounds
+            are fixed by the kernel; the last bucket counts observations
+            above the largest bound.
+        sum: Sum of all observations.
+    """
+
+    counts: list[int]
+    sum: float
+
+
+class HookMetric(msgspec.Struct):
+    """Execution times of a runner hook.
+
+    Attributes:
+        phase: When the hook runs.
+        hook: Name of the hook.
+        duration: Execution times (seconds).
+    """
+
+    phase: HookPhase
+    hook: str
+    duration: MetricHistogram
+
+
+class KernelMetricsNotification(Notification, tag="kernel-metrics"):
+    """Kernel instrumentation recorded since the previous report.
+
+    Sent after each run, and aggregated by the server for its metrics
+    endpoint.
+
+    Attributes:
+        cell_duration: Execution times of cells (seconds).
+        hooks: Execution times of runner hooks.
+        cache_hits: Hits of the caches currently defined in the notebook.
+        cache_misses: Misses of the caches currently defined in the
+            notebook.
+    """
+
+    name: ClassVar[str] = "kernel-metrics"
+    cell_duration: MetricHistogram
+    hooks: list[HookMetric]
+    cache_hits: int
+    cache_misses: int
+
+
 class NotebookDocumentTransactionNotification(
     Notification, tag="notebook-document-transaction"
 ):
@@ -979,6 +1162,7 @@ NotificationMessage = (
     # Notebook lifecycle
     | ReloadNotification
     | ReconnectedNotification
+    | SessionSnapshotNotification
     | InterruptedNotification
     | CompletedRunNotification
     | KernelReadyNotification
@@ -994,6 +1178,7 @@ NotificationMessage = (
     # Variables
     | VariablesNotification
     | VariableValuesNotification
+    | MemoryUsageNotification
     # Query params
     | QueryParamsSetNotification
     | QueryParamsAppendNotification
@@ -1006,6 +1191,7 @@ NotificationMessage = (
     | SQLTableListPreviewNotification
     | SQLSchemaListPreviewNotification
     | DataSourceConnectionsNotification
+    | DataSourceTablesNotification
     | DataSourceDiscoveryResultNotification
     | ValidateSQLResultNotification
     # Storage
@@ -1017,6 +1203,9 @@ NotificationMessage = (
     # Cache
     | CacheClearedNotification
     | CacheInfoNotification
+    # Profiling
+    | CellProfileNotification
+    | KernelMetricsNotification
     # Kiosk
     | FocusCellNotification
     # Debugger
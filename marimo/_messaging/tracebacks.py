@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import sys
 import traceback as tb
+from typing import TYPE_CHECKING
 
 from marimo._messaging.cell_output import CellChannel, CellOutput
 from marimo._messaging.context import is_code_mode_request
@@ -12,6 +13,9 @@ from marimo._messaging.types import Stderr
 from marimo._runtime.context.types import safe_get_context
 from marimo._runtime.context.utils import get_mode
 
+if TYPE_CHECKING:
+    from marimo._types.ids import CellId_t
+
 
 def _highlight_traceback(traceback: str) -> str:
     """
@@ -42,11 +46,17 @@ def _show_tracebacks_enabled() -> bool:
         return True  # no context → not in run mode, always show
 
 
-def write_traceback(traceback: str) -> None:
+def write_traceback(traceback: str, cell_id: CellId_t | None = None) -> None:
+    """Write a traceback to a cell's console.
+
+    Defaults to the running cell. Pass `cell_id` when writing from another
+    thread, where the redirected stderr follows whichever cell the kernel
+    is running.
+    """
     in_run_mode = get_mode() == "run"
     code_mode = is_code_mode_request()
 
-    if isinstance(sys.stderr, Stderr) and not code_mode:
+    if cell_id is None and isinstance(sys.stderr, Stderr) and not code_mode:
         # In run mode, only forward to the frontend if show_tracebacks is on.
         if in_run_mode and not _show_tracebacks_enabled():
             return
@@ -58,14 +68,18 @@ def write_traceback(traceback: str) -> None:
         # When stderr is not redirected (e.g., run mode with redirect_console_to_browser=False),
         # send the traceback directly via the stream to ensure exceptions reach the frontend
         ctx = safe_get_context()
-        if ctx is not None and ctx.cell_id is not None:
+        if cell_id is None and ctx is not None:
+            cell_id = ctx.cell_id
+        if ctx is not None and cell_id is not None:
             # In run mode, only forward to the frontend if show_tracebacks is on.
             if in_run_mode and not _show_tracebacks_enabled():
-                sys.stderr.write(traceback)
+                # A redirected stderr would forward it to the frontend
+                if not isinstance(sys.stderr, Stderr):
+                    sys.stderr.write(traceback)
                 return
             broadcast_notification(
                 CellNotification(
-                    cell_id=ctx.cell_id,
+                    cell_id=cell_id,
                     console=CellOutput(
                         channel=CellChannel.STDERR,
                         mimetype="application/vnd.marimo+traceback",
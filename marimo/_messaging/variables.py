@@ -8,7 +8,7 @@ from marimo._messaging.notification import VariableValue
 from marimo._plugins.ui._impl.tables.utils import get_table_manager_or_none
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Iterable, Mapping, Sequence
 
 
 def get_variable_preview(
@@ -192,23 +192,25 @@ def _stringify_variable_value(value: object) -> str:
         return "<UNKNOWN>"
 
 
-def _format_variable_value(value: object) -> str:
-    """Format a variable value for display.
-
-    Handles special types like UIElement, Html, and ModuleType.
-    """
-
+def _resolve_variable_value(value: object) -> object:
     from marimo._output.hypertext import Html
     from marimo._plugins.ui._core.ui_element import UIElement
 
-    resolved = value
     if isinstance(value, UIElement):
-        resolved = value.value
+        return value.value
     elif isinstance(value, Html):
-        resolved = value.text
+        return value.text
     elif isinstance(value, ModuleType):
-        resolved = value.__name__
-    return _stringify_variable_value(resolved)
+        return value.__name__
+    return value
+
+
+def _format_variable_value(value: object) -> str:
+    """Format a variable value for display.
+
+    Handles special types like UIElement, Html, and ModuleType.
+    """
+    return _stringify_variable_value(_resolve_variable_value(value))
 
 
 def create_variable_value(
@@ -244,3 +246,106 @@ def create_variable_value(
     return VariableValue(
         name=name, value=formatted_value, datatype=computed_datatype
     )
+
+
+# Values whose preview is as cheap as formatting a scalar; these are
+# previewed eagerly, everything else on request.
+_SCALAR_TYPES = (type(None), bool, int, float, complex, str)
+
+_BUILTIN_CONTAINERS = (
+    bytes,
+    bytearray,
+    list,
+    tuple,
+    set,
+    frozenset,
+    dict,
+)
+
+# Libraries whose `.shape` is metadata, not a computation.
+_SHAPED_LIBRARIES = frozenset({"numpy", "pandas", "polars", "pyarrow"})
+
+
+def _get_variable_size(value: object) -> int | None:
+    """Length of a container or number of rows of an array or table.
+
+    Only sizes known without computation are reported: `len()` of a lazy
+    table or a user-defined `__len__` may run arbitrary work.
+    """
+    try:
+        if isinstance(value, (str, *_BUILTIN_CONTAINERS)):
+            return len(value)
+        module = type(value).__module__.split(".", 1)[0]
+        if module in _SHAPED_LIBRARIES:
+            shape = getattr(value, "shape", None)
+            if (
+                isinstance(shape, tuple)
+                and shape
+                and isinstance(shape[0], int)
+            ):
+                return shape[0]
+    except Exception:
+        pass
+    return None
+
+
+def _try_resolve_variable_value(value: object) -> object:
+    try:
+        return _resolve_variable_value(value)
+    except Exception:
+        return value
+
+
+def create_variable_summary(name: str, value: object) -> VariableValue:
+    """Create a VariableValue without computing an expensive preview.
+
+    Scalars are previewed immediately. For other values, only the datatype
+    and size are filled in, and the VariableValue is marked as
+    `preview_pending`; the preview is computed by `VariablePreviews` when
+    requested.
+    """
+    resolved = _try_resolve_variable_value(value)
+    if isinstance(resolved, _SCALAR_TYPES):
+        return create_variable_value(name=name, value=value)
+
+    try:
+        datatype = type(value).__name__
+    except Exception:
+        datatype = None
+    return VariableValue(
+        name=name,
+        value=None,
+        datatype=datatype,
+        size=_get_variable_size(resolved),
+        preview_pending=True,
+    )
+
+
+class VariablePreviews:
+    """Previews of global variables, computed on request.
+
+    A preview is cached for the object it was computed from, identified by
+    `id()`, until the variable is invalidated: when its defining cell
+    reruns, or when a cell that references it runs (and may have mutated
+    it in place).
+    """
+
+    def __init__(self) -> None:
+        self._previews: dict[str, tuple[int, VariableValue]] = {}
+
+    def get(self, name: str, value: object) -> VariableValue:
+        cached = self._previews.get(name)
+        if cached is not None and cached[0] == id(value):
+            return cached[1]
+
+        preview = create_variable_value(name=name, value=value)
+        preview.size = _get_variable_size(_try_resolve_variable_value(value))
+        self._previews[name] = (id(value), preview)
+        return preview
+
+    def invalidate(self, names: Iterable[str]) -> None:
+        for name in names:
+            self._previews.pop(name, None)
+
+    def clear(self) -> None:
+        self._previews.clear()
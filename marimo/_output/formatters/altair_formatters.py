@@ -31,6 +31,9 @@ class AltairFormatter(FormatterFactory):
         import altair
 
         from marimo._output import formatting
+        from marimo._plugins.ui._impl.charts.altair_aggregate import (
+            preaggregate_chart,
+        )
         from marimo._plugins.ui._impl.charts.altair_transformer import (
             register_transformers,
         )
@@ -42,6 +45,9 @@ class AltairFormatter(FormatterFactory):
         def _show_chart(chart: AltairChartType) -> tuple[KnownMimeType, str]:
             import altair as alt
 
+            # Large charts are drawn from their aggregated rows
+            chart = preaggregate_chart(chart)
+
             # Try to get the _repr_mimebundle_ method from the chart
             # If its HTML, we want to handle this ourselves
             # if its svg, vega, or png, then we want to pass that instead
@@ -25,6 +25,7 @@ from matplotlib.backend_bases import (
 )
 from matplotlib.backends.backend_agg import FigureCanvasAgg
 
+import marimo._output.data.data as mo_data
 from marimo._messaging.cell_output import CellChannel
 from marimo._messaging.mimetypes import METADATA_KEY, KnownMimeType
 from marimo._messaging.notification_utils import CellNotificationUtils
@@ -38,6 +39,17 @@ def close_figures() -> None:
         plt.close("all")
 
 
+# Raster formats that figures can be encoded in, keyed by the value of
+# `matplotlib.rcParams["savefig.format"]`; anything else renders as PNG.
+# JPEG and WebP are much smaller than PNG for large, dense figures.
+_RASTER_FORMATS: dict[str, KnownMimeType] = {
+    "png": "image/png",
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "webp": "image/webp",
+}
+
+
 def _extract_png_dimensions(png_bytes: bytes) -> tuple[int, int]:
     """Extract width and height from PNG binary data.
 
@@ -56,6 +68,52 @@ def _extract_png_dimensions(png_bytes: bytes) -> tuple[int, int]:
     return width, height
 
 
+def _extract_image_dimensions(
+    image_bytes: bytes, image_format: str
+) -> tuple[int, int]:
+    if image_format == "png":
+        return _extract_png_dimensions(image_bytes)
+
+    # Pillow is a dependency of matplotlib
+    from PIL import Image
+
+    with Image.open(io.BytesIO(image_bytes)) as image:
+        return image.size
+
+
+def _serve_as_virtual_files() -> bool:
+    from marimo._runtime.context import (
+        ContextNotInitializedError,
+        get_context,
+    )
+
+    try:
+        ctx = get_context()
+    except ContextNotInitializedError:
+        return False
+    experimental = ctx.marimo_config.get("experimental", {})
+    return bool(experimental.get("image_virtual_files", False))
+
+
+def _image_url(
+    image_bytes: bytes, image_format: str, mimetype: KnownMimeType
+) -> str:
+    """A URL for a rendered figure.
+
+    With the `image_virtual_files` experimental flag, the image is stored as
+    a virtual file owned by the running cell, so that outputs (and the
+    session state replayed to reconnecting clients) carry a short URL
+    instead of the base64-encoded image.
+    """
+    if _serve_as_virtual_files():
+        # Falls back to a data URL when virtual files aren't supported
+        # (e.g., when exporting).
+        return mo_data.image(image_bytes, ext=image_format).url
+    return build_data_url(
+        mimetype=mimetype, data=base64.b64encode(image_bytes)
+    )
+
+
 def _render_figure_mimebundle(
     fig: FigureCanvasBase,
 ) -> tuple[KnownMimeType, str]:
@@ -68,7 +126,9 @@ def _render_figure_mimebundle(
         Tuple of (mimetype, data). If `matplotlib.rcParams["savefig.format"]` is 'svg',
         mimetype is 'image/svg+xml' and data is the Base64-encoded SVG data URL.
         Otherwise, mimetype is 'application/vnd.marimo+mimebundle' and data is a JSON string
-        representing a mimebundle containing the PNG data URL and display metadata.
+        representing a mimebundle containing the image URL and display metadata.
+        The image is a PNG unless `savefig.format` is 'jpeg' or 'webp' and
+        the `image_virtual_files` experimental flag is on.
     """
     buf = io.BytesIO()
 
@@ -76,34 +136,40 @@ def _render_figure_mimebundle(
     # inlined into the DOM. This avoids sanitization complexity (SVG can
     # contain scripts, event handlers, etc.) at the cost of non-selectable
     # text. Could inline with a stricter sanitizer if that's needed.
-    if plt.rcParams["savefig.format"] == "svg":
+    savefig_format = plt.rcParams["savefig.format"]
+    if savefig_format == "svg":
         fig.figure.savefig(buf, format="svg", bbox_inches="tight")  # type: ignore[attr-defined]
         svg_bytes = buf.getvalue()
         plot_bytes = base64.b64encode(svg_bytes)
         data_url = build_data_url(mimetype="image/svg+xml", data=plot_bytes)
         return "image/svg+xml", data_url
 
+    # Other raster formats are only used for images served as virtual files;
+    # inline data URLs stay PNG, as they were before the flag existed.
+    image_format = (
+        savefig_format
+        if savefig_format in _RASTER_FORMATS and _serve_as_virtual_files()
+        else "png"
+    )
+    image_mimetype = _RASTER_FORMATS[image_format]
     render_dpi = fig.figure.dpi * 2
     fig.figure.savefig(  # type: ignore[attr-defined]
-        buf, format="png", bbox_inches="tight", dpi=render_dpi
+        buf, format=image_format, bbox_inches="tight", dpi=render_dpi
     )
 
-    png_bytes = buf.getvalue()
-    plot_bytes = base64.b64encode(png_bytes)
-
-    image_mimetype: KnownMimeType = "image/png"
-    data_url = build_data_url(mimetype=image_mimetype, data=plot_bytes)
+    image_bytes = buf.getvalue()
+    url = _image_url(image_bytes, image_format, image_mimetype)
 
     try:
-        # Extract dimensions from the PNG
-        width, height = _extract_png_dimensions(png_bytes)
+        # Extract dimensions from the image
+        width, height = _extract_image_dimensions(image_bytes, image_format)
         # Normalize to a fixed 100 DPI reference for consistent display size
         # https://matplotlib.org/stable/api/_as_gen/matplotlib.figure.Figure.html
         display_factor = render_dpi / 100
         mimebundle = {
-            "image/png": data_url,
+            image_mimetype: url,
             METADATA_KEY: {
-                "image/png": {
+                image_mimetype: {
                     "width": round(width / display_factor),
                     "height": round(height / display_factor),
                 }
@@ -113,9 +179,9 @@ def _render_figure_mimebundle(
             "application/vnd.marimo+mimebundle",
             json.dumps(mimebundle),
         )
-    except (ValueError, struct.error, IndexError):
+    except (ValueError, struct.error, IndexError, OSError):
         # Fall back to plain image if dimension extraction fails
-        return (image_mimetype, data_url)
+        return (image_mimetype, url)
 
 
 def _internal_show(canvas: FigureCanvasBase) -> None:
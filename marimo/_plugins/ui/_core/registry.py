@@ -126,6 +126,10 @@ class UIElementRegistry:
     def get_cell(self, object_id: UIElementId) -> CellId_t:
         return self._constructing_cells[object_id]
 
+    def constructing_cells(self) -> set[CellId_t]:
+        """Cells that constructed the registered UI elements."""
+        return set(self._constructing_cells.values())
+
     def resolve_lens(
         self, object_id: UIElementId, value: LensValue[T]
     ) -> tuple[UIElementId, LensValue[T]]:
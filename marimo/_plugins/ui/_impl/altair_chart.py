@@ -23,6 +23,9 @@ from marimo._messaging.mimetypes import KnownMimeType
 from marimo._output.hypertext import is_non_interactive
 from marimo._output.rich_help import mddoc
 from marimo._plugins.ui._core.ui_element import UIElement
+from marimo._plugins.ui._impl.charts.altair_aggregate import (
+    preaggregate_chart,
+)
 from marimo._plugins.ui._impl.charts.altair_transformer import (
     register_transformers,
     sanitize_nan_infs,
@@ -100,6 +103,13 @@ def _get_binned_fields(spec: VegaSpec) -> dict[str, Any]:
     return binned_fields
 
 
+def _get_bin_step(bin_config: Any) -> Any:
+    """Return the bin size of a field that is already binned, if known."""
+    if isinstance(bin_config, dict) and bin_config.get("binned"):
+        return bin_config.get("step")
+    return None
+
+
 def _has_geoshape(spec: altair.TopLevelMixin) -> bool:
     """Return True if the spec has geoshape."""
     try:
@@ -294,6 +304,18 @@ def _filter_dataframe(
             dtype = schema[field]
             resolved_values = _resolve_values(values, dtype)
 
+            # Pre-binned fields (see `preaggregate_chart`) select bins by
+            # their start
+            bin_step = _get_bin_step(binned_fields.get(field))
+            if (
+                is_binned
+                and bin_step is not None
+                and len(resolved_values) == 1
+                and isinstance(resolved_values[0], (int, float))
+            ):
+                start = resolved_values[0]
+                resolved_values = [start, start + bin_step]
+
             # Validate that resolved values have compatible types
             # If coercion failed, the values will still be strings when they should be dates/numbers
             if nw.Date == dtype or (
@@ -563,6 +585,10 @@ class altair_chart(UIElement[ChartSelection, ChartDataType]):
         # Fix vegafusion background to be transparent
         chart = maybe_fix_vegafusion_background(chart)
 
+        # Large charts draw their aggregated rows; selections are still
+        # applied to the original data
+        chart = preaggregate_chart(chart)
+
         try:
             vega_spec = _parse_spec(chart)
         except Exception:
@@ -635,7 +661,7 @@ class altair_chart(UIElement[ChartSelection, ChartDataType]):
             )
 
         self.dataframe: ChartDataType | None = self._get_dataframe_from_chart(
-            chart
+            original_chart
         )
 
         self._spec = vega_spec
@@ -0,0 +1,537 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Server-side pre-aggregation of large Altair charts.
+
+Altair's data transformers only see a chart's data, never its encodings,
+so they ship every row to the browser even when the chart draws a few
+dozen bars. For single-view charts over more than `max_rows` rows, this
+module evaluates the chart's `filter` transforms and the `bin`, `timeUnit`
+and `aggregate` of its encodings with narwhals (so on the dataframe's own
+backend: polars, DuckDB, pandas, ...) and rewrites the chart to draw the
+aggregated rows instead.
+
+The rewritten chart has one row per group, so each aggregate is re-encoded
+as `max` over its pre-computed column (an identity on a single row). This
+keeps the chart looking and behaving like an aggregated chart on the
+frontend. Binned fields keep their names and ship their bin starts, with
+the bin ends as `x2`/`y2`, so that selections still refer to columns of
+the original data. Charts using anything else (expression filters,
+composite marks, layers, ...) are left untouched.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+import narwhals.stable.v2 as nw
+
+from marimo import _loggers
+from marimo._utils.narwhals_utils import can_narwhalify
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import altair
+
+LOGGER = _loggers.marimo_logger()
+
+ChartT = TypeVar("ChartT", bound="altair.TopLevelMixin")
+
+# Used when `max_rows` is not set on altair's data transformers
+DEFAULT_MAX_ROWS = 20_000
+
+# Marks that draw one mark per row; composite marks (boxplot, errorbar,
+# ...) aggregate raw rows themselves
+_MARKS = {
+    "arc",
+    "area",
+    "bar",
+    "circle",
+    "line",
+    "point",
+    "rect",
+    "rule",
+    "square",
+    "text",
+    "tick",
+    "trail",
+}
+
+# Channels whose bins can be drawn from a start and an end field
+_BIN_END_CHANNELS = {"x": "x2", "y": "y2"}
+
+# Vega-Lite's default maxbins for positional channels
+_MAXBINS = 10
+
+# Vega-Lite aggregate op -> expression of the aggregated field
+_AGGREGATES: dict[str, Callable[[Any], nw.Expr]] = {
+    "count": lambda _field: nw.len(),
+    "valid": lambda field: nw.col(field).count(),
+    "missing": lambda field: nw.col(field).null_count(),
+    "distinct": lambda field: nw.col(field).n_unique(),
+    "sum": lambda field: nw.col(field).sum(),
+    "mean": lambda field: nw.col(field).mean(),
+    "average": lambda field: nw.col(field).mean(),
+    "median": lambda field: nw.col(field).median(),
+    "min": lambda field: nw.col(field).min(),
+    "max": lambda field: nw.col(field).max(),
+    "stdev": lambda field: nw.col(field).std(ddof=1),
+    "stdevp": lambda field: nw.col(field).std(ddof=0),
+    "variance": lambda field: nw.col(field).var(ddof=1),
+    "variancep": lambda field: nw.col(field).var(ddof=0),
+}
+
+# Vega-Lite timeUnit -> truncation interval
+_TIME_UNITS = {
+    "year": "1y",
+    "yearquarter": "1q",
+    "yearmonth": "1mo",
+    "yearmonthdate": "1d",
+    "yearmonthdatehours": "1h",
+    "yearmonthdatehoursminutes": "1m",
+    "yearmonthdatehoursminutesseconds": "1s",
+}
+
+_BIN_PARAMS = {
+    "base",
+    "divide",
+    "maxbins",
+    "minstep",
+    "nice",
+    "step",
+    "steps",
+}
+
+# Vega's bin transform nudges values by this much before flooring
+_BIN_EPSILON = 1e-14
+
+
+class _Unsupported(Exception):
+    """The chart uses a feature that isn't evaluated server-side."""
+
+
+def preaggregate_chart(chart: ChartT) -> ChartT:
+    """Return `chart` drawing its aggregated rows, if it has many rows.
+
+    Returns `chart` itself when it is small, not a single-view chart with an
+    aggregate, or uses transforms that are only evaluated by Vega.
+    """
+    import altair as alt
+
+    if alt.data_transformers.active.startswith("vegafusion"):
+        # vegafusion already evaluates transforms server-side
+        return chart
+    max_rows = alt.data_transformers.options.get("max_rows", DEFAULT_MAX_ROWS)
+    if max_rows is None:
+        return chart
+    aggregated = _preaggregate(chart, max_rows)
+    if aggregated is None:
+        return chart
+    # The aggregated chart is a copy of `chart`, so it has the same type
+    return cast("ChartT", aggregated)
+
+
+def _preaggregate(
+    chart: altair.TopLevelMixin, max_rows: int
+) -> altair.Chart | None:
+    """`chart` drawing its aggregated rows, or `None` to leave it as is."""
+    import altair as alt
+
+    if not isinstance(chart, alt.Chart) or not can_narwhalify(chart.data):
+        return None
+
+    try:
+        mark = _mark_type(chart.mark)
+        if mark not in _MARKS:
+            return None
+        encoding = chart.encoding.to_dict(
+            validate=False, context={"data": chart.data}
+        )
+        filters = _filters(chart.transform)
+        plan = _Plan.from_encoding(encoding)
+    except _Unsupported as e:
+        LOGGER.debug("Not pre-aggregating chart: %s", e)
+        return None
+    except Exception as e:
+        LOGGER.debug("Failed to inspect chart for pre-aggregation: %s", e)
+        return None
+
+    if not plan.aggregates:
+        # Without an aggregate, every row is drawn
+        return None
+
+    df = nw.from_native(chart.data)
+    if _num_rows(df) <= max_rows:
+        return None
+
+    try:
+        aggregated = plan.evaluate(df.lazy(), filters)
+    except _Unsupported as e:
+        LOGGER.debug("Not pre-aggregating chart: %s", e)
+        return None
+    except Exception as e:
+        LOGGER.warning("Failed to pre-aggregate chart data: %s", e)
+        return None
+
+    result = chart.copy()
+    result.data = aggregated
+    result.encoding = alt.FacetedEncoding.from_dict(
+        plan.encoding, validate=False
+    )
+    result.transform = alt.Undefined
+    return result
+
+
+def _mark_type(mark: Any) -> str:
+    if isinstance(mark, str):
+        return mark
+    if hasattr(mark, "to_dict"):
+        mark = mark.to_dict(validate=False)
+    mark_type = mark.get("type") if isinstance(mark, dict) else None
+    if isinstance(mark_type, str):
+        return mark_type
+    raise _Unsupported(f"mark {mark!r}")
+
+
+def _num_rows(df: nw.DataFrame[Any] | nw.LazyFrame[Any]) -> int:
+    if isinstance(df, nw.DataFrame):
+        return len(df)
+    return int(df.select(nw.len()).collect().item())
+
+
+def _filters(transforms: Any) -> list[nw.Expr]:
+    """Filter expressions for a chart's transforms."""
+    import altair as alt
+
+    if transforms is alt.Undefined:
+        return []
+    filters: list[nw.Expr] = []
+    for transform in transforms:
+        spec = (
+            transform.to_dict(validate=False)
+            if hasattr(transform, "to_dict")
+            else transform
+        )
+        if not isinstance(spec, dict) or set(spec) != {"filter"}:
+            raise _Unsupported(f"transform {spec!r}")
+        filters.append(_predicate(spec["filter"]))
+    return filters
+
+
+def _predicate(predicate: Any) -> nw.Expr:
+    """Translate a Vega-Lite field predicate."""
+    if not isinstance(predicate, dict):
+        # Expression strings are evaluated by Vega
+        raise _Unsupported(f"filter {predicate!r}")
+    if "and" in predicate:
+        return _all([_predicate(p) for p in predicate["and"]])
+    if "or" in predicate:
+        return _any([_predicate(p) for p in predicate["or"]])
+    if "not" in predicate:
+        return ~_predicate(predicate["not"])
+
+    field = predicate.get("field")
+    if not isinstance(field, str) or set(predicate) & {"timeUnit", "param"}:
+        raise _Unsupported(f"filter {predicate!r}")
+    _check_field(field)
+    if any(isinstance(value, dict) for value in predicate.values()):
+        # Vega-Lite DateTime objects
+        raise _Unsupported(f"filter {predicate!r}")
+    col = nw.col(field)
+    # narwhals types comparisons as returning `Any`
+    if "equal" in predicate:
+        return cast("nw.Expr", col == predicate["equal"])
+    if "lt" in predicate:
+        return cast("nw.Expr", col < predicate["lt"])
+    if "lte" in predicate:
+        return cast("nw.Expr", col <= predicate["lte"])
+    if "gt" in predicate:
+        return cast("nw.Expr", col > predicate["gt"])
+    if "gte" in predicate:
+        return cast("nw.Expr", col >= predicate["gte"])
+    if "oneOf" in predicate:
+        return col.is_in(predicate["oneOf"])
+    if "range" in predicate:
+        low, high = predicate["range"]
+        conditions = []
+        if low is not None:
+            conditions.append(col >= low)
+        if high is not None:
+            conditions.append(col <= high)
+        return _all(conditions) if conditions else nw.lit(True)
+    if "valid" in predicate:
+        valid = ~col.is_null()
+        return valid if predicate["valid"] else ~valid
+    raise _Unsupported(f"filter {predicate!r}")
+
+
+def _all(conditions: list[nw.Expr]) -> nw.Expr:
+    return nw.all_horizontal(*conditions, ignore_nulls=False)
+
+
+def _any(conditions: list[nw.Expr]) -> nw.Expr:
+    return nw.any_horizontal(*conditions, ignore_nulls=False)
+
+
+def _check_field(field: Any) -> str:
+    if not isinstance(field, str) or any(c in field for c in ".[]\\"):
+        # Nested or escaped field access is resolved by Vega
+        raise _Unsupported(f"field {field!r}")
+    return field
+
+
+def _aggregate_name(op: str, field: str | None) -> str:
+    # Vega-Lite's own names for aggregated fields
+    return "__count" if op == "count" else f"{op}_{field}"
+
+
+def _aggregate_title(op: str, field: str | None) -> str:
+    # Vega-Lite's default titles for aggregated fields
+    if op == "count":
+        return "Count of Records"
+    return f"{op[0].upper()}{op[1:]} of {field}"
+
+
+def _bin_extent(
+    params: dict[str, Any], low: float, high: float, maxbins: int
+) -> tuple[float, float, float]:
+    """Return (start, stop, step) as computed by Vega's bin transform."""
+    maxbins = params.get("maxbins", maxbins)
+    base = params.get("base", 10)
+    divide = params.get("divide", [5, 2])
+    log_base = math.log(base)
+    span = (high - low) or abs(low) or 1
+
+    if "step" in params:
+        step = params["step"]
+    elif "steps" in params:
+        target = span / maxbins
+        steps = params["steps"]
+        i = 0
+        while i < len(steps) and steps[i] < target:
+            i += 1
+        step = steps[max(0, i - 1)]
+    else:
+        level = math.ceil(math.log(maxbins) / log_base)
+        minstep = params.get("minstep", 0)
+        step = max(
+            minstep,
+            base ** (round(math.log(span) / log_base) - level),
+        )
+        while math.ceil(span / step) > maxbins:
+            step *= base
+        for div in divide:
+            candidate = step / div
+            if candidate >= minstep and span / candidate <= maxbins:
+                step = candidate
+
+    value = math.log(step)
+    precision = 0 if value >= 0 else int(-value / log_base) + 1
+    eps = base ** (-precision - 1)
+    start, stop = low, high
+    if params.get("nice", True):
+        value = math.floor(low / step + eps) * step
+        start = value - step if low < value else value
+        stop = math.ceil(high / step) * step
+    if stop == start:
+        stop = start + step
+    return start, stop, step
+
+
+class _Plan:
+    """How to aggregate a chart's data and re-encode the result."""
+
+    def __init__(self) -> None:
+        # The rewritten encoding
+        self.encoding: dict[str, Any] = {}
+        # Group-by fields, and how each is derived from its source field
+        self.raw_keys: list[str] = []
+        self.time_units: dict[str, str] = {}
+        # field -> (channel, bin params)
+        self.bins: dict[str, tuple[str, dict[str, Any]]] = {}
+        # aggregated column -> expression
+        self.aggregates: dict[str, nw.Expr] = {}
+        self._usages: dict[str, object] = {}
+
+    @staticmethod
+    def from_encoding(encoding: dict[str, Any]) -> _Plan:
+        plan = _Plan()
+        for channel, definition in encoding.items():
+            if channel in ("x2", "y2"):
+                # Pre-computed ends are left to Vega
+                raise _Unsupported(f"channel {channel}")
+            if isinstance(definition, list):
+                plan.encoding[channel] = [
+                    plan._add(channel, item) for item in definition
+                ]
+            else:
+                plan.encoding[channel] = plan._add(channel, definition)
+        return plan
+
+    def _use(self, field: str, usage: object) -> None:
+        # A field is grouped by in a single way
+        if self._usages.setdefault(field, usage) != usage:
+            raise _Unsupported(f"field {field} is used more than once")
+
+    def _add(self, channel: str, definition: Any) -> Any:
+        if not isinstance(definition, dict):
+            raise _Unsupported(f"encoding {channel}")
+        if "field" not in definition and "aggregate" not in definition:
+            # value or datum
+            if isinstance(definition.get("condition"), dict) and (
+                "field" in definition["condition"]
+            ):
+                raise _Unsupported(f"condition on {channel}")
+            return definition
+        if isinstance(definition.get("sort"), dict):
+            # Sorting by another field or op sees the raw rows
+            raise _Unsupported(f"sort on {channel}")
+        if isinstance(definition.get("condition"), (dict, list)):
+            raise _Unsupported(f"condition on {channel}")
+
+        if "aggregate" in definition:
+            return self._add_aggregate(channel, definition)
+
+        field = _check_field(definition.get("field"))
+        result = dict(definition)
+        bin_params = definition.get("bin")
+        time_unit = definition.get("timeUnit")
+        if bin_params and time_unit:
+            raise _Unsupported(f"bin and timeUnit on {channel}")
+
+        if bin_params:
+            if bin_params is True:
+                bin_params = {}
+            if (
+                not isinstance(bin_params, dict)
+                or channel not in _BIN_END_CHANNELS
+                or not set(bin_params) <= _BIN_PARAMS
+            ):
+                raise _Unsupported(f"bin on {channel}")
+            self._use(field, ("bin", channel))
+            self.bins[field] = (channel, bin_params)
+            # Bins are drawn from their start and end
+            result["bin"] = {"binned": True}
+            result.setdefault("title", f"{field} (binned)")
+            self.encoding[_BIN_END_CHANNELS[channel]] = {
+                "field": f"{field}_end"
+            }
+        elif time_unit:
+            unit = (
+                time_unit.removeprefix("utc")
+                if isinstance(time_unit, str)
+                else None
+            )
+            if unit not in _TIME_UNITS:
+                raise _Unsupported(f"timeUnit {time_unit!r}")
+            self._use(field, ("timeUnit", unit))
+            self.time_units[field] = unit
+            # Truncated values are naive, so keep Vega from shifting them
+            # to local time
+            result["timeUnit"] = f"utc{unit}"
+        else:
+            self._use(field, "raw")
+            if field not in self.raw_keys:
+                self.raw_keys.append(field)
+        return result
+
+    def _add_aggregate(self, channel: str, definition: dict[str, Any]) -> Any:
+        op = definition["aggregate"]
+        field = definition.get("field")
+        if not isinstance(op, str) or op not in _AGGREGATES:
+            raise _Unsupported(f"aggregate {op!r} on {channel}")
+        if definition.get("bin") or definition.get("timeUnit"):
+            raise _Unsupported(f"aggregate of a derived field on {channel}")
+        if op != "count":
+            _check_field(field)
+        name = _aggregate_name(op, field)
+        self.aggregates[name] = _AGGREGATES[op](field).alias(name)
+
+        result = {
+            key: value
+            for key, value in definition.items()
+            if key not in ("aggregate", "field")
+        }
+        result["field"] = name
+        # One row per group: max is the identity, and keeps the channel
+        # aggregated so the frontend treats it as such
+        result["aggregate"] = "max"
+        result["type"] = "quantitative"
+        result.setdefault("title", _aggregate_title(op, field))
+        return result
+
+    def evaluate(self, df: nw.LazyFrame[Any], filters: list[nw.Expr]) -> Any:
+        """Aggregate `df`, returning a native dataframe."""
+        schema = df.collect_schema()
+        names = set(schema.names())
+        outputs = set(self.aggregates) | {
+            f"{field}_end" for field in self.bins
+        }
+        if outputs & names:
+            raise _Unsupported(f"columns {sorted(outputs & names)} exist")
+
+        if filters:
+            df = df.filter(_all(filters))
+
+        # Group keys are computed under temporary names, so that
+        # aggregates still see the original columns
+        keys: dict[str, nw.Expr] = {}
+        for field, unit in self.time_units.items():
+            dtype = schema[field]
+            if not (dtype == nw.Date or dtype == nw.Datetime):
+                raise _Unsupported(f"timeUnit on {dtype} column {field}")
+            keys[field] = nw.col(field).dt.truncate(_TIME_UNITS[unit])
+        keys.update(self._bin_keys(df, schema))
+
+        temporary = {f"__marimo_key_{i}": name for i, name in enumerate(keys)}
+        df = df.with_columns(
+            expr.alias(alias)
+            for alias, expr in zip(temporary, keys.values(), strict=True)
+        )
+        group_by = [*self.raw_keys, *temporary]
+        aggregates = list(self.aggregates.values())
+        if group_by:
+            result = df.group_by(group_by).agg(*aggregates)
+        else:
+            result = df.select(*aggregates)
+        return result.rename(temporary).collect().to_native()
+
+    def _bin_keys(
+        self, df: nw.LazyFrame[Any], schema: Any
+    ) -> dict[str, nw.Expr]:
+        if not self.bins:
+            return {}
+        for field in self.bins:
+            if not schema[field].is_numeric():
+                raise _Unsupported(f"bin on {schema[field]} column {field}")
+        extents = (
+            df.select(
+                *(
+                    nw.col(field).min().alias(f"{field}_min")
+                    for field in self.bins
+                ),
+                *(
+                    nw.col(field).max().alias(f"{field}_max")
+                    for field in self.bins
+                ),
+            )
+            .collect()
+            .rows(named=True)[0]
+        )
+
+        keys: dict[str, nw.Expr] = {}
+        for field, (channel, params) in self.bins.items():
+            low, high = extents[f"{field}_min"], extents[f"{field}_max"]
+            if low is None or high is None:
+                raise _Unsupported(f"no values to bin in {field}")
+            start, stop, step = _bin_extent(params, low, high, _MAXBINS)
+            # Same as Vega: the maximum falls in the last bin
+            index = (
+                (nw.col(field).clip(start, stop - step) - start) / step
+                + _BIN_EPSILON
+            ).floor()
+            keys[field] = start + index * step
+            keys[f"{field}_end"] = start + (index + 1) * step
+            # Tell the frontend the size of the bins
+            self.encoding[channel]["bin"] = {"binned": True, "step": step}
+        return keys
@@ -7,10 +7,11 @@ import inspect
 import json
 import uuid
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, ClassVar, Final, Literal, cast
+from typing import TYPE_CHECKING, Any, ClassVar, Final, cast
 
 from marimo import _loggers
 from marimo._ai._types import (
+    AI_SDK_VERSION,
     ChatMessage,
     ChatModelConfig,
     ChatModelConfigDict,
@@ -40,9 +41,6 @@ DEFAULT_CONFIG = ChatModelConfigDict(
     presence_penalty=0,
 )
 
-# The version of the Vercel AI SDK we use.
-AI_SDK_VERSION: Final[Literal[5, 6, 7]] = 7
-DONE_CHUNK: Final[str] = "[DONE]"
 USER_CANCELLED_ABORT_REASON: Final[str] = "user_cancelled"
 
 
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import ast
+import bisect
 import datetime
 from copy import deepcopy
 from dataclasses import dataclass
@@ -311,10 +312,24 @@ def _apply_edits_dataframe(
     native_df: IntoDataFrame, edits: DataEdits, schema: nw.Schema | None
 ) -> IntoDataFrame:
     df = nw.from_native(native_df, eager_only=True)
-    column_oriented = df.to_dict(as_series=False)
     schema = schema or cast(nw.Schema, df.schema)
 
-    # TODO: We should try to find more performant methods of bulk edits for dataframes
+    try:
+        new_df = _apply_edits_native(df, edits, schema)
+    except Exception as e:
+        # Some edits can't be expressed natively (e.g., writing a null into
+        # a non-nullable pandas column, or values into an all-null column);
+        # fall back to the Python round-trip, which lets the backend infer
+        # dtypes from scratch.
+        LOGGER.debug("Falling back to column-oriented edits: %s", e)
+        return _apply_edits_via_python(df, edits, schema)
+    return nw.maybe_reset_index(new_df).to_native()  # type: ignore[no-any-return]
+
+
+def _apply_edits_via_python(
+    df: nw.DataFrame[Any], edits: DataEdits, schema: nw.Schema
+) -> IntoDataFrame:
+    column_oriented = df.to_dict(as_series=False)
     new_data = _apply_edits_column_oriented(column_oriented, edits, schema)
     new_native_df = nw.from_dict(
         new_data, backend=nw.get_native_namespace(df)
@@ -322,6 +337,164 @@ def _apply_edits_dataframe(
     return new_native_df  # type: ignore[no-any-return]
 
 
+def _apply_edits_native(
+    df: nw.DataFrame[Any], edits: DataEdits, schema: nw.Schema
+) -> nw.DataFrame[Any]:
+    """Apply edits with dataframe operations, without leaving the backend.
+
+    Edits are applied in order, but consecutive runs of the same kind are
+    batched: cell edits become one scatter per column, and row removals
+    become a single filter.
+    """
+    all_edits = edits["edits"]
+    i = 0
+    while i < len(all_edits):
+        edit = all_edits[i]
+        if is_positional_edit(edit):
+            j = i
+            while j < len(all_edits) and is_positional_edit(all_edits[j]):
+                j += 1
+            df = _apply_positional_edits_native(
+                df, cast(list[PositionalEdit], all_edits[i:j]), schema
+            )
+            i = j
+        elif is_row_edit(edit):
+            j = i
+            while j < len(all_edits) and is_row_edit(all_edits[j]):
+                j += 1
+            df = _apply_row_edits_native(
+                df, cast(list[RowEdit], all_edits[i:j])
+            )
+            i = j
+        elif is_column_edit(edit):
+            df = _apply_column_edit_native(df, edit)
+            i += 1
+        else:
+            i += 1
+    return df
+
+
+def _apply_positional_edits_native(
+    df: nw.DataFrame[Any],
+    edits: list[PositionalEdit],
+    schema: nw.Schema,
+) -> nw.DataFrame[Any]:
+    """Scatter a batch of cell edits into their columns."""
+    # Group by column; later edits to the same cell win.
+    by_column: dict[str, dict[int, Any]] = {}
+    for edit in edits:
+        by_column.setdefault(edit["columnId"], {})[edit["rowIdx"]] = edit[
+            "value"
+        ]
+
+    n_rows = max(max(rows) for rows in by_column.values()) + 1
+    if n_rows > len(df):
+        df = _extend_rows_native(df, n_rows - len(df))
+
+    backend = nw.get_native_namespace(df)
+    new_columns: list[nw.Series[Any]] = []
+    for column_id, rows in by_column.items():
+        column = df.get_column(column_id)
+        original_value = column.item(0) if len(column) else None
+        dtype = schema.get(column_id)
+        values = [
+            _convert_value(value, original_value, dtype)
+            for value in rows.values()
+        ]
+        new_columns.append(
+            column.scatter(
+                list(rows.keys()),
+                nw.new_series(
+                    column_id, values, dtype=column.dtype, backend=backend
+                ),
+            )
+        )
+    return df.with_columns(new_columns)
+
+
+def _extend_rows_native(
+    df: nw.DataFrame[Any], count: int
+) -> nw.DataFrame[Any]:
+    """Append `count` all-null rows, keeping each column's dtype."""
+    backend = nw.get_native_namespace(df)
+    nulls = nw.from_dict(
+        {
+            name: nw.new_series(
+                name, [None] * count, dtype=dtype, backend=backend
+            )
+            for name, dtype in df.schema.items()
+        },
+    )
+    return nw.concat([df, nulls], how="vertical")
+
+
+def _apply_row_edits_native(
+    df: nw.DataFrame[Any], edits: list[RowEdit]
+) -> nw.DataFrame[Any]:
+    """Drop a batch of rows with one filter.
+
+    Each removal's index refers to the frame after the previous removals,
+    so translate the indices back to positions in `df` first.
+    """
+    remaining = len(df)
+    removed: list[int] = []  # sorted positions in `df`
+    for edit in edits:
+        row_idx = edit["rowIdx"]
+        if edit["type"] != "remove" or not _is_valid_index(row_idx, remaining):
+            continue
+        position = row_idx
+        for r in removed:
+            if r <= position:
+                position += 1
+            else:
+                break
+        bisect.insort(removed, position)
+        remaining -= 1
+
+    if not removed:
+        return df
+
+    index_name = "__marimo_row_index__"
+    while index_name in df.columns:
+        index_name = f"_{index_name}_"
+    return (
+        df.with_row_index(index_name)
+        .filter(~nw.col(index_name).is_in(removed))
+        .drop(index_name)
+    )
+
+
+def _apply_column_edit_native(
+    df: nw.DataFrame[Any], edit: ColumnEdit
+) -> nw.DataFrame[Any]:
+    """Apply a column insert, rename, or removal."""
+    column_order = df.columns
+    new_column_name = edit.get("newName")
+    _validate_column_edit(edit, len(column_order), new_column_name)
+
+    column_idx = edit["columnIdx"]
+    edit_type = edit["type"]
+
+    if edit_type == "insert":
+        assert new_column_name is not None
+        return df.with_columns(nw.lit(None).alias(new_column_name)).select(
+            column_order[:column_idx]
+            + [new_column_name]
+            + column_order[column_idx:]
+        )
+
+    if column_idx >= len(column_order):
+        raise ValueError(f"Column index {column_idx} not found")
+    column_id = column_order[column_idx]
+
+    if edit_type == "rename":
+        assert new_column_name is not None
+        return df.rename({column_id: new_column_name})
+    elif edit_type == "remove":
+        return df.drop(column_id)
+    return df
+
+
 def _convert_value(
     value: Any,
     original_value: Any,
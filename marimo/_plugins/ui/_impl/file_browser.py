@@ -1,9 +1,12 @@
 # Copyright 2026 Marimo. All rights reserved.
 from __future__ import annotations
 
+import os
 import re
-from collections.abc import Callable, Sequence
-from dataclasses import dataclass
+import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import (
     Any,
@@ -18,6 +21,7 @@ from marimo._plugins.ui._core.ui_element import UIElement
 from marimo._runtime.functions import Function
 from marimo._utils.files import natural_sort
 from marimo._utils.paths import is_cloudpath, normalize_path
+from marimo._utils.platform import is_pyodide
 
 LOGGER = _loggers.marimo_logger()
 
@@ -163,9 +167,99 @@ def _warn_default_root_once(root: Path) -> None:
     )
 
 
+# How long a directory listing is reused when navigating back to it.
+# Continuation pages always reuse the listing of their first page, so that
+# offsets stay stable while the user pages through a directory.
+_LISTING_TTL_SECONDS: Final[float] = 5.0
+# Directories kept in each file browser's listing cache.
+_LISTING_CACHE_SIZE: Final[int] = 8
+# Concurrent metadata requests when resolving entry types of cloud paths.
+_METADATA_WORKERS: Final[int] = 16
+
+
+@dataclass
+class _ListingEntry:
+    """A directory entry with lazily resolved, cached type information."""
+
+    name: str
+    path: str
+    # None until resolved; local entries are resolved from the scandir
+    # result, cloud entries on demand for the page being listed.
+    is_directory: bool | None = None
+    # The original path object, kept for non-local paths so metadata
+    # lookups reuse its client.
+    path_obj: Path | None = None
+    # Cached result of the recursive emptiness check.
+    has_files: bool | None = None
+
+
+@dataclass
+class _DirectoryListing:
+    entries: list[_ListingEntry]
+    created_at: float = field(default_factory=time.monotonic)
+
+
+def _is_local_path(path: Path) -> bool:
+    return isinstance(path, Path) and not is_cloudpath(path)
+
+
+def _scan_local_directory(path: Path) -> list[_ListingEntry]:
+    """List a local directory with `os.scandir`.
+
+    Entry types come from the `DirEntry`, which on most platforms is
+    populated by the directory read itself, avoiding a `stat` per entry.
+    """
+    entries: list[_ListingEntry] = []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                is_directory = entry.is_dir()
+            except OSError:
+                is_directory = False
+            entries.append(
+                _ListingEntry(
+                    name=entry.name,
+                    path=entry.path,
+                    is_directory=is_directory,
+                )
+            )
+    return entries
+
+
+def _resolve_entry_types(entries: Iterable[_ListingEntry]) -> None:
+    """Fill in `is_directory` for entries that don't know it yet.
+
+    For cloud paths each lookup is a network round-trip, so they are issued
+    concurrently.
+    """
+    pending = [entry for entry in entries if entry.is_directory is None]
+    if not pending:
+        return
+
+    def resolve(entry: _ListingEntry) -> bool:
+        assert entry.path_obj is not None
+        try:
+            return entry.path_obj.is_dir()
+        except OSError:
+            return False
+
+    if len(pending) == 1 or is_pyodide():
+        results = [resolve(entry) for entry in pending]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(_METADATA_WORKERS, len(pending))
+        ) as executor:
+            results = list(executor.map(resolve, pending))
+    for entry, is_directory in zip(pending, results, strict=True):
+        entry.is_directory = is_directory
+
+
 @dataclass
 class ListDirectoryArgs:
     path: str
+    # Index into the directory listing to resume from; the
+    # `next_offset` of the previous page.
+    offset: int = 0
 
 
 @dataclass
@@ -188,6 +282,8 @@ class ListDirectoryResponse:
     files: list[TypedFileBrowserFileInfo]
     total_count: int
     is_truncated: bool = False  # Whether results were truncated due to limit
+    # Offset of the next page, or None if this is the last page
+    next_offset: int | None = None
 
 
 @mddoc
@@ -292,7 +388,8 @@ class file_browser(
             symlinks are skipped during traversal to prevent infinite loops.
             Filetype filtering is applied recursively and is case-insensitive.
             This may impact performance for large directory trees. Defaults to False.
-        limit (int, optional): Maximum number of files to display.
+        limit (int, optional): Maximum number of files to fetch at a time;
+            more can be loaded incrementally from the browser.
             If None (default), automatically chooses 50 for cloud storage (S3, GCS, Azure)
             or 10000 for local filesystems. Set explicitly to override defaults.
         label (str, optional): Markdown label for the element. Defaults to "".
@@ -434,6 +531,7 @@ class file_browser(
                 limit = 10000  # High limit for local filesystems
 
         self._limit = limit
+        self._listing_cache: dict[str, _DirectoryListing] = {}
 
         if self._selection_mode == _VALID_KINDS:
             wire_selection_mode = "all"
@@ -515,6 +613,9 @@ class file_browser(
             # Reached maximum depth, assume directory might have files to be safe
             return True
 
+        if _is_local_path(directory):
+            return self._has_files_recursive_local(directory, max_depth)
+
         try:
             for item in directory.iterdir():
                 if item.is_file():
@@ -539,6 +640,75 @@ class file_browser(
             # to avoid hiding potentially accessible subdirectories
             return True
 
+    def _has_files_recursive_local(
+        self, directory: Path | str, max_depth: int
+    ) -> bool:
+        """`_has_files_recursive` for local paths, using `os.scandir`."""
+        if max_depth <= 0:
+            return True
+
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_file():
+                        if (
+                            self._filetypes
+                            and os.path.splitext(entry.name)[1].lower()
+                            not in self._filetypes
+                        ):
+                            continue
+                        if not self._passes_filter(
+                            self._create_path(entry.path)
+                        ):
+                            continue
+                        return True
+                    elif entry.is_dir() and not entry.is_symlink():
+                        if self._has_files_recursive_local(
+                            entry.path, max_depth - 1
+                        ):
+                            return True
+            return False
+        except (PermissionError, OSError):
+            return True
+
+    def _get_listing(self, path: Path, *, reuse: bool) -> _DirectoryListing:
+        """Return the (cached) listing of `path`, in natural sort order.
+
+        If `reuse` is True, a cached listing is returned regardless of its
+        age; otherwise only if it is younger than `_LISTING_TTL_SECONDS`.
+        """
+        key = str(path)
+        cached = self._listing_cache.get(key)
+        if cached is not None and (
+            reuse
+            or time.monotonic() - cached.created_at < _LISTING_TTL_SECONDS
+        ):
+            return cached
+
+        try:
+            if _is_local_path(path):
+                entries = _scan_local_directory(path)
+            else:
+                entries = [
+                    _ListingEntry(
+                        name=child.name, path=str(child), path_obj=child
+                    )
+                    for child in path.iterdir()
+                ]
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Directory {path} does not exist."
+            ) from None
+        # Sort based on natural sort (alpha, then num)
+        entries.sort(key=lambda entry: natural_sort(entry.name))
+
+        listing = _DirectoryListing(entries)
+        self._listing_cache.pop(key, None)
+        self._listing_cache[key] = listing
+        while len(self._listing_cache) > _LISTING_CACHE_SIZE:
+            del self._listing_cache[next(iter(self._listing_cache))]
+        return listing
+
     def _list_directory(
         self, args: ListDirectoryArgs
     ) -> ListDirectoryResponse:
@@ -558,64 +728,82 @@ class file_browser(
         folders: list[TypedFileBrowserFileInfo] = []
         files: list[TypedFileBrowserFileInfo] = []
 
-        # Sort based on natural sort (alpha, then num)
-        try:
-            all_file_paths = sorted(
-                path.iterdir(), key=lambda f: natural_sort(f.name)
-            )
-        except FileNotFoundError:
-            raise FileNotFoundError(
-                f"Directory {path} does not exist."
-            ) from None
-        is_truncated = False
-
-        for files_examined, file in enumerate(all_file_paths, 1):
-            extension = file.suffix
-            is_directory = file.is_dir()  # Expensive call for cloud paths
-
-            # Directories are always shown so the user can navigate into
-            # them. Files are hidden when files aren't selectable.
-            if not is_directory and "file" not in self._selection_mode:
-                continue
-
-            # Skip non-matching file types (case-insensitive)
-            if self._filetypes and not is_directory:
-                if extension.lower() not in self._filetypes:
-                    continue
-
-            # Apply regex or callable filter to files
-            if not is_directory and not self._passes_filter(file):
-                continue
-
-            # Skip empty directories if ignore_empty_dirs is enabled
-            if self._ignore_empty_dirs and is_directory:
-                if not self._has_files_recursive(file):
+        offset = max(args.offset, 0)
+        entries = self._get_listing(path, reuse=offset > 0).entries
+        next_offset: int | None = None
+
+        # Entry types are resolved a batch at a time, so that cloud paths
+        # only pay for the metadata of the entries on this page.
+        batch_size = max(self._limit, 1)
+        index = offset
+        while index < len(entries) and next_offset is None:
+            batch = entries[index : index + batch_size]
+            _resolve_entry_types(batch)
+            for entry in batch:
+                index += 1
+                file_info = self._to_file_info(entry)
+                if file_info is None:
                     continue
 
-            file_info = TypedFileBrowserFileInfo(
-                id=str(file),
-                path=str(file),
-                name=file.name,
-                is_directory=is_directory,
-            )
-
-            if is_directory:
-                folders.append(file_info)
-            else:
-                files.append(file_info)
+                if file_info["is_directory"]:
+                    folders.append(file_info)
+                else:
+                    files.append(file_info)
 
-            if len(folders) + len(files) >= self._limit:
-                # handles the case where limit equals exactly the number of items
-                is_truncated = files_examined < len(all_file_paths)
-                break
+                if len(folders) + len(files) >= self._limit:
+                    # handles the case where limit equals exactly the
+                    # number of items
+                    if index < len(entries):
+                        next_offset = index
+                    break
 
         # Display folders first, then files
         all_files = folders + files
 
         return ListDirectoryResponse(
             files=all_files,
-            total_count=len(all_file_paths),
-            is_truncated=is_truncated,
+            total_count=len(entries),
+            is_truncated=next_offset is not None,
+            next_offset=next_offset,
+        )
+
+    def _to_file_info(
+        self, entry: _ListingEntry
+    ) -> TypedFileBrowserFileInfo | None:
+        """Return the file info for `entry`, or None if it is hidden."""
+        is_directory = bool(entry.is_directory)
+
+        # Directories are always shown so the user can navigate into
+        # them. Files are hidden when files aren't selectable.
+        if not is_directory and "file" not in self._selection_mode:
+            return None
+
+        # Skip non-matching file types (case-insensitive)
+        if self._filetypes and not is_directory:
+            extension = os.path.splitext(entry.name)[1]
+            if extension.lower() not in self._filetypes:
+                return None
+
+        # Apply regex or callable filter to files
+        if not is_directory and not self._passes_filter(
+            entry.path_obj or self._create_path(entry.path)
+        ):
+            return None
+
+        # Skip empty directories if ignore_empty_dirs is enabled
+        if self._ignore_empty_dirs and is_directory:
+            if entry.has_files is None:
+                entry.has_files = self._has_files_recursive(
+                    entry.path_obj or self._create_path(entry.path)
+                )
+            if not entry.has_files:
+                return None
+
+        return TypedFileBrowserFileInfo(
+            id=entry.path,
+            path=entry.path,
+            name=entry.name,
+            is_directory=is_directory,
         )
 
     def _convert_value(
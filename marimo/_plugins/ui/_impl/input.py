@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import base64
+import bisect
 import dataclasses
+import itertools
 import sys
 import traceback
 from collections.abc import Callable, Iterable, Sequence
@@ -958,11 +960,13 @@ def _to_option_name(option: Any) -> str:
 def _validate_option_name(option_name: str, options: dict[str, Any]) -> None:
     """Raise a helpful error if `option_name` isn't one of `options`."""
     if option_name not in options:
+        names = list(itertools.islice(options.keys(), 20))
+        more = " ..." if len(options) > len(names) else ""
         raise ValueError(
             f"The option name '{option_name}' "
             "is not a valid option. "
             "Please use one of the following options: "
-            f"{list(options.keys())}"
+            f"{names}{more}"
         )
 
 
@@ -989,6 +993,92 @@ def _build_option_map(options: Iterable[Any]) -> dict[str, Any]:
     return result
 
 
+@dataclass
+class SearchOptionsArgs:
+    query: str
+    limit: int = 50
+
+
+@dataclass
+class SearchOptionsResponse:
+    options: list[str]
+    # Whether more options match the query than were returned
+    has_more: bool
+
+
+class _OptionIndex:
+    """Case-insensitive search over option names, for server-side search.
+
+    Options whose name starts with the query rank first, in sorted order,
+    found by bisecting a sorted copy of the names; options that merely
+    contain the query follow in their original order. The index is built
+    on the first search.
+    """
+
+    # Upper bound on the matches returned by a single search.
+    MAX_RESULTS: Final[int] = 1000
+
+    def __init__(self, names: Iterable[str]) -> None:
+        self._names = list(names)
+        self._folded: list[str] | None = None
+        self._sorted_folded: list[str] = []
+        self._sorted_names: list[str] = []
+
+    def _build(self) -> list[str]:
+        folded = [name.casefold() for name in self._names]
+        order = sorted(range(len(folded)), key=folded.__getitem__)
+        self._sorted_folded = [folded[i] for i in order]
+        self._sorted_names = [self._names[i] for i in order]
+        self._folded = folded
+        return folded
+
+    def search(self, args: SearchOptionsArgs) -> SearchOptionsResponse:
+        limit = min(max(args.limit, 0), self.MAX_RESULTS)
+        needle = args.query.strip().casefold()
+        if not needle:
+            return SearchOptionsResponse(
+                options=self._names[:limit],
+                has_more=len(self._names) > limit,
+            )
+
+        folded = self._folded if self._folded is not None else self._build()
+        # Collect one extra match to know whether there are more.
+        matches: list[str] = []
+        i = bisect.bisect_left(self._sorted_folded, needle)
+        while (
+            i < len(self._sorted_folded)
+            and len(matches) <= limit
+            and self._sorted_folded[i].startswith(needle)
+        ):
+            matches.append(self._sorted_names[i])
+            i += 1
+
+        if len(matches) <= limit:
+            for name, key in zip(self._names, folded, strict=True):
+                if needle in key and not key.startswith(needle):
+                    matches.append(name)
+                    if len(matches) > limit:
+                        break
+
+        return SearchOptionsResponse(
+            options=matches[:limit], has_more=len(matches) > limit
+        )
+
+
+def _search_functions(
+    options: dict[str, Any], server_search: bool
+) -> tuple[Function[Any, Any], ...]:
+    if not server_search:
+        return ()
+    return (
+        Function(
+            name="search_options",
+            arg_cls=SearchOptionsArgs,
+            function=_OptionIndex(options.keys()).search,
+        ),
+    )
+
+
 @mddoc
 class dropdown(UIElement[list[str], Any]):
     """A dropdown selector.
@@ -1039,6 +1129,12 @@ class dropdown(UIElement[list[str], Any]):
             Defaults to False.
             If the number of options is greater than 1000, this will be set to True,
             automatically.
+        server_search (bool, optional): Keep the options in the kernel and
+            search them as the user types, instead of sending every option to
+            the browser. Use this for very large option sets, such as IDs
+            from a database table. Implies `searchable`. Requires a running
+            kernel, so it doesn't work in static HTML exports.
+            Defaults to False.
         label (str, optional): Markdown label for the element. Defaults to "".
         on_change (Callable[[Any], None], optional): Optional callback to run when
             this element's value changes. Defaults to None.
@@ -1063,10 +1159,11 @@ class dropdown(UIElement[list[str], Any]):
         on_change: Callable[[Any], None] | None = None,
         full_width: bool = False,
         disabled: bool = False,
+        server_search: bool = False,
     ) -> None:
         # Force searchable if there are too many options
         # This makes the list 'virtualized' on the frontend
-        if len(options) > dropdown._FORCE_SEARCHABLE:
+        if len(options) > dropdown._FORCE_SEARCHABLE or server_search:
             searchable = True
 
         if not isinstance(options, dict):
@@ -1096,13 +1193,19 @@ class dropdown(UIElement[list[str], Any]):
             initial_value=initial_value,
             label=label,
             args={
-                "options": list(self.options.keys()),
+                # With server-side search, the frontend only needs the
+                # selected option up front; it queries for the rest.
+                "options": initial_value
+                if server_search
+                else list(self.options.keys()),
                 "allow-select-none": allow_select_none,
                 "searchable": searchable,
+                "server-search": server_search,
                 "full-width": full_width,
                 "disabled": disabled,
             },
             on_change=on_change,
+            functions=_search_functions(self.options, server_search),
         )
 
     @staticmethod
@@ -1164,6 +1267,12 @@ class multiselect(UIElement[list[str], list[object]]):
         max_selections (int, optional): Maximum number of items that can be selected.
             Defaults to None.
         disabled (bool, optional): Whether the multiselect is disabled. Defaults to False.
+        server_search (bool, optional): Keep the options in the kernel and
+            search them as the user types, instead of sending every option to
+            the browser. Use this for very large option sets, such as IDs
+            from a database table; there is no limit on the number of options
+            in this mode. Requires a running kernel, so it doesn't work in
+            static HTML exports. Defaults to False.
     """
 
     _MAX_OPTIONS: Final[int] = 100000
@@ -1179,16 +1288,16 @@ class multiselect(UIElement[list[str], list[object]]):
         full_width: bool = False,
         max_selections: int | None = None,
         disabled: bool = False,
+        server_search: bool = False,
     ) -> None:
-        if len(options) > multiselect._MAX_OPTIONS:
+        if len(options) > multiselect._MAX_OPTIONS and not server_search:
             raise ValueError(
                 "The maximum number of options allowed "
                 f"is {multiselect._MAX_OPTIONS}, but your multiselect has "
                 f"{len(options)} options. "
-                "If you really want to expose that many options, consider "
-                "using `mo.ui.text()` to let the user type an option name, "
-                "and `mo.ui.table()` to present the options matching the "
-                "user's query.",
+                "If you really want to expose that many options, pass "
+                "`server_search=True` to search them from the kernel "
+                "instead of sending them all to the browser.",
             )
 
         if not isinstance(options, dict):
@@ -1213,12 +1322,18 @@ class multiselect(UIElement[list[str], list[object]]):
             initial_value=initial_value,
             label=label,
             args={
-                "options": list(self.options.keys()),
+                # With server-side search, the frontend only needs the
+                # selected options up front; it queries for the rest.
+                "options": initial_value
+                if server_search
+                else list(self.options.keys()),
                 "full-width": full_width,
                 "max-selections": max_selections,
                 "disabled": disabled,
+                "server-search": server_search,
             },
             on_change=on_change,
+            functions=_search_functions(self.options, server_search),
         )
 
     @staticmethod
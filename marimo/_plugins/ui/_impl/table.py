@@ -21,7 +21,6 @@ from narwhals.typing import IntoDataFrame
 import marimo._output.data.data as mo_data
 from marimo import _loggers
 from marimo._data.models import BinValue, ColumnStats, ValueCount
-from marimo._data.preview_column import get_column_preview_dataset
 from marimo._dependencies.dependencies import DependencyManager
 from marimo._messaging.mimetypes import KnownMimeType
 from marimo._messaging.notification import ColumnPreview
@@ -1493,6 +1492,9 @@ class table(
 
     def _preview_column(self, args: PreviewColumnArgs) -> ColumnPreview:
         """Preview a column of a dataset."""
+        # Imported here: `preview_column` imports this package
+        from marimo._data.preview_column import get_column_preview_dataset
+
         column = args.column
 
         # We use a placeholder for table names
@@ -48,6 +48,8 @@ from marimo._utils.narwhals_utils import (
 )
 
 if TYPE_CHECKING:
+    import duckdb
+
     from marimo._plugins.ui._impl.table import SortArgs
 
 LOGGER = _loggers.marimo_logger()
@@ -336,6 +338,17 @@ class NarwhalsTableManager(
         if offset == 0:
             return self.with_new_data(self.data.head(count))
         else:
+            if (
+                is_narwhals_lazyframe(self.data)
+                and self.data.implementation.is_duckdb()
+            ):
+                # Page with LIMIT/OFFSET instead of collecting every
+                # preceding row
+                relation = cast(
+                    "duckdb.DuckDBPyRelation", self.data.to_native()
+                )
+                native = relation.limit(count, offset)
+                return self.with_new_data(nw.from_native(native))
             if is_narwhals_lazyframe(self.data):
                 # Lazyframes do not support slicing, https://github.com/narwhals-dev/narwhals/issues/2389
                 # So we collect the first n rows
@@ -700,6 +713,12 @@ class NarwhalsTableManager(
     def get_num_rows(self, force: bool = True) -> int | None:
         # If force is true, collect the data and get the number of rows
         if force:
+            if (
+                is_narwhals_lazyframe(self.data)
+                and self.data.implementation.is_duckdb()
+            ):
+                # Push the count down to DuckDB (COUNT(*))
+                return int(self.data.select(nw.len()).collect().item())
             return self.as_frame().shape[0]
 
         # When lazy, we don't know the number of rows
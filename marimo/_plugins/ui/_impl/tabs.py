@@ -7,7 +7,6 @@ from marimo._output.formatting import as_html
 from marimo._output.hypertext import Html
 from marimo._output.md import md
 from marimo._output.rich_help import mddoc
-from marimo._plugins.stateless.lazy import lazy as lazy_ui
 from marimo._plugins.ui._core.ui_element import UIElement
 
 if TYPE_CHECKING:
@@ -81,6 +80,9 @@ class tabs(UIElement[str, str]):
     ) -> None:
         def render_content(tab: object) -> Html:
             if lazy:
+                # Imported here: `lazy` imports the `ui` package
+                from marimo._plugins.stateless.lazy import lazy as lazy_ui
+
                 return lazy_ui(tab)
             if isinstance(tab, str):
                 return md(tab)
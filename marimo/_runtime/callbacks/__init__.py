@@ -16,6 +16,10 @@ from marimo._runtime.callbacks.protocol import (
 )
 from marimo._runtime.callbacks.secrets import SecretsCallbacks
 from marimo._runtime.callbacks.sql import SqlCallbacks
+from marimo._runtime.callbacks.variables import (
+    VariablesCallbacks,
+    eager_variable_previews_enabled,
+)
 
 __all__ = [
     "CacheCallbacks",
@@ -26,5 +30,7 @@ __all__ = [
     "SecretsCallbacks",
     "SqlCallbacks",
     "SupportsTeardown",
+    "VariablesCallbacks",
     "cache_cells_enabled",
+    "eager_variable_previews_enabled",
 ]
@@ -29,6 +29,7 @@ from marimo._runtime.commands import (
     PreviewDatasetColumnCommand,
     PreviewSQLTableCommand,
 )
+from marimo._sql.engines.duckdb import INTERNAL_DUCKDB_ENGINE
 from marimo._sql.engines.types import EngineCatalog
 from marimo._sql.get_engines import engine_to_data_source_connection
 from marimo._tracer import kernel_tracer
@@ -361,6 +362,10 @@ class DatasetCallbacks:
         data_source_connection = engine_to_data_source_connection(
             variable_name, engine
         )
+        if variable_name == INTERNAL_DUCKDB_ENGINE:
+            self._kernel.duckdb_catalog.record_full_refresh(
+                data_source_connection.databases
+            )
 
         LOGGER.debug(
             "Broadcasting datasource connection for %s engine", variable_name
@@ -0,0 +1,99 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+from marimo._messaging.notification import (
+    MemoryUsageNotification,
+    VariableValuesNotification,
+)
+from marimo._messaging.notification_utils import broadcast_notification
+from marimo._messaging.variables import VariablePreviews
+from marimo._runtime.commands import (
+    GetMemoryUsageCommand,
+    PreviewVariablesCommand,
+)
+from marimo._runtime.memory import MemoryMonitor, estimate_memory
+from marimo._runtime.spill import SpilledValue
+from marimo._tracer import kernel_tracer
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from typing import Any
+
+    from marimo._config.config import MarimoConfig
+    from marimo._messaging.notification import VariableValue
+    from marimo._runtime.callbacks.protocol import GlobalsView
+    from marimo._runtime.request_router import RequestRouter
+
+
+def eager_variable_previews_enabled(user_config: MarimoConfig | None) -> bool:
+    """Whether variable previews are computed when variables are defined.
+
+    Set by runs without an interactive frontend to request previews
+    (exports, islands, session caches); otherwise previews of non-scalar
+    values are computed on request.
+    """
+    if user_config is None:
+        return False
+    runtime = cast("Mapping[str, Any]", user_config.get("runtime", {}))
+    return bool(runtime.get("eager_variable_previews", False))
+
+
+class VariablesCallbacks:
+    def __init__(self, scope: GlobalsView) -> None:
+        self._scope = scope
+        self.previews = VariablePreviews()
+        self.memory = MemoryMonitor()
+
+    def register(self, router: RequestRouter) -> None:
+        router.register(PreviewVariablesCommand, self.preview_variables)
+        router.register(GetMemoryUsageCommand, self.get_memory_usage)
+
+    def invalidate(self, names: Iterable[str]) -> None:
+        """Drop cached previews of variables that were redefined or may
+        have been mutated."""
+        self.previews.invalidate(names)
+
+    @kernel_tracer.start_as_current_span("preview_variables")
+    async def preview_variables(
+        self, request: PreviewVariablesCommand
+    ) -> None:
+        glbls = self._scope.globals
+        values: list[VariableValue] = []
+        for name in request.names:
+            if name not in glbls:
+                continue
+            value = glbls[name]
+            if isinstance(value, SpilledValue):
+                # Loading the value just to preview it would undo the spill
+                values.append(value.variable_value())
+            else:
+                values.append(self.previews.get(name, value))
+        if values:
+            broadcast_notification(
+                VariableValuesNotification(variables=values)
+            )
+
+    @kernel_tracer.start_as_current_span("get_memory_usage")
+    async def get_memory_usage(self, request: GetMemoryUsageCommand) -> None:
+        glbls = self._scope.globals
+        names = (
+            request.names
+            if request.names is not None
+            else [name for name in glbls if not name.startswith("_")]
+        )
+        variables = estimate_memory(
+            {name: glbls[name] for name in names if name in glbls}
+        )
+        rss = self.memory.sample()
+        broadcast_notification(
+            MemoryUsageNotification(
+                variables=sorted(
+                    variables, key=lambda v: v.size_bytes, reverse=True
+                ),
+                total_bytes=sum(v.size_bytes for v in variables),
+                rss_bytes=rss,
+                rss_history=self.memory.samples,
+            )
+        )
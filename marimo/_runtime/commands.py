@@ -598,6 +598,35 @@ class StopKernelCommand(Command):
     """
 
 
+class HibernateKernelCommand(Command):
+    """Checkpoint the kernel to disk and stop it.
+
+    Sent by the server when an edit session has been idle for a while. The
+    kernel exits once the checkpoint is written; if writing fails, it keeps
+    running.
+
+    Attributes:
+        directory: Directory to write the checkpoint to.
+    """
+
+    directory: str
+
+
+class RestoreKernelCommand(Command):
+    """Restore a new kernel from a hibernated kernel's checkpoint.
+
+    Cells whose definitions couldn't be saved are rerun, with UI elements
+    taking the values in `set_ui_element_value_request`.
+
+    Attributes:
+        directory: Directory the checkpoint was written to.
+        set_ui_element_value_request: Current UI element values.
+    """
+
+    directory: str
+    set_ui_element_value_request: UpdateUIElementCommand
+
+
 class CodeCompletionCommand(Command):
     """Request code completion suggestions.
 
@@ -646,6 +675,34 @@ class InstallPackagesCommand(Command):
     source: Literal["kernel", "server"] = "kernel"
 
 
+class PreviewVariablesCommand(Command):
+    """Compute previews of global variables.
+
+    After a run, the kernel sends only the names, types, and sizes of
+    non-scalar variables; the variables panel requests their previews when
+    it displays them. Previews are sent as a `VariableValuesNotification`.
+
+    Attributes:
+        names: Names of the variables to preview.
+    """
+
+    names: list[str]
+
+
+class GetMemoryUsageCommand(Command):
+    """Estimate the memory used by global variables.
+
+    Sizes are deep estimates; memory shared between variables is counted
+    once. The result, along with the kernel's resident set size over time,
+    is sent as a `MemoryUsageNotification`.
+
+    Attributes:
+        names: Names of the variables to measure, or None for all globals.
+    """
+
+    names: list[str] | None = None
+
+
 class PreviewDatasetColumnCommand(Command):
     """Preview a dataset column.
 
@@ -958,6 +1015,9 @@ CommandMessage = (
     | InvokeFunctionCommand
     # User/configuration operations
     | UpdateUserConfigCommand
+    # Variable and data previews
+    | PreviewVariablesCommand
+    | GetMemoryUsageCommand
     # Data SQL operations
     | PreviewDatasetColumnCommand
     | PreviewSQLTableCommand
@@ -977,6 +1037,8 @@ CommandMessage = (
     | GetCacheInfoCommand
     # Kernel operations
     | StopKernelCommand
+    | HibernateKernelCommand
+    | RestoreKernelCommand
 )
 """Union of all command messages.
 
@@ -0,0 +1,285 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Checkpointing a kernel to disk so that its process can exit.
+
+An edit session whose kernel has been idle for a while can hibernate: the
+kernel writes its cells, their run state and their definitions to a
+directory and exits, freeing its memory. When a client comes back, the
+server starts a new kernel, which restores the checkpoint instead of
+rerunning the notebook.
+
+Definitions are written with the serializers of the `marimo._save` caches
+(numpy arrays as `.npy`, dataframes as Arrow IPC, other values pickled);
+modules are re-imported by name. Some definitions can't be saved: UI
+elements, `mo.state` objects, and functions and classes defined in the
+notebook (and values that reference them). A cell that defines any of
+these, or that constructed a UI element, is rerun on restore; its
+descendants keep their restored values.
+
+Virtual files created by cells (images, downloads, ...) are restored with
+their original names, so that outputs held by the frontend keep working.
+"""
+
+from __future__ import annotations
+
+import importlib
+import io
+import pickle
+import shutil
+import types
+from typing import TYPE_CHECKING, Any
+
+import msgspec
+
+from marimo import _loggers
+from marimo._runtime.spill import SpilledValue
+from marimo._runtime.virtual_file import VirtualFileLifecycleItem
+from marimo._types.ids import CellId_t
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from marimo._ast.cell import CellConfig
+    from marimo._runtime.cell_lifecycle_registry import CellLifecycleRegistry
+    from marimo._runtime.dataflow import DirectedGraph
+
+LOGGER = _loggers.marimo_logger()
+
+CHECKPOINT_FILENAME = "checkpoint.json"
+# Written instead of the checkpoint when checkpointing fails, so that the
+# server stops waiting for the kernel to exit.
+FAILED_FILENAME = "failed"
+
+_VALUES_DIRECTORY = "values"
+_FILES_DIRECTORY = "files"
+
+# Serialization strategies (see `LAZY_STUB_LOOKUP`) tried before pickling
+_TYPED_LOADERS = ("npy", "arrow", "pt")
+
+# Run results after which a cell's definitions are complete
+_RESTORABLE_STATUSES = ("success", "disabled")
+
+
+class SavedValue(msgspec.Struct):
+    """A definition written to disk."""
+
+    # Path relative to the values directory; empty for modules
+    filename: str
+    # A key of `BLOB_DESERIALIZERS` without the dot, or "module"
+    loader: str
+    # Fully qualified type name; the module name for modules
+    type_hint: str
+
+
+class SavedCell(msgspec.Struct):
+    """A cell's code and run state."""
+
+    code: str
+    status: str | None
+    stale: bool
+    # Whether the cell must run again to recreate its definitions
+    rerun: bool = False
+    values: dict[str, SavedValue] = msgspec.field(default_factory=dict)
+    # Definitions that couldn't be saved
+    unsaved: list[str] = msgspec.field(default_factory=list)
+    # Names of virtual files in the files directory
+    virtual_files: list[str] = msgspec.field(default_factory=list)
+
+
+class Checkpoint(msgspec.Struct):
+    cells: dict[CellId_t, SavedCell]
+    configs: dict[CellId_t, dict[str, Any]]
+    # Cells not run yet because autorun on startup is disabled
+    uninstantiated: dict[CellId_t, str] = msgspec.field(default_factory=dict)
+
+
+class _CheckpointPickler(pickle.Pickler):
+    """Refuses objects that can't be recreated in a new kernel process."""
+
+    def reducer_override(self, obj: Any) -> Any:
+        from marimo._plugins.ui._core.ui_element import UIElement
+        from marimo._runtime.state import State
+
+        if isinstance(obj, (UIElement, State)):
+            raise pickle.PicklingError(f"{type(obj).__name__} is not saved")
+        if (
+            isinstance(obj, (type, types.FunctionType))
+            and getattr(obj, "__module__", None) == "__main__"
+        ):
+            # Defined in the notebook, which isn't importable
+            raise pickle.PicklingError(
+                f"{obj.__qualname__} is defined in the notebook"
+            )
+        return NotImplemented
+
+
+def _pickle(value: Any) -> bytes:
+    buffer = io.BytesIO()
+    _CheckpointPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(value)
+    return buffer.getvalue()
+
+
+def _type_hint(value: Any) -> str:
+    return f"{type(value).__module__}.{type(value).__name__}"
+
+
+def _save_value(name: str, value: Any, directory: Path) -> SavedValue | None:
+    from marimo._save.loaders.lazy import maybe_update_lazy_stub
+    from marimo._save.stubs.lazy_stub import BLOB_SERIALIZERS
+
+    if isinstance(value, types.ModuleType):
+        return SavedValue(
+            filename="", loader="module", type_hint=value.__name__
+        )
+
+    if isinstance(value, SpilledValue):
+        filename = f"{name}.{value.loader}"
+        shutil.copyfile(value.path, directory / filename)
+        return SavedValue(
+            filename=filename, loader=value.loader, type_hint=value.type_hint
+        )
+
+    blob: bytes | None = None
+    loader = maybe_update_lazy_stub(value)
+    if loader in _TYPED_LOADERS:
+        try:
+            blob = BLOB_SERIALIZERS[loader](value)
+        except Exception:
+            # e.g., an object column Arrow can't represent
+            blob = None
+    if blob is None:
+        loader = "pickle"
+        try:
+            blob = _pickle(value)
+        except Exception as e:
+            LOGGER.debug("Not saving %s: %s", name, e)
+            return None
+
+    filename = f"{name}.{loader}"
+    (directory / filename).write_bytes(blob)
+    return SavedValue(
+        filename=filename, loader=loader, type_hint=_type_hint(value)
+    )
+
+
+def _virtual_files(
+    cell_id: CellId_t, cell_lifecycle_registry: CellLifecycleRegistry
+) -> list[VirtualFileLifecycleItem]:
+    return [
+        item
+        for item in cell_lifecycle_registry.registry.get(cell_id, ())
+        if isinstance(item, VirtualFileLifecycleItem)
+        and item._virtual_file is not None
+    ]
+
+
+def write_checkpoint(
+    directory: Path,
+    graph: DirectedGraph,
+    glbls: dict[str, Any],
+    configs: dict[CellId_t, CellConfig],
+    uninstantiated: dict[CellId_t, str],
+    cell_lifecycle_registry: CellLifecycleRegistry,
+    ui_element_cells: set[CellId_t],
+) -> Checkpoint:
+    """Write a checkpoint of the kernel to `directory`.
+
+    `ui_element_cells` are the cells that constructed live UI elements.
+    The manifest is written last: a directory without one is incomplete.
+    """
+    values_directory = directory / _VALUES_DIRECTORY
+    files_directory = directory / _FILES_DIRECTORY
+    values_directory.mkdir(parents=True, exist_ok=True)
+    files_directory.mkdir(exist_ok=True)
+
+    cells: dict[CellId_t, SavedCell] = {}
+    for cell_id, cell in graph.cells.items():
+        saved = SavedCell(
+            code=cell.code,
+            status=cell.run_result_status,
+            stale=cell.stale,
+        )
+        cells[cell_id] = saved
+        if cell.run_result_status not in _RESTORABLE_STATUSES:
+            continue
+
+        # Running the cell again recreates its definitions and outputs
+        rerunnable = cell.run_result_status == "success" and not cell.stale
+        if rerunnable and cell_id in ui_element_cells:
+            saved.rerun = True
+            continue
+
+        for name in sorted(cell.defs):
+            if name not in glbls:
+                continue
+            value = _save_value(name, glbls[name], values_directory)
+            if value is None:
+                saved.unsaved.append(name)
+            else:
+                saved.values[name] = value
+
+        if rerunnable and saved.unsaved:
+            saved.rerun = True
+            for value in saved.values.values():
+                if value.filename:
+                    (values_directory / value.filename).unlink(missing_ok=True)
+            saved.values = {}
+            continue
+
+        for item in _virtual_files(cell_id, cell_lifecycle_registry):
+            filename = item.virtual_file.filename
+            (files_directory / filename).write_bytes(item.buffer)
+            saved.virtual_files.append(filename)
+
+    checkpoint = Checkpoint(
+        cells=cells,
+        configs={
+            cell_id: config.asdict() for cell_id, config in configs.items()
+        },
+        uninstantiated=uninstantiated,
+    )
+    (directory / CHECKPOINT_FILENAME).write_bytes(
+        msgspec.json.encode(checkpoint)
+    )
+    return checkpoint
+
+
+def read_checkpoint(directory: Path) -> Checkpoint:
+    return msgspec.json.decode(
+        (directory / CHECKPOINT_FILENAME).read_bytes(), type=Checkpoint
+    )
+
+
+def load_values(directory: Path, saved: SavedCell) -> dict[str, Any]:
+    """Load a cell's saved definitions; raises if any fails to load."""
+    from marimo._save.stubs.lazy_stub import BLOB_DESERIALIZERS
+
+    values: dict[str, Any] = {}
+    for name, value in saved.values.items():
+        if value.loader == "module":
+            values[name] = importlib.import_module(value.type_hint)
+            continue
+        values[name] = BLOB_DESERIALIZERS[f".{value.loader}"](
+            (directory / _VALUES_DIRECTORY / value.filename).read_bytes(),
+            value.type_hint,
+        )
+    return values
+
+
+def load_virtual_files(
+    directory: Path, saved: SavedCell
+) -> list[VirtualFileLifecycleItem]:
+    """Lifecycle items recreating a cell's virtual files."""
+    items: list[VirtualFileLifecycleItem] = []
+    for filename in saved.virtual_files:
+        path = directory / _FILES_DIRECTORY / filename
+        try:
+            buffer = path.read_bytes()
+        except OSError as e:
+            LOGGER.debug("Failed to restore virtual file %s: %s", filename, e)
+            continue
+        items.append(
+            VirtualFileLifecycleItem(
+                ext=path.suffix, buffer=buffer, filename=filename
+            )
+        )
+    return items
@@ -16,6 +16,7 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from marimo import _loggers
 from marimo._runtime import patches
 from marimo._runtime.commands import (
+    HibernateKernelCommand,
     ModelCommand,
     OutOfBandCommand,
     StopKernelCommand,
@@ -229,7 +230,8 @@ async def listen_messages(
     set_ui_element_queue: UIElementQueue,
     get_request: Callable[[_Q], Awaitable[CommandMessage | None]],
 ) -> None:
-    """Run the kernel's control loop until `StopKernelCommand` is received.
+    """Run the kernel's control loop until `StopKernelCommand` is received,
+    or the kernel is checkpointed by `HibernateKernelCommand`.
 
     `get_request` adapts the queue-read mechanism so this loop can drive
     either a threading/multiprocessing queue or an `asyncio.Queue`.
@@ -253,6 +255,10 @@ async def listen_messages(
         LOGGER.debug("Received control request: %s", type(request).__name__)
         if isinstance(request, StopKernelCommand):
             return
+        if isinstance(request, HibernateKernelCommand):
+            if kernel.checkpoint(request.directory):
+                return
+            continue
 
         merged: list[CommandMessage]
         if isinstance(request, (UpdateUIElementCommand, ModelCommand)):
@@ -23,9 +23,11 @@ from marimo._runtime.commands import (
     ExecuteCellsCommand,
     ExecuteScratchpadCommand,
     ExecuteStaleCellsCommand,
+    HibernateKernelCommand,
     InvokeFunctionCommand,
     ModelCommand,
     RenameNotebookCommand,
+    RestoreKernelCommand,
     StopKernelCommand,
     SyncGraphCommand,
     UpdateCellConfigCommand,
@@ -71,6 +73,8 @@ class KernelRequestHandlers:
         router.register(ModelCommand, self._handle_receive_model_message)
         router.register(UpdateUserConfigCommand, self._handle_set_user_config)
         router.register(StopKernelCommand, self._handle_stop)
+        router.register(HibernateKernelCommand, self._handle_hibernate)
+        router.register(RestoreKernelCommand, self._handle_restore)
 
     async def _handle_instantiate(
         self, request: CreateNotebookCommand
@@ -186,3 +190,13 @@ class KernelRequestHandlers:
     async def _handle_stop(self, request: StopKernelCommand) -> None:
         del request
         return
+
+    async def _handle_hibernate(self, request: HibernateKernelCommand) -> None:
+        # Handled by the control loop, which exits after checkpointing
+        del request
+        return
+
+    async def _handle_restore(self, request: RestoreKernelCommand) -> None:
+        with http_request_context(None):
+            await self._kernel.restore(request)
+        broadcast_notification(CompletedRunNotification())
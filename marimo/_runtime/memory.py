@@ -0,0 +1,290 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Memory accounting for the kernel's global variables.
+
+`estimate_memory` estimates the deep size of each global: the object, and
+everything it (transitively) holds. Array and table libraries report their
+buffer sizes directly, so a large frame is measured without walking its
+values. Memory shared between variables (the same object, a numpy view of
+another array, a frame sharing an arrow buffer) is counted once, for the
+first variable that reaches it.
+
+Estimates are lower bounds: the traversal visits a bounded number of
+objects per variable, and memory held outside of Python objects that
+don't report it (e.g., native handles) is not seen.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from collections import deque
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import TYPE_CHECKING, Any
+
+from marimo import _loggers
+from marimo._messaging.notification import MemorySample, VariableMemory
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+LOGGER = _loggers.marimo_logger()
+
+# Maximum number of Python objects visited per variable.
+MAX_OBJECTS_PER_VARIABLE = 100_000
+
+# Number of elements of an object array that are measured; the size of the
+# rest is extrapolated.
+OBJECT_ARRAY_SAMPLE_SIZE = 1_000
+
+# Objects that are shared by the whole program rather than owned by a
+# variable: only their own size is counted.
+_SHALLOW_TYPES = (
+    type,
+    ModuleType,
+    FunctionType,
+    BuiltinFunctionType,
+    MethodType,
+)
+
+
+def estimate_memory(
+    variables: Mapping[str, object],
+    max_objects: int = MAX_OBJECTS_PER_VARIABLE,
+) -> list[VariableMemory]:
+    """Estimate the memory held by each variable, in bytes.
+
+    Memory reachable from more than one variable is attributed to the first
+    of them, in iteration order, so the sizes add up to the total.
+    """
+    estimator = _SizeEstimator(max_objects=max_objects)
+    return [
+        VariableMemory(name=name, size_bytes=estimator.size(value))
+        for name, value in variables.items()
+    ]
+
+
+class _SizeEstimator:
+    def __init__(self, max_objects: int) -> None:
+        self._max_objects = max_objects
+        # Objects and buffers already counted, across variables
+        self._seen_objects: set[int] = set()
+        self._seen_buffers: set[tuple[int, int]] = set()
+        # Keeps visited objects alive so that their ids aren't reused by
+        # temporaries created during the traversal (e.g., pandas columns)
+        self._visited: list[object] = []
+
+    def size(self, obj: object) -> int:
+        total = 0
+        remaining = self._max_objects
+        stack = [obj]
+        while stack and remaining > 0:
+            current = stack.pop()
+            if id(current) in self._seen_objects:
+                continue
+            self._seen_objects.add(id(current))
+            self._visited.append(current)
+            remaining -= 1
+            try:
+                total += self._visit(current, stack)
+            except Exception as e:
+                LOGGER.debug(
+                    "Failed to measure %s: %s", type(current).__name__, e
+                )
+        return total
+
+    def _buffer(self, address: int, nbytes: int) -> int:
+        key = (address, nbytes)
+        if key in self._seen_buffers:
+            return 0
+        self._seen_buffers.add(key)
+        return nbytes
+
+    def _visit(self, obj: object, stack: list[object]) -> int:
+        """Size of `obj` itself; pushes the objects it holds onto `stack`."""
+        module = type(obj).__module__.split(".", 1)[0]
+        if module == "numpy":
+            return self._numpy(obj)
+        if module == "pandas":
+            return self._pandas(obj, stack)
+        if module == "polars":
+            return self._polars(obj)
+        if module == "pyarrow":
+            return self._pyarrow(obj)
+
+        size = sys.getsizeof(obj, 0)
+        if isinstance(obj, _SHALLOW_TYPES):
+            return size
+        stack.extend(_referents(obj))
+        return size
+
+    def _numpy(self, obj: Any) -> int:
+        import numpy as np
+
+        if not isinstance(obj, np.ndarray):
+            return sys.getsizeof(obj, 0)
+
+        # Views share their base's buffer: count the base's, once
+        root = obj
+        while isinstance(root.base, np.ndarray):
+            root = root.base
+        header = sys.getsizeof(obj, 0) - (
+            obj.nbytes if obj.base is None else 0
+        )
+        address = root.__array_interface__["data"][0]
+        size = max(header, 0) + self._buffer(address, root.nbytes)
+        if obj.dtype.hasobject:
+            size += self._object_array(obj)
+        return size
+
+    def _object_array(self, arr: Any) -> int:
+        """Size of the objects referenced by an object array, from a
+        sample of its elements."""
+        flat = arr.ravel()
+        count = len(flat)
+        if count == 0:
+            return 0
+        step = max(count // OBJECT_ARRAY_SAMPLE_SIZE, 1)
+        sample = flat[::step]
+        sampled = sum(self.size(item) for item in sample)
+        return sampled * count // len(sample)
+
+    def _pandas(self, obj: Any, stack: list[object]) -> int:
+        import pandas as pd
+
+        if isinstance(obj, pd.DataFrame):
+            stack.append(obj.index)
+            stack.extend(
+                # NB. by position: labels may be duplicated
+                _pandas_values(obj.iloc[:, i])
+                for i in range(obj.shape[1])
+            )
+            # NB. not `sys.getsizeof`: pandas' `__sizeof__` is a deep
+            # measurement, which would count the values twice
+            return object.__sizeof__(obj)
+        if isinstance(obj, pd.Series):
+            stack.extend((obj.index, _pandas_values(obj)))
+            return object.__sizeof__(obj)
+        if isinstance(obj, pd.RangeIndex):
+            return object.__sizeof__(obj)
+        if isinstance(obj, pd.MultiIndex):
+            return int(obj.memory_usage(deep=False))
+        if isinstance(obj, pd.Index):
+            stack.append(_pandas_values(obj))
+            return object.__sizeof__(obj)
+        if isinstance(obj, pd.api.extensions.ExtensionArray):
+            return int(obj.nbytes)
+        return object.__sizeof__(obj)
+
+    def _polars(self, obj: Any) -> int:
+        import polars as pl
+
+        if isinstance(obj, (pl.DataFrame, pl.Series)):
+            return int(obj.estimated_size())
+        return sys.getsizeof(obj, 0)
+
+    def _pyarrow(self, obj: Any) -> int:
+        import pyarrow as pa
+
+        if isinstance(obj, (pa.Table, pa.RecordBatch)):
+            arrays: Iterable[Any] = obj.columns
+        elif isinstance(obj, (pa.Array, pa.ChunkedArray)):
+            arrays = [obj]
+        else:
+            return sys.getsizeof(obj, 0)
+        size = 0
+        for array in arrays:
+            for buffer in _arrow_buffers(array):
+                size += self._buffer(buffer.address, buffer.size)
+        return size
+
+
+def _pandas_values(obj: Any) -> object:
+    """The array behind a pandas Series or Index, as a numpy array or
+    arrow array when possible so that shared buffers are recognized."""
+    import numpy as np
+    import pandas as pd
+
+    values = obj.array
+    if isinstance(values, pd.arrays.NumpyExtensionArray):
+        # A view; it shares the buffer of the block it belongs to
+        return np.asarray(values)
+    arrow_array_type = getattr(pd.arrays, "ArrowExtensionArray", None)
+    if arrow_array_type is not None and isinstance(values, arrow_array_type):
+        # Zero-copy
+        return values.__arrow_array__()
+    return values
+
+
+def _arrow_buffers(array: Any) -> Iterator[Any]:
+    chunks = getattr(array, "chunks", [array])
+    for chunk in chunks:
+        for buffer in chunk.buffers():
+            if buffer is not None:
+                yield buffer
+
+
+def _referents(obj: object) -> Iterable[object]:
+    if isinstance(obj, dict):
+        return [*obj.keys(), *obj.values()]
+    if isinstance(obj, (list, tuple, set, frozenset, deque)):
+        return obj
+    if isinstance(obj, (str, bytes, bytearray, int, float, complex)):
+        return ()
+
+    referents: list[object] = []
+    instance_dict = getattr(obj, "__dict__", None)
+    if isinstance(instance_dict, dict):
+        referents.append(instance_dict)
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for slot in slots:
+            if slot in ("__dict__", "__weakref__"):
+                continue
+            try:
+                referents.append(getattr(obj, slot))
+            except AttributeError:
+                pass
+    return referents
+
+
+def get_rss_bytes() -> int | None:
+    """Resident set size of this process, if it can be measured."""
+    try:
+        import psutil
+
+        return int(psutil.Process().memory_info().rss)
+    except Exception:
+        pass
+    try:
+        # Linux, without psutil
+        with open("/proc/self/statm", encoding="utf-8") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        return None
+
+
+class MemoryMonitor:
+    """Samples the kernel's resident set size over time.
+
+    The kernel takes a sample after each run; the most recent
+    `max_samples` are kept.
+    """
+
+    def __init__(self, max_samples: int = 256) -> None:
+        self._samples: deque[MemorySample] = deque(maxlen=max_samples)
+
+    def sample(self) -> int | None:
+        rss = get_rss_bytes()
+        if rss is not None:
+            self._samples.append(
+                MemorySample(timestamp=time.time(), rss_bytes=rss)
+            )
+        return rss
+
+    @property
+    def samples(self) -> list[MemorySample]:
+        return list(self._samples)
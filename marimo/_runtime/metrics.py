@@ -0,0 +1,166 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Kernel instrumentation for the server's metrics endpoint.
+
+The runner times each cell and each hook into fixed-bucket histograms,
+which cost a couple of clock reads and a bisect per observation. After
+each run, the kernel sends what was recorded since its previous report in
+a `KernelMetricsNotification`; the server aggregates the reports of all
+sessions and exports them (see `marimo._session.metrics`).
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from bisect import bisect_left
+from typing import TYPE_CHECKING
+
+from marimo._messaging.notification import (
+    HookMetric,
+    HookPhase,
+    KernelMetricsNotification,
+    MetricHistogram,
+)
+from marimo._runtime.runner.profiler import hook_name
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+    from types import TracebackType
+    from typing import Any
+
+# Upper bounds, in seconds, of the buckets of duration histograms
+DURATION_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+)
+
+
+class Histogram:
+    """Observations counted in buckets with fixed upper bounds.
+
+    `counts[i]` is the number of observations at most `bounds[i]` (and
+    greater than `bounds[i - 1]`); the last count is for observations
+    greater than every bound.
+    """
+
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: tuple[float, ...] = DURATION_BUCKETS) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    def merge(self, snapshot: MetricHistogram) -> None:
+        """Add the observations of a snapshot with the same bounds."""
+        if len(snapshot.counts) != len(self.counts):
+            return
+        for i, count in enumerate(snapshot.counts):
+            self.counts[i] += count
+        self.sum += snapshot.sum
+
+    def snapshot(self) -> MetricHistogram:
+        return MetricHistogram(counts=list(self.counts), sum=self.sum)
+
+
+class _Timer:
+    """Context manager that observes its duration in a histogram."""
+
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: Histogram) -> None:
+        self._histogram = histogram
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        del exc_type, exc_value, traceback
+        self._histogram.observe(time.perf_counter() - self._start)
+
+
+class KernelMetrics:
+    """Cell and hook timings recorded since the kernel's last report.
+
+    Owned by the kernel and shared by its runners.
+    """
+
+    def __init__(self) -> None:
+        self.cell_duration = Histogram()
+        self.hook_durations: dict[tuple[HookPhase, str], Histogram] = {}
+
+    def time_cell(self) -> _Timer:
+        return _Timer(self.cell_duration)
+
+    def time_hook(self, phase: HookPhase, hook: Callable[..., None]) -> _Timer:
+        key = (phase, hook_name(hook))
+        histogram = self.hook_durations.get(key)
+        if histogram is None:
+            histogram = self.hook_durations[key] = Histogram()
+        return _Timer(histogram)
+
+    def report(
+        self, glbls: Mapping[str, Any]
+    ) -> KernelMetricsNotification | None:
+        """Drain the recorded timings into a notification.
+
+        Returns `None` if nothing was recorded since the last report.
+        """
+        if self.cell_duration.count == 0 and not self.hook_durations:
+            return None
+        hits, misses = _cache_stats(glbls)
+        notification = KernelMetricsNotification(
+            cell_duration=self.cell_duration.snapshot(),
+            hooks=[
+                HookMetric(
+                    phase=phase, hook=hook, duration=histogram.snapshot()
+                )
+                for (phase, hook), histogram in self.hook_durations.items()
+            ],
+            cache_hits=hits,
+            cache_misses=misses,
+        )
+        self.cell_duration = Histogram()
+        self.hook_durations = {}
+        return notification
+
+
+def _cache_stats(glbls: Mapping[str, Any]) -> tuple[int, int]:
+    """Hits and misses of the caches defined in the notebook."""
+    cache_module = sys.modules.get("marimo._save.cache")
+    if cache_module is None:
+        # No cache can have been created
+        return 0, 0
+    hits = 0
+    misses = 0
+    for obj in glbls.values():
+        if isinstance(obj, cache_module.CacheContext):
+            info = obj.cache_info()
+            hits += info.hits
+            misses += info.misses
+    return hits, misses
@@ -33,7 +33,12 @@ if TYPE_CHECKING:
 class QueryParams(State[SerializedQueryParams]):
     """Query parameters for a marimo app."""
 
-    IGNORED_KEYS = {"access_token", "refresh_token", "session_id"}
+    IGNORED_KEYS = {
+        "access_token",
+        "refresh_token",
+        "session_id",
+        "document_version",
+    }
 
     def __init__(
         self,
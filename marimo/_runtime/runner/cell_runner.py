@@ -5,6 +5,7 @@ import ast
 import asyncio
 import io
 import traceback
+from contextlib import nullcontext
 from pathlib import Path
 from types import TracebackType
 from typing import TYPE_CHECKING, Any
@@ -23,6 +24,7 @@ from marimo._messaging.errors import (
     MarimoSQLError,
     UnknownError,
 )
+from marimo._messaging.notification_utils import broadcast_notification
 from marimo._messaging.tracebacks import write_traceback
 from marimo._runtime import dataflow
 from marimo._runtime.context.types import safe_get_context
@@ -47,6 +49,12 @@ from marimo._runtime.runner.hook_context import (
     ExceptionOrError,
     ExecutionContextManager,
 )
+from marimo._runtime.runner.output_formatter import OutputFormatter
+from marimo._runtime.runner.profiler import (
+    CellProfiler,
+    hook_category,
+    hook_name,
+)
 from marimo._runtime.runner.result import RunResult
 from marimo._runtime.runner.scheduler import SequentialScheduler
 from marimo._sql.error_utils import (
@@ -55,13 +63,19 @@ from marimo._sql.error_utils import (
 )
 from marimo._types.globals import MutableGlobals
 from marimo._types.ids import CellId_t
+from marimo._utils.platform import is_pyodide
 
 LOGGER = marimo_logger()
 
 if TYPE_CHECKING:
     from collections import deque
+    from collections.abc import Callable
+    from contextlib import AbstractContextManager
 
     from marimo._ast.cell import CellImpl
+    from marimo._data.duckdb_catalog import DuckDBCatalog
+    from marimo._messaging.notification import HookPhase, ProfileCategory
+    from marimo._runtime.metrics import KernelMetrics
     from marimo._runtime.runner.hooks import NotebookCellHooks
     from marimo._runtime.state import State
 
@@ -150,6 +164,8 @@ class Runner:
         excluded_cells: set[CellId_t] | None = None,
         execution_context: ExecutionContextManager | None = None,
         user_config: MarimoConfig | None = None,
+        duckdb_catalog: DuckDBCatalog | None = None,
+        metrics: KernelMetrics | None = None,
     ):
         self.graph = graph
         self.debugger = debugger
@@ -157,6 +173,8 @@ class Runner:
         self.execution_context = execution_context
         self._hooks = hooks
         self.user_config = user_config
+        self.duckdb_catalog = duckdb_catalog
+        self._metrics = metrics
 
         # runtime globals
         self.glbls = glbls
@@ -222,6 +240,18 @@ class Runner:
             lifecycles.append(
                 DebuggerLifecycle(self.debugger if debugger_on else None)
             )
+        # Per-cell profiling; like the lifecycles above, gated so there is
+        # no sampling overhead when disabled.
+        self._profiler: CellProfiler | None = (
+            CellProfiler() if experimental.get("profiler", False) else None
+        )
+        # Formatting outputs on a worker thread; Pyodide has no threads.
+        self._output_formatter: OutputFormatter | None = (
+            OutputFormatter()
+            if experimental.get("background_output_formatting", False)
+            and not is_pyodide()
+            else None
+        )
         self._evaluator = Evaluator(
             executor=resolve_executor(), lifecycles=lifecycles
         )
@@ -754,33 +784,97 @@ class Runner:
                     return defining_cell_id
         return None
 
+    def _profile(
+        self, name: str, category: ProfileCategory
+    ) -> AbstractContextManager[None]:
+        if self._profiler is None:
+            return nullcontext()
+        return self._profiler.phase(name, category)
+
+    def _profile_hook(
+        self, hook: Callable[..., None]
+    ) -> AbstractContextManager[None]:
+        if self._profiler is None:
+            return nullcontext()
+        return self._profiler.phase(hook_name(hook), hook_category(hook))
+
+    def _time_cell(self) -> AbstractContextManager[None]:
+        if self._metrics is None:
+            return nullcontext()
+        return self._metrics.time_cell()
+
+    def _time_hook(
+        self, phase: HookPhase, hook: Callable[..., None]
+    ) -> AbstractContextManager[None]:
+        if self._metrics is None:
+            return nullcontext()
+        return self._metrics.time_hook(phase, hook)
+
     async def _run_one(
         self,
         cell_id: CellId_t,
         pre_exec_ctx: Any,
         post_exec_ctx: Any,
+    ) -> None:
+        if self._profiler is not None:
+            self._profiler.start_cell(cell_id)
+        try:
+            await self._run_cell_with_hooks(
+                cell_id, pre_exec_ctx, post_exec_ctx
+            )
+        finally:
+            if self._profiler is not None:
+                profile = self._profiler.end_cell()
+                if profile is not None:
+                    broadcast_notification(profile)
+
+    async def _run_cell_with_hooks(
+        self,
+        cell_id: CellId_t,
+        pre_exec_ctx: Any,
+        post_exec_ctx: Any,
     ) -> None:
         cell = self.graph.cells[cell_id]
+        if self._output_formatter is not None:
+            # The cell may mutate an output that is still being formatted
+            self._output_formatter.wait_for(cell.refs)
         for pre_hook in self._hooks.pre_execution_hooks:
-            pre_hook(cell, pre_exec_ctx)
+            with (
+                self._profile_hook(pre_hook),
+                self._time_hook("pre_execution", pre_hook),
+            ):
+                pre_hook(cell, pre_exec_ctx)
         LOGGER.debug("Running cell %s", cell_id)
 
         if self.execution_context is not None:
             try:
                 with self.execution_context(cell_id) as exc_ctx:
-                    run_result = await self.run(cell_id)
+                    with (
+                        self._profile("execute", "execution"),
+                        self._time_cell(),
+                    ):
+                        run_result = await self.run(cell_id)
                     run_result.accumulated_output = exc_ctx.output
                     for post_hook in self._hooks.post_execution_hooks:
-                        post_hook(cell, post_exec_ctx, run_result)
+                        with (
+                            self._profile_hook(post_hook),
+                            self._time_hook("post_execution", post_hook),
+                        ):
+                            post_hook(cell, post_exec_ctx, run_result)
             except KeyboardInterrupt:
                 LOGGER.error(
                     "A keyboard interrupt was raised but not handled by "
                     "the runner."
                 )
         else:
-            run_result = await self.run(cell_id)
+            with self._profile("execute", "execution"), self._time_cell():
+                run_result = await self.run(cell_id)
             for post_hook in self._hooks.post_execution_hooks:
-                post_hook(cell, post_exec_ctx, run_result)
+                with (
+                    self._profile_hook(post_hook),
+                    self._time_hook("post_execution", post_hook),
+                ):
+                    post_hook(cell, post_exec_ctx, run_result)
 
     async def run_all(self) -> None:
         from marimo._runtime.runner.hook_context import (
@@ -797,7 +891,8 @@ class Runner:
         )
         LOGGER.debug("Running preparation hooks")
         for prep_hook in self._hooks.preparation_hooks:
-            prep_hook(prep_ctx)
+            with self._time_hook("preparation", prep_hook):
+                prep_hook(prep_ctx)
 
         pre_exec_ctx = PreExecutionHookContext(
             graph=self.graph,
@@ -819,6 +914,8 @@ class Runner:
             all_temporaries=all_temporaries,
             should_broadcast_data=_should_broadcast_data(),
             user_config=self.user_config,
+            duckdb_catalog=self.duckdb_catalog,
+            output_formatter=self._output_formatter,
         )
 
         # `async with self._scheduler` publishes the scheduler on the
@@ -835,8 +932,16 @@ class Runner:
         async with self._scheduler:
             try:
                 await self._dispatch_runnable(pre_exec_ctx, post_exec_ctx)
+                if self._output_formatter is not None:
+                    # Outputs still being formatted belong to this run.
+                    self._output_formatter.join()
             except KeyboardInterrupt:
                 LOGGER.info("Runner interrupted via SIGINT")
+            finally:
+                if self._profiler is not None:
+                    self._profiler.stop()
+                if self._output_formatter is not None:
+                    self._output_formatter.close()
 
         finish_ctx = OnFinishHookContext(
             graph=self.graph,
@@ -847,7 +952,8 @@ class Runner:
         )
         LOGGER.debug("Running on_finish hooks")
         for finish_hook in self._hooks.on_finish_hooks:
-            finish_hook(finish_ctx)
+            with self._time_hook("on_finish", finish_hook):
+                finish_hook(finish_ctx)
 
     async def _dispatch_runnable(
         self,
@@ -13,8 +13,10 @@ if TYPE_CHECKING:
     from collections.abc import Iterator, Mapping, Sequence
     from contextlib import AbstractContextManager
 
+    from marimo._data.duckdb_catalog import DuckDBCatalog
     from marimo._runtime.context.types import ExecutionContext
     from marimo._runtime.dataflow.graph import DirectedGraph
+    from marimo._runtime.runner.output_formatter import OutputFormatter
 
 ExceptionOrError = Union[BaseException, Error]
 
@@ -106,6 +108,11 @@ class PostExecutionHookContext:
     should_broadcast_data: bool = False
     # User configuration, for hooks that need access to runtime settings
     user_config: MarimoConfig | None = None
+    # The internal DuckDB catalog as last sent to the frontend, for
+    # incremental catalog updates after SQL cells
+    duckdb_catalog: DuckDBCatalog | None = None
+    # Formats outputs off the kernel thread, if enabled
+    output_formatter: OutputFormatter | None = None
 
 
 @dataclass(frozen=True)
@@ -16,7 +16,6 @@ from marimo._data.get_datasets import (
     has_updates_to_datasource,
 )
 from marimo._dependencies.dependencies import DependencyManager
-from marimo._messaging.cell_output import CellChannel
 from marimo._messaging.errors import (
     MarimoExceptionRaisedError,
     MarimoInterruptionError,
@@ -26,6 +25,8 @@ from marimo._messaging.errors import (
 from marimo._messaging.notification import (
     DatasetsNotification,
     DataSourceConnectionsNotification,
+    DataSourceTablesNotification,
+    SQLMetadata,
     StorageNamespacesNotification,
     VariableValuesNotification,
 )
@@ -36,11 +37,15 @@ from marimo._messaging.notification_utils import (
 from marimo._messaging.tracebacks import (
     _highlight_traceback,
     format_exception_message,
-    write_traceback,
 )
-from marimo._messaging.variables import create_variable_value
-from marimo._output import formatting
+from marimo._messaging.variables import (
+    create_variable_summary,
+    create_variable_value,
+)
 from marimo._plugins.ui._core.ui_element import UIElement
+from marimo._runtime.callbacks.variables import (
+    eager_variable_previews_enabled,
+)
 from marimo._runtime.context.types import (
     get_context,
     get_global_context,
@@ -49,6 +54,10 @@ from marimo._runtime.control_flow import MarimoInterrupt, MarimoStopError
 from marimo._runtime.runner import cell_runner
 from marimo._runtime.runner.hook_context import PostExecutionHookContext
 from marimo._runtime.runner.hooks import PostExecutionHook
+from marimo._runtime.runner.output_formatter import (
+    broadcast_formatted_output,
+    reachable_names,
+)
 from marimo._runtime.side_effect import SideEffect
 from marimo._sql.engines.duckdb import (
     INTERNAL_DUCKDB_ENGINE,
@@ -130,8 +139,15 @@ def _broadcast_variables(
         return
 
     del run_result
+    # Previews of non-scalar values are computed on request (see
+    # `PreviewVariablesCommand`), unless nothing will request them.
+    create = (
+        create_variable_value
+        if eager_variable_previews_enabled(ctx.user_config)
+        else create_variable_summary
+    )
     values = [
-        create_variable_value(
+        create(
             name=variable,
             value=(ctx.glbls.get(variable, None)),
         )
@@ -209,24 +225,44 @@ def _broadcast_duckdb_datasource(
         return
 
     try:
-        sqls = cell.sqls
+        sqls = [sql for sql in cell.sqls if has_updates_to_datasource(sql)]
         if not sqls:
             return
-        modifies_datasources = any(
-            has_updates_to_datasource(sql) for sql in sqls
+
+        engine = DuckDBEngine()
+        catalog = ctx.duckdb_catalog
+        schemas = (
+            catalog.schemas_to_refresh(sqls) if catalog is not None else None
         )
-        if not modifies_datasources:
+        if schemas is not None:
+            # Only the tables of some schemas changed: re-list just those,
+            # instead of re-introspecting every attached database.
+            LOGGER.debug("Broadcasting tables of %s", schemas)
+            for database, schema in sorted(schemas):
+                broadcast_notification(
+                    DataSourceTablesNotification(
+                        metadata=SQLMetadata(
+                            connection=INTERNAL_DUCKDB_ENGINE,
+                            database=database,
+                            schema=schema,
+                        ),
+                        tables=engine.get_tables_in_schema(
+                            schema=schema,
+                            database=database,
+                            include_table_details=True,
+                        ),
+                    )
+                )
             return
 
         LOGGER.debug("Broadcasting internal duckdb datasource")
+        connection = engine_to_data_source_connection(
+            INTERNAL_DUCKDB_ENGINE, engine
+        )
+        if catalog is not None:
+            catalog.record_full_refresh(connection.databases)
         broadcast_notification(
-            DataSourceConnectionsNotification(
-                connections=[
-                    engine_to_data_source_connection(
-                        INTERNAL_DUCKDB_ENGINE, DuckDBEngine()
-                    )
-                ]
-            )
+            DataSourceConnectionsNotification(connections=[connection])
         )
     except Exception:
         return
@@ -350,28 +386,18 @@ def _broadcast_outputs(
         run_result.success()
         or isinstance(run_result.exception, MarimoStopError)
     ) and should_send_output:
-        formatted_output = formatting.try_format(run_result.output)
-        if formatted_output.exception is not None:
-            # Try a plain formatter; maybe an opinionated one failed.
-            formatted_output = formatting.try_format(
-                run_result.output, include_opinionated=False
+        formatter = ctx.output_formatter
+        if formatter is not None and formatter.accepts(run_result.output):
+            formatter.submit(
+                cell.cell_id,
+                run_result.output,
+                ctx.exceptions,
+                reachable_names(ctx.graph, cell.cell_id, ctx.glbls),
+            )
+        else:
+            broadcast_formatted_output(
+                cell.cell_id, run_result.output, ctx.exceptions
             )
-        # For ImportError and ModuleNotFoundError, store the exception in the
-        # context so it can be reported by the missing_packages_hook.
-        if isinstance(
-            formatted_output.exception, (ImportError, ModuleNotFoundError)
-        ):
-            ctx.exceptions[cell.cell_id] = formatted_output.exception
-        if formatted_output.traceback is not None:
-            write_traceback(formatted_output.traceback)
-
-        CellNotificationUtils.broadcast_output(
-            channel=CellChannel.OUTPUT,
-            mimetype=formatted_output.mimetype,
-            data=formatted_output.data,
-            cell_id=cell.cell_id,
-            status=None,
-        )
     elif isinstance(run_result.exception, MarimoStrictExecutionError):
         LOGGER.debug("Cell %s raised a strict error", cell.cell_id)
         # Cell never runs, so clear console
@@ -0,0 +1,225 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Formatting cell outputs off the kernel thread.
+
+Enabled with the `background_output_formatting` experimental flag. Turning
+a cell's last expression into HTML or JSON (rendering a matplotlib figure,
+serializing a plotly or Altair chart, building a dataframe table) can take
+longer than running the cell. With the flag on, the runner hands each
+output to an `OutputFormatter` and moves on to the next cell; a worker
+thread formats the outputs and broadcasts them as they finish.
+
+Outputs are formatted one at a time, in the order their cells ran, so they
+reach the frontend in order and formatters (which are not all thread-safe)
+never run concurrently with each other. Formatting overlaps with the cells
+that run after the output's cell, unless a cell references a global the
+output may hold a reference to (a definition of the output's cell or of one
+of its ancestors); the runner waits for such outputs before running the
+cell, so user code never mutates an output while it is being formatted. The
+runner also waits before finishing a run, so a run is complete (and
+formatting errors are recorded) only once every output has been sent.
+
+Outputs of libraries that render through global state, such as pyplot's
+current figure and rcParams, are always formatted on the kernel thread.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import replace
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+from marimo import _loggers
+from marimo._messaging.cell_output import CellChannel
+from marimo._messaging.notification_utils import CellNotificationUtils
+from marimo._messaging.tracebacks import write_traceback
+from marimo._output import formatting
+from marimo._output.hypertext import Html
+from marimo._runtime.context.types import get_context
+
+if TYPE_CHECKING:
+    from collections.abc import MutableMapping, Set as AbstractSet
+
+    from marimo._runtime.context.types import RuntimeContext
+    from marimo._runtime.dataflow.graph import DirectedGraph
+    from marimo._runtime.runner.hook_context import ExceptionOrError
+    from marimo._types.ids import CellId_t
+
+LOGGER = _loggers.marimo_logger()
+
+# Top-level modules of values that are formatted on the kernel thread;
+# their formatters read or write global (and not thread-safe) state.
+_KERNEL_THREAD_MODULES = frozenset({"matplotlib", "seaborn", "plotnine"})
+
+
+def reachable_names(
+    graph: DirectedGraph, cell_id: CellId_t, glbls: dict[str, Any]
+) -> frozenset[str]:
+    """Globals through which a cell's output may be reached.
+
+    An output can only hold objects that its cell defined or read, and the
+    globals a cell reads were defined by its ancestors. Modules are left
+    out: nearly every cell references some module, and cells rarely mutate
+    one.
+    """
+    names: set[str] = set()
+    for ancestor in (cell_id, *graph.ancestors(cell_id)):
+        names.update(graph.cells[ancestor].defs)
+    return frozenset(
+        name for name in names if not isinstance(glbls.get(name), ModuleType)
+    )
+
+
+def broadcast_formatted_output(
+    cell_id: CellId_t,
+    value: Any,
+    exceptions: MutableMapping[CellId_t, ExceptionOrError],
+    *,
+    background: bool = False,
+) -> None:
+    """Format a cell's output and send it to the frontend.
+
+    `background` marks a call from the formatter thread, whose tracebacks
+    must be addressed to `cell_id` explicitly.
+    """
+    formatted_output = formatting.try_format(value)
+    if formatted_output.exception is not None:
+        # Try a plain formatter; maybe an opinionated one failed.
+        formatted_output = formatting.try_format(
+            value, include_opinionated=False
+        )
+    # For ImportError and ModuleNotFoundError, store the exception so it
+    # can be reported by the missing_packages_hook.
+    if isinstance(
+        formatted_output.exception, (ImportError, ModuleNotFoundError)
+    ):
+        exceptions[cell_id] = formatted_output.exception
+    if formatted_output.traceback is not None:
+        write_traceback(
+            formatted_output.traceback,
+            cell_id=cell_id if background else None,
+        )
+
+    CellNotificationUtils.broadcast_output(
+        channel=CellChannel.OUTPUT,
+        mimetype=formatted_output.mimetype,
+        data=formatted_output.data,
+        cell_id=cell_id,
+        status=None,
+    )
+
+
+class OutputFormatter:
+    """Formats and broadcasts cell outputs on a worker thread.
+
+    Owned by a `Runner`, for the duration of one run.
+    """
+
+    def __init__(self) -> None:
+        self._executor: ThreadPoolExecutor | None = None
+        # Queued outputs, with the globals through which each can be reached
+        self._pending: list[tuple[Future[None], frozenset[str]]] = []
+        self._closed = threading.Event()
+
+    def accepts(self, value: Any) -> bool:
+        """Whether `value` should be formatted in the background.
+
+        Values that are already HTML (including UI elements) are cheap to
+        format and are sent right away; values of libraries that format
+        through global state are formatted on the kernel thread.
+        """
+        if self._closed.is_set():
+            return False
+        if value is None or isinstance(value, Html):
+            return False
+        module = getattr(type(value), "__module__", None) or ""
+        if module.split(".", 1)[0] in _KERNEL_THREAD_MODULES:
+            return False
+
+        from marimo._runtime.context.kernel_context import (
+            KernelRuntimeContext,
+        )
+
+        return isinstance(get_context(), KernelRuntimeContext)
+
+    def submit(
+        self,
+        cell_id: CellId_t,
+        value: Any,
+        exceptions: MutableMapping[CellId_t, ExceptionOrError],
+        reachable: frozenset[str],
+    ) -> None:
+        """Queue `value`, the output of `cell_id`, for formatting.
+
+        `reachable` names the globals through which `value` may be reached
+        (see `reachable_names`); cells referencing them wait for it.
+
+        Must be called while `cell_id`'s execution context is installed:
+        the worker formats with a copy of it, so that virtual files, UI
+        elements, and lifecycle items are attributed to `cell_id`.
+        """
+        ctx = get_context()
+        thread_ctx = replace(ctx)
+        # standard IO is not threadsafe
+        thread_ctx.stdout = None
+        thread_ctx.stderr = None
+        thread_ctx.stream = ctx.stream.copy_for_thread()
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="marimo-output-formatter"
+            )
+        future = self._executor.submit(
+            self._format, thread_ctx, cell_id, value, exceptions
+        )
+        self._pending.append((future, reachable))
+
+    def _format(
+        self,
+        ctx: RuntimeContext,
+        cell_id: CellId_t,
+        value: Any,
+        exceptions: MutableMapping[CellId_t, ExceptionOrError],
+    ) -> None:
+        if self._closed.is_set():
+            return
+        with ctx.install():
+            try:
+                broadcast_formatted_output(
+                    cell_id, value, exceptions, background=True
+                )
+            except Exception:
+                LOGGER.exception("Failed to format output of %s", cell_id)
+
+    def wait_for(self, refs: AbstractSet[str]) -> None:
+        """Wait until no queued output can be reached through `refs`."""
+        self._pending = [
+            pending for pending in self._pending if not pending[0].done()
+        ]
+        # Outputs are formatted in order, so waiting for the last output
+        # reachable through `refs` waits for all the ones before it.
+        last: Future[None] | None = None
+        for future, reachable in self._pending:
+            if not reachable.isdisjoint(refs):
+                last = future
+        if last is not None:
+            wait([last])
+
+    def join(self) -> None:
+        """Wait until every queued output has been sent."""
+        if self._pending:
+            wait([future for future, _ in self._pending])
+            self._pending.clear()
+
+    def close(self) -> None:
+        """Stop the worker, dropping outputs that haven't been formatted.
+
+        An output already being formatted is still sent; this waits for it,
+        so that its errors are recorded before the run's on-finish hooks.
+        """
+        self._closed.set()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self._pending.clear()
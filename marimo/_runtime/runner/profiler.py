@@ -0,0 +1,223 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Per-cell execution profiler.
+
+Enabled with the `profiler` experimental flag. While a cell runs, the
+profiler times each phase of the run (pre-execution hooks, the cell body,
+post-execution hooks) and a background thread samples the kernel thread's
+call stack, so that time can be attributed to user code, runtime hooks, or
+output formatting. Each finished cell is summarized in a
+`CellProfileNotification`.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from marimo import _loggers
+from marimo._messaging.notification import (
+    CellProfileNotification,
+    CellProfileSpan,
+    ProfileCategory,
+)
+from marimo._utils.platform import is_pyodide
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import FrameType, TracebackType
+
+    from marimo._types.ids import CellId_t
+
+LOGGER = _loggers.marimo_logger()
+
+# 200 Hz: fine-grained enough for multi-second cells, cheap enough to leave
+# on for a whole "run all".
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+# Root frame of samples taken while the phase was suspended on an `await`
+# (for example, a coroutine cell waiting on I/O).
+SUSPENDED_FRAME = "[suspended]"
+
+# Post-execution hooks whose work is formatting or serializing outputs,
+# as opposed to runtime bookkeeping.
+_FORMATTING_HOOKS = frozenset(
+    {
+        "_broadcast_outputs",
+        "_broadcast_variables",
+        "_broadcast_datasets",
+    }
+)
+
+
+def hook_category(hook: Callable[..., None]) -> ProfileCategory:
+    """Attribute a runner hook to the formatting or hook category."""
+    name = getattr(hook, "__name__", "")
+    return "formatting" if name in _FORMATTING_HOOKS else "hook"
+
+
+def hook_name(hook: Callable[..., None]) -> str:
+    return getattr(hook, "__name__", type(hook).__name__)
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    filename = os.path.basename(code.co_filename)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+class _Phase:
+    """Context manager that times one phase of a cell run."""
+
+    def __init__(
+        self,
+        profiler: CellProfiler,
+        name: str,
+        category: ProfileCategory,
+    ) -> None:
+        self._profiler = profiler
+        self._name = name
+        self._category = category
+        self._start = 0.0
+        self._perf_start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.time()
+        self._perf_start = time.perf_counter()
+        # The caller's frame bounds sampled stacks: only frames called
+        # from within the phase are recorded.
+        self._profiler._enter_phase(self._name, sys._getframe(1))
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        del exc_type, exc_value, traceback
+        self._profiler._exit_phase(
+            CellProfileSpan(
+                name=self._name,
+                category=self._category,
+                start=self._start,
+                duration=time.perf_counter() - self._perf_start,
+            )
+        )
+
+
+class CellProfiler:
+    """Times the phases of each cell run and samples its call stacks.
+
+    A profiler is owned by a single `Runner`: `start_cell` and `end_cell`
+    bracket each cell, `phase` brackets each hook and the cell body, and
+    `stop` tears down the sampling thread once the run is over.
+    """
+
+    def __init__(
+        self, sample_interval: float = DEFAULT_SAMPLE_INTERVAL
+    ) -> None:
+        self.sample_interval = sample_interval
+        self._thread_id = threading.get_ident()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._sampler: threading.Thread | None = None
+
+        self._cell_id: CellId_t | None = None
+        self._start = 0.0
+        self._perf_start = 0.0
+        self._spans: list[CellProfileSpan] = []
+        self._stacks: defaultdict[str, int] = defaultdict(int)
+        # (phase name, bounding frame) of the phase being sampled, swapped
+        # atomically so the sampler never sees a torn pair.
+        self._active: tuple[str, FrameType] | None = None
+
+    def phase(self, name: str, category: ProfileCategory) -> _Phase:
+        return _Phase(self, name, category)
+
+    def start_cell(self, cell_id: CellId_t) -> None:
+        self._ensure_sampler()
+        with self._lock:
+            self._cell_id = cell_id
+            self._spans = []
+            self._stacks = defaultdict(int)
+        self._start = time.time()
+        self._perf_start = time.perf_counter()
+
+    def end_cell(self) -> CellProfileNotification | None:
+        """Finish the current cell and summarize its profile."""
+        with self._lock:
+            cell_id = self._cell_id
+            self._cell_id = None
+            self._active = None
+            spans, stacks = self._spans, self._stacks
+            self._spans = []
+            self._stacks = defaultdict(int)
+        if cell_id is None:
+            return None
+        return CellProfileNotification(
+            cell_id=cell_id,
+            start=self._start,
+            duration=time.perf_counter() - self._perf_start,
+            spans=spans,
+            stacks=dict(stacks),
+            sample_interval=self.sample_interval,
+        )
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+
+    def _enter_phase(self, name: str, frame: FrameType) -> None:
+        self._active = (name, frame)
+
+    def _exit_phase(self, span: CellProfileSpan) -> None:
+        self._active = None
+        with self._lock:
+            if self._cell_id is not None:
+                self._spans.append(span)
+
+    def _ensure_sampler(self) -> None:
+        # Threads are unavailable in Pyodide; phases are still timed.
+        if self._sampler is not None or is_pyodide():
+            return
+        self._stop_event.clear()
+        self._sampler = threading.Thread(
+            target=self._sample_loop,
+            name="marimo-profiler",
+            daemon=True,
+        )
+        self._sampler.start()
+
+    def _sample_loop(self) -> None:
+        while not self._stop_event.wait(self.sample_interval):
+            try:
+                self._sample()
+            except Exception as e:
+                LOGGER.debug("Profiler failed to sample: %s", e)
+
+    def _sample(self) -> None:
+        active = self._active
+        if active is None:
+            return
+        phase_name, base = active
+        frame = sys._current_frames().get(self._thread_id)
+
+        labels: list[str] = []
+        while frame is not None and frame is not base:
+            labels.append(_frame_label(frame))
+            frame = frame.f_back
+        if frame is None:
+            # The bounding frame is not on the stack: the phase is awaiting
+            # and the thread is running the event loop (or idling).
+            labels = [SUSPENDED_FRAME]
+        labels.append(phase_name)
+        key = ";".join(reversed(labels))
+
+        with self._lock:
+            if self._cell_id is not None:
+                self._stacks[key] += 1
@@ -8,6 +8,7 @@ import io
 import itertools
 import os
 import pathlib
+import shutil
 import signal
 import sys
 import threading
@@ -24,7 +25,12 @@ from typing import (
 from uuid import uuid4
 
 from marimo import _loggers
-from marimo._ast.cell import CellConfig, CellImpl, RuntimeStateType
+from marimo._ast.cell import (
+    CellConfig,
+    CellImpl,
+    RunResultStatusType,
+    RuntimeStateType,
+)
 from marimo._ast.compiler import _build_source_position_map, compile_cell
 from marimo._ast.errors import ImportStarError
 from marimo._ast.names import SETUP_CELL_NAME
@@ -35,6 +41,7 @@ from marimo._config.config import (
     MarimoConfig,
     OnCellChangeType,
 )
+from marimo._data.duckdb_catalog import DuckDBCatalog
 from marimo._dependencies.dependencies import DependencyManager
 from marimo._entrypoints.registry import EntryPointRegistry
 from marimo._lint.validate_graph import check_for_errors
@@ -81,11 +88,20 @@ from marimo._messaging.types import (
     Stdout,
     Stream,
 )
-from marimo._messaging.variables import create_variable_value
+from marimo._messaging.variables import (
+    create_variable_summary,
+    create_variable_value,
+)
 from marimo._output.rich_help import mddoc
 from marimo._plugins.core.web_component import JSONType
 from marimo._plugins.ui._core.ui_element import MarimoConvertValueException
-from marimo._runtime import dataflow, handlers, marimo_pdb, patches
+from marimo._runtime import (
+    dataflow,
+    handlers,
+    hibernate,
+    marimo_pdb,
+    patches,
+)
 from marimo._runtime.agent import Agent
 from marimo._runtime.app_meta import AppMeta
 from marimo._runtime.callbacks import (
@@ -97,7 +113,9 @@ from marimo._runtime.callbacks import (
     SecretsCallbacks,
     SqlCallbacks,
     SupportsTeardown,
+    VariablesCallbacks,
     cache_cells_enabled,
+    eager_variable_previews_enabled,
 )
 from marimo._runtime.commands import (
     AppMetadata,
@@ -110,6 +128,7 @@ from marimo._runtime.commands import (
     ExecuteStaleCellsCommand,
     InvokeFunctionCommand,
     OutOfBandCommand,
+    RestoreKernelCommand,
     SetBreakpointsCommand,
     UpdateCellConfigCommand,
     UpdateUIElementCommand,
@@ -127,6 +146,7 @@ from marimo._runtime.context.utils import get_mode
 from marimo._runtime.control_flow import MarimoInterrupt
 from marimo._runtime.input_override import getpass_override
 from marimo._runtime.kernel_request_handlers import KernelRequestHandlers
+from marimo._runtime.metrics import KernelMetrics
 from marimo._runtime.packages.module_registry import ModuleRegistry
 from marimo._runtime.params import CLIArgs, QueryParams
 from marimo._runtime.parent_poller import (
@@ -141,6 +161,7 @@ from marimo._runtime.runner.hooks import (
     Priority,
 )
 from marimo._runtime.scratch import SCRATCH_CELL_ID
+from marimo._runtime.spill import GlobalsSpiller
 from marimo._runtime.state import State
 from marimo._runtime.win32_interrupt_handler import (
     Win32InterruptHandler,
@@ -552,6 +573,13 @@ class Kernel:
             notebook_filename=app_metadata.filename,
         )
         self.external_storage_callbacks = ExternalStorageCallbacks(self)
+        self.variables_callbacks = VariablesCallbacks(self)
+        # Large globals that no cell needs, written to disk
+        self.globals_spiller = GlobalsSpiller()
+        # What the frontend last received of the internal DuckDB catalog
+        self.duckdb_catalog = DuckDBCatalog()
+        # Timings reported to the server after each run
+        self.metrics = KernelMetrics()
         self._callbacks: list[KernelCallback] = [
             self.secrets_callbacks,
             self.datasets_callbacks,
@@ -559,6 +587,7 @@ class Kernel:
             self.sql_callbacks,
             self.cache_callbacks,
             self.external_storage_callbacks,
+            self.variables_callbacks,
         ]
 
         self.router = RequestRouter()
@@ -702,6 +731,7 @@ class Kernel:
         self.stream.stop()
 
         self.autoreload_manager.teardown()
+        self.globals_spiller.teardown()
 
         # TODO(akshayka): There's a memory leak in run mode, with memory
         # usage increasing with each session creation. Somehow the kernel
@@ -1146,6 +1176,9 @@ class Kernel:
             {**cell.variable_data, **temporaries},
             exclude_defs if exclude_defs is not None else set(),
         )
+        self.globals_spiller.forget(cell.defs - (exclude_defs or set()))
+        # The cell may also mutate the variables it references.
+        self.variables_callbacks.invalidate(cell.defs | cell.refs)
 
         missing_modules_after_deletion = (
             missing_modules_before_deletion & self.module_registry.modules()
@@ -1440,8 +1473,14 @@ class Kernel:
         else:
             return cells_registered_without_error.union(stale_cells)
 
-    async def _run_cells(self, cell_ids: set[CellId_t]) -> None:
-        """Run cells and any state updates they trigger"""
+    async def _run_cells(
+        self, cell_ids: set[CellId_t], *, isolated: bool = False
+    ) -> None:
+        """Run cells and any state updates they trigger
+
+        When `isolated`, only `cell_ids` run: not their descendants, nor
+        their stale ancestors.
+        """
 
         with run_id_context():
             # This patch is an attempt to mitigate problems caused by the fact
@@ -1460,12 +1499,21 @@ class Kernel:
                     and cell.run_result_status
                     in ("exception", "marimo-error", "cancelled")
                 }
-                while cell_ids := await self._run_cells_internal(cell_ids):
+                while cell_ids := await self._run_cells_internal(
+                    cell_ids, isolated=isolated
+                ):
                     LOGGER.debug("Running state updates ...")
                     if self.lazy() and cell_ids:
                         self.graph.set_stale(cell_ids, prune_imports=True)
                         break
                 LOGGER.debug("Finished run.")
+                self.variables_callbacks.memory.sample()
+                metrics = self.metrics.report(self.globals)
+                if metrics is not None:
+                    broadcast_notification(metrics)
+                experimental = self.user_config.get("experimental", {})
+                if experimental.get("spill_globals", False):
+                    self.globals_spiller.spill(self.graph, self.globals)
                 # Clear stale error state from disabled cells whose ancestor
                 # recovered. Uses pre-run snapshot since run_result_status is
                 # updated during the run.
@@ -1500,7 +1548,9 @@ class Kernel:
             if isinstance(error, MarimoStrictExecutionError):
                 self.errors[cell_id] = (error,)
 
-    async def _run_cells_internal(self, roots: set[CellId_t]) -> set[CellId_t]:
+    async def _run_cells_internal(
+        self, roots: set[CellId_t], *, isolated: bool = False
+    ) -> set[CellId_t]:
         """Run cells, send outputs to frontends
 
         Returns set of cells that need to be re-run due to state updates.
@@ -1527,9 +1577,16 @@ class Kernel:
             if isinstance(run_result.exception, MarimoInterrupt):
                 self.last_interrupt_timestamp = time.time()
 
+        def restore_spilled_refs(
+            cell_impl: CellImpl, ctx: hook_context.PreExecutionHookContext
+        ) -> None:
+            del ctx
+            self.globals_spiller.restore(cell_impl.refs, self.globals)
+
         # Copy hooks and add run-specific hooks
         run_hooks = self._hooks.copy()
         run_hooks.add_preparation(invalidate_state)
+        run_hooks.add_pre_execution(restore_spilled_refs, Priority.EARLY)
         run_hooks.add_post_execution(note_time_of_interruption, Priority.LATE)
         run_hooks.add_on_finish(self.packages_callbacks.missing_packages_hook)
         run_hooks.add_on_finish(self._propagate_kernel_errors)
@@ -1540,17 +1597,26 @@ class Kernel:
         if os.getenv("DEBUGPY_RUNNING"):
             graph = self.graph.copy(self.app_metadata.filename)
 
+        excluded_cells = set(self.errors.keys())
+        execution_mode = self.reactive_execution_mode
+        if isolated:
+            excluded_cells |= set(graph.cells) - roots
+            # Lazy runs would mark the excluded descendants as stale
+            execution_mode = "autorun"
+
         runner = cell_runner.Runner(
             roots=roots,
             graph=graph,
             glbls=self.globals,
-            excluded_cells=set(self.errors.keys()),
+            excluded_cells=excluded_cells,
             debugger=self.debugger,
-            execution_mode=self.reactive_execution_mode,
+            execution_mode=execution_mode,
             execution_type=self.execution_type,
             execution_context=self._install_execution_context,
             hooks=run_hooks,
             user_config=self.user_config,
+            duckdb_catalog=self.duckdb_catalog,
+            metrics=self.metrics,
         )
 
         # I/O
@@ -1842,6 +1908,7 @@ class Kernel:
             return
         elif not cell:
             return
+        self.globals_spiller.restore(cell.refs, self.globals)
         cell.defs.clear()  # remove definitions
         cell.refs.clear()  # remove references
 
@@ -2073,11 +2140,16 @@ class Kernel:
                 if not is_local(name)
             }
             variable_values: list[VariableValue] = []
+            create_variable = (
+                create_variable_value
+                if eager_variable_previews_enabled(self.user_config)
+                else create_variable_summary
+            )
+            self.variables_callbacks.invalidate(bound_names)
+            self.globals_spiller.forget(bound_names)
             for name in bound_names:
                 # TODO update variable values even for namespaces? lenses? etc
-                variable_values.append(
-                    create_variable_value(name=name, value=value)
-                )
+                variable_values.append(create_variable(name=name, value=value))
                 try:
                     # subtracting self.graph.definitions[name]: never rerun the
                     # cell that created the name
@@ -2324,6 +2396,113 @@ class Kernel:
                         cell_id=cell_id, stale=True
                     )
 
+    def checkpoint(self, directory: str) -> bool:
+        """Write a checkpoint of the kernel to `directory`.
+
+        See `marimo._runtime.hibernate`. Returns whether the checkpoint was
+        written; if it wasn't, a marker file in `directory` says so.
+        """
+        path = pathlib.Path(directory)
+        ctx = get_context()
+        try:
+            hibernate.write_checkpoint(
+                path,
+                graph=self.graph,
+                glbls=self.globals,
+                configs={
+                    cell_id: metadata.config
+                    for cell_id, metadata in self.cell_metadata.items()
+                },
+                uninstantiated={
+                    cell_id: request.code
+                    for cell_id, request in (
+                        self._uninstantiated_execution_requests.items()
+                    )
+                },
+                cell_lifecycle_registry=ctx.cell_lifecycle_registry,
+                ui_element_cells=ctx.ui_element_registry.constructing_cells(),
+            )
+        except Exception as e:
+            LOGGER.warning("Failed to checkpoint the kernel: %s", e)
+            with contextlib.suppress(OSError):
+                (path / hibernate.FAILED_FILENAME).touch()
+            return False
+        LOGGER.debug("Checkpointed the kernel to %s", directory)
+        return True
+
+    @kernel_tracer.start_as_current_span("restore")
+    async def restore(self, request: RestoreKernelCommand) -> None:
+        """Restore the kernel from a hibernated kernel's checkpoint
+
+        Takes the place of `instantiate`. Cells are registered with their
+        saved definitions and run state; cells whose definitions weren't
+        saved are rerun, without rerunning their descendants.
+        """
+        if self._lifespan is not None:
+            await self._lifespan.__aenter__()
+
+        self.load_dotenv()
+
+        directory = pathlib.Path(request.directory)
+        try:
+            checkpoint = hibernate.read_checkpoint(directory)
+        except Exception as e:
+            LOGGER.error("Failed to read checkpoint %s: %s", directory, e)
+            return
+
+        for cell_id, config in checkpoint.configs.items():
+            self.cell_metadata[cell_id] = CellMetadata(
+                config=CellConfig.from_dict(config)
+            )
+        self.mutate_graph(
+            [
+                ExecuteCellCommand(cell_id=cell_id, code=saved.code)
+                for cell_id, saved in checkpoint.cells.items()
+            ],
+            deletion_requests=[],
+        )
+
+        ctx = get_context()
+        rerun: set[CellId_t] = set()
+        for cell_id, saved in checkpoint.cells.items():
+            cell = self.graph.cells.get(cell_id)
+            if cell is None or cell_id in self.errors:
+                continue
+            cell.set_stale(saved.stale, broadcast=False)
+            if saved.rerun:
+                rerun.add(cell_id)
+                continue
+            if saved.status is None:
+                continue
+            try:
+                self.globals.update(hibernate.load_values(directory, saved))
+            except Exception as e:
+                LOGGER.warning("Failed to restore cell %s: %s", cell_id, e)
+                if saved.status == "success" and not saved.stale:
+                    rerun.add(cell_id)
+                continue
+            cell.set_run_result_status(cast(RunResultStatusType, saved.status))
+            for item in hibernate.load_virtual_files(directory, saved):
+                item.create(ctx)
+                ctx.cell_lifecycle_registry.inject(cell_id, item)
+
+        self._uninstantiated_execution_requests = {
+            cell_id: ExecuteCellCommand(cell_id=cell_id, code=code)
+            for cell_id, code in checkpoint.uninstantiated.items()
+        }
+        shutil.rmtree(directory, ignore_errors=True)
+
+        if rerun:
+            LOGGER.debug("Rerunning cells after restore: %s", rerun)
+            self.reset_ui_initializers()
+            for (
+                object_id,
+                initial_value,
+            ) in request.set_ui_element_value_request.ids_and_values:
+                self.ui_initializers[object_id] = initial_value
+            await self._run_cells(rerun, isolated=True)
+            self.reset_ui_initializers()
+
     def _handle_markdown_cells_on_instantiate(
         self, execution_requests: dict[CellId_t, ExecuteCellCommand]
     ) -> None:
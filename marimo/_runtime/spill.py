@@ -0,0 +1,298 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Spilling large globals to disk once no cell needs them.
+
+marimo keeps every cell's definitions in memory, so that any cell can be
+rerun. In a linear pipeline, most intermediate values are never read again
+once the cells that use them have run. With the `spill_globals`
+experimental flag, the kernel writes such values to disk after each run,
+replacing them in its globals with a `SpilledValue` placeholder, and loads
+them back before a cell that references them runs.
+
+A global is spilled when
+
+- it is large (at least `SPILL_THRESHOLD_BYTES`),
+- every cell that references it has run and is not stale,
+- no function, class, or lambda reads it lazily (these may be called
+  after their cell has run, without the kernel knowing),
+- it is data: not a module, nor callable (functions, classes, callbacks,
+  and `mo.cache`d functions, which hold their cache statistics, may be
+  called at any time), and
+- no object other than the globals refers to it, so that spilling frees
+  memory; this is checked with `gc.get_referrers`, in one pass over the
+  heap per run, for the values that pass every other check.
+
+The variables panel shows spilled values as such, without loading them.
+
+Values are written with the serializers of the `marimo._save` caches
+(numpy arrays as `.npy`, dataframes as Arrow IPC, other values pickled).
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import shutil
+import tempfile
+import types
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from marimo import _loggers
+from marimo._messaging.notification import VariableValue
+from marimo._messaging.variables import _get_variable_size
+from marimo._runtime.memory import estimate_memory
+from marimo._utils.platform import is_pyodide
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from marimo._ast.cell import CellImpl
+    from marimo._runtime.dataflow import DirectedGraph
+
+LOGGER = _loggers.marimo_logger()
+
+# Smallest value that is spilled.
+SPILL_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+# Serialization strategies (see `LAZY_STUB_LOOKUP`) usable for spilling;
+# the file extension is the strategy's name.
+_SPILLABLE_LOADERS = ("npy", "arrow", "pt", "pickle")
+
+# Run results after which a cell won't run again unless something changes.
+_FINISHED_STATUSES = ("success", "exception", "marimo-error", "disabled")
+
+
+class SpilledValue:
+    """Placeholder for a global whose value was spilled to disk."""
+
+    __slots__ = ("length", "loader", "name", "path", "size_bytes", "type_hint")
+
+    def __init__(
+        self,
+        name: str,
+        path: Path,
+        loader: str,
+        type_hint: str,
+        size_bytes: int,
+        length: int | None = None,
+    ) -> None:
+        self.name = name
+        self.path = path
+        self.loader = loader
+        self.type_hint = type_hint
+        self.size_bytes = size_bytes
+        # The spilled value's length, for the variables panel
+        self.length = length
+
+    def load(self) -> Any:
+        from marimo._save.stubs.lazy_stub import BLOB_DESERIALIZERS
+
+        return BLOB_DESERIALIZERS[f".{self.loader}"](
+            self.path.read_bytes(), self.type_hint
+        )
+
+    def variable_value(self) -> VariableValue:
+        """How the variables panel shows the spilled value."""
+        return VariableValue(
+            name=self.name,
+            value=repr(self),
+            datatype=self.type_hint.rsplit(".", 1)[-1],
+            size=self.length,
+        )
+
+    def __getattr__(self, attr: str) -> Any:
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        raise AttributeError(
+            f"'{self.name}' was spilled to disk since no cell needed it; "
+            f"rerun a cell that references '{self.name}' to load it back."
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.type_hint} spilled to disk "
+            f"({self.size_bytes / 1024 / 1024:.1f} MiB)>"
+        )
+
+
+class GlobalsSpiller:
+    """Spills and restores the kernel's globals; see the module docstring."""
+
+    def __init__(
+        self,
+        threshold_bytes: int = SPILL_THRESHOLD_BYTES,
+        directory: Path | None = None,
+    ) -> None:
+        self._threshold_bytes = threshold_bytes
+        self._directory = directory
+        self._owns_directory = directory is None
+        self._spilled: dict[str, SpilledValue] = {}
+
+    @property
+    def spilled(self) -> set[str]:
+        return set(self._spilled)
+
+    def spill(self, graph: DirectedGraph, glbls: dict[str, Any]) -> list[str]:
+        """Spill the globals that no cell needs; returns their names."""
+        if is_pyodide():
+            # The filesystem is in memory
+            return []
+
+        candidates = [
+            name
+            for name in graph.definitions
+            if name not in self._spilled
+            and name in glbls
+            and self._is_spillable(name, glbls, graph)
+        ]
+        spilled: list[str] = []
+        for name in _unshared(candidates, glbls):
+            placeholder = self._write(name, glbls[name])
+            if placeholder is not None:
+                glbls[name] = placeholder
+                self._spilled[name] = placeholder
+                spilled.append(name)
+        if spilled:
+            LOGGER.debug("Spilled globals to disk: %s", spilled)
+        return spilled
+
+    def restore(self, names: Iterable[str], glbls: dict[str, Any]) -> None:
+        """Load spilled values back into `glbls`."""
+        for name in names:
+            placeholder = self._spilled.get(name)
+            if placeholder is None:
+                continue
+            if glbls.get(name) is not placeholder:
+                # Redefined since it was spilled
+                self._discard(name)
+                continue
+            try:
+                glbls[name] = placeholder.load()
+            except Exception as e:
+                # Leave the placeholder, whose errors explain what happened
+                LOGGER.error("Failed to load spilled value %s: %s", name, e)
+                continue
+            self._discard(name)
+
+    def forget(self, names: Iterable[str]) -> None:
+        """Drop spilled values of names that were deleted or redefined."""
+        for name in names:
+            if name in self._spilled:
+                self._discard(name)
+
+    def teardown(self) -> None:
+        self._spilled.clear()
+        if self._owns_directory and self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+
+    def _discard(self, name: str) -> None:
+        placeholder = self._spilled.pop(name)
+        try:
+            placeholder.path.unlink(missing_ok=True)
+        except OSError as e:
+            LOGGER.debug("Failed to remove %s: %s", placeholder.path, e)
+
+    def _is_spillable(
+        self, name: str, glbls: dict[str, Any], graph: DirectedGraph
+    ) -> bool:
+        from marimo._plugins.ui._core.ui_element import UIElement
+
+        value = glbls[name]
+        if isinstance(
+            value, (SpilledValue, UIElement, type, types.ModuleType)
+        ) or callable(value):
+            return False
+        if not _consumers_finished(name, graph):
+            return False
+        (memory,) = estimate_memory({name: value})
+        return memory.size_bytes >= self._threshold_bytes
+
+    def _write(self, name: str, value: Any) -> SpilledValue | None:
+        from marimo._save.loaders.lazy import maybe_update_lazy_stub
+        from marimo._save.stubs.lazy_stub import BLOB_SERIALIZERS
+
+        loader = maybe_update_lazy_stub(value)
+        if loader not in _SPILLABLE_LOADERS:
+            return None
+        try:
+            blob = BLOB_SERIALIZERS[loader](value)
+        except Exception:
+            if loader == "pickle":
+                return None
+            # e.g., an object column Arrow can't represent
+            loader = "pickle"
+            try:
+                blob = BLOB_SERIALIZERS[loader](value)
+            except Exception:
+                return None
+
+        try:
+            path = self._get_directory() / f"{name}.{loader}"
+            path.write_bytes(blob)
+        except OSError as e:
+            LOGGER.warning("Failed to spill %s to disk: %s", name, e)
+            return None
+        return SpilledValue(
+            name=name,
+            path=path,
+            loader=loader,
+            type_hint=f"{type(value).__module__}.{type(value).__name__}",
+            size_bytes=len(blob),
+            length=_get_variable_size(value),
+        )
+
+    def _get_directory(self) -> Path:
+        if self._directory is None:
+            self._directory = Path(
+                tempfile.mkdtemp(prefix=f"marimo-spill-{os.getpid()}-")
+            )
+        return self._directory
+
+
+def _unshared(names: list[str], glbls: dict[str, Any]) -> list[str]:
+    """The names whose value no object other than `glbls` refers to."""
+    if not names:
+        return []
+    values = tuple(glbls[name] for name in names)
+    ids = {id(value) for value in values}
+    shared: set[int] = set()
+    for referrer in gc.get_referrers(*values):
+        if referrer is glbls or referrer is values:
+            continue
+        if isinstance(referrer, types.FrameType):
+            # Frames of the kernel, such as this one
+            continue
+        shared.update(
+            id(referent)
+            for referent in gc.get_referents(referrer)
+            if id(referent) in ids
+        )
+    return [name for name in names if id(glbls[name]) not in shared]
+
+
+def _consumers_finished(name: str, graph: DirectedGraph) -> bool:
+    """Whether every cell that reads `name` has run, and won't read it again
+    without running first."""
+    for cell in graph.cells.values():
+        if name in cell.refs and not _is_finished(cell):
+            return False
+        if _reads_lazily(name, cell):
+            return False
+    return True
+
+
+def _is_finished(cell: CellImpl) -> bool:
+    return not cell.stale and cell.run_result_status in _FINISHED_STATUSES
+
+
+def _reads_lazily(name: str, cell: CellImpl) -> bool:
+    """Whether a function, class or lambda defined by `cell` reads `name`."""
+    for variables in cell.variable_data.values():
+        for variable in variables:
+            refs = variable.required_refs | variable.unbounded_refs
+            if name not in refs:
+                continue
+            if variable.kind in ("function", "class") or "_lambda" in refs:
+                return True
+    return False
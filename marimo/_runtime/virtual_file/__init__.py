@@ -20,6 +20,8 @@ from marimo._runtime.virtual_file.virtual_file import (
     VirtualFileLifecycleItem,
     VirtualFileRegistry,
     VirtualFileRegistryItem,
+    content_digest,
+    content_filename,
     random_filename,
     read_virtual_file,
     read_virtual_file_chunked,
@@ -38,6 +40,8 @@ __all__ = [  # noqa: RUF022
     "VirtualFileLifecycleItem",
     "VirtualFileRegistryItem",
     "VirtualFileRegistry",
+    "content_digest",
+    "content_filename",
     "random_filename",
     "read_virtual_file",
     "read_virtual_file_chunked",
@@ -3,8 +3,10 @@ from __future__ import annotations
 
 import base64
 import dataclasses
+import hashlib
 import mimetypes
 import random
+import re
 import string
 import threading
 from typing import TYPE_CHECKING, cast
@@ -13,6 +15,7 @@ if TYPE_CHECKING:
     from collections.abc import Iterator
 
 from marimo import _loggers
+from marimo._config.settings import GLOBAL_SETTINGS
 from marimo._messaging.mimetypes import KnownMimeType
 from marimo._runtime.cell_lifecycle_item import CellLifecycleItem
 from marimo._runtime.context import ContextNotInitializedError
@@ -33,18 +36,48 @@ LOGGER = _loggers.marimo_logger()
 _ALPHABET = string.ascii_letters + string.digits
 
 
-def random_filename(ext: str) -> str:
-    # adapted from: https://stackoverflow.com/questions/13484726/safe-enough-8-character-short-unique-random-string
-    # TODO(akshayka): should callers redraw if they get a collision?
+# Names of content-addressed files: [w<worker_id>_]<thread_id>-<digest>.<ext>
+_CONTENT_FILENAME = re.compile(r"^(?:w\d+_)?\d+-([0-9a-f]{32})\.")
+
+
+def _with_prefix(basename: str) -> str:
     try:
         tid = str(threading.get_native_id())
     except AttributeError:
         # get_native_id() not implemented in pyodide/WASM
         tid = "0"
-    basename = tid + "-" + "".join(random.choices(_ALPHABET, k=8))
+    basename = tid + "-" + basename
+    if GLOBAL_SETTINGS.WORKER_ID is not None:
+        # Lets the worker router send requests for this file to the worker
+        # whose memory holds it.
+        basename = f"w{GLOBAL_SETTINGS.WORKER_ID}_{basename}"
+    return basename
+
+
+def random_filename(ext: str) -> str:
+    # adapted from: https://stackoverflow.com/questions/13484726/safe-enough-8-character-short-unique-random-string
+    # TODO(akshayka): should callers redraw if they get a collision?
+    basename = _with_prefix("".join(random.choices(_ALPHABET, k=8)))
     return f"{basename}.{ext}"
 
 
+def content_filename(buffer: bytes, ext: str) -> str:
+    """A filename derived from the contents of `buffer`.
+
+    Identical buffers created by the same kernel get the same name, so they
+    share storage and a URL that browsers can cache. The thread id keeps
+    names of different kernels apart, since shared memory names are global.
+    """
+    digest = hashlib.blake2b(buffer, digest_size=16).hexdigest()
+    return f"{_with_prefix(digest)}.{ext}"
+
+
+def content_digest(filename: str) -> str | None:
+    """The content digest of a file named by `content_filename`, if any."""
+    match = _CONTENT_FILENAME.match(filename)
+    return match.group(1) if match else None
+
+
 @dataclasses.dataclass
 class VirtualFile:
     url: str
@@ -91,7 +124,7 @@ class VirtualFile:
         """
         from marimo._runtime.context import get_context
 
-        vfile_name = random_filename(ext)
+        vfile_name = content_filename(buffer, ext)
 
         def return_data_url() -> VirtualFile:
             return VirtualFile(
@@ -126,9 +159,13 @@ EMPTY_VIRTUAL_FILE = VirtualFile(
 
 
 class VirtualFileLifecycleItem(CellLifecycleItem):
-    def __init__(self, ext: str, buffer: bytes) -> None:
+    def __init__(
+        self, ext: str, buffer: bytes, filename: str | None = None
+    ) -> None:
         self.ext = _without_leading_dot(ext)
         self.buffer = buffer
+        # Set when recreating a file that outputs already point to
+        self._filename = filename
         # Not resolved until added to registry
         self._virtual_file: VirtualFile | None = None
 
@@ -153,28 +190,17 @@ class VirtualFileLifecycleItem(CellLifecycleItem):
     def create(self, context: RuntimeContext | None) -> None:
         """Create the virtual file
 
-        Every virtual file gets a unique random name. Uniqueness is
-        required for reference counting.
+        Virtual files are named by their contents, unless a name was
+        given; files with the same contents are shared, and the registry
+        counts their owners.
         """
-        filename = random_filename(self.ext)
+        filename = self._filename or content_filename(self.buffer, self.ext)
         if context is None or not context.virtual_files_supported:
             self._virtual_file = VirtualFile(
                 filename=filename, buffer=self.buffer, as_data_url=True
             )
             return
 
-        registry = context.virtual_file_registry
-        # create a unique filename for the virtual file
-        tries = 0
-        max_tries = 100
-        while registry.has(filename) and tries < max_tries:
-            filename = random_filename(self.ext)
-            tries += 1
-        if tries > max_tries:
-            raise RuntimeError(
-                "Failed to add virtual file to registry. "
-                "This is a bug in marimo. Please file an issue."
-            )
         self._virtual_file = VirtualFile(filename, self.buffer)
         context.virtual_file_registry.add(self._virtual_file, context)
 
@@ -182,11 +208,18 @@ class VirtualFileLifecycleItem(CellLifecycleItem):
         # Remove the file if the refcount is 0, or if the cell is being
         # deleted. (We can't rely on when the refcount will be decremented, so
         # we need to check for deletion explicitly to prevent leaks.)
-        if deletion or (
-            context.virtual_file_registry.refcount(self.virtual_file.filename)
-            <= 0
+        #
+        # A file shared with other owners stays registered through them, so
+        # this owner can let go right away; otherwise identical files
+        # recreated on every run would keep their disposal hooks around.
+        registry = context.virtual_file_registry
+        filename = self.virtual_file.filename
+        if (
+            deletion
+            or registry.owners(filename) > 1
+            or registry.refcount(filename) <= 0
         ):
-            context.virtual_file_registry.remove(self.virtual_file)
+            registry.remove(self.virtual_file)
             return True
         # refcount > 0, so need to keep this disposal hook around
         return False
@@ -196,6 +229,10 @@ class VirtualFileLifecycleItem(CellLifecycleItem):
 class VirtualFileRegistryItem:
     # number of HTML objects that are referencing this virtual file
     refcount: int
+    # number of times this virtual file was added and not yet removed;
+    # identical files created by different cells, or by reruns, share
+    # one item
+    owners: int = 1
 
 
 @dataclasses.dataclass
@@ -204,7 +241,9 @@ class VirtualFileRegistry:
 
     The registry maps virtual file filenames to their contents. Each
     registry item is reference counted: refcount > 0 means that an object
-    exists somewhere that uses the virtual file.
+    exists somewhere that uses the virtual file. Files are named by their
+    contents, so a file may be added more than once; it is stored once, and
+    removed when it has been removed as many times as it was added.
 
     The registry itself doesn't maintain the reference counts, it only
     exposes methods for incrementing, decrementing, and getting the counts.
@@ -255,15 +294,20 @@ class VirtualFileRegistry:
             return self.registry[filename].refcount
         return 0
 
+    def owners(self, filename: str) -> int:
+        """Get the number of owners"""
+        if filename in self.registry:
+            return self.registry[filename].owners
+        return 0
+
     def add(self, virtual_file: VirtualFile, context: RuntimeContext) -> None:
         if not context.virtual_files_supported:
             return
 
         key = virtual_file.filename
         if key in self.registry:
-            LOGGER.debug(
-                "Virtual file (key=%s) already registered", virtual_file
-            )
+            # Same contents: share the stored file
+            self.registry[key].owners += 1
             return
 
         buffer = virtual_file.buffer
@@ -276,7 +320,11 @@ class VirtualFileRegistry:
 
     def remove(self, virtual_file: VirtualFile) -> None:
         key = virtual_file.filename
-        if key in self.registry:
+        if key not in self.registry:
+            return
+        item = self.registry[key]
+        item.owners -= 1
+        if item.owners <= 0:
             self.storage.remove(key)
             del self.registry[key]
 
@@ -15,6 +15,7 @@ from marimo._schemas.export_options import (
     IPYNBSortMode,
     MarkdownExportOptions,
     PDFExportOptions,
+    ProfileFormat,
     ServerExportFormat,
 )
 from marimo._types.ids import CellId_t
@@ -96,6 +97,13 @@ def to_pdf_export_options(
     )
 
 
+class ExportProfileRequest(msgspec.Struct, rename="camel"):
+    download: bool
+    format: ProfileFormat = "chrome-trace"
+    # Restrict the profile to a single cell, e.g. for a per-cell flamegraph
+    cell_id: CellId_t | None = None
+
+
 class ExportedFile(msgspec.Struct, rename="camel"):
     contents: str
     filename: str
@@ -18,6 +18,7 @@ SERVER_EXPORT_FORMATS: tuple[ServerExportFormat, ...] = get_args(
     ServerExportFormat
 )
 WASMMode = Literal["edit", "run"]
+ProfileFormat = Literal["chrome-trace", "folded"]
 
 
 @dataclass(frozen=True, kw_only=True)
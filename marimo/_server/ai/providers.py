@@ -26,10 +26,8 @@ from marimo._ai._pydantic_ai_utils import (
     generate_id,
     profile_get,
 )
+from marimo._ai._types import AI_SDK_VERSION
 from marimo._dependencies.dependencies import Dependency, DependencyManager
-from marimo._plugins.ui._impl.chat.chat import (
-    AI_SDK_VERSION,
-)
 from marimo._server.ai.config import AnyProviderConfig
 from marimo._server.ai.constants import ANTHROPIC_DEFAULT_MAX_TOKENS
 from marimo._server.ai.ids import AiModelId, AiProviderId
@@ -27,6 +27,7 @@ from marimo._config.settings import GLOBAL_SETTINGS
 from marimo._output.utils import uri_decode_component, uri_encode_component
 from marimo._runtime.virtual_file import (
     EMPTY_VIRTUAL_FILE,
+    content_digest,
     read_virtual_file_chunked,
 )
 from marimo._server.api.auth import TOKEN_QUERY_PARAM
@@ -154,21 +155,27 @@ def _html_response(request: Request, html: str) -> Response:
         **_HTML_SECURITY_HEADERS,
     }
 
-    if_none_match = request.headers.get("if-none-match")
-    if if_none_match is not None:
-        # If-None-Match may contain multiple validators or weak ETags (`W/`).
-        # See https://www.rfc-editor.org/rfc/rfc9110#section-13.1.2
-        candidates = {
-            candidate.strip().removeprefix("W/")
-            for candidate in if_none_match.split(",")
-        }
-        # Allow caching if things exactly match.
-        if "*" in candidates or etag in candidates:
-            return Response(status_code=304, headers=headers)
+    if _matches_etag(request, etag):
+        return Response(status_code=304, headers=headers)
 
     return HTMLResponse(html, headers=headers)
 
 
+def _matches_etag(request: Request, etag: str) -> bool:
+    """Whether the client's cached copy, if any, has the given ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    # If-None-Match may contain multiple validators or weak ETags (`W/`).
+    # See https://www.rfc-editor.org/rfc/rfc9110#section-13.1.2
+    candidates = {
+        candidate.strip().removeprefix("W/")
+        for candidate in if_none_match.split(",")
+    }
+    # Allow caching if things exactly match.
+    return "*" in candidates or etag in candidates
+
+
 def _strip_access_token_redirect(request: Request) -> RedirectResponse:
     """Build a redirect to the current URL with access_token removed.
 
@@ -562,6 +569,8 @@ def virtual_file(
                         type: string
         404:
             description: Invalid virtual file request
+        304:
+            description: The cached virtual file is current
         404:
             description: Invalid byte length in virtual file request
     """
@@ -608,6 +617,15 @@ def virtual_file(
         download_filename = request.query_params.get("filename") or filename
         headers.update(make_download_headers(download_filename))
 
+    digest = content_digest(filename)
+    if digest is not None:
+        # Files named by their contents never change
+        etag = f'"{digest}"'
+        headers["Cache-Control"] = "private, max-age=31536000, immutable"
+        headers["ETag"] = etag
+        if _matches_etag(request, etag):
+            return Response(status_code=304, headers=headers)
+
     range_header = request.headers.get("range")
     if range_header is not None:
         parsed = _parse_range_header(range_header, total_size)
@@ -15,7 +15,7 @@ from marimo._server.api.utils import parse_request
 from marimo._server.models.models import (
     BaseResponse,
     NotebookDocumentTransactionRequest,
-    SuccessResponse,
+    NotebookDocumentTransactionResponse,
 )
 from marimo._server.router import APIRouter
 from marimo._types.ids import ConsumerId
@@ -47,7 +47,7 @@ async def document_transaction(request: Request) -> BaseResponse:
             content:
                 application/json:
                     schema:
-                        $ref: "#/components/schemas/SuccessResponse"
+                        $ref: "#/components/schemas/NotebookDocumentTransactionResponse"
     """
     app_state = AppState(request)
     body = await parse_request(request, cls=NotebookDocumentTransactionRequest)
@@ -62,4 +62,6 @@ async def document_transaction(request: Request) -> BaseResponse:
         from_consumer_id=ConsumerId(session_id),
     )
 
-    return SuccessResponse()
+    return NotebookDocumentTransactionResponse(
+        version=session.document.version
+    )
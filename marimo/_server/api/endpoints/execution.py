@@ -30,9 +30,11 @@ from marimo._server.models.models import (
     DebugCellRequest,
     ExecuteCellsRequest,
     ExecuteScratchpadRequest,
+    GetMemoryUsageRequest,
     InvokeFunctionRequest,
     KernelStatusResponse,
     ModelRequest,
+    PreviewVariablesRequest,
     SetBreakpointsRequest,
     SuccessResponse,
 )
@@ -201,6 +203,68 @@ async def function_call(
     return await dispatch_control_request(request, InvokeFunctionRequest)
 
 
+@router.post("/preview_variables")
+@requires("edit")
+async def preview_variables(
+    *,
+    request: Request,
+) -> BaseResponse:
+    """
+    parameters:
+        - in: header
+          name: Marimo-Session-Id
+          schema:
+            type: string
+          required: true
+    requestBody:
+        content:
+            application/json:
+                schema:
+                    $ref: "#/components/schemas/PreviewVariablesRequest"
+    responses:
+        200:
+            description: >
+                Compute previews of variables; they are sent as a
+                variable-values notification
+            content:
+                application/json:
+                    schema:
+                        $ref: "#/components/schemas/SuccessResponse"
+    """
+    return await dispatch_control_request(request, PreviewVariablesRequest)
+
+
+@router.post("/memory_usage")
+@requires("edit")
+async def memory_usage(
+    *,
+    request: Request,
+) -> BaseResponse:
+    """
+    parameters:
+        - in: header
+          name: Marimo-Session-Id
+          schema:
+            type: string
+          required: true
+    requestBody:
+        content:
+            application/json:
+                schema:
+                    $ref: "#/components/schemas/GetMemoryUsageRequest"
+    responses:
+        200:
+            description: >
+                Estimate the memory used by variables; the estimate is sent
+                as a memory-usage notification
+            content:
+                application/json:
+                    schema:
+                        $ref: "#/components/schemas/SuccessResponse"
+    """
+    return await dispatch_control_request(request, GetMemoryUsageRequest)
+
+
 @router.post("/interrupt")
 @requires("edit")
 async def interrupt(
@@ -33,6 +33,10 @@ from marimo._export.exporter import (
     export_script,
     render_pdf,
 )
+from marimo._export.profile import (
+    profile_to_chrome_trace,
+    profile_to_folded,
+)
 from marimo._export.requests import (
     HTMLExportRequest,
     IPYNBExportRequest,
@@ -51,6 +55,7 @@ from marimo._schemas.export import (
     ExportAsScriptRequest,
     ExportAvailabilityResponse,
     ExportFormatAvailability,
+    ExportProfileRequest,
     InstallExportRequirementsRequest,
     UpdateCellOutputsRequest,
     to_html_export_options,
@@ -733,6 +738,81 @@ async def export_as_pdf(*, request: Request) -> Response:
     )
 
 
+@router.post("/profile")
+@requires("edit")
+async def export_profile(
+    *,
+    request: Request,
+) -> JSONResponse | PlainTextResponse:
+    """
+    parameters:
+        - in: header
+          name: Marimo-Session-Id
+          schema:
+            type: string
+          required: true
+    requestBody:
+        content:
+            application/json:
+                schema:
+                    $ref: "#/components/schemas/ExportProfileRequest"
+    responses:
+        200:
+            description: >
+                Export the profiles of the session's last cell runs, as a
+                Chrome trace (JSON) or collapsed stacks (text)
+            content:
+                application/json:
+                    schema:
+                        type: object
+                text/plain:
+                    schema:
+                        type: string
+        404:
+            description: No profiles were recorded for the session or cell
+    """
+    app_state = AppState(request)
+    body = await parse_request(request, cls=ExportProfileRequest)
+    session = app_state.require_current_session()
+
+    profiles = list(session.session_view.cell_profiles.values())
+    if body.cell_id is not None:
+        profiles = [p for p in profiles if p.cell_id == body.cell_id]
+    if not profiles:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail=(
+                "No profiles recorded; enable the experimental profiler "
+                "and run the notebook"
+            ),
+        )
+
+    app = session.app_file_manager.app
+    cell_names = {
+        cell_data.cell_id: cell_data.name
+        for cell_data in app.cell_manager.cell_data()
+    }
+    if body.format == "folded":
+        return PlainTextResponse(
+            content=profile_to_folded(profiles, cell_names),
+            headers=make_export_headers(
+                get_download_filename(
+                    session.app_file_manager.filename, "folded.txt"
+                ),
+                download=body.download,
+            ),
+        )
+    return JSONResponse(
+        content=profile_to_chrome_trace(profiles, cell_names),
+        headers=make_export_headers(
+            get_download_filename(
+                session.app_file_manager.filename, "trace.json"
+            ),
+            download=body.download,
+        ),
+    )
+
+
 @router.post("/update_cell_outputs")
 @requires("edit")
 async def update_cell_outputs(
@@ -404,6 +404,28 @@ async def connections(request: Request) -> JSONResponse:
     )
 
 
+@router.get("/api/metrics")
+@requires("edit")
+async def metrics(request: Request) -> PlainTextResponse:
+    """
+    responses:
+        200:
+            description: >-
+                Get kernel and session metrics (cell and hook execution
+                times, notification sizes, queue depths, cache statistics)
+                in the Prometheus text format
+            content:
+                text/plain:
+                    schema:
+                        type: string
+    """
+    session_manager = AppState(request).session_manager
+    return PlainTextResponse(
+        session_manager.metrics.render(session_manager.sessions.values()),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
 _NVIDIA_GPU_STATS_CMD = [
     "nvidia-smi",
     "--query-gpu=index,name,memory.total,memory.used,memory.free",
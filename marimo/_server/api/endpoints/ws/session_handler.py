@@ -13,6 +13,7 @@ from marimo._config.settings import GLOBAL_SETTINGS
 from marimo._messaging.notification import (
     AlertNotification,
     BannerNotification,
+    NotebookDocumentTransactionNotification,
     NotificationMessage,
     ReconnectedNotification,
 )
@@ -217,6 +218,8 @@ class SessionHandler(SessionConsumer, abc.ABC):
         # Write reconnected message
         self._serialize_and_notify(ReconnectedNotification())
 
+        caught_up = self._catch_up_document(session)
+
         # If not replaying, just send a toast
         if not replay:
             self._serialize_and_notify(
@@ -227,7 +230,10 @@ class SessionHandler(SessionConsumer, abc.ABC):
             )
             return
 
-        self._write_kernel_ready_from_session_view(session, self.params.kiosk)
+        if not caught_up:
+            self._write_kernel_ready_from_session_view(
+                session, self.params.kiosk
+            )
         self._serialize_and_notify(
             BannerNotification(
                 title="Reconnected",
@@ -238,6 +244,31 @@ class SessionHandler(SessionConsumer, abc.ABC):
 
         self._replay_previous_session(session)
 
+    def _catch_up_document(self, session: Session) -> bool:
+        """Bring a reconnecting client's document up to date.
+
+        A client that reports the document version it last applied is sent
+        the transactions it missed, or the full document when the
+        document's log no longer reaches back to that version. Returns
+        whether the client's document is now current.
+        """
+        version = self.params.document_version
+        if version is None:
+            return False
+        missed = session.document.transactions_since(version)
+        if missed is None:
+            self._write_kernel_ready_from_session_view(
+                session, self.params.kiosk
+            )
+            return True
+        for transaction in missed:
+            self._serialize_and_notify(
+                NotebookDocumentTransactionNotification(
+                    transaction=transaction
+                )
+            )
+        return True
+
     def _connect_kiosk(self, session: Session) -> None:
         """Connect to a kiosk session.
 
@@ -271,15 +302,16 @@ class SessionHandler(SessionConsumer, abc.ABC):
         self._replay_previous_session(session)
 
     def _replay_previous_session(self, session: Session) -> None:
-        """Replay the previous session view."""
-        notifications = session.session_view.notifications
-        if len(notifications) == 0:
+        """Replay the previous session view as a single snapshot."""
+        snapshot = session.session_view.snapshot()
+        if len(snapshot.notifications) == 0:
             LOGGER.debug("No notifications to replay")
             return
-        LOGGER.debug(f"Replaying {len(notifications)} notifications")
-        for notif in notifications:
-            LOGGER.debug("Replaying notification %s", notif)
-            self._serialize_and_notify(notif)
+        LOGGER.debug(
+            "Replaying snapshot of %s notifications",
+            len(snapshot.notifications),
+        )
+        self._serialize_and_notify(snapshot)
 
     def _on_disconnect(
         self,
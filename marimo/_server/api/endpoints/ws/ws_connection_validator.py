@@ -19,6 +19,7 @@ LOGGER = _loggers.marimo_logger()
 SESSION_QUERY_PARAM_KEY = "session_id"
 FILE_QUERY_PARAM_KEY = "file"
 KIOSK_QUERY_PARAM_KEY = "kiosk"
+DOCUMENT_VERSION_QUERY_PARAM_KEY = "document_version"
 
 
 @dataclass
@@ -30,6 +31,8 @@ class ConnectionParams:
     kiosk: bool
     auto_instantiate: bool
     rtc_enabled: bool
+    # Last document version the client applied, sent when it reconnects
+    document_version: int | None = None
 
 
 @dataclass
@@ -80,6 +83,19 @@ def parse_connection_params(
     # Extract kiosk mode
     kiosk = app_state.query_params(KIOSK_QUERY_PARAM_KEY) == "true"
 
+    # Extract the document version of a reconnecting client
+    raw_document_version = app_state.query_params(
+        DOCUMENT_VERSION_QUERY_PARAM_KEY
+    )
+    document_version: int | None = None
+    if raw_document_version is not None:
+        try:
+            document_version = int(raw_document_version)
+        except ValueError:
+            LOGGER.debug(
+                "Ignoring invalid document version %s", raw_document_version
+            )
+
     # Extract config-based parameters
     config = app_state.config_manager_at_file(file_key).get_config()
     rtc_enabled = allow_rtc and config.get("experimental", {}).get(
@@ -93,6 +109,7 @@ def parse_connection_params(
         kiosk=kiosk,
         auto_instantiate=auto_instantiate,
         rtc_enabled=rtc_enabled,
+        document_version=document_version,
     )
 
 
@@ -93,6 +93,7 @@ def build_kernel_ready(
         ),
         capabilities=KernelCapabilitiesNotification(),
         auto_instantiated=auto_instantiated,
+        document_version=document.version,
     )
 
 
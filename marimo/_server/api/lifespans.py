@@ -273,18 +273,28 @@ async def reap_subprocesses(app: Starlette) -> AsyncIterator[None]:
 
 
 def _startup_url(state: AppStateBase) -> str:
-    url_host = format_url_host(state.host, state.port)
-    port = state.port
+    return startup_url(
+        host=state.host,
+        port=state.port,
+        base_url=state.base_url,
+        auth_token=state.session_manager.auth_token,
+    )
+
+
+def startup_url(
+    *, host: str, port: int, base_url: str, auth_token: AuthToken
+) -> str:
+    url_host = format_url_host(host, port)
 
-    url = f"http://{url_host}:{port}{state.base_url}"
+    url = f"http://{url_host}:{port}{base_url}"
     if port == 80:
-        url = f"http://{url_host}{state.base_url}"
+        url = f"http://{url_host}{base_url}"
     elif port == 443:
-        url = f"https://{url_host}{state.base_url}"
+        url = f"https://{url_host}{base_url}"
 
-    if AuthToken.is_empty(state.session_manager.auth_token):
+    if AuthToken.is_empty(auth_token):
         return url
-    return f"{url}?access_token={state.session_manager.auth_token!s}"
+    return f"{url}?access_token={auth_token!s}"
 
 
 def _mcp_startup_url(state: AppStateBase) -> str:
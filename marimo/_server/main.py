@@ -58,7 +58,14 @@ def create_starlette_app(
     lsp_servers: list[LspServer] | None = None,
     skew_protection: bool = True,
     timeout: float | None = None,
+    session_secret: str | None = None,
 ) -> Starlette:
+    """Create the server's app.
+
+    `session_secret` signs the session cookies; it defaults to a secret of
+    this process, so servers that must accept each other's cookies need to
+    share one.
+    """
     final_middlewares: list[Middleware] = []
 
     if allow_origins is None:
@@ -71,7 +78,7 @@ def create_starlette_app(
             [
                 Middleware(
                     CustomSessionMiddleware,
-                    secret_key=RANDOM_SECRET,
+                    secret_key=session_secret or RANDOM_SECRET,
                     https_only=GLOBAL_SETTINGS.SESSION_COOKIE_SECURE,
                 ),
             ]
@@ -16,6 +16,7 @@ from marimo._runtime.commands import (
     ExecuteCellsCommand,
     ExecuteScratchpadCommand,
     GetCacheInfoCommand,
+    GetMemoryUsageCommand,
     HTTPRequest,
     InstallPackagesCommand,
     InvokeFunctionCommand,
@@ -26,6 +27,7 @@ from marimo._runtime.commands import (
     ModelCommand,
     PreviewDatasetColumnCommand,
     PreviewSQLTableCommand,
+    PreviewVariablesCommand,
     SetBreakpointsCommand,
     StorageDownloadCommand,
     StorageListEntriesCommand,
@@ -131,6 +133,16 @@ class ListSQLSchemasRequest(ListSQLSchemasCommand, tag=False):
         )
 
 
+class PreviewVariablesRequest(PreviewVariablesCommand, tag=False):
+    def as_command(self) -> PreviewVariablesCommand:
+        return PreviewVariablesCommand(names=self.names)
+
+
+class GetMemoryUsageRequest(GetMemoryUsageCommand, tag=False):
+    def as_command(self) -> GetMemoryUsageCommand:
+        return GetMemoryUsageCommand(names=self.names)
+
+
 class PreviewDatasetColumnRequest(PreviewDatasetColumnCommand, tag=False):
     def as_command(self) -> PreviewDatasetColumnCommand:
         return PreviewDatasetColumnCommand(
@@ -258,6 +270,13 @@ class NotebookDocumentTransactionRequest(msgspec.Struct, rename="camel"):
     changes: list[DocumentChange]
 
 
+class NotebookDocumentTransactionResponse(BaseResponse):
+    success: bool = True
+    # Document version after the transaction; the sender doesn't receive
+    # its own transaction back, so it learns the version from here.
+    version: int = 0
+
+
 class FocusCellRequest(msgspec.Struct, rename="camel"):
     cell_id: CellId_t
 
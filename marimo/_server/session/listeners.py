@@ -7,11 +7,18 @@ tracking recent files, managing caches, etc.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from marimo._server.recents import RecentFilesManager
 from marimo._session.extensions.types import EventAwareExtension
 from marimo._session.session import Session
 from marimo._types.ids import SessionId
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from marimo._server.workers.registry import SessionRegistry
+
 
 class RecentsTrackerListener(EventAwareExtension):
     """Event listener that tracks recently accessed files."""
@@ -52,3 +59,60 @@ class RecentsTrackerListener(EventAwareExtension):
             self._recents.rename(path, old_path)
         else:
             self._recents.touch(path)
+
+
+class WorkerSessionListener(EventAwareExtension):
+    """Event listener that records this worker's sessions in the registry
+    shared with the worker router."""
+
+    def __init__(
+        self,
+        registry: SessionRegistry,
+        worker_id: int,
+        get_session_id: Callable[[Session], SessionId | None],
+    ) -> None:
+        """Initialize the worker session listener.
+
+        Args:
+            registry: Registry shared by the router and all workers
+            worker_id: Id of this worker
+            get_session_id: Looks up the id a session is stored under
+        """
+        super().__init__()
+        self._registry = registry
+        self._worker_id = worker_id
+        self._get_session_id = get_session_id
+        # Sessions are removed from the repository before the close event
+        # fires, so remember their ids.
+        self._session_ids: dict[Session, SessionId] = {}
+
+    def _register(self, session: Session, session_id: SessionId) -> None:
+        self._session_ids[session] = session_id
+        self._registry.register(
+            session_id, session.initialization_id, self._worker_id
+        )
+
+    async def on_session_created(self, session: Session) -> None:
+        """Record the session as owned by this worker."""
+        session_id = self._get_session_id(session)
+        if session_id is not None:
+            self._register(session, session_id)
+
+    async def on_session_closed(self, session: Session) -> None:
+        """Remove the session from the registry."""
+        session_id = self._session_ids.pop(session, None)
+        if session_id is not None:
+            self._registry.unregister(session_id)
+
+    async def on_session_resumed(
+        self, session: Session, old_id: SessionId
+    ) -> None:
+        """Re-record the session under the id it was resumed with."""
+        del old_id
+        previous = self._session_ids.get(session)
+        session_id = self._get_session_id(session)
+        if session_id is None or session_id == previous:
+            return
+        if previous is not None:
+            self._registry.unregister(previous)
+        self._register(session, session_id)
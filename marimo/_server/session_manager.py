@@ -22,7 +22,10 @@ from marimo._server.app_defaults import AppDefaults
 from marimo._server.lsp import LspServer
 from marimo._server.recents import RecentFilesManager
 from marimo._server.resume_strategies import create_resume_strategy
-from marimo._server.session.listeners import RecentsTrackerListener
+from marimo._server.session.listeners import (
+    RecentsTrackerListener,
+    WorkerSessionListener,
+)
 from marimo._server.token_manager import TokenManager
 from marimo._server.tokens import AuthToken, SkewProtectionToken
 from marimo._server.workspace import (
@@ -34,6 +37,7 @@ from marimo._server.workspace import (
 from marimo._session.app_host import AppHostContext, AppHostPool
 from marimo._session.consumer import SessionConsumer
 from marimo._session.events import SessionEventBus
+from marimo._session.extensions.extensions import MetricsExtension
 from marimo._session.extensions.types import SessionExtension
 from marimo._session.file_change_handler import (
     FileChangeCoordinator,
@@ -42,6 +46,7 @@ from marimo._session.file_change_handler import (
 from marimo._session.file_watcher_integration import (
     SessionFileWatcherExtension,
 )
+from marimo._session.metrics import SessionMetrics
 from marimo._session.model import ConnectionState, SessionMode
 from marimo._session.session import Session, SessionImpl
 from marimo._session.session_repository import SessionRepository
@@ -53,6 +58,7 @@ from marimo._utils.file_watcher import FileWatcherManager
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from marimo._server.workers.pool import WorkerSpec
     from marimo._session.notebook import AppFileManager
 
 LOGGER = _loggers.marimo_logger()
@@ -86,6 +92,8 @@ class SessionManager:
         sandbox_mode: SandboxMode | None = None,
         isolate_apps: bool = False,
         execute_opengraph_generators: bool = False,
+        worker: WorkerSpec | None = None,
+        hibernate_ttl_seconds: int | None = None,
     ) -> None:
         # Core configuration
         self.workspace = workspace
@@ -93,6 +101,8 @@ class SessionManager:
         self.quiet = quiet
         self.include_code = include_code
         self.ttl_seconds = ttl_seconds
+        # Idle time after which edit sessions' kernels hibernate
+        self.hibernate_ttl_seconds = hibernate_ttl_seconds
         self.lsp_server = lsp_server
         self.cli_args = cli_args
         self.argv = argv
@@ -111,6 +121,8 @@ class SessionManager:
             )
 
         self._repository = SessionRepository()
+        # Aggregated over all sessions, exported by /api/metrics
+        self.metrics = SessionMetrics()
 
         def _get_code() -> str:
             defaults = AppDefaults.from_config_manager(config_manager)
@@ -131,6 +143,11 @@ class SessionManager:
             mode=mode,
             auth_token=auth_token,
             source_code=source_code,
+            skew_protection_token=SkewProtectionToken(
+                worker.skew_protection_token
+            )
+            if worker is not None
+            else None,
         )
 
         # Initialize resume strategy
@@ -142,6 +159,16 @@ class SessionManager:
         self.recents = RecentFilesManager()
         self._event_bus = SessionEventBus()
         self._event_bus.subscribe(RecentsTrackerListener(self.recents))
+        if worker is not None:
+            from marimo._server.workers.registry import SessionRegistry
+
+            self._event_bus.subscribe(
+                WorkerSessionListener(
+                    SessionRegistry(worker.registry_path),
+                    worker.worker_id,
+                    self._repository.get_session_id,
+                )
+            )
 
         # Initialize file watching components
         self._watcher_manager = FileWatcherManager()
@@ -196,7 +223,7 @@ class SessionManager:
         from marimo._runtime.commands import AppMetadata
         from marimo._runtime.patches import extract_docstring_from_header
 
-        extensions: list[SessionExtension] = []
+        extensions: list[SessionExtension] = [MetricsExtension(self.metrics)]
         if self.watch:
             extensions.append(
                 SessionFileWatcherExtension(
@@ -239,6 +266,7 @@ class SessionManager:
             )
             if self._app_host_pool
             else None,
+            hibernate_ttl_seconds=self.hibernate_ttl_seconds,
         )
 
         # Add to repository
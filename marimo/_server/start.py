@@ -42,7 +42,10 @@ from marimo._utils.lifespans import Lifespans
 from marimo._utils.net import find_free_port
 
 if TYPE_CHECKING:
+    import functools
+
     from marimo._cli.tips import CliTip
+    from marimo._server.workers.pool import WorkerSpec
 
 DEFAULT_PORT = 2718
 
@@ -215,9 +218,14 @@ def start(
     startup_tip: CliTip | None = None,
     show_tracebacks: bool | None = None,
     execute_opengraph_generators: bool = False,
+    worker: WorkerSpec | None = None,
+    hibernate_ttl_seconds: int | None = None,
 ) -> None:
     """
     Start the server.
+
+    `worker` is set when this server is one of the processes started by
+    `start_workers`.
     """
     import packaging.version
 
@@ -324,8 +332,14 @@ def start(
         sandbox_mode=sandbox_mode,
         isolate_apps=isolate_apps,
         execute_opengraph_generators=execute_opengraph_generators,
+        worker=worker,
+        hibernate_ttl_seconds=hibernate_ttl_seconds,
     )
 
+    # Things that should happen once per deployment are left to the first
+    # worker.
+    is_primary = worker is None or worker.worker_id == 0
+
     log_level = "info" if development_mode else "error"
 
     lifespans_list = [
@@ -336,7 +350,7 @@ def start(
         lifespans.logging,
         lifespans.open_browser,
         lifespans.tool_manager,
-        lifespans.server_registry,
+        *([lifespans.server_registry] if is_primary else []),
         lifespans.reap_subprocesses,
         *LIFESPAN_REGISTRY.get_all(),
     ]
@@ -356,6 +370,7 @@ def start(
         else None,
         skew_protection=skew_protection,
         timeout=timeout,
+        session_secret=worker.session_secret if worker is not None else None,
     )
 
     if mcp_enabled and mcp is not None:
@@ -442,7 +457,133 @@ def start(
     app.state.server = server
 
     # Execute server startup command if provided
-    if server_startup_command:
+    if server_startup_command and is_primary:
         _execute_startup_command(server_startup_command, session_manager)
 
     server.run()
+
+
+def start_workers(
+    start_server: functools.partial[None], *, workers: int
+) -> None:
+    """Run `workers` server processes behind a session-affinity router.
+
+    `start_server` is `start` with its arguments bound. Each worker calls
+    it with a loopback port of its own; only the router listens on the
+    configured host and port, and it pins every session to one worker.
+    """
+    import asyncio
+    import contextlib
+    import secrets
+    import signal
+    import tempfile
+    from pathlib import Path
+
+    from marimo._server.api.lifespans import startup_url
+    from marimo._server.print import print_shutdown, print_startup
+    from marimo._server.tokens import SkewProtectionToken
+    from marimo._server.workers.pool import WorkerPool
+    from marimo._server.workers.registry import SessionRegistry
+    from marimo._server.workers.router import WorkerRouter
+
+    options = start_server.keywords
+    workspace: NotebookWorkspace = options["workspace"]
+    host: str = options["host"]
+    port: int = options.get("port") or find_free_port(DEFAULT_PORT, addr=host)
+    proxy: str | None = options.get("proxy")
+    quiet: bool = options.get("quiet", False)
+    auth_token: AuthToken | None = options.get("auth_token")
+    if auth_token is None:
+        # Otherwise each worker would generate a token of its own.
+        auth_token = AuthToken.random()
+
+    bare_host = host.strip("[]")
+    router_address = (
+        f"[{bare_host}]:{port}" if ":" in bare_host else f"{bare_host}:{port}"
+    )
+    (external_port, external_host) = _resolve_proxy(port, host, proxy)
+
+    initialize_fd_limit(limit=4096)
+    initialize_asyncio()
+
+    with tempfile.TemporaryDirectory(prefix="marimo-workers-") as tmpdir:
+        registry = SessionRegistry(Path(tmpdir) / "sessions.db")
+        pool = WorkerPool(
+            start_server,
+            count=workers,
+            registry_path=registry.path,
+            skew_protection_token=str(SkewProtectionToken.random()),
+            session_secret=secrets.token_hex(32),
+            overrides={
+                "auth_token": auth_token,
+                # Workers build URLs and check origins for the address
+                # clients actually use: the router's (or the user's proxy).
+                "proxy": proxy or router_address,
+                "quiet": True,
+                "headless": True,
+                "startup_tip": None,
+            },
+        )
+        router = WorkerRouter(pool.addresses, registry)
+
+        async def serve() -> None:
+            task = asyncio.current_task()
+            assert task is not None
+            with contextlib.suppress(NotImplementedError):
+                # Windows has no signal handlers on the event loop
+                asyncio.get_running_loop().add_signal_handler(
+                    signal.SIGTERM, task.cancel
+                )
+            server = await router.serve(bare_host, port)
+            pool.start()
+            url = startup_url(
+                host=external_host,
+                port=external_port,
+                base_url=options.get("base_url", ""),
+                auth_token=auth_token,
+            )
+            if not quiet:
+                file = workspace.single_file()
+                print_startup(
+                    file_name=file.name if file else None,
+                    url=url,
+                    run=True,
+                    new=False,
+                    network=host == "0.0.0.0",
+                    startup_tip=options.get("startup_tip"),
+                )
+            if not options.get("headless", False):
+                _open_browser(workspace, url)
+
+            async with server:
+                while True:
+                    await asyncio.sleep(1)
+                    for worker_id in pool.dead_workers():
+                        router.worker_down(worker_id)
+                        pool.respawn(worker_id)
+                        router.worker_up(worker_id)
+
+        try:
+            asyncio.run(serve())
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            pass
+        finally:
+            pool.shutdown()
+            registry.close()
+            if not quiet:
+                print_shutdown()
+
+
+def _open_browser(workspace: NotebookWorkspace, url: str) -> None:
+    from marimo._server.api.utils import open_url_in_browser
+
+    single_file = workspace.single_file()
+    start_path = (
+        single_file.path
+        if single_file is not None
+        else workspace.directory or os.getcwd()
+    )
+    browser = get_default_config_manager(current_path=start_path).get_config()[
+        "server"
+    ]["browser"]
+    open_url_in_browser(browser, url)
@@ -19,6 +19,7 @@ class TokenManager:
         mode: SessionMode,
         auth_token: AuthToken | None = None,
         source_code: str | None = None,
+        skew_protection_token: SkewProtectionToken | None = None,
     ) -> None:
         """Initialize token manager.
 
@@ -26,6 +27,8 @@ class TokenManager:
             mode: The session mode (edit or run)
             auth_token: Optional pre-configured auth token
             source_code: Source code for generating code-based tokens in run mode
+            skew_protection_token: Optional pre-configured skew protection
+                token, for servers that must agree on one (e.g. workers)
         """
         self.mode = mode
 
@@ -50,6 +53,8 @@ class TokenManager:
             self.skew_protection_token = SkewProtectionToken.from_code(
                 source_code
             )
+        if skew_protection_token is not None:
+            self.skew_protection_token = skew_protection_token
 
     def validate_auth(self, token: AuthToken) -> bool:
         """Validate an auth token."""
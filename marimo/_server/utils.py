@@ -25,6 +25,8 @@ def initialize_mimetypes() -> None:
     mimetypes.add_type("application/javascript", ".js")
     mimetypes.add_type("text/css", ".css")
     mimetypes.add_type("image/svg+xml", ".svg")
+    # Missing from the default types map on older Pythons
+    mimetypes.add_type("image/webp", ".webp")
 
     # Office document formats
     # Ensures these mimetypes are available across all platforms
@@ -0,0 +1,158 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Server worker processes for `marimo run --workers N`.
+
+Each worker is a complete marimo server (its own event loop, sessions
+and kernels) listening on a loopback port. The router in the parent
+process is the only thing exposed to clients.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import os
+import sys
+from dataclasses import dataclass
+from multiprocessing import get_context
+from typing import TYPE_CHECKING, Any
+
+from marimo import _loggers
+from marimo._config.settings import GLOBAL_SETTINGS, GlobalSettings
+from marimo._utils.net import find_free_port
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from multiprocessing.process import BaseProcess
+
+LOGGER = _loggers.marimo_logger()
+
+WORKER_HOST = "127.0.0.1"
+# First port tried for workers; far from the default server port so that
+# workers don't take the ports users expect their servers on.
+_WORKER_MIN_PORT = 27180
+_SHUTDOWN_TIMEOUT_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class WorkerSpec:
+    """What a worker needs to know about the pool it belongs to."""
+
+    worker_id: int
+    # Path of the shared `SessionRegistry` database
+    registry_path: str
+    # Every worker must hand out the same skew protection token, since
+    # consecutive requests from one page can land on different workers.
+    skew_protection_token: str
+    # Likewise for the key signing the session cookies, or a client
+    # authenticated by one worker would be rejected by the others.
+    session_secret: str
+
+
+def _run_worker(
+    start_server: Callable[..., None],
+    spec: WorkerSpec,
+    settings: GlobalSettings,
+    overrides: dict[str, Any],
+) -> None:
+    # Settings set by the CLI don't survive the spawn.
+    for field in dataclasses.fields(settings):
+        setattr(GLOBAL_SETTINGS, field.name, getattr(settings, field.name))
+    GLOBAL_SETTINGS.WORKER_ID = spec.worker_id
+    _loggers.set_level(settings.LOG_LEVEL)
+
+    # Leave Ctrl+C to the router, which stops the workers itself, and
+    # exit if the router dies without doing so.
+    if sys.platform != "win32":
+        os.setpgrp()
+    from marimo._runtime.parent_poller import start_parent_poller
+
+    start_parent_poller(parent_pid=os.getppid())
+
+    start_server(worker=spec, **overrides)
+
+
+class WorkerPool:
+    """Spawns and supervises the worker processes."""
+
+    def __init__(
+        self,
+        start_server: Callable[..., None],
+        *,
+        count: int,
+        registry_path: str,
+        skew_protection_token: str,
+        session_secret: str,
+        overrides: dict[str, Any],
+    ) -> None:
+        self._start_server = start_server
+        self._registry_path = registry_path
+        self._skew_protection_token = skew_protection_token
+        self._session_secret = session_secret
+        self._overrides = overrides
+        self._context = get_context("spawn")
+        self._processes: dict[int, BaseProcess] = {}
+        self.addresses: dict[int, tuple[str, int]] = {}
+        port = _WORKER_MIN_PORT
+        for worker_id in range(count):
+            port = find_free_port(port, addr=WORKER_HOST)
+            self.addresses[worker_id] = (WORKER_HOST, port)
+            port += 1
+
+    def start(self) -> None:
+        for worker_id in self.addresses:
+            self._spawn(worker_id)
+
+    def _spawn(self, worker_id: int) -> None:
+        _, port = self.addresses[worker_id]
+        spec = WorkerSpec(
+            worker_id=worker_id,
+            registry_path=self._registry_path,
+            skew_protection_token=self._skew_protection_token,
+            session_secret=self._session_secret,
+        )
+        process = self._context.Process(
+            target=_run_worker,
+            args=(
+                self._start_server,
+                spec,
+                GLOBAL_SETTINGS,
+                {**self._overrides, "host": WORKER_HOST, "port": port},
+            ),
+            name=f"marimo-worker-{worker_id}",
+        )
+        process.start()
+        self._processes[worker_id] = process
+        LOGGER.debug(
+            "Started worker %s (pid %s) on port %s",
+            worker_id,
+            process.pid,
+            port,
+        )
+
+    def dead_workers(self) -> list[int]:
+        return [
+            worker_id
+            for worker_id, process in self._processes.items()
+            if not process.is_alive()
+        ]
+
+    def respawn(self, worker_id: int) -> None:
+        process = self._processes[worker_id]
+        LOGGER.warning(
+            "Worker %s exited with code %s, restarting",
+            worker_id,
+            process.exitcode,
+        )
+        process.close()
+        self._spawn(worker_id)
+
+    def shutdown(self) -> None:
+        processes = list(self._processes.values())
+        self._processes.clear()
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join(_SHUTDOWN_TIMEOUT_SECONDS)
+            if process.is_alive():
+                process.kill()
+                process.join()
@@ -0,0 +1,124 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Shared registry of which server worker owns which session.
+
+The router and every worker open the same SQLite file. Workers record
+their sessions as they are created, resumed, and closed; the router reads
+the table to send a reconnecting client back to the worker that still
+holds its session, even if the hash ring has changed since the session
+was created (e.g. because a worker was restarted).
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from marimo import _loggers
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+LOGGER = _loggers.marimo_logger()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    file_key TEXT NOT NULL,
+    worker_id INTEGER NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+
+
+@dataclass(frozen=True)
+class RegisteredSession:
+    session_id: str
+    file_key: str
+    worker_id: int
+    updated_at: float
+
+
+class SessionRegistry:
+    """SQLite-backed map of session id to worker id.
+
+    Each process creates its own registry for the shared path; the
+    connection is opened on first use.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(
+                self.path,
+                timeout=5.0,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            # WAL lets the router read while a worker writes.
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def register(self, session_id: str, file_key: str, worker_id: int) -> None:
+        with self._lock:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?)",
+                (session_id, file_key, worker_id, time.time()),
+            )
+
+    def unregister(self, session_id: str) -> None:
+        with self._lock:
+            self._connection().execute(
+                "DELETE FROM sessions WHERE session_id = ?", (session_id,)
+            )
+
+    def lookup(self, session_id: str) -> int | None:
+        """Return the worker holding `session_id`, if any."""
+        with self._lock:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT worker_id FROM sessions WHERE session_id = ?",
+                    (session_id,),
+                )
+                .fetchone()
+            )
+        return None if row is None else int(row[0])
+
+    def forget_worker(self, worker_id: int) -> int:
+        """Drop every session of a worker that has exited.
+
+        Returns the number of sessions dropped.
+        """
+        with self._lock:
+            cursor = self._connection().execute(
+                "DELETE FROM sessions WHERE worker_id = ?", (worker_id,)
+            )
+        return cursor.rowcount
+
+    def sessions(self) -> list[RegisteredSession]:
+        with self._lock:
+            rows = (
+                self._connection()
+                .execute(
+                    "SELECT session_id, file_key, worker_id, updated_at "
+                    "FROM sessions ORDER BY updated_at"
+                )
+                .fetchall()
+            )
+        return [RegisteredSession(*row) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
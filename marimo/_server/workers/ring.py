@@ -0,0 +1,76 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Consistent hashing of routing keys onto server workers."""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Points per worker on the ring. More points spread keys more evenly
+# across workers; 64 keeps the imbalance within a few percent for the
+# handful of workers a single machine runs.
+DEFAULT_REPLICAS = 64
+
+
+def _hash(value: str) -> int:
+    # Python's hash() is salted per process; the ring has to agree across
+    # restarts of the router, so use a stable digest.
+    digest = hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class HashRing:
+    """Maps routing keys (session ids, file keys) onto worker ids.
+
+    Adding or removing a worker only moves the keys that hashed to that
+    worker; every other session stays where it is.
+    """
+
+    def __init__(
+        self, workers: Iterable[int], *, replicas: int = DEFAULT_REPLICAS
+    ) -> None:
+        self._replicas = replicas
+        self._points: list[int] = []
+        self._owners: list[int] = []
+        self._workers: set[int] = set()
+        for worker_id in workers:
+            self.add(worker_id)
+
+    @property
+    def workers(self) -> frozenset[int]:
+        return frozenset(self._workers)
+
+    def add(self, worker_id: int) -> None:
+        if worker_id in self._workers:
+            return
+        self._workers.add(worker_id)
+        for replica in range(self._replicas):
+            point = _hash(f"{worker_id}:{replica}")
+            index = bisect.bisect_left(self._points, point)
+            self._points.insert(index, point)
+            self._owners.insert(index, worker_id)
+
+    def remove(self, worker_id: int) -> None:
+        if worker_id not in self._workers:
+            return
+        self._workers.discard(worker_id)
+        keep = [
+            (point, owner)
+            for point, owner in zip(self._points, self._owners, strict=True)
+            if owner != worker_id
+        ]
+        self._points = [point for point, _ in keep]
+        self._owners = [owner for _, owner in keep]
+
+    def get(self, key: str) -> int | None:
+        """Return the worker that owns `key`, or None if the ring is empty."""
+        if not self._points:
+            return None
+        index = bisect.bisect(self._points, _hash(key))
+        if index == len(self._points):
+            index = 0
+        return self._owners[index]
@@ -0,0 +1,294 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Session-affinity router in front of the server workers.
+
+The router reads only the head of each request (request line and
+headers), picks the worker that owns the request's session, and then
+splices bytes between the client and that worker. Bodies, responses and
+websocket frames are never parsed, so the router costs one extra local
+hop and little else.
+
+Plain HTTP requests are forwarded with `Connection: close` so that a
+keep-alive connection, which browsers share across tabs, can't carry a
+request for one session to the worker of another.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qs, urlsplit
+
+from marimo import _loggers
+from marimo._server.workers.ring import HashRing
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from marimo._server.workers.registry import SessionRegistry
+
+LOGGER = _loggers.marimo_logger()
+
+# Largest request head the router will buffer before giving up
+_MAX_HEAD_BYTES = 64 * 1024
+_CHUNK_SIZE = 64 * 1024
+# Workers can take a few seconds to boot; requests that arrive in the
+# meantime wait for them instead of failing.
+_CONNECT_TIMEOUT_SECONDS = 15.0
+
+SESSION_ID_HEADER = "marimo-session-id"
+# Virtual files created on a worker are named `w<worker_id>_...`; see
+# `marimo._runtime.virtual_file.content_filename`.
+_VIRTUAL_FILE_PATTERN = re.compile(r"/@file/\d+-w(\d+)_")
+_HOP_BY_HOP_HEADERS = frozenset(("connection", "keep-alive"))
+
+
+@dataclass
+class RequestHead:
+    method: str
+    target: str
+    version: str
+    headers: list[tuple[str, str]]
+
+    @property
+    def path(self) -> str:
+        return urlsplit(self.target).path
+
+    def query_param(self, name: str) -> str | None:
+        values = parse_qs(urlsplit(self.target).query).get(name)
+        return values[0] if values else None
+
+    def header(self, name: str) -> str | None:
+        for key, value in self.headers:
+            if key.lower() == name:
+                return value
+        return None
+
+    @property
+    def is_upgrade(self) -> bool:
+        connection = self.header("connection") or ""
+        return "upgrade" in connection.lower()
+
+    def encode(self) -> bytes:
+        """Serialize the head for the worker.
+
+        Non-upgrade requests are rewritten to close the connection after
+        the response.
+        """
+        lines = [f"{self.method} {self.target} {self.version}"]
+        if self.is_upgrade:
+            lines.extend(f"{key}: {value}" for key, value in self.headers)
+        else:
+            lines.extend(
+                f"{key}: {value}"
+                for key, value in self.headers
+                if key.lower() not in _HOP_BY_HOP_HEADERS
+            )
+            lines.append("Connection: close")
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+def parse_request_head(data: bytes) -> RequestHead:
+    """Parse an HTTP/1.x request head (everything before the blank line)."""
+    text = data.decode("latin-1")
+    request_line, *header_lines = text.split("\r\n")
+    parts = request_line.split(" ")
+    if len(parts) != 3 or not parts[2].startswith("HTTP/"):
+        raise ValueError(f"Malformed request line: {request_line!r}")
+    headers: list[tuple[str, str]] = []
+    for line in header_lines:
+        if not line:
+            continue
+        key, sep, value = line.partition(":")
+        if not sep:
+            raise ValueError(f"Malformed header: {line!r}")
+        headers.append((key.strip(), value.strip()))
+    return RequestHead(
+        method=parts[0], target=parts[1], version=parts[2], headers=headers
+    )
+
+
+def _error_response(status: int, reason: str) -> bytes:
+    body = reason.encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {reason}\r\n"
+        "Content-Type: text/plain; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+class WorkerRouter:
+    """Routes connections to workers by session affinity.
+
+    A request goes to, in order of preference:
+
+    1. the worker named in a virtual file URL;
+    2. the worker the registry says holds the request's session;
+    3. the worker the hash ring assigns to the session id, or to the
+       `file` query parameter when there is no session yet;
+    4. any live worker (static assets, the gallery page, ...).
+    """
+
+    def __init__(
+        self,
+        addresses: Mapping[int, tuple[str, int]],
+        registry: SessionRegistry | None = None,
+        *,
+        connect_timeout: float = _CONNECT_TIMEOUT_SECONDS,
+    ) -> None:
+        self._addresses = dict(addresses)
+        self._registry = registry
+        self._connect_timeout = connect_timeout
+        self._ring = HashRing(self._addresses)
+        self._round_robin = itertools.cycle(sorted(self._addresses))
+
+    @property
+    def live_workers(self) -> frozenset[int]:
+        return self._ring.workers
+
+    def worker_down(self, worker_id: int) -> None:
+        """Stop routing to a worker; its sessions are gone."""
+        self._ring.remove(worker_id)
+        if self._registry is not None:
+            dropped = self._registry.forget_worker(worker_id)
+            LOGGER.debug(
+                "Worker %s down, dropped %s sessions", worker_id, dropped
+            )
+
+    def worker_up(self, worker_id: int) -> None:
+        self._ring.add(worker_id)
+
+    def route(self, head: RequestHead) -> int | None:
+        live = self._ring.workers
+        if not live:
+            return None
+
+        match = _VIRTUAL_FILE_PATTERN.search(head.path)
+        if match is not None and int(match.group(1)) in live:
+            return int(match.group(1))
+
+        session_id = head.header(SESSION_ID_HEADER) or head.query_param(
+            "session_id"
+        )
+        if session_id:
+            if self._registry is not None:
+                owner = self._registry.lookup(session_id)
+                if owner in live:
+                    return owner
+            return self._ring.get(session_id)
+
+        file_key = head.query_param("file")
+        if file_key:
+            return self._ring.get(file_key)
+
+        return self._next_live(live)
+
+    def _next_live(self, live: Iterable[int]) -> int:
+        live = frozenset(live)
+        while True:
+            worker_id = next(self._round_robin)
+            if worker_id in live:
+                return worker_id
+
+    async def _connect(
+        self, worker_id: int
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        host, port = self._addresses[worker_id]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._connect_timeout
+        delay = 0.05
+        while True:
+            try:
+                return await asyncio.open_connection(host, port)
+            except OSError:
+                if (
+                    loop.time() + delay > deadline
+                    or worker_id not in self._ring.workers
+                ):
+                    raise
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 0.5)
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one client connection."""
+        try:
+            try:
+                data = await reader.readuntil(b"\r\n\r\n")
+                head = parse_request_head(data[:-4])
+            except asyncio.LimitOverrunError:
+                writer.write(
+                    _error_response(431, "Request Header Fields Too Large")
+                )
+                return
+            except (asyncio.IncompleteReadError, ValueError):
+                writer.write(_error_response(400, "Bad Request"))
+                return
+
+            worker_id = self.route(head)
+            if worker_id is None:
+                writer.write(_error_response(503, "Service Unavailable"))
+                return
+            try:
+                upstream_reader, upstream_writer = await self._connect(
+                    worker_id
+                )
+            except OSError as e:
+                LOGGER.warning("Failed to reach worker %s: %s", worker_id, e)
+                writer.write(_error_response(502, "Bad Gateway"))
+                return
+
+            upstream_writer.write(head.encode())
+            await _splice(reader, writer, upstream_reader, upstream_writer)
+        except ConnectionError:
+            pass
+        finally:
+            await _close(writer)
+
+    async def serve(self, host: str, port: int) -> asyncio.Server:
+        return await asyncio.start_server(
+            self.handle, host=host, port=port, limit=_MAX_HEAD_BYTES
+        )
+
+
+async def _pipe(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    while data := await reader.read(_CHUNK_SIZE):
+        writer.write(data)
+        await writer.drain()
+
+
+async def _splice(
+    client_reader: asyncio.StreamReader,
+    client_writer: asyncio.StreamWriter,
+    upstream_reader: asyncio.StreamReader,
+    upstream_writer: asyncio.StreamWriter,
+) -> None:
+    """Copy bytes both ways until either side closes."""
+    tasks = [
+        asyncio.create_task(_pipe(client_reader, upstream_writer)),
+        asyncio.create_task(_pipe(upstream_reader, client_writer)),
+    ]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await _close(upstream_writer)
+
+
+async def _close(writer: asyncio.StreamWriter) -> None:
+    if writer.is_closing():
+        return
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except (ConnectionError, OSError):
+        pass
@@ -57,9 +57,12 @@ _READ_COMMANDS: frozenset[type] = frozenset(
 )
 
 # Edit-tier commands mutate the notebook, its reactive state, or the kernel
-# lifecycle. Enumerated explicitly so a deliberate edit-tier command is
-# distinguishable from one that was never triaged: the latter raises in
-# `required_capability` instead of being silently classified as edit.
+# lifecycle, or invoke user code on arbitrary globals: variable previews call
+# `__repr__` and table managers, and memory estimates call `__sizeof__`, so
+# they are edit-tier like the endpoints that issue them. Enumerated explicitly
+# so a deliberate edit-tier command is distinguishable from one that was never
+# triaged: the latter raises in `required_capability` instead of being
+# silently classified as edit.
 _EDIT_COMMANDS: frozenset[type] = frozenset(
     {
         commands.CreateNotebookCommand,
@@ -70,6 +73,8 @@ _EDIT_COMMANDS: frozenset[type] = frozenset(
         commands.DebugCellCommand,
         commands.SetBreakpointsCommand,
         commands.DeleteCellCommand,
+        commands.PreviewVariablesCommand,
+        commands.GetMemoryUsageCommand,
         commands.SyncGraphCommand,
         commands.UpdateCellConfigCommand,
         commands.InstallPackagesCommand,
@@ -77,6 +82,8 @@ _EDIT_COMMANDS: frozenset[type] = frozenset(
         commands.RefreshSecretsCommand,
         commands.ClearCacheCommand,
         commands.StopKernelCommand,
+        commands.HibernateKernelCommand,
+        commands.RestoreKernelCommand,
     }
 )
 
@@ -10,6 +10,7 @@ from __future__ import annotations
 import asyncio
 import copy
 import html
+import time
 from enum import Enum
 from functools import partial
 from typing import TYPE_CHECKING
@@ -23,6 +24,7 @@ from marimo._messaging.notebook.document import NotebookCell
 from marimo._messaging.notification import (
     AlertNotification,
     BannerNotification,
+    KernelMetricsNotification,
     NotebookDocumentTransactionNotification,
     NotificationMessage,
 )
@@ -57,6 +59,7 @@ if TYPE_CHECKING:
     from marimo._session.events import (
         SessionEventBus,
     )
+    from marimo._session.metrics import SessionMetrics
     from marimo._session.types import Session
     from marimo._types.ids import ConsumerId, SessionId
 
@@ -157,6 +160,86 @@ class HeartbeatExtension(SessionExtension):
             self.heartbeat_task.cancel()
 
 
+class HibernationExtension(EventAwareExtension):
+    """Extension for hibernating the kernels of idle sessions.
+
+    Once no client has been connected, and nothing has happened in the
+    session, for `idle_seconds`, the kernel is checkpointed to disk and
+    stopped (see `Session.hibernate`). It is restored when a client
+    reconnects.
+    """
+
+    def __init__(self, idle_seconds: float, interval: float = 5) -> None:
+        super().__init__()
+        self.idle_seconds = idle_seconds
+        self.interval = interval
+        self.hibernation_task: asyncio.Task[None] | None = None
+        self._last_activity = time.monotonic()
+
+    def on_attach(self, session: Session, event_bus: SessionEventBus) -> None:
+        super().on_attach(session, event_bus)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop (tests, scripts) — nothing to schedule against.
+            return
+        self.hibernation_task = loop.create_task(self._watch(session))
+
+    def on_detach(self) -> None:
+        super().on_detach()
+        if self.hibernation_task is not None:
+            self.hibernation_task.cancel()
+            self.hibernation_task = None
+
+    def on_received_command(
+        self,
+        session: Session,
+        request: commands.CommandMessage,
+        from_consumer_id: ConsumerId | None,
+    ) -> None:
+        del session, request, from_consumer_id
+        self._touch()
+
+    def on_received_stdin(self, session: Session, stdin: str) -> None:
+        del session, stdin
+        self._touch()
+
+    def on_notification_sent(
+        self, session: Session, notification: KernelMessage
+    ) -> None:
+        del session, notification
+        self._touch()
+
+    def _touch(self) -> None:
+        self._last_activity = time.monotonic()
+
+    @staticmethod
+    def _in_use(session: Session) -> bool:
+        if session.room.size > 0:
+            return True
+        return any(
+            notification.status in ("queued", "running")
+            for notification in session.session_view.cell_notifications.values()
+        )
+
+    async def _watch(self, session: Session) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            if self._in_use(session):
+                self._touch()
+                continue
+            if session.kernel_state() != KernelState.RUNNING:
+                continue
+            if time.monotonic() - self._last_activity < self.idle_seconds:
+                continue
+            try:
+                await session.hibernate()
+            except Exception:
+                LOGGER.exception("Failed to hibernate kernel")
+            # Don't retry right away if hibernating failed
+            self._touch()
+
+
 class CachingExtension(EventAwareExtension):
     """Extension for caching session state to disk.
 
@@ -499,6 +582,49 @@ class QueueExtension(EventAwareExtension):
         self.queue_manager.put_input(stdin)
 
 
+class MetricsExtension(EventAwareExtension):
+    """Extension for recording the session's activity in server metrics.
+
+    Counts the notifications the session sends, and merges the timings and
+    cache statistics its kernel reports into the shared `SessionMetrics`.
+    """
+
+    def __init__(self, metrics: SessionMetrics) -> None:
+        super().__init__()
+        self.metrics = metrics
+        # The kernel's latest cache statistics
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def on_notification_sent(
+        self, session: Session, notification: KernelMessage
+    ) -> None:
+        """Called when a notification is sent."""
+        del session
+        op = try_deserialize_kernel_notification_name(notification)
+        if op is None:
+            return
+        self.metrics.record_notification(op, len(notification))
+        if op != KernelMetricsNotification.name:
+            return
+        try:
+            report = msgspec.json.decode(
+                notification, type=KernelMetricsNotification
+            )
+        except msgspec.DecodeError:
+            LOGGER.warning("Failed to decode kernel metrics")
+            return
+        self.metrics.record_kernel_metrics(report)
+        # The kernel reports totals over the caches it holds, which restart
+        # when a cache is redefined; the server's counts only grow.
+        self.metrics.record_cache_stats(
+            max(report.cache_hits - self.cache_hits, 0),
+            max(report.cache_misses - self.cache_misses, 0),
+        )
+        self.cache_hits = report.cache_hits
+        self.cache_misses = report.cache_misses
+
+
 class ReplayExtension(EventAwareExtension):
     """Extension for replaying commands from one session to another."""
 
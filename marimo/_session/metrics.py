@@ -0,0 +1,212 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Server metrics, exported in the Prometheus text format.
+
+Each session's `MetricsExtension` records the notifications the session
+sends, and merges the reports of its kernel (`KernelMetricsNotification`),
+into the session manager's `SessionMetrics`. Queue depths are gauges,
+read from the live sessions when the metrics are rendered.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from marimo._runtime.metrics import Histogram
+from marimo._session.extensions.extensions import QueueExtension
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from marimo._messaging.notification import KernelMetricsNotification
+    from marimo._session.session import Session
+
+
+# Upper bounds, in bytes, of the buckets of notification sizes
+SIZE_BUCKETS: tuple[float, ...] = (
+    256,
+    1024,
+    4096,
+    16384,
+    65536,
+    262144,
+    1048576,
+    4194304,
+    16777216,
+)
+
+
+class SessionMetrics:
+    """Counters aggregated over all sessions of a server."""
+
+    def __init__(self) -> None:
+        # notification sizes by op; their counts are the number of
+        # notifications sent
+        self.notification_sizes: dict[str, Histogram] = {}
+        self.cell_duration = Histogram()
+        self.hook_durations: dict[tuple[str, str], Histogram] = {}
+        # hits and misses of the notebooks' caches, including those of
+        # closed sessions
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def record_notification(self, op: str, size: int) -> None:
+        histogram = self.notification_sizes.get(op)
+        if histogram is None:
+            histogram = self.notification_sizes[op] = Histogram(SIZE_BUCKETS)
+        histogram.observe(size)
+
+    def record_kernel_metrics(
+        self, notification: KernelMetricsNotification
+    ) -> None:
+        self.cell_duration.merge(notification.cell_duration)
+        for hook in notification.hooks:
+            key = (hook.phase, hook.hook)
+            histogram = self.hook_durations.get(key)
+            if histogram is None:
+                histogram = self.hook_durations[key] = Histogram()
+            histogram.merge(hook.duration)
+
+    def record_cache_stats(self, hits: int, misses: int) -> None:
+        self.cache_hits += hits
+        self.cache_misses += misses
+
+    def render(self, sessions: Iterable[Session]) -> str:
+        """Render the metrics, with gauges read from `sessions`."""
+        sessions = list(sessions)
+        lines: list[str] = []
+
+        _header(
+            lines,
+            "marimo_notification_size_bytes",
+            "histogram",
+            "Sizes of the notifications sent by sessions, by operation.",
+        )
+        for op, histogram in sorted(self.notification_sizes.items()):
+            _histogram(
+                lines,
+                "marimo_notification_size_bytes",
+                {"op": op},
+                histogram,
+            )
+
+        _header(
+            lines,
+            "marimo_cell_duration_seconds",
+            "histogram",
+            "Execution time of cells.",
+        )
+        _histogram(
+            lines, "marimo_cell_duration_seconds", {}, self.cell_duration
+        )
+
+        _header(
+            lines,
+            "marimo_hook_duration_seconds",
+            "histogram",
+            "Execution time of runner hooks, by phase and hook.",
+        )
+        for (phase, hook), histogram in sorted(self.hook_durations.items()):
+            _histogram(
+                lines,
+                "marimo_hook_duration_seconds",
+                {"phase": phase, "hook": hook},
+                histogram,
+            )
+
+        _header(lines, "marimo_sessions", "gauge", "Open sessions.")
+        lines.append(f"marimo_sessions {len(sessions)}")
+
+        _header(
+            lines,
+            "marimo_queue_depth",
+            "gauge",
+            "Commands waiting in the kernels' queues, by queue.",
+        )
+        depths = _queue_depths(sessions)
+        for queue in ("control", "set_ui_element", "completion"):
+            lines.append(
+                f"marimo_queue_depth{_labels({'queue': queue})} "
+                f"{depths[queue]}"
+            )
+
+        _header(
+            lines,
+            "marimo_cache_hits_total",
+            "counter",
+            "Hits of the caches defined in the notebooks.",
+        )
+        lines.append(f"marimo_cache_hits_total {self.cache_hits}")
+        _header(
+            lines,
+            "marimo_cache_misses_total",
+            "counter",
+            "Misses of the caches defined in the notebooks.",
+        )
+        lines.append(f"marimo_cache_misses_total {self.cache_misses}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _queue_depths(sessions: Iterable[Session]) -> dict[str, int]:
+    depths = {"control": 0, "set_ui_element": 0, "completion": 0}
+    for session in sessions:
+        extension = session.extensions.get(QueueExtension)
+        if extension is None:
+            continue
+        queue_manager = extension.queue_manager
+        for name, queue in (
+            ("control", queue_manager.control_queue),
+            ("set_ui_element", queue_manager.set_ui_element_queue),
+            ("completion", queue_manager.completion_queue),
+        ):
+            # `qsize` isn't part of the `QueueType` protocol: queues that
+            # only forward commands (e.g., to an app host) don't have one
+            qsize = getattr(queue, "qsize", None)
+            if qsize is None:
+                continue
+            try:
+                depths[name] += qsize()
+            except (NotImplementedError, OSError, ValueError):
+                # Not supported by multiprocessing queues on macOS, and
+                # fails on closed queues
+                pass
+    return depths
+
+
+def _header(lines: list[str], name: str, kind: str, help_text: str) -> None:
+    lines.extend((f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"))
+
+
+def _histogram(
+    lines: list[str],
+    name: str,
+    labels: dict[str, str],
+    histogram: Histogram,
+) -> None:
+    # Prometheus buckets are cumulative
+    cumulative = 0
+    for bound, count in zip(histogram.bounds, histogram.counts, strict=False):
+        cumulative += count
+        bucket_labels = _labels({**labels, "le": repr(bound)})
+        lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+    total = cumulative + histogram.counts[-1]
+    lines.extend(
+        (
+            f"{name}_bucket{_labels({**labels, 'le': '+Inf'})} {total}",
+            f"{name}_sum{_labels(labels)} {histogram.sum!r}",
+            f"{name}_count{_labels(labels)} {total}",
+        )
+    )
+
+
+def _labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    escaped = ",".join(
+        f'{key}="{_escape(value)}"' for key, value in labels.items()
+    )
+    return f"{{{escaped}}}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
@@ -11,6 +11,7 @@ from marimo._ast import load
 from marimo._ast.app import App, InternalApp
 from marimo._ast.app_config import overloads_from_env
 from marimo._ast.cell import CellConfig
+from marimo._ast.codegen_cache import CodegenCache
 from marimo._messaging.notebook.changes import (
     Transaction,
 )
@@ -88,6 +89,9 @@ class AppFileManager:
         self._save_lock = threading.RLock()
         # Foreground writes supersede queued autosaves.
         self._autosave_generation = 0
+        # Reuses compiled and rendered cells across saves; guarded by
+        # `_save_lock`.
+        self._codegen_cache = CodegenCache()
 
     @property
     def filename(self) -> str | None:
@@ -253,7 +257,7 @@ class AppFileManager:
                 valid=notebook.valid,
                 filename=str(path),
             )
-            contents = handler.serialize(notebook)
+            contents = handler.serialize(notebook, cache=self._codegen_cache)
 
             if persist:
                 if self.content_matches_last_save(contents):
@@ -9,6 +9,10 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
+import shutil
+import tempfile
+from pathlib import Path
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
@@ -24,9 +28,12 @@ from marimo._runtime.commands import (
     AppMetadata,
     CreateNotebookCommand,
     ExecuteCellCommand,
+    HibernateKernelCommand,
     HTTPRequest,
+    RestoreKernelCommand,
     UpdateUIElementCommand,
 )
+from marimo._runtime.hibernate import CHECKPOINT_FILENAME, FAILED_FILENAME
 from marimo._session.capabilities import consumer_can, required_capability
 from marimo._session.consumer import SessionConsumer
 from marimo._session.events import SessionEventBus
@@ -34,6 +41,7 @@ from marimo._session.extensions.extensions import (
     CacheMode,
     CachingExtension,
     HeartbeatExtension,
+    HibernationExtension,
     LoggingExtension,
     NotificationListenerExtension,
     QueueExtension,
@@ -60,11 +68,11 @@ from marimo._session.types import (
     QueueManager,
     Session,
 )
-from marimo._types.ids import ConsumerId
+from marimo._types.ids import ConsumerId, UIElementId
 from marimo._utils.repr import format_repr
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
 
     from marimo._runtime.virtual_file import VirtualFileStorageType
     from marimo._session.app_host import AppHostContext
@@ -73,6 +81,8 @@ if TYPE_CHECKING:
 LOGGER = _loggers.marimo_logger()
 
 _DEFAULT_TTL_SECONDS = 120
+# How often to check whether a hibernating kernel has written its checkpoint
+_HIBERNATION_POLL_SECONDS = 0.1
 
 __all__ = ["Session", "SessionImpl"]
 
@@ -101,6 +111,7 @@ class SessionImpl(Session):
         extensions: list[SessionExtension] | None = None,
         sandbox_mode: SandboxMode | None = None,
         app_host_context: AppHostContext | None = None,
+        hibernate_ttl_seconds: int | None = None,
     ) -> Session:
         """
         Create a new session.
@@ -203,6 +214,14 @@ class SessionImpl(Session):
             ReplayExtension(),
             SessionViewExtension(),
         ]
+        if (
+            hibernate_ttl_seconds is not None
+            and mode == SessionMode.EDIT
+            and isinstance(kernel_manager, KernelManagerImpl)
+        ):
+            extensions.append(
+                HibernationExtension(idle_seconds=hibernate_ttl_seconds)
+            )
 
         return cls(
             initialization_id=initialization_id,
@@ -245,6 +264,14 @@ class SessionImpl(Session):
         self._event_bus = SessionEventBus()
 
         self._closed = False
+        # Set while the kernel is hibernating or hibernated
+        self._checkpoint: Path | None = None
+        # Whether the hibernated kernel has stopped
+        self._hibernated = False
+        # Whether the session was used while the kernel was checkpointing,
+        # and the commands received meanwhile; see `_wake`.
+        self._wake_requested = False
+        self._deferred: list[Callable[[], None]] = []
 
         # Attach all extensions
         self._attach_extensions()
@@ -322,12 +349,139 @@ class SessionImpl(Session):
             return KernelState.NOT_STARTED
         if self._kernel_manager.kernel_task.is_alive():
             return KernelState.RUNNING
+        if self._checkpoint is not None:
+            return KernelState.HIBERNATED
         return KernelState.STOPPED
 
     def kernel_pid(self) -> int | None:
         """Get the PID of the kernel."""
+        if self._hibernated:
+            return None
         return self._kernel_manager.pid
 
+    async def hibernate(self) -> bool:
+        """Checkpoint the kernel to disk and stop it.
+
+        The kernel is restored the next time the session is used. Returns
+        whether the kernel was hibernated.
+        """
+        kernel_manager = self._kernel_manager
+        if (
+            self._closed
+            or self._checkpoint is not None
+            or not isinstance(kernel_manager, KernelManagerImpl)
+            or kernel_manager.mode != SessionMode.EDIT
+            or not kernel_manager.is_alive()
+        ):
+            return False
+
+        directory = Path(tempfile.mkdtemp(prefix="marimo-hibernate-"))
+        self._checkpoint = directory
+        # Sent directly to the kernel: the command isn't part of the
+        # session's history, and shouldn't count as activity.
+        kernel_manager.queue_manager.put_control_request(
+            HibernateKernelCommand(directory=str(directory))
+        )
+        while True:
+            await asyncio.sleep(_HIBERNATION_POLL_SECONDS)
+            if self._closed:
+                return False
+            written = self._hibernation_status(directory)
+            if written is None:
+                continue
+            hibernated = self._finish_hibernation(directory, written)
+            if not self._wake_requested:
+                return hibernated
+            # Used while checkpointing
+            self._wake_requested = False
+            self._wake()
+            deferred, self._deferred = self._deferred, []
+            for emit in deferred:
+                emit()
+            return False
+
+    def _hibernation_status(self, directory: Path) -> bool | None:
+        """Whether the kernel wrote its checkpoint; `None` while pending."""
+        if (directory / FAILED_FILENAME).exists():
+            return False
+        if self._kernel_manager.is_alive():
+            return None
+        # The kernel exits once the checkpoint is written
+        return (directory / CHECKPOINT_FILENAME).exists()
+
+    def _finish_hibernation(self, directory: Path, written: bool) -> bool:
+        if not written:
+            LOGGER.warning("Failed to hibernate the kernel")
+            shutil.rmtree(directory, ignore_errors=True)
+            self._checkpoint = None
+            return False
+
+        for extension_type in (NotificationListenerExtension, QueueExtension):
+            extension = self.extensions.get(extension_type)
+            if extension is not None:
+                extension.on_detach()
+                self.extensions.remove(extension)
+        self._kernel_manager.close_kernel()
+        self._hibernated = True
+        LOGGER.debug("Hibernated kernel to %s", directory)
+        return True
+
+    def _wake(self) -> bool:
+        """Start a new kernel that restores the hibernated one.
+
+        Returns whether the kernel can take commands. It can't while it
+        is writing its checkpoint: `hibernate` wakes it once the checkpoint
+        is written, and commands are deferred until then.
+        """
+        directory = self._checkpoint
+        if directory is None:
+            return True
+        if not self._hibernated:
+            self._wake_requested = True
+            return False
+
+        old_kernel_manager = self._kernel_manager
+        assert isinstance(old_kernel_manager, KernelManagerImpl)
+        queue_manager = QueueManagerImpl(use_multiprocessing=True)
+        kernel_manager = KernelManagerImpl(
+            queue_manager=queue_manager,
+            mode=old_kernel_manager.mode,
+            configs=self.app_file_manager.app.cell_manager.config_map(),
+            app_metadata=old_kernel_manager.app_metadata,
+            config_manager=old_kernel_manager.config_manager,
+            virtual_file_storage=old_kernel_manager._virtual_file_storage,
+            redirect_console_to_browser=(
+                old_kernel_manager.redirect_console_to_browser
+            ),
+        )
+        kernel_manager.start_kernel()
+        self._kernel_manager = kernel_manager
+        self._checkpoint = None
+        self._hibernated = False
+
+        extensions: list[SessionExtension] = [
+            NotificationListenerExtension(
+                kernel_manager=kernel_manager, queue_manager=queue_manager
+            ),
+            QueueExtension(queue_manager=queue_manager),
+        ]
+        for extension in extensions:
+            self.extensions.add(extension)
+            extension.on_attach(self, self._event_bus)
+
+        ui_values = self.session_view.ui_values
+        queue_manager.put_control_request(
+            RestoreKernelCommand(
+                directory=str(directory),
+                set_ui_element_value_request=UpdateUIElementCommand(
+                    object_ids=[UIElementId(key) for key in ui_values],
+                    values=list(ui_values.values()),
+                ),
+            )
+        )
+        LOGGER.debug("Restoring kernel from %s", directory)
+        return True
+
     def kernel_exit_info(self) -> KernelExitInfo | None:
         """Describe how the kernel exited."""
         task = self._kernel_manager.kernel_task
@@ -357,6 +511,16 @@ class SessionImpl(Session):
                 required_capability(type(request)).value,
             )
             return
+        if not self._wake():
+            self._deferred.append(
+                functools.partial(
+                    self._event_bus.emit_received_command,
+                    self,
+                    request,
+                    from_consumer_id,
+                )
+            )
+            return
         self._event_bus.emit_received_command(self, request, from_consumer_id)
 
     def _consumer_may_issue(
@@ -378,6 +542,13 @@ class SessionImpl(Session):
 
     def put_input(self, text: str) -> None:
         """Put an input() request in the input queue."""
+        if not self._wake():
+            self._deferred.append(
+                functools.partial(
+                    self._event_bus.emit_received_stdin, self, text
+                )
+            )
+            return
         self._event_bus.emit_received_stdin(self, text)
 
     def disconnect_consumer(self, session_consumer: SessionConsumer) -> None:
@@ -406,6 +577,7 @@ class SessionImpl(Session):
         If its the main consumer and one already exists,
         an exception is raised.
         """
+        self._wake()
         # Consumers are also extensions, so we want to attach them to the session
         self.extensions.add(session_consumer)
         session_consumer.on_attach(self, self._event_bus)
@@ -455,7 +627,11 @@ class SessionImpl(Session):
         self._detach_extensions()
         # Close the room
         self.room.close()
-        self._kernel_manager.close_kernel(graceful=graceful)
+        if not self._hibernated:
+            self._kernel_manager.close_kernel(graceful=graceful)
+        if self._checkpoint is not None:
+            shutil.rmtree(self._checkpoint, ignore_errors=True)
+            self._checkpoint = None
 
     def instantiate(
         self,
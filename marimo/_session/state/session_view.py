@@ -1,6 +1,7 @@
 # Copyright 2026 Marimo. All rights reserved.
 from __future__ import annotations
 
+import re
 import time
 from dataclasses import dataclass
 from typing import Any, Literal, cast
@@ -10,11 +11,17 @@ import msgspec
 from marimo import _loggers
 from marimo._data.models import DataSourceConnection, DataTable
 from marimo._messaging.cell_output import CellChannel, CellOutput
+from marimo._messaging.console_output_worker import (
+    MAX_LINES,
+    collapse_carriage_returns,
+)
 from marimo._messaging.mimetypes import KnownMimeType, MimeBundleTuple
 from marimo._messaging.notification import (
     CellNotification,
+    CellProfileNotification,
     DatasetsNotification,
     DataSourceConnectionsNotification,
+    DataSourceTablesNotification,
     EsmSpec,
     InstallingPackageAlertNotification,
     InterruptedNotification,
@@ -23,6 +30,7 @@ from marimo._messaging.notification import (
     ModelOpen,
     ModelUpdate,
     NotificationMessage,
+    SessionSnapshotNotification,
     SQLSchemaListPreviewNotification,
     SQLTableListPreviewNotification,
     SQLTablePreviewNotification,
@@ -33,11 +41,15 @@ from marimo._messaging.notification import (
     VariableValue,
     VariableValuesNotification,
 )
-from marimo._messaging.serde import deserialize_kernel_message
+from marimo._messaging.serde import (
+    deserialize_kernel_message,
+    serialize_kernel_message,
+)
 from marimo._messaging.types import KernelMessage
 from marimo._runtime.commands import (
     CommandMessage,
     CreateNotebookCommand,
+    DeleteCellCommand,
     ExecuteCellCommand,
     ExecuteCellsCommand,
     ModelCommand,
@@ -58,6 +70,8 @@ LOGGER = _loggers.marimo_logger()
 
 ExportType = Literal["html", "md", "ipynb", "session"]
 MIMEBUNDLE_TYPE: KnownMimeType = "application/vnd.marimo+mimebundle"
+# Bumped when the layout of a session snapshot changes
+SESSION_SNAPSHOT_VERSION = 1
 
 
 BufferPath = tuple[str | int, ...]
@@ -180,6 +194,9 @@ class SessionView:
         self.last_executed_code: dict[CellId_t, str] = {}
         # Map of cell id to the last cell execution time
         self.last_execution_time: dict[CellId_t, float] = {}
+        # Map of cell id to the profile of its last run; only populated
+        # when the profiler is enabled.
+        self.cell_profiles: dict[CellId_t, CellProfileNotification] = {}
         # Aggregated model state — one snapshot per live model.
         # Updates merge in; close removes the entry.
         self.model_states: dict[WidgetModelId, ModelReplayState] = {}
@@ -203,6 +220,11 @@ class SessionView:
         # Auto-saving
         self.auto_export_state = AutoExportState()
 
+        # Serialized cell and model notifications, reused across snapshots
+        # until the underlying notification changes.
+        self._encoded_cells: dict[CellId_t, msgspec.Raw] = {}
+        self._encoded_models: dict[WidgetModelId, msgspec.Raw] = {}
+
     def _add_ui_value(self, name: str, value: Any) -> None:
         self.ui_values[name] = value
 
@@ -223,6 +245,10 @@ class SessionView:
         elif isinstance(request, (ExecuteCellsCommand, SyncGraphCommand)):
             for execution_request in request.execution_requests:
                 self._add_last_run_code(execution_request)
+            if isinstance(request, SyncGraphCommand):
+                self._remove_cells(request.delete_ids)
+        elif isinstance(request, DeleteCellCommand):
+            self._remove_cells([request.cell_id])
         elif isinstance(request, CreateNotebookCommand):
             for (
                 object_id,
@@ -234,6 +260,12 @@ class SessionView:
         elif isinstance(request, ModelCommand):
             self._apply_model_command(request)
 
+    def _remove_cells(self, cell_ids: list[CellId_t]) -> None:
+        # Profiles are replayed and exported, so a deleted cell's profile
+        # would outlive the cell
+        for cell_id in cell_ids:
+            self.cell_profiles.pop(cell_id, None)
+
     def _apply_model_command(self, request: ModelCommand) -> None:
         """Merge a client's model write into replay state.
 
@@ -249,6 +281,7 @@ class SessionView:
         view = self.model_states.get(request.model_id)
         if view is None:
             return
+        self._encoded_models.pop(request.model_id, None)
         # Clients may write widget state, never code or style: replayed
         # state reaches future viewers. Mirrors the kernel-side filter
         # in MarimoCommManager.receive_comm_message.
@@ -272,6 +305,7 @@ class SessionView:
             console_outputs: list[CellOutput] = as_list(cell_notif.console)
             for cell_output in console_outputs:
                 if cell_output.channel == CellChannel.STDIN:
+                    self._encoded_cells.pop(cell_notif.cell_id, None)
                     cell_output.channel = CellChannel.STDOUT
                     cell_output.data = f"{cell_output.data} {stdin}\n"
                     return
@@ -282,6 +316,7 @@ class SessionView:
         self.auto_export_state.mark_all_stale()
 
         if isinstance(notification, CellNotification):
+            self._encoded_cells.pop(notification.cell_id, None)
             previous = self.cell_notifications.get(notification.cell_id)
             self.cell_notifications[notification.cell_id] = (
                 merge_cell_notification(previous, notification)
@@ -356,6 +391,9 @@ class SessionView:
             for value in notification.variables:
                 self.variable_values[value.name] = value
 
+        elif isinstance(notification, CellProfileNotification):
+            self.cell_profiles[notification.cell_id] = notification
+
         elif isinstance(notification, InterruptedNotification):
             # Resolve stdin
             self.add_stdin("")
@@ -419,6 +457,13 @@ class SessionView:
                     sql_schema_list_preview.schemas,
                 )
 
+        elif isinstance(notification, DataSourceTablesNotification):
+            update_table_list_in_connection(
+                self.data_connectors.connections,
+                notification.metadata,
+                notification.tables,
+            )
+
         elif isinstance(notification, SQLTableListPreviewNotification):
             sql_table_list_preview = notification
             sql_metadata = sql_table_list_preview.metadata
@@ -443,6 +488,7 @@ class SessionView:
         elif isinstance(notification, ModelLifecycleNotification):
             model_id = notification.model_id
             msg = notification.message
+            self._encoded_models.pop(model_id, None)
             if isinstance(msg, ModelOpen):
                 self.model_states[model_id] = ModelReplayState.from_open(
                     model_id, msg
@@ -516,6 +562,7 @@ class SessionView:
             if cell_notif is None:
                 LOGGER.warning(f"Cell {cell_id} not found in session view")
                 continue
+            self._encoded_cells.pop(cell_id, None)
 
             mimetype, data = output
             new_mimebundle = {mimetype: data}
@@ -574,6 +621,61 @@ class SessionView:
 
     @property
     def notifications(self) -> list[NotificationMessage]:
+        all_notifications = self._state_notifications()
+
+        # Model messages must come before cell notifications to ensure
+        # the model exists before the view tries to use it.
+        for state in self.model_states.values():
+            all_notifications.append(state.to_notification())
+
+        for ui_messages in self.ui_element_messages.values():
+            all_notifications.extend(ui_messages)
+
+        all_notifications.extend(self.cell_notifications.values())
+        startup_logs = self._pending_startup_logs()
+        if startup_logs is not None:
+            all_notifications.append(startup_logs)
+        return all_notifications
+
+    def snapshot(self) -> SessionSnapshotNotification:
+        """Bundle the replay notifications into a single notification.
+
+        Holds the same notifications as `notifications`, in the same
+        order. Cell and model notifications are serialized once and
+        reused until they change, so a snapshot only re-encodes what
+        changed since the previous one.
+        """
+        encoded = [
+            msgspec.Raw(serialize_kernel_message(notification))
+            for notification in self._state_notifications()
+        ]
+        for model_id, state in self.model_states.items():
+            raw = self._encoded_models.get(model_id)
+            if raw is None:
+                raw = msgspec.Raw(
+                    serialize_kernel_message(state.to_notification())
+                )
+                self._encoded_models[model_id] = raw
+            encoded.append(raw)
+        for ui_messages in self.ui_element_messages.values():
+            encoded.extend(
+                msgspec.Raw(serialize_kernel_message(message))
+                for message in ui_messages
+            )
+        for cell_id, cell_notif in self.cell_notifications.items():
+            raw = self._encoded_cells.get(cell_id)
+            if raw is None:
+                raw = msgspec.Raw(serialize_kernel_message(cell_notif))
+                self._encoded_cells[cell_id] = raw
+            encoded.append(raw)
+        startup_logs = self._pending_startup_logs()
+        if startup_logs is not None:
+            encoded.append(msgspec.Raw(serialize_kernel_message(startup_logs)))
+        return SessionSnapshotNotification(
+            version=SESSION_SNAPSHOT_VERSION, notifications=encoded
+        )
+
+    def _state_notifications(self) -> list[NotificationMessage]:
         all_notifications: list[NotificationMessage] = []
         if self.variable_notifications.variables:
             all_notifications.append(self.variable_notifications)
@@ -589,21 +691,13 @@ class SessionView:
             all_notifications.append(self.data_connectors)
         if self.external_storage_namespaces.namespaces:
             all_notifications.append(self.external_storage_namespaces)
+        return all_notifications
 
-        # Model messages must come before cell notifications to ensure
-        # the model exists before the view tries to use it.
-        for state in self.model_states.values():
-            all_notifications.append(state.to_notification())
-
-        if self.ui_element_messages:
-            for ui_messages in self.ui_element_messages.values():
-                all_notifications.extend(ui_messages)
-
-        all_notifications.extend(self.cell_notifications.values())
+    def _pending_startup_logs(self) -> StartupLogsNotification | None:
         # Only include startup logs if they are in progress (not done)
         if self.startup_logs and self.startup_logs.status != "done":
-            all_notifications.append(self.startup_logs)
-        return all_notifications
+            return self.startup_logs
+        return None
 
     def get_model_notifications(self) -> list[ModelLifecycleNotification]:
         """Return model-open notifications for all live widget models.
@@ -660,10 +754,20 @@ def _merge_consecutive_console_outputs(
             and isinstance(output.data, str)
         ):
             # Merge by concatenating the data
+            previous = merged[-1].data
+            if output.channel != CellChannel.STDIN and "\r" in output.data:
+                # Progress updates can span flushes: collapse the line the
+                # new data continues (earlier lines are already collapsed)
+                start = previous.rfind("\n") + 1
+                data = previous[:start] + collapse_carriage_returns(
+                    previous[start:] + output.data
+                )
+            else:
+                data = previous + output.data
             merged[-1] = CellOutput(
                 channel=merged[-1].channel,
                 mimetype=merged[-1].mimetype,
-                data=merged[-1].data + output.data,
+                data=data,
                 timestamp=merged[-1].timestamp,
             )
         else:
@@ -672,6 +776,94 @@ def _merge_consecutive_console_outputs(
     return merged
 
 
+_ELIDED_MARKER = re.compile(
+    r"^\.\.\. (\d+) lines elided \.\.\.$", re.MULTILINE
+)
+
+
+def _n_lines(output: CellOutput) -> int:
+    if output.mimetype == "text/plain" and isinstance(output.data, str):
+        return output.data.count("\n") + 1
+    return 1
+
+
+def _n_elided(text: str) -> int:
+    """Lines of `text`, counting elision markers as the lines they elide."""
+    n_lines = text.count("\n") + 1
+    for match in _ELIDED_MARKER.finditer(text):
+        n_lines += int(match.group(1)) - 1
+    return n_lines
+
+
+def _elide_console(
+    console: list[CellOutput], max_lines: int = MAX_LINES
+) -> list[CellOutput]:
+    """Keep the last `max_lines` lines of a cell's merged console outputs.
+
+    The kernel elides lines within each flush (see `_elide_lines`); this
+    bounds the outputs accumulated over flushes. Non-text outputs count as
+    a single line, and elided output is replaced by a marker stating how
+    many lines were dropped, including those dropped by earlier markers.
+    """
+    n_lines = 0
+    for i in range(len(console) - 1, -1, -1):
+        n_lines += _n_lines(console[i])
+        if n_lines > max_lines:
+            break
+    else:
+        return console
+
+    # console[i] holds the oldest line that is kept, possibly partially
+    output = console[i]
+    n_elided = sum(
+        _n_elided(msg.data)
+        if msg.mimetype == "text/plain" and isinstance(msg.data, str)
+        else 1
+        for msg in console[:i]
+    )
+    kept = console[i + 1 :]
+    if output.mimetype == "text/plain" and isinstance(output.data, str):
+        lines = output.data.split("\n")
+        n_keep = max_lines - (n_lines - len(lines))
+        n_elided += _n_elided("\n".join(lines[: len(lines) - n_keep]))
+        if n_keep > 0:
+            kept.insert(
+                0,
+                CellOutput(
+                    channel=output.channel,
+                    mimetype=output.mimetype,
+                    data="\n".join(lines[len(lines) - n_keep :]),
+                    timestamp=output.timestamp,
+                ),
+            )
+    else:
+        n_elided += 1
+    marker = f"... {n_elided} lines elided ...\n"
+    first = kept[0] if kept else None
+    if (
+        first is not None
+        and first.mimetype == "text/plain"
+        and isinstance(first.data, str)
+    ):
+        kept[0] = CellOutput(
+            channel=first.channel,
+            mimetype=first.mimetype,
+            data=marker + first.data,
+            timestamp=first.timestamp,
+        )
+    else:
+        kept.insert(
+            0,
+            CellOutput(
+                channel=first.channel if first is not None else output.channel,
+                mimetype="text/plain",
+                data=marker,
+                timestamp=output.timestamp,
+            ),
+        )
+    return kept
+
+
 def merge_cell_notification(
     previous: CellNotification | None,
     current: CellNotification,
@@ -697,7 +889,9 @@ def merge_cell_notification(
     else:
         combined_console: list[CellOutput] = as_list(previous.console)
         combined_console.extend(as_list(current.console))
-        current.console = _merge_consecutive_console_outputs(combined_console)
+        current.console = _elide_console(
+            _merge_consecutive_console_outputs(combined_console)
+        )
 
     # If we went from running to running, use the previous timestamp.
     if current.status == "running" and previous.status == "running":
@@ -24,7 +24,10 @@ if TYPE_CHECKING:
     from marimo._messaging.types import KernelMessage
     from marimo._runtime import commands
     from marimo._session.consumer import SessionConsumer
-    from marimo._session.extensions.types import SessionExtension
+    from marimo._session.extensions.types import (
+        ExtensionRegistry,
+        SessionExtension,
+    )
     from marimo._session.model import (
         ConnectionState,
         SessionMode,
@@ -109,6 +112,8 @@ class KernelState(Enum):
     NOT_STARTED = "not_started"
     RUNNING = "running"
     STOPPED = "stopped"
+    # Checkpointed to disk; a new kernel restores it on next use
+    HIBERNATED = "hibernated"
 
 
 @dataclass(frozen=True)
@@ -140,6 +145,7 @@ class Session(Protocol):
     ttl_seconds: int
     scratchpad_lock: asyncio.Lock
     room: Room
+    extensions: ExtensionRegistry
 
     @property
     def document(self) -> NotebookDocument:
@@ -169,6 +175,14 @@ class Session(Protocol):
         """Rename the path of the session."""
         ...
 
+    async def hibernate(self) -> bool:
+        """Checkpoint the kernel to disk and stop it.
+
+        The kernel is restored the next time the session is used. Returns
+        whether the kernel was hibernated.
+        """
+        ...
+
     def put_control_request(
         self,
         request: commands.CommandMessage,
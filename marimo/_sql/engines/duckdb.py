@@ -5,15 +5,28 @@ from contextlib import contextmanager, nullcontext
 from typing import TYPE_CHECKING, Any, Literal, Optional, cast
 
 from marimo import _loggers
-from marimo._data.get_datasets import get_databases_from_duckdb
+from marimo._config.config import SqlOutputType
+from marimo._data.get_datasets import (
+    get_databases_from_duckdb,
+    get_duckdb_schema_tables,
+)
 from marimo._data.models import Database, DataTable, Schema
 from marimo._dependencies.dependencies import DependencyManager
 from marimo._runtime.context.types import (
     ContextNotInitializedError,
     get_context,
 )
-from marimo._sql.engines.types import InferenceConfig, SQLConnection
-from marimo._sql.utils import convert_to_output, wrapped_sql
+from marimo._sql.engines.types import (
+    InferenceConfig,
+    SQLConnection,
+    _validate_sql_output_format,
+)
+from marimo._sql.result_table import persist_relation
+from marimo._sql.utils import (
+    convert_to_output,
+    get_configured_sql_output_format,
+    wrapped_sql,
+)
 from marimo._types.ids import VariableName
 
 LOGGER = _loggers.marimo_logger()
@@ -83,6 +96,14 @@ class DuckDBEngine(SQLConnection[Optional["duckdb.DuckDBPyConnection"]]):
             return None
 
         sql_output_format = self.sql_output_format()
+        if sql_output_format == "duckdb-table":
+            import duckdb
+
+            connection = cast(
+                duckdb.DuckDBPyConnection, self._connection or duckdb
+            )
+            with self._install_connection(connection):
+                return persist_relation(relation, connection)
 
         def to_polars() -> pl.DataFrame:
             import polars as pl
@@ -109,6 +130,10 @@ class DuckDBEngine(SQLConnection[Optional["duckdb.DuckDBPyConnection"]]):
             to_lazy_polars=to_lazy_polars,
         )
 
+    def sql_output_format(self) -> SqlOutputType:
+        # Unlike other engines, DuckDB supports "duckdb-table"
+        return _validate_sql_output_format(get_configured_sql_output_format())
+
     @staticmethod
     def is_compatible(var: Any) -> bool:
         if not DependencyManager.duckdb.imported():
@@ -203,9 +228,17 @@ class DuckDBEngine(SQLConnection[Optional["duckdb.DuckDBPyConnection"]]):
         include_table_details: bool,
         schema_path: list[str] | None = None,
     ) -> list[DataTable]:
-        """Return all tables in a schema. This is currently implemented in get_databases_from_duckdb."""
-        _, _, _, _ = database, schema, include_table_details, schema_path
-        return []
+        """Return all tables in a schema, with their columns."""
+        _, _ = include_table_details, schema_path
+        import duckdb
+
+        connection = cast(
+            duckdb.DuckDBPyConnection, self._connection or duckdb
+        )
+        with self._install_connection(connection):
+            return get_duckdb_schema_tables(
+                connection, database, schema, self._engine_name
+            )
 
     def get_table_details(
         self,
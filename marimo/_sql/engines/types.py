@@ -209,6 +209,9 @@ class QueryEngine(BaseEngine[CONN], ABC):
 
     def sql_output_format(self) -> SqlOutputType:
         configured_output_format = get_configured_sql_output_format()
+        if configured_output_format == "duckdb-table":
+            # Only the DuckDB engine can keep results in a table
+            return "auto"
         return _validate_sql_output_format(configured_output_format)
 
     def execute_in_explain_mode(
@@ -0,0 +1,115 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""SQL results kept in DuckDB instead of Python memory.
+
+With the `duckdb-table` SQL output format, `mo.sql` writes the result of a
+DuckDB query to a temporary table and returns a relation over that table.
+DuckDB spills the table to its `temp_directory` when it outgrows the memory
+limit, and `mo.ui.table` counts and pages it with SQL, so a large result is
+never materialized in Python.
+
+Each table belongs to the cell that created it and is dropped when that
+cell re-runs or is deleted.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import TYPE_CHECKING, Any
+
+from marimo import _loggers
+from marimo._dependencies.dependencies import DependencyManager
+from marimo._runtime.cell_lifecycle_item import CellLifecycleItem
+from marimo._runtime.context.types import (
+    ContextNotInitializedError,
+    get_context,
+)
+from marimo._sql.sql_quoting import quote_sql_identifier
+
+if TYPE_CHECKING:
+    import duckdb
+
+    from marimo._runtime.context.types import RuntimeContext
+
+LOGGER = _loggers.marimo_logger()
+
+RESULT_TABLE_PREFIX = "__marimo_sql_result_"
+
+
+def is_result_table_name(name: str) -> bool:
+    """Whether `name` is a table created to hold a SQL result."""
+    return name.startswith(RESULT_TABLE_PREFIX)
+
+
+def is_result_table(value: Any) -> bool:
+    """Whether `value` is a relation over a SQL result table."""
+    if not DependencyManager.duckdb.imported():
+        return False
+
+    import duckdb
+
+    if not isinstance(value, duckdb.DuckDBPyRelation):
+        return False
+    try:
+        return is_result_table_name(value.alias)
+    except Exception:
+        return False
+
+
+class ResultTableLifecycleItem(CellLifecycleItem):
+    """Drops a result table when the cell that created it is disposed."""
+
+    def __init__(
+        self, connection: duckdb.DuckDBPyConnection, table_name: str
+    ) -> None:
+        self._connection = connection
+        self._table_name = table_name
+
+    def create(self, context: RuntimeContext) -> None:
+        del context
+
+    def dispose(self, context: RuntimeContext, deletion: bool) -> bool:
+        del context, deletion
+        table = quote_sql_identifier(self._table_name)
+        try:
+            self._connection.execute(f"DROP TABLE IF EXISTS temp.main.{table}")
+        except Exception as e:
+            # The connection may have been closed by the user
+            LOGGER.debug(
+                "Failed to drop result table %s: %s", self._table_name, e
+            )
+        return True
+
+
+def persist_relation(
+    relation: duckdb.DuckDBPyRelation,
+    connection: duckdb.DuckDBPyConnection,
+) -> duckdb.DuckDBPyRelation:
+    """Write `relation` to a temporary table and return a relation over it.
+
+    `connection` must be the connection `relation` was created on.
+    """
+    table_name = f"{RESULT_TABLE_PREFIX}{uuid.uuid4().hex}"
+    view_name = f"{table_name}_query"
+    # The relation is already bound (including replacement scans of Python
+    # variables), so it is exposed as a view rather than re-run from its SQL.
+    relation.create_view(view_name, replace=True)
+    try:
+        connection.execute(
+            f"CREATE TEMP TABLE {quote_sql_identifier(table_name)} AS "
+            f"SELECT * FROM {quote_sql_identifier(view_name)}"
+        )
+    finally:
+        connection.execute(
+            f"DROP VIEW IF EXISTS {quote_sql_identifier(view_name)}"
+        )
+
+    try:
+        ctx = get_context()
+    except ContextNotInitializedError:
+        # Outside of a notebook, the table lives as long as the connection.
+        pass
+    else:
+        ctx.cell_lifecycle_registry.add(
+            ResultTableLifecycleItem(connection, table_name)
+        )
+    return connection.table(table_name)
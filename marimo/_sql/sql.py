@@ -17,6 +17,7 @@ from marimo._sql.engines.sqlalchemy import SQLAlchemyEngine
 from marimo._sql.engines.types import QueryEngine
 from marimo._sql.error_utils import MarimoSQLException, is_sql_parse_error
 from marimo._sql.get_engines import SUPPORTED_ENGINES
+from marimo._sql.result_table import is_result_table
 from marimo._sql.utils import (
     extract_explain_content,
     get_configured_sql_output_format,
@@ -54,8 +55,8 @@ def _resolve_default_duckdb_deps(
     elif sql_output == "auto":
         if not polars_installed() and not pandas_installed():
             deps.append(polars_with_pyarrow)
-    elif sql_output == "native":
-        # "native" returns the underlying DuckDB relation and needs no df lib.
+    elif sql_output == "native" or sql_output == "duckdb-table":
+        # These return a DuckDB relation and need no df lib.
         pass
     else:
         log_never(sql_output)
@@ -146,6 +147,9 @@ def sql(
     if df is None:
         return None
 
+    # Result tables are counted and paged in DuckDB, never loaded in full
+    paged_in_duckdb = is_result_table(df)
+
     has_limit = False
     try:
         default_result_limit = get_default_result_limit()
@@ -158,7 +162,14 @@ def sql(
 
     custom_total_count: Literal["too_many"] | None = None
     if enforce_own_limit:
-        if DependencyManager.polars.has():
+        if paged_in_duckdb:
+            custom_total_count = (
+                "too_many"
+                if _count_rows(df) > cast(int, default_result_limit)
+                else None
+            )
+            df = df.limit(default_result_limit)
+        elif DependencyManager.polars.has():
             custom_total_count = (
                 "too_many"
                 if len(df) > cast(int, default_result_limit)
@@ -188,6 +199,15 @@ def sql(
         elif not include_opinionated():
             # Respect display.dataframes config - use plain formatting
             replace(plain(df))
+        elif paged_in_duckdb:
+            replace(
+                table.table(
+                    df,
+                    selection=None,
+                    pagination=True,
+                    _internal_total_rows=custom_total_count,
+                )
+            )
         elif can_narwhalify_lazyframe(df):
             # For pl.LazyFrame and DuckDBRelation, we only show the first few rows
             # to avoid loading all the data into memory.
@@ -213,6 +233,11 @@ def sql(
     return df
 
 
+def _count_rows(relation: Any) -> int:
+    row = relation.aggregate("count(*)").fetchone()
+    return int(row[0]) if row is not None else 0
+
+
 def _query_includes_limit(query: str) -> bool:
     """Check if a SQL query includes a LIMIT clause."""
     import sqlglot
@@ -25,11 +25,21 @@ from marimo._utils.versions import is_editable
 from marimo._version import __version__
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
     from marimo._server.api.endpoints.assets import LspWorkspace
 
 
 MOUNT_CONFIG_TEMPLATE = "'{{ mount_config }}'"
 
+# Stand-ins for the largest parts of a static notebook, the session snapshot
+# and the virtual files, which are emitted in chunks after templating
+_SESSION_PLACEHOLDER = "\x00marimo-session\x00"
+_FILES_PLACEHOLDER = "\x00marimo-files\x00"
+
+# Approximate size of the chunks that large JSON values are emitted in
+_JSON_CHUNK_SIZE = 64 * 1024
+
 
 _json_script_escapes = {
     ord(">"): "\\u003E",
@@ -49,6 +59,38 @@ def json_script(data: Any) -> str:
     return json.dumps(data, sort_keys=True).translate(_json_script_escapes)
 
 
+def _iter_json_script(data: Any) -> Iterator[str]:
+    """`json_script(data)`, in chunks."""
+    buffer: list[str] = []
+    size = 0
+    for chunk in json.JSONEncoder(sort_keys=True).iterencode(data):
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= _JSON_CHUNK_SIZE:
+            yield "".join(buffer).translate(_json_script_escapes)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield "".join(buffer).translate(_json_script_escapes)
+
+
+def _iter_json_script_object(
+    mapping: Mapping[str, str | None],
+) -> Iterator[str]:
+    """`json_script(dict(mapping))`, without None values, one entry at a
+    time, so that values of a lazy mapping are computed (and released) one
+    by one."""
+    separator = ""
+    yield "{"
+    for key in sorted(mapping):
+        value = mapping[key]
+        if value is None:
+            continue
+        yield f"{separator}{json_script(key)}: {json_script(value)}"
+        separator = ", "
+    yield "}"
+
+
 def _export_context_block(*, notebook_code: str) -> str:
     """Emit the trusted export marker consumed by islands/export runtime code."""
     return dedent(
@@ -394,10 +436,50 @@ def static_notebook_template(
     code_hash: str,
     session_snapshot: NotebookSessionV1,
     notebook_snapshot: NotebookV1,
-    files: dict[str, str],
+    files: Mapping[str, str | None],
     model_notifications: list[ModelLifecycleNotification] | None = None,
     asset_url: str | None = None,
 ) -> str:
+    return "".join(
+        iter_static_notebook_template(
+            html=html,
+            user_config=user_config,
+            config_overrides=config_overrides,
+            server_token=server_token,
+            app_config=app_config,
+            filepath=filepath,
+            code=code,
+            code_hash=code_hash,
+            session_snapshot=session_snapshot,
+            notebook_snapshot=notebook_snapshot,
+            files=files,
+            model_notifications=model_notifications,
+            asset_url=asset_url,
+        )
+    )
+
+
+def iter_static_notebook_template(
+    html: str,
+    user_config: MarimoConfig,
+    config_overrides: PartialMarimoConfig,
+    server_token: SkewProtectionToken,
+    app_config: _AppConfig,
+    filepath: str | None,
+    code: str,
+    code_hash: str,
+    session_snapshot: NotebookSessionV1,
+    notebook_snapshot: NotebookV1,
+    files: Mapping[str, str | None],
+    model_notifications: list[ModelLifecycleNotification] | None = None,
+    asset_url: str | None = None,
+) -> Iterator[str]:
+    """`static_notebook_template`, in chunks.
+
+    The session snapshot and the virtual files, which make up most of a
+    notebook with large outputs, are encoded incrementally, and `files` is
+    read one entry at a time: the document is never held in memory whole.
+    """
     if asset_url is None:
         version = str(__version__).replace(".dev", "-dev")
         asset_url = f"https://cdn.jsdelivr.net/npm/@marimo-team/frontend@{version}/dist"
@@ -420,7 +502,7 @@ def static_notebook_template(
             user_config=user_config,
             config_overrides=config_overrides,
             app_config=app_config,
-            session_snapshot=session_snapshot,
+            session_snapshot=cast(NotebookSessionV1, _SESSION_PLACEHOLDER),
             notebook_snapshot=notebook_snapshot,
             runtime_config=None,
         ),
@@ -436,7 +518,7 @@ def static_notebook_template(
     )
 
     static_block = _static_state_block(
-        files=files,
+        files=cast(dict[str, str], _FILES_PLACEHOLDER),
         model_notifications=[
             n.to_json_serializable() for n in model_notifications or []
         ],
@@ -494,7 +576,29 @@ def static_notebook_template(
 
     html = _inject_custom_css_for_config(html, user_config, filepath)
     html = _inject_custom_css_for_config(html, config_overrides, filepath)
-    return html
+
+    yield from _fill_placeholders(
+        html,
+        {
+            json_script(_SESSION_PLACEHOLDER): _iter_json_script(
+                session_snapshot
+            ),
+            json_script(_FILES_PLACEHOLDER): _iter_json_script_object(files),
+        },
+    )
+
+
+def _fill_placeholders(
+    html: str, replacements: dict[str, Iterator[str]]
+) -> Iterator[str]:
+    """Emit `html`, with each placeholder replaced by its chunks."""
+    positions = sorted((html.index(p), p) for p in replacements)
+    start = 0
+    for index, placeholder in positions:
+        yield html[start:index]
+        yield from replacements[placeholder]
+        start = index + len(placeholder)
+    yield html[start:]
 
 
 def wasm_notebook_template(
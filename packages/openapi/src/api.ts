@@ -35,6 +35,13 @@ export interface paths {
             "application/octet-stream": string;
           };
         };
+        /** @description The cached virtual file is current */
+        304: {
+          headers: {
+            [name: string]: unknown;
+          };
+          content?: never;
+        };
         /** @description Invalid byte length in virtual file request */
         404: {
           headers: {
@@ -642,7 +649,7 @@ export interface paths {
             [name: string]: unknown;
           };
           content: {
-            "application/json": components["schemas"]["SuccessResponse"];
+            "application/json": components["schemas"]["NotebookDocumentTransactionResponse"];
           };
         };
       };
@@ -1124,6 +1131,55 @@ export interface paths {
     patch?: never;
     trace?: never;
   };
+  "/api/export/profile": {
+    parameters: {
+      query?: never;
+      header?: never;
+      path?: never;
+      cookie?: never;
+    };
+    get?: never;
+    put?: never;
+    post: {
+      parameters: {
+        query?: never;
+        header: {
+          "Marimo-Session-Id": string;
+        };
+        path?: never;
+        cookie?: never;
+      };
+      requestBody?: {
+        content: {
+          "application/json": components["schemas"]["ExportProfileRequest"];
+        };
+      };
+      responses: {
+        /** @description Export the profiles of the session's last cell runs, as a Chrome trace (JSON) or collapsed stacks (text) */
+        200: {
+          headers: {
+            [name: string]: unknown;
+          };
+          content: {
+            "application/json": Record<string, never>;
+            "text/plain": string;
+          };
+        };
+        /** @description No profiles were recorded for the session or cell */
+        404: {
+          headers: {
+            [name: string]: unknown;
+          };
+          content?: never;
+        };
+      };
+    };
+    delete?: never;
+    options?: never;
+    head?: never;
+    patch?: never;
+    trace?: never;
+  };
   "/api/export/requirements/install": {
     parameters: {
       query?: never;
@@ -2221,6 +2277,47 @@ export interface paths {
     patch?: never;
     trace?: never;
   };
+  "/api/kernel/memory_usage": {
+    parameters: {
+      query?: never;
+      header?: never;
+      path?: never;
+      cookie?: never;
+    };
+    get?: never;
+    put?: never;
+    post: {
+      parameters: {
+        query?: never;
+        header: {
+          "Marimo-Session-Id": string;
+        };
+        path?: never;
+        cookie?: never;
+      };
+      requestBody?: {
+        content: {
+          "application/json": components["schemas"]["GetMemoryUsageRequest"];
+        };
+      };
+      responses: {
+        /** @description Estimate the memory used by variables; the estimate is sent as a memory-usage notification */
+        200: {
+          headers: {
+            [name: string]: unknown;
+          };
+          content: {
+            "application/json": components["schemas"]["SuccessResponse"];
+          };
+        };
+      };
+    };
+    delete?: never;
+    options?: never;
+    head?: never;
+    patch?: never;
+    trace?: never;
+  };
   "/api/kernel/pdb/breakpoints": {
     parameters: {
       query?: never;
@@ -2303,6 +2400,47 @@ export interface paths {
     patch?: never;
     trace?: never;
   };
+  "/api/kernel/preview_variables": {
+    parameters: {
+      query?: never;
+      header?: never;
+      path?: never;
+      cookie?: never;
+    };
+    get?: never;
+    put?: never;
+    post: {
+      parameters: {
+        query?: never;
+        header: {
+          "Marimo-Session-Id": string;
+        };
+        path?: never;
+        cookie?: never;
+      };
+      requestBody?: {
+        content: {
+          "application/json": components["schemas"]["PreviewVariablesRequest"];
+        };
+      };
+      responses: {
+        /** @description Compute previews of variables; they are sent as a variable-values notification */
+        200: {
+          headers: {
+            [name: string]: unknown;
+          };
+          content: {
+            "application/json": components["schemas"]["SuccessResponse"];
+          };
+        };
+      };
+    };
+    delete?: never;
+    options?: never;
+    head?: never;
+    patch?: never;
+    trace?: never;
+  };
   "/api/kernel/read_code": {
     parameters: {
       query?: never;
@@ -2988,6 +3126,41 @@ export interface paths {
     patch?: never;
     trace?: never;
   };
+  "/api/metrics": {
+    parameters: {
+      query?: never;
+      header?: never;
+      path?: never;
+      cookie?: never;
+    };
+    get: {
+      parameters: {
+        query?: never;
+        header?: never;
+        path?: never;
+        cookie?: never;
+      };
+      requestBody?: never;
+      responses: {
+        /** @description Get kernel and session metrics (cell and hook execution times, notification sizes, queue depths, cache statistics) in the Prometheus text format */
+        200: {
+          headers: {
+            [name: string]: unknown;
+          };
+          content: {
+            "text/plain": string;
+          };
+        };
+      };
+    };
+    put?: never;
+    post?: never;
+    delete?: never;
+    options?: never;
+    head?: never;
+    patch?: never;
+    trace?: never;
+  };
   "/api/packages/add": {
     parameters: {
       query?: never;
@@ -4035,6 +4208,7 @@ export interface components {
         | "image/png"
         | "image/svg+xml"
         | "image/tiff"
+        | "image/webp"
         | "text/csv"
         | "text/html"
         | "text/latex"
@@ -4063,6 +4237,50 @@ export interface components {
         [key: string]: components["schemas"]["CellOutput"];
       };
     };
+    /**
+     * CellProfileNotification
+     * @description Execution profile of a cell, sent when the profiler is enabled.
+     *
+     *         Attributes:
+     *             cell_id: The profiled cell.
+     *             start: Wall-clock start time (seconds since the epoch).
+     *             duration: Total time spent on the cell, hooks included (seconds).
+     *             spans: Timed phases of the run, in execution order.
+     *             stacks: Sampled call stacks in collapsed ("folded") form, mapping
+     *                 `phase;frame;frame` to the number of samples observed.
+     *             sample_interval: Seconds between stack samples.
+     */
+    CellProfileNotification: {
+      cell_id: components["schemas"]["CellId"];
+      duration: number;
+      /** @enum {unknown} */
+      op: "cell-profile";
+      sample_interval: number;
+      spans: components["schemas"]["CellProfileSpan"][];
+      stacks: {
+        [key: string]: number;
+      };
+      start: number;
+    };
+    /**
+     * CellProfileSpan
+     * @description A timed phase of a single cell run.
+     *
+     *         Attributes:
+     *             name: Phase name (`execute`, or the name of a hook).
+     *             category: What the time is attributed to: user code
+     *                 (`execution`), runtime bookkeeping (`hook`), or output
+     *                 formatting/serialization (`formatting`).
+     *             start: Wall-clock start time (seconds since the epoch).
+     *             duration: Duration in seconds.
+     */
+    CellProfileSpan: {
+      /** @enum {unknown} */
+      category: "execution" | "formatting" | "hook";
+      duration: number;
+      name: string;
+      start: number;
+    };
     /** ChatAttachment */
     ChatAttachment: {
       /** @default null */
@@ -4413,6 +4631,23 @@ export interface components {
       request_id: string;
       sources: components["schemas"]["DetectedDataSource"][];
     };
+    /**
+     * DataSourceTablesNotification
+     * @description Tables of one schema of a data source connection.
+     *
+     *         Sent instead of a full `DataSourceConnectionsNotification` when a SQL
+     *         cell only changed the tables of some schemas.
+     *
+     *         Attributes:
+     *             metadata: Connection, database, and schema the tables belong to.
+     *             tables: All tables and views now in the schema.
+     */
+    DataSourceTablesNotification: {
+      metadata: components["schemas"]["SQLMetadata"];
+      /** @enum {unknown} */
+      op: "data-source-tables";
+      tables: components["schemas"]["DataTable"][];
+    };
     /**
      * DataTable
      * @description Represents a data table.
@@ -4905,6 +5140,17 @@ export interface components {
       missingPackages: string[];
       missingSetup: components["schemas"]["ExportSetupRequirement"][];
     };
+    /** ExportProfileRequest */
+    ExportProfileRequest: {
+      /** @default null */
+      cellId?: components["schemas"]["CellId"] | null;
+      download: boolean;
+      /**
+       * @default chrome-trace
+       * @enum {unknown}
+       */
+      format?: "chrome-trace" | "folded";
+    };
     /** ExportSetupRequirement */
     ExportSetupRequirement: {
       command: string;
@@ -5141,6 +5387,28 @@ export interface components {
     };
     /** GetCacheInfoRequest */
     GetCacheInfoRequest: Record<string, any>;
+    /**
+     * GetMemoryUsageCommand
+     * @description Estimate the memory used by global variables.
+     *
+     *         Sizes are deep estimates; memory shared between variables is counted
+     *         once. The result, along with the kernel's resident set size over time,
+     *         is sent as a `MemoryUsageNotification`.
+     *
+     *         Attributes:
+     *             names: Names of the variables to measure, or None for all globals.
+     */
+    GetMemoryUsageCommand: {
+      /** @default null */
+      names?: string[] | null;
+      /** @enum {unknown} */
+      type: "get-memory-usage";
+    };
+    /** GetMemoryUsageRequest */
+    GetMemoryUsageRequest: {
+      /** @default null */
+      names?: string[] | null;
+    };
     /**
      * GitHubConfig
      * @description Configuration options for GitHub.
@@ -5202,6 +5470,21 @@ export interface components {
       url: Record<string, any>;
       user: unknown;
     };
+    /**
+     * HookMetric
+     * @description Execution times of a runner hook.
+     *
+     *         Attributes:
+     *             phase: When the hook runs.
+     *             hook: Name of the hook.
+     *             duration: Execution times (seconds).
+     */
+    HookMetric: {
+      duration: components["schemas"]["MetricHistogram"];
+      hook: string;
+      /** @enum {unknown} */
+      phase: "on_finish" | "post_execution" | "pre_execution" | "preparation";
+    };
     /**
      * HumanReadableStatus
      * @description Human-readable status for operation results.
@@ -5386,6 +5669,28 @@ export interface components {
       /** @default false */
       ty?: boolean;
     };
+    /**
+     * KernelMetricsNotification
+     * @description Kernel instrumentation recorded since the previous report.
+     *
+     *         Sent after each run, and aggregated by the server for its metrics
+     *         endpoint.
+     *
+     *         Attributes:
+     *             cell_duration: Execution times of cells (seconds).
+     *             hooks: Execution times of runner hooks.
+     *             cache_hits: Hits of the caches currently defined in the notebook.
+     *             cache_misses: Misses of the caches currently defined in the
+     *                 notebook.
+     */
+    KernelMetricsNotification: {
+      cache_hits: number;
+      cache_misses: number;
+      cell_duration: components["schemas"]["MetricHistogram"];
+      hooks: components["schemas"]["HookMetric"][];
+      /** @enum {unknown} */
+      op: "kernel-metrics";
+    };
     /**
      * KernelReadyNotification
      * @description Kernel ready for execution. First notification sent at startup.
@@ -5404,6 +5709,8 @@ export interface components {
      *             kiosk: Whether running in kiosk mode.
      *             capabilities: Available kernel capabilities.
      *             auto_instantiated: Whether cells already executed (run mode).
+     *             document_version: Version of the notebook document the cells
+     *                 reflect.
      */
     KernelReadyNotification: {
       app_config: components["schemas"]["_AppConfig"];
@@ -5414,6 +5721,8 @@ export interface components {
       codes: string[];
       configs: components["schemas"]["CellConfig"][];
       consumer_capabilities: components["schemas"]["ConsumerCapabilities"];
+      /** @default 0 */
+      document_version?: number;
       kiosk: boolean;
       last_executed_code: {
         [key: string]: string;
@@ -5484,6 +5793,8 @@ export interface components {
         | components["schemas"]["ModelCommand"]
         | components["schemas"]["InvokeFunctionCommand"]
         | components["schemas"]["UpdateUserConfigCommand"]
+        | components["schemas"]["PreviewVariablesCommand"]
+        | components["schemas"]["GetMemoryUsageCommand"]
         | components["schemas"]["PreviewDatasetColumnCommand"]
         | components["schemas"]["PreviewSQLTableCommand"]
         | components["schemas"]["ListSQLTablesCommand"]
@@ -5531,6 +5842,7 @@ export interface components {
         | components["schemas"]["RemoveUIElementsNotification"]
         | components["schemas"]["ReloadNotification"]
         | components["schemas"]["ReconnectedNotification"]
+        | components["schemas"]["SessionSnapshotNotification"]
         | components["schemas"]["InterruptedNotification"]
         | components["schemas"]["CompletedRunNotification"]
         | components["schemas"]["KernelReadyNotification"]
@@ -5543,6 +5855,7 @@ export interface components {
         | components["schemas"]["KernelStartupErrorNotification"]
         | components["schemas"]["VariablesNotification"]
         | components["schemas"]["VariableValuesNotification"]
+        | components["schemas"]["MemoryUsageNotification"]
         | components["schemas"]["QueryParamsSetNotification"]
         | components["schemas"]["QueryParamsAppendNotification"]
         | components["schemas"]["QueryParamsDeleteNotification"]
@@ -5553,6 +5866,7 @@ export interface components {
         | components["schemas"]["SQLTableListPreviewNotification"]
         | components["schemas"]["SQLSchemaListPreviewNotification"]
         | components["schemas"]["DataSourceConnectionsNotification"]
+        | components["schemas"]["DataSourceTablesNotification"]
         | components["schemas"]["DataSourceDiscoveryResultNotification"]
         | components["schemas"]["ValidateSQLResultNotification"]
         | components["schemas"]["StorageNamespacesNotification"]
@@ -5561,6 +5875,8 @@ export interface components {
         | components["schemas"]["SecretKeysResultNotification"]
         | components["schemas"]["CacheClearedNotification"]
         | components["schemas"]["CacheInfoNotification"]
+        | components["schemas"]["CellProfileNotification"]
+        | components["schemas"]["KernelMetricsNotification"]
         | components["schemas"]["FocusCellNotification"]
         | components["schemas"]["ActiveLineNotification"]
         | components["schemas"]["NotebookDocumentTransactionNotification"]
@@ -5920,6 +6236,51 @@ export interface components {
       /** @enum {unknown} */
       type: "syntax";
     };
+    /**
+     * MemorySample
+     * @description Resident set size of the kernel at a point in time.
+     *
+     *         Attributes:
+     *             timestamp: Unix timestamp of the sample (seconds).
+     *             rss_bytes: Resident set size, in bytes.
+     */
+    MemorySample: {
+      rss_bytes: number;
+      timestamp: number;
+    };
+    /**
+     * MemoryUsageNotification
+     * @description Memory used by the kernel and its variables.
+     *
+     *         Attributes:
+     *             variables: Estimated memory of each global variable, largest first.
+     *             total_bytes: Sum of the variables' estimated memory.
+     *             rss_bytes: Current resident set size of the kernel, if known.
+     *             rss_history: Recent samples of the kernel's resident set size,
+     *                 oldest first.
+     */
+    MemoryUsageNotification: {
+      /** @enum {unknown} */
+      op: "memory-usage";
+      rss_bytes: number | null;
+      rss_history: components["schemas"]["MemorySample"][];
+      total_bytes: number;
+      variables: components["schemas"]["VariableMemory"][];
+    };
+    /**
+     * MetricHistogram
+     * @description Observations counted in fixed buckets.
+     *
+     *         Attributes:
+     *             counts: Number of observations in each bucket. The bucket bounds
+     *                 are fixed by the kernel; the last bucket counts observations
+     *                 above the largest bound.
+     *             sum: Sum of all observations.
+     */
+    MetricHistogram: {
+      counts: number[];
+      sum: number;
+    };
     /**
      * MissingPackageAlertNotification
      * @description Alert for missing packages with install option.
@@ -6143,6 +6504,13 @@ export interface components {
         | components["schemas"]["SetConfig"]
       )[];
     };
+    /** NotebookDocumentTransactionResponse */
+    NotebookDocumentTransactionResponse: {
+      /** @default true */
+      success?: boolean;
+      /** @default 0 */
+      version?: number;
+    };
     /**
      * OpenAiConfig
      * @description Configuration options for OpenAI or OpenAI-compatible services.
@@ -6297,6 +6665,26 @@ export interface components {
       schemaPath?: string[];
       tableName: string;
     };
+    /**
+     * PreviewVariablesCommand
+     * @description Compute previews of global variables.
+     *
+     *         After a run, the kernel sends only the names, types, and sizes of
+     *         non-scalar variables; the variables panel requests their previews when
+     *         it displays them. Previews are sent as a `VariableValuesNotification`.
+     *
+     *         Attributes:
+     *             names: Names of the variables to preview.
+     */
+    PreviewVariablesCommand: {
+      names: string[];
+      /** @enum {unknown} */
+      type: "preview-variables";
+    };
+    /** PreviewVariablesRequest */
+    PreviewVariablesRequest: {
+      names: string[];
+    };
     /**
      * PyreflyLanguageServerConfig
      * @description Configuration options for Pyrefly Language Server.
@@ -6498,8 +6886,8 @@ export interface components {
      *             If the file does not exist, it will be silently ignored.
      *             The default is `[".env"]` if a pyproject.toml is found, otherwise `[]`.
      *         - `default_sql_output`: the default output format for SQL queries. Can be one of:
-     *             `"auto"`, `"native"`, `"polars"`, `"lazy-polars"`, or `"pandas"`.
-     *             The default is `"auto"`.
+     *             `"auto"`, `"native"`, `"duckdb-table"`, `"polars"`, `"lazy-polars"`,
+     *             or `"pandas"`. The default is `"auto"`.
      *         - `default_auto_download`: an Optional list of export types to automatically snapshot your notebook as:
      *            `html`, `markdown`, `ipynb`.
      *            The default is None.
@@ -6518,6 +6906,7 @@ export interface components {
       /** @enum {unknown} */
       default_sql_output:
         | "auto"
+        | "duckdb-table"
         | "lazy-polars"
         | "native"
         | "pandas"
@@ -6762,6 +7151,23 @@ export interface components {
     };
     /** Format: session-id */
     SessionId: TypedString<"SessionId">;
+    /**
+     * SessionSnapshotNotification
+     * @description Current session state, replayed to a connecting frontend.
+     *
+     *         Bundles the notifications needed to restore a session view into a
+     *         single frame instead of sending each one separately.
+     *
+     *         Attributes:
+     *             version: Snapshot format version.
+     *             notifications: Serialized notifications, applied in order.
+     */
+    SessionSnapshotNotification: {
+      notifications: unknown[];
+      /** @enum {unknown} */
+      op: "session-snapshot";
+      version: number;
+    };
     /**
      * SetBreakpointsCommand
      * @description Set the live debugger's breakpoints (session-scoped, not persisted).
@@ -7302,6 +7708,7 @@ export interface components {
             | "image/png"
             | "image/svg+xml"
             | "image/tiff"
+            | "image/webp"
             | "text/csv"
             | "text/html"
             | "text/latex"
@@ -7444,20 +7851,43 @@ export interface components {
       name: components["schemas"]["VariableName"];
       used_by: components["schemas"]["CellId"][];
     };
+    /**
+     * VariableMemory
+     * @description Estimated memory held by a variable.
+     *
+     *         Attributes:
+     *             name: Variable name.
+     *             size_bytes: Estimated deep size of the value, in bytes. Memory shared
+     *                 with other variables is counted for only one of them.
+     */
+    VariableMemory: {
+      name: string;
+      size_bytes: number;
+    };
     /** Format: variable-name */
     VariableName: TypedString<"VariableName">;
     /**
      * VariableValue
      * @description Variable value and type for variables panel.
      *
+     *         Previews of non-scalar values are computed on demand: after a run, only
+     *         the name, type, and size are sent, with `preview_pending` set, and the
+     *         preview follows in response to a `PreviewVariablesCommand`.
+     *
      *         Attributes:
      *             name: Variable name.
      *             value: String representation of value.
      *             datatype: Data type as string.
+     *             size: Length of the value, for sized containers and tables.
+     *             preview_pending: Whether `value` has yet to be computed.
      */
     VariableValue: {
       datatype: string | null;
       name: string;
+      /** @default false */
+      preview_pending?: boolean;
+      /** @default null */
+      size?: number | null;
       value: string | null;
     };
     /**
@@ -7539,7 +7969,13 @@ export interface components {
        * @default auto
        * @enum {unknown}
        */
-      sql_output?: "auto" | "lazy-polars" | "native" | "pandas" | "polars";
+      sql_output?:
+        | "auto"
+        | "duckdb-table"
+        | "lazy-polars"
+        | "native"
+        | "pandas"
+        | "polars";
       /**
        * @default compact
        * @enum {unknown}
@@ -8,7 +8,12 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from marimo._ai._types import ChatMessage, ChatModelConfig, TextPart
+from marimo._ai._types import (
+    AI_SDK_VERSION,
+    ChatMessage,
+    ChatModelConfig,
+    TextPart,
+)
 from marimo._ai.llm._impl import (
     DEFAULT_SYSTEM_MESSAGE,
     anthropic,
@@ -20,7 +25,6 @@ from marimo._ai.llm._impl import (
     simple,
 )
 from marimo._dependencies.dependencies import DependencyManager
-from marimo._plugins.ui._impl.chat.chat import AI_SDK_VERSION
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
@@ -0,0 +1,168 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import ast
+import os
+import sys
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from marimo._ast import bytecode_cache, compiler
+from marimo._ast.cell import CellImpl, SourcePosition
+from marimo._types.ids import CellId_t
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+CODE = "x = 1\ny = x + 1\ny"
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path):
+    with (
+        patch.object(
+            bytecode_cache, "bytecode_cache_dir", return_value=tmp_path
+        ),
+        patch.object(sys, "dont_write_bytecode", False),
+    ):
+        yield tmp_path
+
+
+def _compile(code: str = CODE, cell_id: str = "a") -> CellImpl:
+    return compiler.compile_cell(
+        code, cell_id=CellId_t(cell_id), use_bytecode_cache=True
+    )
+
+
+def _run(cell: CellImpl) -> object:
+    glbls: dict[str, object] = {}
+    assert cell.body is not None
+    assert cell.last_expr is not None
+    exec(cell.body, glbls)
+    return eval(cell.last_expr, glbls)
+
+
+def test_second_compile_uses_cache(cache_dir: Path) -> None:
+    first = _compile()
+    assert len(list(cache_dir.iterdir())) == 1
+
+    with (
+        patch.object(
+            compiler, "ast_compile", wraps=compiler.ast_compile
+        ) as ast_compile,
+        patch.object(
+            compiler, "ScopedVisitor", wraps=compiler.ScopedVisitor
+        ) as visitor,
+    ):
+        second = _compile()
+    # Only parsed once; the analysis and code objects come from disk
+    assert ast_compile.call_count == 1
+    assert visitor.call_count == 0
+    assert second.body == first.body
+    assert second.last_expr == first.last_expr
+    assert second.defs == first.defs
+    assert second.refs == first.refs
+    assert second.temporaries == first.temporaries
+    assert second.variable_data == first.variable_data
+    assert ast.dump(second.mod) == ast.dump(first.mod)
+    assert _run(second) == 2
+
+
+def test_cached_import_block_carries_imports(cache_dir: Path) -> None:
+    del cache_dir
+    code = "import os\nimport sys"
+    _compile(code)
+    carried = _compile(code).variable_data["os"][0].import_data
+    assert carried is not None
+
+    cell = compiler.compile_cell(
+        code,
+        cell_id=CellId_t("a"),
+        carried_imports=[carried],
+        use_bytecode_cache=True,
+    )
+    assert cell.import_workspace.is_import_block
+    assert cell.import_workspace.imported_defs == {"os"}
+
+
+def test_key_covers_inputs() -> None:
+    def key(
+        code: str = CODE,
+        cell_id: str = "a",
+        filename: str = "f.py",
+        source_position: SourcePosition | None = None,
+    ) -> str:
+        return bytecode_cache.cache_key(
+            code, CellId_t(cell_id), filename, source_position
+        )
+
+    assert key() == key()
+    assert key() != key(code="x = 2")
+    assert key() != key(cell_id="b")
+    assert key() != key(filename="g.py")
+    assert key() != key(
+        source_position=SourcePosition(filename="f.py", lineno=3, col_offset=4)
+    )
+    # SQL analysis depends on the installed duckdb and sqlglot
+    original = key()
+    with patch.object(
+        bytecode_cache, "_sql_analysis_versions", return_value="other"
+    ):
+        assert key() != original
+
+
+def test_corrupt_entry_is_recompiled(cache_dir: Path) -> None:
+    _compile()
+    (entry,) = cache_dir.iterdir()
+    entry.write_bytes(b"not a cache entry")
+
+    assert _run(_compile()) == 2
+
+
+def test_not_used_by_default(cache_dir: Path) -> None:
+    compiler.compile_cell(CODE, cell_id=CellId_t("a"))
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_respects_dont_write_bytecode(cache_dir: Path) -> None:
+    with patch.object(sys, "dont_write_bytecode", True):
+        _compile()
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_test_cells_are_not_cached(cache_dir: Path) -> None:
+    _compile("def test_foo():\n    assert 1 == 1")
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_prune(tmp_path: Path) -> None:
+    now = time.time()
+    for name, age in (("old", 60), ("a", 3), ("b", 2), ("c", 1)):
+        (tmp_path / name).write_bytes(b"")
+        os.utime(tmp_path / name, (now - age, now - age))
+    (tmp_path / "d.123.tmp").write_bytes(b"")
+
+    bytecode_cache.prune(tmp_path, max_entries=2, max_age_s=30)
+
+    # Unused entries are dropped, then the least recently used ones;
+    # temporary files being written are kept
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "b",
+        "c",
+        "d.123.tmp",
+    ]
+
+
+def test_first_store_prunes(cache_dir: Path) -> None:
+    old = cache_dir / "old"
+    old.write_bytes(b"")
+    os.utime(old, (0, 0))
+
+    with patch.object(bytecode_cache, "_pruned", False):
+        _compile()
+
+    assert not old.exists()
+    assert len(list(cache_dir.iterdir())) == 1
@@ -0,0 +1,113 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from marimo._ast import codegen
+from marimo._ast.cell import CellConfig
+from marimo._ast.codegen_cache import CodegenCache
+from marimo._ast.compiler import compile_cell
+from marimo._types.ids import CellId_t
+
+Notebook = list[tuple[str, str, CellConfig]]
+
+BASE: Notebook = [
+    ("import marimo as mo", "_", CellConfig()),
+    ("x: int = 1", "_", CellConfig()),
+    ("y = x + 1", "_", CellConfig(hide_code=True)),
+    ("def add(a, b):\n    return a + b", "add", CellConfig()),
+    ("mo.md('# Hello')", "_", CellConfig()),
+    ("z = (", "_", CellConfig()),
+    ("", "_", CellConfig()),
+    ("", "_", CellConfig(disabled=True)),
+]
+
+
+def _generate(notebook: Notebook, cache: CodegenCache | None) -> str:
+    return codegen.generate_filecontents(
+        [code for code, _, _ in notebook],
+        [name for _, name, _ in notebook],
+        [config for _, _, config in notebook],
+        cache=cache,
+    )
+
+
+def _edit(notebook: Notebook, idx: int, code: str) -> Notebook:
+    _, name, config = notebook[idx]
+    return [*notebook[:idx], (code, name, config), *notebook[idx + 1 :]]
+
+
+# Each edit changes some cell, possibly affecting how *other* cells render
+# (their signature, returns or annotations).
+EDITS: list[Notebook] = [
+    BASE,
+    # Annotation of `x` changes, which changes y's signature
+    _edit(BASE, 1, "x: float = 1.0"),
+    # `y` is now used, so it's returned
+    [*BASE, ("print(y)", "_", CellConfig())],
+    # Shadowing a builtin turns it into a parameter elsewhere
+    [*BASE, ("len = 1", "_", CellConfig()), ("len(x)", "_", CellConfig())],
+    # `add` is no longer a reusable function
+    _edit(BASE, 3, "def add(a, b):\n    return a + b + y"),
+    # Unparsable cell becomes parsable
+    _edit(BASE, 5, "z = (1,)"),
+    # Reordered
+    list(reversed(BASE)),
+    # Renamed and reconfigured
+    [
+        (code, "renamed" if name == "_" else name, CellConfig(column=1))
+        for code, name, config in BASE
+    ],
+    BASE,
+]
+
+
+def test_output_matches_uncached() -> None:
+    cache = CodegenCache()
+    for notebook in EDITS:
+        assert _generate(notebook, cache) == _generate(notebook, None)
+
+
+def test_only_changed_cells_are_compiled() -> None:
+    cache = CodegenCache()
+    _generate(BASE, cache)
+
+    with patch(
+        "marimo._ast.codegen_cache.compile_cell", side_effect=compile_cell
+    ) as compile_mock:
+        _generate(_edit(BASE, 2, "y = x + 2"), cache)
+
+    assert [call.args[0] for call in compile_mock.call_args_list] == [
+        "y = x + 2"
+    ]
+
+
+def test_unused_entries_are_dropped() -> None:
+    cache = CodegenCache()
+    _generate(BASE, cache)
+    _generate(_edit(BASE, 2, "y = x + 2"), cache)
+    _generate(_edit(BASE, 2, "y = x + 3"), cache)
+
+    assert cache._compiled.get("y = x + 1") is None
+    assert cache._compiled.get("y = x + 3") is not None
+
+
+def test_compiled_cells_do_not_share_config() -> None:
+    cache = CodegenCache()
+    hidden = cache.compile_cell(
+        "x = 1", CellId_t("0"), CellConfig(hide_code=True)
+    )
+    shown = cache.compile_cell("x = 1", CellId_t("1"), CellConfig())
+
+    assert hidden.config.hide_code is True
+    assert shown.config.hide_code is False
+    assert (hidden.cell_id, shown.cell_id) == ("0", "1")
+
+
+def test_syntax_errors_are_cached() -> None:
+    cache = CodegenCache()
+    for _ in range(2):
+        with pytest.raises(SyntaxError):
+            cache.compile_cell("x = (", CellId_t("0"), CellConfig())
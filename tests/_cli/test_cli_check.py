@@ -3,11 +3,18 @@
 
 import tempfile
 
+import pytest
 from click.testing import CliRunner
 
 from marimo._cli.cli import check
 
 
+@pytest.fixture(autouse=True)
+def _lint_cache_dir(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """`marimo check` caches results; keep them out of the user's cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
 class TestLintCLI:
     """Test the check CLI command."""
 
@@ -220,6 +220,34 @@ class TestExportHTML:
         html = _normalize_html_path(html, temp_marimo_file)
         assert '<marimo-code hidden=""></marimo-code>' in html
 
+    @staticmethod
+    def test_cli_export_html_to_file(
+        temp_marimo_file: str, tmp_path: Path
+    ) -> None:
+        output = tmp_path / "site" / "index.html"
+        p = _run_export(
+            "html",
+            temp_marimo_file,
+            "--output",
+            str(output),
+            "--assets-dir",
+            str(tmp_path / "site" / "assets"),
+        )
+        _assert_success(p)
+        html = output.read_text(encoding="utf-8")
+        assert "<marimo-code hidden=" in html
+        assert "__MARIMO_STATIC__" in html
+
+    @staticmethod
+    def test_cli_export_html_assets_dir_requires_output(
+        temp_marimo_file: str, tmp_path: Path
+    ) -> None:
+        p = _run_export(
+            "html", temp_marimo_file, "--assets-dir", str(tmp_path)
+        )
+        assert p.exit_code != 0
+        assert "--assets-dir" in p.output
+
     @staticmethod
     def test_cli_export_html_wasm(temp_marimo_file: str) -> None:
         out_dir = Path(temp_marimo_file).parent / "out"
@@ -0,0 +1,150 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from marimo._data.duckdb_catalog import (
+    DuckDBCatalog,
+    TableTarget,
+    get_ddl_table_targets,
+)
+from marimo._data.get_datasets import get_databases_from_duckdb
+
+if TYPE_CHECKING:
+    import duckdb
+
+
+@pytest.mark.requires("sqlglot")
+class TestGetDDLTableTargets:
+    def test_create_table(self) -> None:
+        assert get_ddl_table_targets("CREATE TABLE t (x INT)") == [
+            TableTarget(name="t")
+        ]
+        assert get_ddl_table_targets(
+            "CREATE OR REPLACE TABLE s.t AS SELECT * FROM other.u"
+        ) == [TableTarget(name="t", schema="s")]
+        assert get_ddl_table_targets(
+            'CREATE TABLE IF NOT EXISTS "my db".s."T" (x INT)'
+        ) == [TableTarget(name="T", schema="s", database="my db")]
+
+    def test_temporary(self) -> None:
+        assert get_ddl_table_targets("CREATE TEMP TABLE t (x INT)") == [
+            TableTarget(name="t", temporary=True)
+        ]
+
+    def test_views_drop_and_alter(self) -> None:
+        assert get_ddl_table_targets("CREATE VIEW v AS SELECT 1") == [
+            TableTarget(name="v")
+        ]
+        assert get_ddl_table_targets("DROP VIEW IF EXISTS a, s.b") == [
+            TableTarget(name="a"),
+            TableTarget(name="b", schema="s"),
+        ]
+        assert get_ddl_table_targets("ALTER TABLE t ADD COLUMN y INT") == [
+            TableTarget(name="t")
+        ]
+
+    def test_multiple_statements(self) -> None:
+        assert get_ddl_table_targets(
+            "CREATE TABLE a (x INT); INSERT INTO a VALUES (1); SELECT * FROM a"
+        ) == [TableTarget(name="a")]
+
+    def test_unlisted_objects(self) -> None:
+        assert get_ddl_table_targets("CREATE SEQUENCE seq") == []
+        assert get_ddl_table_targets("CREATE MACRO m(a) AS a + 1") == []
+
+    def test_needs_full_refresh(self) -> None:
+        assert get_ddl_table_targets("CREATE SCHEMA s") is None
+        assert get_ddl_table_targets("DROP SCHEMA s CASCADE") is None
+        assert get_ddl_table_targets("ATTACH 'file.db' AS f") is None
+        assert get_ddl_table_targets("DETACH f") is None
+        assert get_ddl_table_targets("not valid sql (") is None
+
+
+@pytest.mark.requires("duckdb", "sqlglot")
+class TestDuckDBCatalog:
+    @staticmethod
+    def _catalog(
+        connection: duckdb.DuckDBPyConnection,
+    ) -> DuckDBCatalog:
+        catalog = DuckDBCatalog(connection)
+        catalog.record_full_refresh(get_databases_from_duckdb(connection))
+        return catalog
+
+    def test_not_recorded(self) -> None:
+        import duckdb
+
+        catalog = DuckDBCatalog(duckdb.connect(":memory:"))
+        assert catalog.schemas_to_refresh(["CREATE TABLE t (x INT)"]) is None
+
+    def test_table_in_listed_schema(self) -> None:
+        import duckdb
+
+        connection = duckdb.connect(":memory:")
+        connection.execute("CREATE TABLE t (x INT)")
+        catalog = self._catalog(connection)
+
+        sql = "CREATE TABLE u (y INT)"
+        connection.execute(sql)
+        assert catalog.schemas_to_refresh([sql]) == {("memory", "main")}
+
+        sql = "DROP TABLE memory.main.t"
+        connection.execute(sql)
+        assert catalog.schemas_to_refresh([sql]) == {("memory", "main")}
+
+    def test_schema_qualified_name(self) -> None:
+        import duckdb
+
+        connection = duckdb.connect(":memory:")
+        connection.execute("CREATE SCHEMA s")
+        connection.execute("CREATE TABLE s.t (x INT)")
+        catalog = self._catalog(connection)
+
+        sql = "CREATE TABLE s.u (y INT)"
+        connection.execute(sql)
+        assert catalog.schemas_to_refresh([sql]) == {("memory", "s")}
+
+    def test_database_qualified_name(self) -> None:
+        import duckdb
+
+        connection = duckdb.connect(":memory:")
+        connection.execute("ATTACH ':memory:' AS other")
+        connection.execute("CREATE TABLE other.t (x INT)")
+        catalog = self._catalog(connection)
+
+        # `other.u` is the `main` schema of database `other`
+        sql = "CREATE TABLE other.u (y INT)"
+        connection.execute(sql)
+        assert catalog.schemas_to_refresh([sql]) == {("other", "main")}
+
+    def test_unlisted_schema(self) -> None:
+        import duckdb
+
+        connection = duckdb.connect(":memory:")
+        catalog = self._catalog(connection)
+
+        # memory.main had no tables, so the frontend has no node for it
+        sql = "CREATE TABLE t (x INT)"
+        connection.execute(sql)
+        assert catalog.schemas_to_refresh([sql]) is None
+
+    def test_schema_changes(self) -> None:
+        import duckdb
+
+        connection = duckdb.connect(":memory:")
+        connection.execute("CREATE TABLE t (x INT)")
+        catalog = self._catalog(connection)
+
+        # A schema created outside of the DDL being inspected
+        connection.execute("CREATE SCHEMA s")
+        sql = "CREATE TABLE u (y INT)"
+        connection.execute(sql)
+        assert catalog.schemas_to_refresh([sql]) is None
+
+        catalog.record_full_refresh(get_databases_from_duckdb(connection))
+        assert catalog.schemas_to_refresh([sql]) == {("memory", "main")}
+
+        catalog.invalidate()
+        assert catalog.schemas_to_refresh([sql]) is None
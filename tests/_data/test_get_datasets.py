@@ -14,6 +14,7 @@ from marimo._data.get_datasets import (
     get_databases_from_duckdb,
     get_datasets_from_variables,
     get_duckdb_databases_agg_query,
+    get_duckdb_schema_tables,
     get_table_columns,
     has_updates_to_datasource,
 )
@@ -28,6 +29,8 @@ def test_has_updates_to_datasource() -> None:
     assert has_updates_to_datasource("ATTACH 'marimo.db'") is True
     assert has_updates_to_datasource("DETACH marimo") is True
     assert has_updates_to_datasource("CREATE TABLE cars (name TEXT)") is True
+    assert has_updates_to_datasource("DROP TABLE cars") is True
+    assert has_updates_to_datasource("SELECT * FROM cars") is False
 
 
 sql_query = """
@@ -936,3 +939,30 @@ class TestGetDatabasesNestedNamespace:
                 ],
             ),
         ]
+
+
+@pytest.mark.requires("duckdb")
+def test_get_duckdb_schema_tables() -> None:
+    import duckdb
+
+    connection = duckdb.connect(":memory:")
+    connection.execute("CREATE TABLE t (a INTEGER, b VARCHAR)")
+    connection.execute("CREATE VIEW v AS SELECT a FROM t")
+    connection.execute("CREATE SCHEMA other")
+    connection.execute("CREATE TABLE other.u (c DOUBLE)")
+
+    tables = get_duckdb_schema_tables(connection, "memory", "main")
+    assert [table.name for table in tables] == ["t", "v"]
+    assert [column.name for column in tables[0].columns] == ["a", "b"]
+    assert tables[0].columns[0].type == "integer"
+    assert tables[0].source == "memory"
+    assert tables[0].source_type == "duckdb"
+
+    tables = get_duckdb_schema_tables(
+        connection, "memory", "other", engine_name=VariableName("engine")
+    )
+    assert [table.name for table in tables] == ["u"]
+    assert tables[0].source_type == "connection"
+    assert tables[0].engine == "engine"
+
+    assert get_duckdb_schema_tables(connection, "memory", "missing") == []
@@ -292,6 +292,39 @@ if __name__ == "__main__":
     assert "script_metadata_hash" in data["metadata"]
 
 
+async def test_run_notebook_previews_variables(tmp_path: Path) -> None:
+    notebook = tmp_path / "notebook.py"
+    notebook.write_text(
+        """
+import marimo
+
+app = marimo.App()
+
+@app.cell
+def _():
+    xs = [1, 2, 3]
+    return (xs,)
+
+if __name__ == "__main__":
+    app.run()
+""",
+        encoding="utf-8",
+    )
+    file_manager = AppFileManager(str(notebook))
+
+    session_view, did_error = await run_notebook(
+        RunNotebookRequest(
+            file_manager=file_manager,
+            options=NotebookExecutionOptions(cli_args={}, argv=None),
+        )
+    )
+    assert did_error is False
+    # Nothing will request the preview, so it is computed eagerly
+    value = session_view.variable_values["xs"]
+    assert value.value == "[1, 2, 3]"
+    assert value.preview_pending is False
+
+
 @pytest.mark.skipif(
     sys.version_info >= (3, 13), reason="3.13 has different stack trace format"
 )
@@ -1565,6 +1598,97 @@ def test_export_html_skips_oversized_virtual_files(
     assert "./@file/20000000-huge.wav" not in html
 
 
+def _image_export_request(session_view: SessionView) -> HTMLExportRequest:
+    app = App()
+
+    @app.cell()
+    def test_cell():
+        import marimo as mo
+
+        return mo.image(src="test.png")
+
+    file_manager = AppFileManager.from_app(InternalApp(app))
+    (cell_id,) = file_manager.app.cell_manager.cell_ids()
+    session_view.cell_notifications[cell_id] = CellNotification(
+        cell_id=cell_id,
+        status="idle",
+        output=CellOutput(
+            channel=CellChannel.OUTPUT,
+            mimetype="text/html",
+            data='<img src="./@file/15-test.png" alt="Test image">',
+        ),
+        console=[],
+        timestamp=0,
+    )
+    session_view.last_executed_code[cell_id] = (
+        "import marimo as mo\nreturn mo.image(src='test.png')"
+    )
+    return _html_export_request(
+        filename=file_manager.filename,
+        app=file_manager.app,
+        session_view=session_view,
+        display_config=DEFAULT_CONFIG["display"],
+        request=ExportAsHTMLRequest(
+            download=True,
+            files=["/@file/15-test.png", "/@file/9-data.csv"],
+            include_code=True,
+        ),
+    )
+
+
+def test_write_html_matches_export_as_html(
+    session_view: SessionView, tmp_path: Path
+) -> None:
+    request = _image_export_request(session_view)
+    output = tmp_path / "out" / "notebook.html"
+
+    with (
+        patch(
+            "marimo._convert.common.dom_traversal.read_virtual_file",
+            return_value=b"fake_image_data",
+        ),
+        patch(
+            "marimo._export.exporter.read_virtual_file",
+            return_value=b"a,b\n1,2\n",
+        ),
+    ):
+        html, filename = Exporter().export_as_html(request)
+        written_filename = Exporter().write_html(request, output)
+
+    assert written_filename == filename
+    assert output.read_text(encoding="utf-8") == html
+    assert base64.b64encode(b"a,b\n1,2\n").decode() in html
+    assert list(output.parent.iterdir()) == [output]
+
+
+def test_write_html_with_assets_dir(
+    session_view: SessionView, tmp_path: Path
+) -> None:
+    request = _image_export_request(session_view)
+    output = tmp_path / "site" / "index.html"
+    assets_dir = tmp_path / "site" / "assets"
+
+    def read_virtual_file(filename: str, byte_length: int) -> bytes:
+        del byte_length
+        return {"test.png": b"fake_image_data", "data.csv": b"a,b\n"}[filename]
+
+    with patch(
+        "marimo._export.exporter.read_virtual_file",
+        side_effect=read_virtual_file,
+    ):
+        Exporter().write_html(request, output, assets_dir=assets_dir)
+
+    html = output.read_text(encoding="utf-8")
+    assert "data:image/png" not in html
+    assert "./@file/15-test.png" not in html
+    # Outputs link to the file, relative to the document
+    assert 'src=\\"assets/test.png\\"' in html
+    # Files only the frontend fetches are linked from the virtual file table
+    assert '"/@file/9-data.csv": "assets/data.csv"' in html
+    assert (assets_dir / "test.png").read_bytes() == b"fake_image_data"
+    assert (assets_dir / "data.csv").read_bytes() == b"a,b\n"
+
+
 class TestPDFExport:
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -0,0 +1,86 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import json
+
+from marimo._export.profile import profile_to_chrome_trace, profile_to_folded
+from marimo._messaging.notification import (
+    CellProfileNotification,
+    CellProfileSpan,
+)
+from marimo._types.ids import CellId_t
+
+
+def _profile(
+    cell_id: str, start: float, stacks: dict[str, int]
+) -> CellProfileNotification:
+    return CellProfileNotification(
+        cell_id=CellId_t(cell_id),
+        start=start,
+        duration=0.5,
+        spans=[
+            CellProfileSpan(
+                name="execute",
+                category="execution",
+                start=start,
+                duration=0.4,
+            ),
+            CellProfileSpan(
+                name="_broadcast_outputs",
+                category="formatting",
+                start=start + 0.4,
+                duration=0.1,
+            ),
+        ],
+        stacks=stacks,
+        sample_interval=0.005,
+    )
+
+
+PROFILES = [
+    _profile("b", 101.0, {"execute;g (b.py:1)": 1}),
+    _profile(
+        "a",
+        100.0,
+        {"execute;f (a.py:1)": 3, "_broadcast_outputs;h (c.py:2)": 2},
+    ),
+]
+
+
+def test_profile_to_folded() -> None:
+    assert profile_to_folded(PROFILES, {CellId_t("a"): "load"}) == (
+        "load;_broadcast_outputs;h (c.py:2) 2\n"
+        "load;execute;f (a.py:1) 3\n"
+        "cell-b;execute;g (b.py:1) 1\n"
+    )
+
+
+def test_profile_to_folded_empty() -> None:
+    assert profile_to_folded([]) == ""
+
+
+def test_profile_to_chrome_trace() -> None:
+    trace = profile_to_chrome_trace(PROFILES, {CellId_t("b"): "_"})
+    # Must be JSON-serializable for trace viewers.
+    json.dumps(trace)
+
+    events = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    cells = [e for e in events if e["cat"] == "cell"]
+    assert [e["name"] for e in cells] == ["cell-a", "cell-b"]
+    # Timestamps are relative to the first cell, in microseconds.
+    assert [e["ts"] for e in cells] == [0, 1_000_000]
+    assert cells[0]["dur"] == 500_000
+    assert cells[0]["args"] == {
+        "cell_id": "a",
+        "samples": 5,
+        "execution_ms": 400.0,
+        "formatting_ms": 100.0,
+    }
+
+    spans = [e for e in events if e["cat"] != "cell"]
+    assert [(e["name"], e["cat"], e["ts"]) for e in spans] == [
+        ("execute", "execution", 0),
+        ("_broadcast_outputs", "formatting", 400_000),
+        ("execute", "execution", 1_000_000),
+        ("_broadcast_outputs", "formatting", 1_400_000),
+    ]
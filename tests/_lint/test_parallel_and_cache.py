@@ -0,0 +1,189 @@
+# Copyright 2026 Marimo. All rights reserved.
+"""Tests for parallel `marimo check` and the on-disk lint cache."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from marimo._lint import Linter, run_check
+from marimo._lint.cache import LintCache
+from marimo._lint.diagnostic import Diagnostic, Severity
+from marimo._lint.linter import FileStatus
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+NOTEBOOK = """import marimo
+
+__generated_with = "0.15.0"
+app = marimo.App()
+
+@app.cell
+def _():
+    x = {value}
+    return (x,)
+
+@app.cell
+def _():
+    x = 2
+    return
+"""
+
+
+def _write_notebooks(tmp_path: Path, count: int) -> list[Path]:
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"notebook_{i}.py"
+        path.write_text(NOTEBOOK.format(value=i))
+        paths.append(path)
+    return paths
+
+
+def _summary(linter: Linter) -> list[tuple[str, list[str | None], bool]]:
+    return [
+        (f.file, [d.code for d in f.diagnostics], f.failed)
+        for f in linter.files
+    ]
+
+
+class TestParallel:
+    def test_results_match_serial_and_keep_order(self, tmp_path: Path):
+        paths = _write_notebooks(tmp_path, 6)
+        paths.append(tmp_path / "missing.py")
+        patterns = tuple(str(p) for p in paths)
+
+        serial_messages: list[str] = []
+        serial = run_check(patterns, pipe=serial_messages.append)
+        parallel_messages: list[str] = []
+        parallel = run_check(patterns, pipe=parallel_messages.append, jobs=3)
+
+        assert [f.file for f in parallel.files] == [str(p) for p in paths]
+        assert _summary(parallel) == _summary(serial)
+        assert parallel_messages == serial_messages
+        assert parallel.issues_count == serial.issues_count > 0
+        assert parallel.errored is serial.errored is True
+
+    def test_parallel_fix(self, tmp_path: Path):
+        # The notebook is missing its `__main__` guard, which fixing adds
+        (path,) = _write_notebooks(tmp_path, 1)
+
+        linter = run_check((str(path),), fix=True, jobs=2)
+
+        assert linter.fixed_count == 1
+        assert 'if __name__ == "__main__":' in path.read_text()
+
+
+class TestLintCache:
+    def test_roundtrip(self, tmp_path: Path):
+        cache = LintCache(["MB001"], directory=tmp_path)
+        status = FileStatus(
+            file="nb.py",
+            diagnostics=[
+                Diagnostic(
+                    message="oops",
+                    line=[1, 2],
+                    column=[0, 0],
+                    cell_id=["Hbol"],
+                    code="MB001",
+                    name="oops",
+                    severity=Severity.BREAKING,
+                    fixable=False,
+                    filename="nb.py",
+                )
+            ],
+            failed=False,
+            message="",
+        )
+        key = cache.key("nb.py", b"contents")
+        assert cache.get(key) is None
+
+        cache.set(key, status)
+        assert cache.get(key) == status
+
+    def test_key_covers_settings_and_contents(self, tmp_path: Path):
+        cache = LintCache(["MB001"], directory=tmp_path)
+        key = cache.key("nb.py", b"a")
+
+        assert cache.key("nb.py", b"a") == key
+        assert cache.key("nb.py", b"b") != key
+        assert cache.key("other.py", b"a") != key
+        assert (
+            LintCache(["MB001", "MF001"], directory=tmp_path).key(
+                "nb.py", b"a"
+            )
+            != key
+        )
+        assert (
+            LintCache(["MB001"], ignore_scripts=True, directory=tmp_path).key(
+                "nb.py", b"a"
+            )
+            != key
+        )
+
+    def test_failures_are_not_cached(self, tmp_path: Path):
+        cache = LintCache([], directory=tmp_path)
+        key = cache.key("nb.py", b"contents")
+        cache.set(
+            key,
+            FileStatus(file="nb.py", failed=True, message="Failed to read"),
+        )
+        assert cache.get(key) is None
+
+    def test_prune_keeps_most_recently_used(self, tmp_path: Path):
+        import os
+
+        cache = LintCache([], directory=tmp_path)
+        keys = [cache.key("nb.py", bytes([i])) for i in range(4)]
+        for i, key in enumerate(keys):
+            cache.set(key, FileStatus(file="nb.py"))
+            os.utime(tmp_path / f"{key}.json", (i, i))
+        # Reading an entry marks it as used
+        assert cache.get(keys[0]) is not None
+
+        cache.prune(max_entries=2)
+
+        assert sorted(p.stem for p in tmp_path.iterdir()) == sorted(
+            [keys[0], keys[3]]
+        )
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path: Path):
+        cache = LintCache([], directory=tmp_path)
+        (tmp_path / "abc.json").write_text("{not json")
+        assert cache.get("abc") is None
+
+    def test_unchanged_files_are_not_reprocessed(self, tmp_path: Path):
+        cache_dir = tmp_path / "cache"
+        paths = _write_notebooks(tmp_path, 3)
+        patterns = tuple(str(p) for p in paths)
+
+        with patch(
+            "marimo._lint.cache.default_lint_cache_dir",
+            return_value=cache_dir,
+        ):
+            first = run_check(patterns, cache=True)
+
+            paths[0].write_text(NOTEBOOK.format(value=100))
+            with patch.object(
+                Linter,
+                "_process_single_file",
+                autospec=True,
+                side_effect=Linter._process_single_file,
+            ) as process:
+                second = run_check(patterns, cache=True)
+
+        assert [call.args[1] for call in process.call_args_list] == [paths[0]]
+        assert _summary(second) == _summary(first)
+        assert second.issues_count == first.issues_count
+
+    def test_cache_is_ignored_when_fixing(self, tmp_path: Path):
+        with patch(
+            "marimo._lint.cache.default_lint_cache_dir",
+            return_value=tmp_path / "cache",
+        ):
+            (path,) = _write_notebooks(tmp_path, 1)
+            run_check((str(path),), cache=True)
+            linter = run_check((str(path),), fix=True, cache=True)
+
+        assert linter.cache is None
+        assert linter.files[0].notebook is not None
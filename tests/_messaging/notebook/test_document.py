@@ -1028,3 +1028,121 @@ class TestReorderCells:
         doc = _doc("a", "b", "c")
         doc.apply(_tx(ReorderCells(cell_ids=(CellId_t("b"),))))
         assert _ids(doc) == snapshot(["b", "a", "c"])
+
+
+# ------------------------------------------------------------------
+# Index
+# ------------------------------------------------------------------
+
+
+def _assert_index_consistent(doc: NotebookDocument) -> None:
+    for cell in doc.cells:
+        assert doc.get_cell(cell.id) is cell
+    assert doc._index == {cid: i for i, cid in enumerate(doc.cell_ids)}
+
+
+class TestIndex:
+    def test_structural_changes(self) -> None:
+        doc = _doc("a", "b", "c", "d")
+        steps: list[DocumentChange] = [
+            CreateCell(
+                cell_id=CellId_t("x"),
+                code="",
+                name="__",
+                config=CellConfig(),
+                after=CellId_t("a"),
+            ),
+            CreateCell(
+                cell_id=CellId_t("y"),
+                code="",
+                name="__",
+                config=CellConfig(),
+                before=CellId_t("a"),
+            ),
+            CreateCell(
+                cell_id=CellId_t("z"),
+                code="",
+                name="__",
+                config=CellConfig(),
+            ),
+            MoveCell(cell_id=CellId_t("y"), after=CellId_t("d")),
+            MoveCell(cell_id=CellId_t("z"), before=CellId_t("a")),
+            MoveCell(cell_id=CellId_t("a"), after=CellId_t("b")),
+            DeleteCell(cell_id=CellId_t("x")),
+            ReorderCells(cell_ids=(CellId_t("d"), CellId_t("c"))),
+        ]
+        for change in steps:
+            doc.apply(_tx(change))
+            _assert_index_consistent(doc)
+
+        assert _ids(doc) == snapshot(["d", "c", "z", "b", "a", "y"])
+
+    def test_rekey(self) -> None:
+        doc = _doc("a", "b")
+        doc._rekey({CellId_t("a"): CellId_t("x")})
+        _assert_index_consistent(doc)
+        assert CellId_t("a") not in doc
+
+    def test_failed_transaction_keeps_index(self) -> None:
+        doc = _doc("a", "b")
+        with pytest.raises(ValueError):
+            doc.apply(
+                _tx(
+                    MoveCell(cell_id=CellId_t("a"), after=CellId_t("b")),
+                    DeleteCell(cell_id=CellId_t("missing")),
+                )
+            )
+        assert _ids(doc) == ["a", "b"]
+        _assert_index_consistent(doc)
+
+
+# ------------------------------------------------------------------
+# Transaction log
+# ------------------------------------------------------------------
+
+
+class TestTransactionsSince:
+    def test_replay_catches_up(self) -> None:
+        doc = _doc("a", "b")
+        client = _doc("a", "b")
+        doc.apply(_tx(SetCode(cell_id=CellId_t("a"), code="x = 1")))
+        doc.apply(_tx(MoveCell(cell_id=CellId_t("a"), after=CellId_t("b"))))
+        doc.apply(_tx(DeleteCell(cell_id=CellId_t("b"))))
+
+        missed = doc.transactions_since(client.version)
+        assert missed is not None
+        assert [tx.version for tx in missed] == [1, 2, 3]
+        for tx in missed:
+            client.apply(tx)
+        assert _state(client) == _state(doc)
+
+        assert [tx.version for tx in doc.transactions_since(2) or []] == [3]
+        assert doc.transactions_since(3) == []
+
+    def test_empty_transactions_are_not_logged(self) -> None:
+        doc = _doc("a")
+        doc.apply(_tx())
+        assert doc.transactions_since(0) == []
+
+    def test_future_version(self) -> None:
+        doc = _doc("a")
+        doc.apply(_tx(SetCode(cell_id=CellId_t("a"), code="x")))
+        assert doc.transactions_since(5) is None
+
+    def test_log_is_bounded(self) -> None:
+        doc = NotebookDocument([_cell("a")], max_log_size=4)
+        for i in range(10):
+            doc.apply(_tx(SetCode(cell_id=CellId_t("a"), code=str(i))))
+            assert len(doc._log) <= 4
+
+        assert doc.transactions_since(0) is None
+        recent = doc.transactions_since(8)
+        assert recent is not None
+        assert [tx.version for tx in recent] == [9, 10]
+
+    def test_rekey_clears_log(self) -> None:
+        doc = _doc("a")
+        doc.apply(_tx(SetCode(cell_id=CellId_t("a"), code="x")))
+        doc._rekey({CellId_t("a"): CellId_t("b")})
+        assert doc.transactions_since(0) is None
+        assert doc.transactions_since(doc.version) == []
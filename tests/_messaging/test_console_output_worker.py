@@ -4,6 +4,7 @@ from __future__ import annotations
 import threading
 import time
 from collections import deque
+from typing import Any
 
 from marimo._messaging.cell_output import CellChannel
 from marimo._messaging.console_output_worker import (
@@ -12,8 +13,10 @@ from marimo._messaging.console_output_worker import (
     FlushMarker,
     _add_output_to_buffer,
     _can_merge_outputs,
+    _elide_lines,
     _write_console_output,
     buffered_writer,
+    collapse_carriage_returns,
 )
 from tests._messaging.mocks import MockStream
 
@@ -118,6 +121,53 @@ class TestConsoleOutputWorker:
         assert outputs_buffered_per_cell["cell1"][0].data == "Hello"
         assert outputs_buffered_per_cell["cell1"][1].data == "Error"
 
+    def test_collapse_carriage_returns(self) -> None:
+        # Nothing to collapse
+        assert collapse_carriage_returns("a\nb\r\n") == "a\nb\r\n"
+        assert collapse_carriage_returns("a\rb\rc") == "a\rb\rc"
+        # Only the overlay of the updates and the last update remain
+        assert (
+            collapse_carriage_returns("start\r10%\r20%\r30%\ndone\n")
+            == "start\r30%\ndone\n"
+        )
+        assert (
+            collapse_carriage_returns("\rloading...\rok\rdone")
+            == "\rdoneing...\rdone"
+        )
+        # ANSI escapes are left alone
+        colored = "\r\x1b[31m1\r\x1b[31m2\r\x1b[31m3"
+        assert collapse_carriage_returns(colored) == colored
+
+    def test_elide_lines(self) -> None:
+        def msg(data: str, stream: Any = CellChannel.STDOUT) -> ConsoleMsg:
+            return ConsoleMsg(
+                stream=stream,
+                cell_id="cell1",
+                data=data,
+                mimetype="text/plain",
+            )
+
+        buffer = [msg("a\nb\n"), msg("c\n", CellChannel.STDERR)]
+        assert _elide_lines(buffer, max_lines=5) == buffer
+
+        # Like the frontend, a trailing newline starts a (blank) line
+        elided = _elide_lines(
+            [msg("1\n2\n3\n4\n"), msg("err\n", CellChannel.STDERR)],
+            max_lines=4,
+        )
+        assert [(m.stream, m.data) for m in elided] == [
+            (CellChannel.STDOUT, "... 3 lines elided ...\n4\n"),
+            (CellChannel.STDERR, "err\n"),
+        ]
+
+        elided = _elide_lines(
+            [msg("1\n2\n"), msg("3\n4\n", CellChannel.STDERR)],
+            max_lines=3,
+        )
+        assert [(m.stream, m.data) for m in elided] == [
+            (CellChannel.STDERR, "... 3 lines elided ...\n3\n4\n"),
+        ]
+
     def test_write_console_output(self) -> None:
         # Test writing console output to stream
         stream = MockStream()
@@ -320,3 +370,48 @@ class TestConsoleOutputWorker:
                 msg_queue.append(None)
                 cv.notify()
             thread.join(timeout=1.0)
+
+    def test_buffered_writer_backs_off_under_load(self) -> None:
+        # Continuous output is flushed less often than every TIMEOUT_S
+        stream = MockStream()
+        msg_queue: deque[ConsoleMsg | FlushMarker | None] = deque()
+        cv = threading.Condition()
+
+        thread = threading.Thread(
+            target=buffered_writer, args=(msg_queue, stream, cv)
+        )
+        thread.daemon = True
+        thread.start()
+
+        try:
+            duration = 0.5
+            start = time.time()
+            n_written = 0
+            while time.time() - start < duration:
+                with cv:
+                    msg_queue.append(
+                        ConsoleMsg(
+                            stream=CellChannel.STDOUT,
+                            cell_id="cell1",
+                            data=f"{n_written}\n",
+                            mimetype="text/plain",
+                        )
+                    )
+                    cv.notify()
+                n_written += 1
+                time.sleep(0.001)
+
+            marker = FlushMarker()
+            with cv:
+                msg_queue.append(marker)
+                cv.notify()
+            assert marker.done.wait(timeout=1.0)
+
+            assert len(stream.operations) < duration / TIMEOUT_S / 2
+            data = "".join(op["console"]["data"] for op in stream.operations)
+            assert data == "".join(f"{i}\n" for i in range(n_written))
+        finally:
+            with cv:
+                msg_queue.append(None)
+                cv.notify()
+            thread.join(timeout=1.0)
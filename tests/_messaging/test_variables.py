@@ -9,8 +9,10 @@ import pytest
 
 from marimo._dependencies.dependencies import DependencyManager
 from marimo._messaging.variables import (
+    VariablePreviews,
     _format_variable_value,
     _stringify_variable_value,
+    create_variable_summary,
     create_variable_value,
     get_variable_preview,
 )
@@ -476,3 +478,89 @@ class TestCreateVariableValue:
         assert vv_false.name == "f"
         assert vv_false.value == "False"
         assert vv_false.datatype == "bool"
+
+
+class TestCreateVariableSummary:
+    def test_scalars_are_previewed(self) -> None:
+        vv = create_variable_summary("x", 42)
+        assert vv.value == "42"
+        assert vv.datatype == "int"
+        assert vv.preview_pending is False
+
+        vv = create_variable_summary("s", "hello")
+        assert vv.value == "hello"
+        assert vv.preview_pending is False
+
+    def test_containers_are_pending(self) -> None:
+        vv = create_variable_summary("xs", list(range(1000)))
+        assert vv.value is None
+        assert vv.datatype == "list"
+        assert vv.size == 1000
+        assert vv.preview_pending is True
+
+    def test_ui_element_with_scalar_value(self) -> None:
+        vv = create_variable_summary("s", slider(1, 10, value=5))
+        assert vv.value == "5"
+        assert vv.datatype == "slider"
+        assert vv.preview_pending is False
+
+    def test_unsized_object(self) -> None:
+        class Custom:
+            def __len__(self) -> int:
+                raise AssertionError("len() should not be called")
+
+        vv = create_variable_summary("c", Custom())
+        assert vv.value is None
+        assert vv.datatype == "Custom"
+        assert vv.size is None
+        assert vv.preview_pending is True
+
+    @pytest.mark.skipif(
+        not DependencyManager.numpy.has(), reason="numpy not installed"
+    )
+    def test_numpy_size(self) -> None:
+        import numpy as np
+
+        vv = create_variable_summary("arr", np.zeros((7, 3)))
+        assert vv.size == 7
+        assert vv.preview_pending is True
+
+
+class TestVariablePreviews:
+    def test_get(self) -> None:
+        previews = VariablePreviews()
+        vv = previews.get("xs", [1, 2, 3])
+        assert vv.name == "xs"
+        assert vv.value == "[1, 2, 3]"
+        assert vv.datatype == "list"
+        assert vv.size == 3
+        assert vv.preview_pending is False
+
+    def test_cached_by_identity(self) -> None:
+        previews = VariablePreviews()
+        xs = [1, 2, 3]
+        first = previews.get("xs", xs)
+        assert previews.get("xs", xs) is first
+
+        # A new object under the same name is previewed again
+        second = previews.get("xs", [4, 5])
+        assert second is not first
+        assert second.value == "[4, 5]"
+
+    def test_invalidate(self) -> None:
+        previews = VariablePreviews()
+        xs = [1, 2, 3]
+        first = previews.get("xs", xs)
+
+        # In-place mutations are picked up after invalidation
+        xs.append(4)
+        assert previews.get("xs", xs) is first
+        previews.invalidate(["xs", "unknown"])
+        assert previews.get("xs", xs).value == "[1, 2, 3, 4]"
+
+    def test_clear(self) -> None:
+        previews = VariablePreviews()
+        xs = [1]
+        first = previews.get("xs", xs)
+        previews.clear()
+        assert previews.get("xs", xs) is not first
@@ -6,6 +6,7 @@ import json
 import pytest
 
 from marimo._dependencies.dependencies import DependencyManager
+from marimo._runtime.context import get_context
 from marimo._runtime.runtime import Kernel
 from tests.conftest import ExecReqProvider
 
@@ -323,3 +324,98 @@ async def test_matplotlib_svg_rendering_in_layout(
     assert isinstance(data, str)
     assert data.startswith("<div")
     assert '<img src="data:image/svg+xml;base64,' in data
+
+
+@pytest.mark.skipif(not HAS_MPL, reason="optional dependencies not installed")
+@pytest.mark.parametrize(
+    ("savefig_format", "mimetype", "ext"),
+    [
+        ("png", "image/png", "png"),
+        ("jpeg", "image/jpeg", "jpeg"),
+        ("webp", "image/webp", "webp"),
+    ],
+)
+async def test_matplotlib_virtual_file_images(
+    executing_kernel: Kernel,
+    exec_req: ExecReqProvider,
+    savefig_format: str,
+    mimetype: str,
+    ext: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that figures are served as virtual files when enabled."""
+    from marimo._output.formatters.formatters import register_formatters
+
+    register_formatters(theme="light")
+    monkeypatch.setitem(
+        executing_kernel.user_config,
+        "experimental",
+        {"image_virtual_files": True},
+    )
+
+    await executing_kernel.run(
+        [
+            exec_req.get(
+                f"""
+                import matplotlib.pyplot as plt
+
+                fmt = plt.rcParams["savefig.format"]
+                plt.rcParams["savefig.format"] = "{savefig_format}"
+
+                fig = plt.figure(figsize=(4, 3), dpi=100)
+                result = fig._mime_()
+
+                plt.rcParams["savefig.format"] = fmt
+                """
+            )
+        ]
+    )
+
+    mime_type, data = executing_kernel.globals["result"]
+    assert mime_type == "application/vnd.marimo+mimebundle"
+    mimebundle = json.loads(data)
+    url = mimebundle[mimetype]
+    assert url.startswith("./@file/")
+    assert url.endswith(f".{ext}")
+    filename = url.split("-", 1)[1]
+    assert get_context().virtual_file_registry.has(filename)
+
+    # Display size is independent of the encoding
+    metadata = mimebundle["__metadata__"][mimetype]
+    assert 400 <= metadata["width"] <= 430
+    assert 300 <= metadata["height"] <= 330
+
+
+@pytest.mark.skipif(not HAS_MPL, reason="optional dependencies not installed")
+async def test_matplotlib_raster_format_requires_virtual_files(
+    executing_kernel: Kernel,
+    exec_req: ExecReqProvider,
+) -> None:
+    """Without virtual files, figures stay inline PNGs."""
+    from marimo._output.formatters.formatters import register_formatters
+
+    register_formatters(theme="light")
+
+    await executing_kernel.run(
+        [
+            exec_req.get(
+                """
+                import matplotlib.pyplot as plt
+
+                fmt = plt.rcParams["savefig.format"]
+                plt.rcParams["savefig.format"] = "jpeg"
+
+                fig = plt.figure(figsize=(4, 3), dpi=100)
+                result = fig._mime_()
+
+                plt.rcParams["savefig.format"] = fmt
+                """
+            )
+        ]
+    )
+
+    mime_type, data = executing_kernel.globals["result"]
+    assert mime_type == "application/vnd.marimo+mimebundle"
+    mimebundle = json.loads(data)
+    assert "image/jpeg" not in mimebundle
+    assert mimebundle["image/png"].startswith("data:image/png;base64,")
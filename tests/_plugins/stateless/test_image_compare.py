@@ -287,7 +287,11 @@ async def test_image_compare_local_file(
                 ),
             ]
         )
-        assert len(get_context().virtual_file_registry.registry) == 2
+        # Identical images share one virtual file
+        registry = get_context().virtual_file_registry
+        assert len(registry.registry) == 1
+        (filename,) = registry.filenames()
+        assert registry.owners(filename) == 2
 
 
 async def test_image_compare_invalid_source_raises() -> None:
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import datetime
+import math
+
+import pytest
+
+from marimo._dependencies.dependencies import DependencyManager
+from marimo._plugins.ui._impl.charts.altair_aggregate import (
+    _bin_extent,
+    preaggregate_chart,
+)
+from tests._data.mocks import create_dataframes
+
+HAS_DEPS = DependencyManager.altair.has() and DependencyManager.polars.has()
+
+
+@pytest.fixture
+def max_rows():
+    import altair as alt
+
+    previous = dict(alt.data_transformers.options)
+    alt.data_transformers.options["max_rows"] = 5
+    yield
+    alt.data_transformers.options.clear()
+    alt.data_transformers.options.update(previous)
+
+
+DATA = {
+    "value": [0.5, 1.5, 1.7, 2.5, 9.0, 9.5, 3.0, None],
+    "group": ["a", "b", "a", "a", "b", "b", "a", "b"],
+}
+
+
+def _rows(data: object) -> list[dict[str, object]]:
+    import narwhals.stable.v2 as nw
+
+    rows = [
+        # pandas represents missing values as NaN
+        {
+            k: None if isinstance(v, float) and math.isnan(v) else v
+            for k, v in row.items()
+        }
+        for row in nw.from_native(data, eager_only=True).rows(named=True)
+    ]
+    return sorted(rows, key=lambda row: tuple(str(v) for v in row.values()))
+
+
+def test_bin_extent_matches_vega() -> None:
+    # Reference values from vega's `bin` with the same parameters
+    assert _bin_extent({}, 0.13, 97.2, 10) == (0, 100, 10)
+    assert _bin_extent({"maxbins": 20}, 46, 230, 10) == (40, 230, 10)
+    assert _bin_extent({"step": 5}, 1, 12, 10) == (0, 15, 5)
+    assert _bin_extent({"nice": False}, 3, 3, 10) == (3, 3.5, 0.5)
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+@pytest.mark.usefixtures("max_rows")
+@pytest.mark.parametrize(
+    "df", create_dataframes(DATA, include=["pandas", "polars", "duckdb"])
+)
+def test_preaggregates_histogram(df: object) -> None:
+    import altair as alt
+
+    chart = (
+        alt.Chart(df)
+        .mark_bar()
+        .encode(x=alt.X("value:Q", bin=True), y="count()", color="group:N")
+    )
+    result = preaggregate_chart(chart)
+
+    assert result is not chart
+    assert result.encoding.to_dict() == {
+        "color": {"field": "group", "type": "nominal"},
+        "x": {
+            "bin": {"binned": True, "step": 1},
+            "field": "value",
+            "title": "value (binned)",
+            "type": "quantitative",
+        },
+        "x2": {"field": "value_end"},
+        "y": {
+            "aggregate": "max",
+            "field": "__count",
+            "title": "Count of Records",
+            "type": "quantitative",
+        },
+    }
+    rows = [
+        (row["group"], row["value"], row["value_end"], row["__count"])
+        for row in _rows(result.data)
+    ]
+    assert sorted(rows, key=str) == sorted(
+        [
+            ("a", 0.0, 1.0, 1),
+            ("a", 1.0, 2.0, 1),
+            ("a", 2.0, 3.0, 1),
+            ("a", 3.0, 4.0, 1),
+            ("b", 1.0, 2.0, 1),
+            # The maximum falls in the last bin
+            ("b", 9.0, 10.0, 2),
+            ("b", None, None, 1),
+        ],
+        key=str,
+    )
+    # The original chart is untouched
+    assert chart.data is df
+    assert chart.encoding.y.to_dict() == {
+        "aggregate": "count",
+        "type": "quantitative",
+    }
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+@pytest.mark.usefixtures("max_rows")
+def test_preaggregates_filters_and_time_units() -> None:
+    import altair as alt
+    import polars as pl
+
+    df = pl.DataFrame(
+        {
+            "date": [
+                datetime.datetime(2024, 1, 1, 10),
+                datetime.datetime(2024, 1, 20),
+                datetime.datetime(2024, 2, 3),
+                datetime.datetime(2024, 2, 4),
+                datetime.datetime(2024, 3, 4),
+                datetime.datetime(2024, 3, 5),
+            ],
+            "amount": [1, 2, 3, 4, 5, 100],
+        }
+    )
+    chart = (
+        alt.Chart(df)
+        .mark_line()
+        .encode(
+            x=alt.X("date:T", timeUnit="yearmonth"),
+            y=alt.Y("sum(amount):Q", title="Total"),
+        )
+        .transform_filter(alt.FieldLTPredicate(field="amount", lt=10))
+    )
+    result = preaggregate_chart(chart)
+
+    assert result.transform is alt.Undefined
+    encoding = result.encoding.to_dict()
+    assert encoding["x"]["timeUnit"] == "utcyearmonth"
+    assert encoding["y"] == {
+        "aggregate": "max",
+        "field": "sum_amount",
+        "title": "Total",
+        "type": "quantitative",
+    }
+    assert _rows(result.data) == [
+        {"date": datetime.datetime(2024, 1, 1), "sum_amount": 3},
+        {"date": datetime.datetime(2024, 2, 1), "sum_amount": 7},
+        {"date": datetime.datetime(2024, 3, 1), "sum_amount": 5},
+    ]
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+@pytest.mark.usefixtures("max_rows")
+def test_keeps_unsupported_charts() -> None:
+    import altair as alt
+    import polars as pl
+
+    df = pl.DataFrame(DATA)
+    base = alt.Chart(df)
+    charts = [
+        # Every row is drawn
+        base.mark_point().encode(x="value:Q", y="group:N"),
+        # Evaluated by Vega
+        base.mark_bar()
+        .encode(x="group:N", y="count()")
+        .transform_filter(alt.datum.value > 1),
+        base.mark_boxplot().encode(x="group:N", y="value:Q"),
+        base.mark_bar().encode(
+            x="group:N", y="count()", tooltip=["q1(value):Q"]
+        ),
+        base.mark_bar().encode(x="group:N", y="count()")
+        + base.mark_rule().encode(y="mean(value):Q"),
+    ]
+    for chart in charts:
+        assert preaggregate_chart(chart) is chart
+
+
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+def test_keeps_small_charts() -> None:
+    import altair as alt
+    import polars as pl
+
+    chart = (
+        alt.Chart(pl.DataFrame(DATA))
+        .mark_bar()
+        .encode(x="group:N", y="count()")
+    )
+    assert preaggregate_chart(chart) is chart
@@ -29,7 +29,10 @@ from marimo._plugins.ui._impl.tables.table_manager import (
     TableManager,
 )
 from marimo._plugins.ui._impl.tables.utils import get_table_manager
-from marimo._utils.narwhals_utils import unwrap_py_scalar
+from marimo._utils.narwhals_utils import (
+    is_narwhals_lazyframe,
+    unwrap_py_scalar,
+)
 from tests._data.mocks import (
     EAGER_LIBS,
     NON_EAGER_LIBS,
@@ -310,6 +313,22 @@ class TestNarwhalsTableManagerFactory(unittest.TestCase):
         assert lazy_manager.take(2, 1).data["A"].to_list() == [2, 3]
         assert lazy_manager.take(2, 2).data["A"].to_list() == [3]
 
+    @pytest.mark.skipif(
+        not DependencyManager.duckdb.has(), reason="duckdb not installed"
+    )
+    def test_take_duckdb_relation(self) -> None:
+        import duckdb
+
+        relation = duckdb.sql("SELECT range AS A FROM range(10)")
+        manager = NarwhalsTableManager.from_dataframe(relation)
+
+        assert manager.get_num_rows(force=True) == 10
+        # Paged with LIMIT/OFFSET; stays lazy
+        page = manager.take(3, 4)
+        assert is_narwhals_lazyframe(page.data)
+        assert page.data.collect()["A"].to_list() == [4, 5, 6]
+        assert manager.take(3, 9).data.collect()["A"].to_list() == [9]
+
     def test_take_zero(self) -> None:
         limited_manager = self.manager.take(0, 0)
         assert limited_manager.data.is_empty()
@@ -1477,6 +1477,46 @@ def test_chart_binning_end_to_end(df: IntoDataFrame):
     assert 99 in collected["values"]  # Last bin includes max value
 
 
+@pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
+@pytest.mark.parametrize(
+    "df",
+    create_dataframes({"values": range(100)}, exclude=["lazy-polars"]),
+)
+def test_chart_preaggregated_selection(df: IntoDataFrame):
+    """Selections on a pre-aggregated chart filter the original data."""
+    import altair as alt
+
+    chart = (
+        alt.Chart(df)
+        .mark_bar()
+        .encode(x=alt.X("values", bin=True), y="count()")
+    )
+    with unittest.mock.patch.dict(
+        alt.data_transformers.options, {"max_rows": 50}
+    ):
+        marimo_chart = altair_chart(chart)
+
+    # Only the bins are shipped
+    assert marimo_chart._spec["encoding"]["x"]["bin"] == {
+        "binned": True,
+        "step": 10,
+    }
+    assert marimo_chart.dataframe is df
+
+    # Point selections on a pre-binned field hold the bin start
+    filtered = marimo_chart._convert_value(
+        {"select_point": {"vlPoint": [1], "values": [20]}}
+    )
+    collected = maybe_collect(filtered)
+    assert sorted(collected["values"].to_list()) == list(range(20, 30))
+
+    # The last bin includes the maximum
+    filtered = marimo_chart._convert_value(
+        {"select_point": {"vlPoint": [1], "values": [90]}}
+    )
+    assert get_len(filtered) == 10
+
+
 @pytest.mark.skipif(not HAS_DEPS, reason="optional dependencies not installed")
 def test_filter_dataframe_without_binned_fields() -> None:
     """Test that filtering works normally when binned_fields is None."""
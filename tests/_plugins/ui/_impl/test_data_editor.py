@@ -381,9 +381,9 @@ def test_apply_edits_dataframe_polars_int8_preserves_dtype():
         "edits": [{"rowIdx": 0, "columnId": "A", "value": "5"}]
     }
     result = apply_edits(df.clone(), edits)
-    # The column stays integer (not coerced to String) even though the
-    # column-oriented round-trip widens the exact type to Int64.
-    assert result["A"].dtype.is_integer()
+    # The edit is scattered into the existing column, so the exact type
+    # is kept (the column-oriented round-trip would widen it to Int64).
+    assert result["A"].dtype == pl.Int8
     assert result["A"].to_list() == [5, 2, 3]
 
 
@@ -931,6 +931,64 @@ class TestBulkEditsDataframe:
         assert pd.DataFrame({"A": [1, 2, 3]}).equals(result)
 
 
+@pytest.mark.parametrize(
+    "df",
+    create_dataframes(
+        {"A": [1, 2, 3, 4], "B": ["a", "b", "c", "d"]},
+        exclude=["lazy-polars", "ibis", "duckdb"],
+    ),
+)
+def test_apply_edits_dataframe_batches(df: Any) -> None:
+    # Mixed batches must match the list-of-dicts semantics: removals shift
+    # later indices, repeated edits to a cell keep the last value, and
+    # edits past the end append rows.
+    edits: DataEdits = {
+        "edits": [
+            {"rowIdx": 0, "columnId": "B", "value": "x"},
+            {"rowIdx": 0, "columnId": "B", "value": "y"},
+            {"rowIdx": 2, "columnId": "A", "value": "30"},
+            {"rowIdx": 1, "type": "remove"},
+            {"rowIdx": 1, "type": "remove"},
+            {"rowIdx": 1, "columnId": "B", "value": "z"},
+            {"columnIdx": 1, "type": "rename", "newName": "C"},
+        ]
+    }
+    expected = {"A": [1, 4], "C": ["y", "z"]}
+
+    result = nw.from_native(apply_edits(df, edits), eager_only=True)
+    assert type(result.to_native()) is type(df)
+    assert result.to_dict(as_series=False) == expected
+    assert result.schema["A"].is_integer()
+
+    rows = [{"A": 1, "B": "a"}, {"A": 2, "B": "b"}]
+    rows += [{"A": 3, "B": "c"}, {"A": 4, "B": "d"}]
+    assert apply_edits(rows, edits) == [
+        {"A": 1, "C": "y"},
+        {"A": 4, "C": "z"},
+    ]
+
+
+@pytest.mark.parametrize(
+    "df",
+    create_dataframes(
+        {"A": [1, 2], "B": ["a", "b"]},
+        exclude=["lazy-polars", "ibis", "duckdb"],
+    ),
+)
+def test_apply_edits_dataframe_append_rows(df: Any) -> None:
+    edits: DataEdits = {
+        "edits": [
+            {"rowIdx": 2, "columnId": "A", "value": "3"},
+            {"rowIdx": 2, "columnId": "B", "value": "c"},
+        ]
+    }
+    result = nw.from_native(apply_edits(df, edits), eager_only=True)
+    assert result.to_dict(as_series=False) == {
+        "A": [1, 2, 3],
+        "B": ["a", "b", "c"],
+    }
+
+
 class TestConvertValue:
     """Test the _convert_value function directly."""
 
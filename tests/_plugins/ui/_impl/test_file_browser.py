@@ -957,6 +957,75 @@ def test_is_truncated_with_filetype_filtering_edge_case(
     assert response.is_truncated is True
 
 
+def test_list_directory_pages_with_next_offset(tmp_path: Path) -> None:
+    """Following next_offset lists every entry exactly once."""
+    for i in range(12):
+        (tmp_path / f"file{i}.txt").touch()
+        (tmp_path / f"file{i}.py").touch()
+
+    fb = file_browser(initial_path=tmp_path, filetypes=[".txt"], limit=5)
+    names: list[str] = []
+    offset = 0
+    pages = 0
+    while True:
+        response = fb._list_directory(
+            ListDirectoryArgs(path=str(tmp_path), offset=offset)
+        )
+        pages += 1
+        names.extend(f["name"] for f in response.files)
+        assert response.is_truncated is (response.next_offset is not None)
+        if response.next_offset is None:
+            break
+        offset = response.next_offset
+
+    assert pages == 3
+    assert names == [f"file{i}.txt" for i in range(12)]
+
+
+def test_list_directory_continuation_uses_cached_listing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Later pages reuse the first page's listing, so offsets stay valid."""
+    for i in range(4):
+        (tmp_path / f"file{i}.txt").touch()
+
+    fb = file_browser(initial_path=tmp_path, limit=2)
+    first = fb._list_directory(ListDirectoryArgs(path=str(tmp_path)))
+    assert first.next_offset == 2
+
+    # A file sorting before the cursor must not shift the second page
+    (tmp_path / "file0a.txt").touch()
+    second = fb._list_directory(
+        ListDirectoryArgs(path=str(tmp_path), offset=2)
+    )
+    assert [f["name"] for f in second.files] == ["file2.txt", "file3.txt"]
+    assert second.next_offset is None
+
+    # Once the listing expires, a fresh first page sees the new file
+    monkeypatch.setattr(fb_module, "_LISTING_TTL_SECONDS", 0)
+    refreshed = fb._list_directory(ListDirectoryArgs(path=str(tmp_path)))
+    assert refreshed.total_count == 5
+
+
+def test_list_directory_uses_scandir_types(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Local listings don't stat each entry through Path."""
+    (tmp_path / "dir").mkdir()
+    (tmp_path / "file.txt").touch()
+
+    def fail(self: Path) -> bool:
+        raise AssertionError(f"unexpected stat of {self}")
+
+    fb = file_browser(initial_path=tmp_path, ignore_empty_dirs=True)
+    monkeypatch.setattr(Path, "is_dir", fail)
+    monkeypatch.setattr(Path, "is_file", fail)
+
+    response = fb._list_directory(ListDirectoryArgs(path=str(tmp_path)))
+    # `dir` is empty, so ignore_empty_dirs hides it
+    assert [f["name"] for f in response.files] == ["file.txt"]
+
+
 def test_ignore_empty_dirs_initialization(tmp_path: Path) -> None:
     """Test that ignore_empty_dirs parameter is properly initialized."""
     # Creates:
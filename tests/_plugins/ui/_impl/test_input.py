@@ -667,6 +667,58 @@ def test_multiselect_too_many_options() -> None:
     assert "maximum number" in str(e.value)
 
 
+def _search_options(element: Any, query: str, limit: int = 50) -> Any:
+    (function,) = (
+        f for f in element._args.functions if f.name == "search_options"
+    )
+    return function({"query": query, "limit": limit})
+
+
+def test_multiselect_server_search() -> None:
+    options = {f"customer-{i}": i for i in range(200000)}
+    ms = ui.multiselect(
+        options=options, value=["customer-7"], server_search=True
+    )
+    # Only the selection is sent up front
+    assert ms._component_args["options"] == ["customer-7"]
+    assert ms._component_args["server-search"] is True
+    assert ms.value == [7]
+
+    result = _search_options(ms, "CUSTOMER-1999", limit=3)
+    assert result.options == [
+        "customer-1999",
+        "customer-19990",
+        "customer-199900",
+    ]
+    assert result.has_more is True
+
+    ms._update(["customer-199999"])
+    assert ms.value == [199999]
+
+
+def test_dropdown_server_search() -> None:
+    dd = ui.dropdown(
+        options=["apple", "pineapple", "Apricot", "banana"],
+        server_search=True,
+    )
+    assert dd._component_args["options"] == []
+    assert dd._component_args["searchable"] is True
+
+    # Prefix matches first (sorted), then substring matches (in order)
+    result = _search_options(dd, "ap")
+    assert result.options == ["apple", "Apricot", "pineapple"]
+    assert result.has_more is False
+
+    assert _search_options(dd, "", limit=2).options == ["apple", "pineapple"]
+    assert _search_options(dd, "zzz").options == []
+
+    # Without server search, all options are sent and nothing is registered
+    dd = ui.dropdown(options=["a", "b"])
+    assert dd._component_args["options"] == ["a", "b"]
+    assert dd._component_args["server-search"] is False
+    assert dd._args.functions == ()
+
+
 def test_multiselect_invalid_value() -> None:
     with pytest.raises(ValueError) as e:
         ui.multiselect(options=["1", "2", "3"], value=["4"])
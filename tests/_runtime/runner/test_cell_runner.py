@@ -10,7 +10,8 @@ from marimo._runtime.capture import capture_stderr
 from marimo._runtime.runner.cell_runner import Runner
 from marimo._runtime.runner.hooks import NotebookCellHooks
 from marimo._runtime.runtime import Kernel
-from tests.conftest import ExecReqProvider
+from tests._messaging.mocks import MockStream
+from tests.conftest import ExecReqProvider, MockedKernel
 
 
 async def test_cell_output(
@@ -116,6 +117,68 @@ async def test_line_timing_lifecycle_gated_by_flag(
     )
 
 
+async def test_profiler_gated_by_flag(
+    execution_kernel: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k = execution_kernel
+    await k.run([exec_req.get("1")])
+
+    def make_runner(value: bool) -> Runner:
+        experimental = {**k.user_config.get("experimental", {})}
+        experimental["profiler"] = value
+        return Runner(
+            roots=set(k.graph.cells.keys()),
+            graph=k.graph,
+            glbls=k.globals,
+            debugger=k.debugger,
+            hooks=NotebookCellHooks(),
+            user_config={**k.user_config, "experimental": experimental},
+        )
+
+    assert make_runner(True)._profiler is not None
+    assert make_runner(False)._profiler is None
+
+
+async def test_profiler_broadcasts_cell_profile(
+    mocked_kernel: MockedKernel, exec_req: ExecReqProvider
+) -> None:
+    from marimo._messaging.notification import CellProfileNotification
+
+    k = mocked_kernel.k
+    experimental = {**k.user_config.get("experimental", {}), "profiler": True}
+    k.user_config = {**k.user_config, "experimental": experimental}
+
+    await k.run(
+        [
+            er := exec_req.get(
+                """
+                def busy():
+                    return sum(i * i for i in range(200_000))
+
+                busy()
+                """
+            )
+        ]
+    )
+
+    profiles = [
+        op
+        for op in MockStream(k.stream).parsed_operations
+        if isinstance(op, CellProfileNotification)
+    ]
+    assert len(profiles) == 1
+    (profile,) = profiles
+    assert profile.cell_id == er.cell_id
+    assert profile.duration > 0
+
+    spans = {span.name: span for span in profile.spans}
+    assert spans["execute"].category == "execution"
+    assert spans["_broadcast_outputs"].category == "formatting"
+    assert spans["_set_status_idle"].category == "hook"
+    # Every sampled stack is rooted at the phase it was taken in.
+    assert all(stack.split(";")[0] in spans for stack in profile.stacks)
+
+
 async def test_traceback_includes_lineno(
     execution_kernel: Kernel, exec_req: ExecReqProvider
 ) -> None:
@@ -0,0 +1,214 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from marimo._messaging.notification import CellNotification
+from marimo._runtime.runtime import Kernel
+from tests.conftest import ExecReqProvider
+
+SLOW_OUTPUT = """
+import threading
+import time
+
+class SlowOutput:
+    def __init__(self, name):
+        self.name = name
+
+    def _mime_(self):
+        time.sleep(0.05)
+        thread = threading.current_thread().name
+        return ("text/plain", f"{self.name}:{thread}")
+"""
+
+
+def _outputs(k: Kernel) -> list[CellNotification]:
+    return [
+        op
+        for op in k.stream.cell_notifications
+        if op.output is not None and op.output.data
+    ]
+
+
+@pytest.fixture
+def background_formatting(
+    k: Kernel, monkeypatch: pytest.MonkeyPatch
+) -> Kernel:
+    monkeypatch.setitem(
+        k.user_config,
+        "experimental",
+        {"background_output_formatting": True},
+    )
+    # Messages sent from the formatter thread land in the same mock stream.
+    monkeypatch.setattr(k.stream, "copy_for_thread", lambda: k.stream)
+    return k
+
+
+async def test_outputs_formatted_in_order_off_kernel_thread(
+    background_formatting: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k = background_formatting
+    cells = [exec_req.get(SLOW_OUTPUT)] + [
+        exec_req.get(f"SlowOutput('{name}')") for name in ("a", "b", "c")
+    ]
+    await k.run(cells)
+
+    assert not k.errors
+    # Every output was sent before the run finished, in cell order.
+    outputs = _outputs(k)
+    assert [op.cell_id for op in outputs] == [c.cell_id for c in cells[1:]]
+    for op, name in zip(outputs, ("a", "b", "c"), strict=True):
+        assert op.output is not None
+        value, thread = str(op.output.data).split(":")
+        assert value == name
+        assert thread != threading.current_thread().name
+        assert thread.startswith("marimo-output-formatter")
+
+
+async def test_output_formatted_before_next_cell_runs(
+    background_formatting: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k = background_formatting
+    define = exec_req.get(
+        """
+        import time
+
+        class SlowList:
+            def __init__(self):
+                self.items = []
+
+            def _mime_(self):
+                time.sleep(0.05)
+                return ("text/plain", repr(self.items))
+
+        items = SlowList()
+        items
+        """
+    )
+    mutate = exec_req.get("items.items.append(1)")
+    await k.run([define, mutate])
+
+    assert not k.errors
+    (output,) = _outputs(k)
+    assert output.cell_id == define.cell_id
+    assert output.output is not None
+    # Formatted before the next cell mutated the value
+    assert output.output.data == "[]"
+
+
+async def test_independent_cell_runs_while_output_formats(
+    background_formatting: Kernel,
+    exec_req: ExecReqProvider,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import sys
+
+    k = background_formatting
+    # Shared through `sys`, which the next cell imports rather than
+    # references, so the cell doesn't reach the pending output.
+    monkeypatch.setattr(
+        sys, "_marimo_test_event", threading.Event(), raising=False
+    )
+    define = exec_req.get(
+        """
+        import sys
+
+        class WaitsForNextCell:
+            def _mime_(self):
+                # Only set if the next cell runs while this is formatted
+                return ("text/plain", str(sys._marimo_test_event.wait(5)))
+
+        WaitsForNextCell()
+        """
+    )
+    independent = exec_req.get(
+        """
+        import sys as _sys
+
+        _sys._marimo_test_event.set()
+        """
+    )
+    await k.run([define, independent])
+
+    assert not k.errors
+    (output,) = _outputs(k)
+    assert output.cell_id == define.cell_id
+    assert output.output is not None
+    assert output.output.data == "True"
+
+
+async def test_matplotlib_outputs_formatted_on_kernel_thread(
+    background_formatting: Kernel,
+) -> None:
+    from marimo._runtime.runner.output_formatter import OutputFormatter
+
+    del background_formatting
+    FakeFigure = type("Figure", (), {"__module__": "matplotlib.figure"})
+    formatter = OutputFormatter()
+    assert not formatter.accepts(FakeFigure())
+    assert formatter.accepts(object())
+
+
+async def test_html_outputs_sent_from_kernel_thread(
+    background_formatting: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k = background_formatting
+    await k.run(
+        [
+            exec_req.get("import marimo as mo"),
+            exec_req.get("mo.md('hello')"),
+        ]
+    )
+
+    assert not k.errors
+    outputs = _outputs(k)
+    assert len(outputs) == 1
+    assert outputs[0].output is not None
+    assert "hello" in str(outputs[0].output.data)
+
+
+async def test_formatter_error_reported_to_cell(
+    background_formatting: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k = background_formatting
+    broken = exec_req.get(
+        """
+        class Broken:
+            def _mime_(self):
+                raise ValueError("cannot format")
+
+        Broken()
+        """
+    )
+    await k.run([broken])
+
+    tracebacks = [
+        op
+        for op in k.stream.cell_notifications
+        if op.console is not None
+        and not isinstance(op.console, list)
+        and op.console.mimetype == "application/vnd.marimo+traceback"
+    ]
+    assert len(tracebacks) == 1
+    assert tracebacks[0].cell_id == broken.cell_id
+    assert "cannot format" in str(tracebacks[0].console.data)  # type: ignore[union-attr]
+    # The cell's output is still replaced
+    assert any(
+        op.cell_id == broken.cell_id and op.output is not None
+        for op in k.stream.cell_notifications
+    )
+
+
+async def test_disabled_by_default(
+    k: Kernel, exec_req: ExecReqProvider
+) -> None:
+    await k.run([exec_req.get(SLOW_OUTPUT), exec_req.get("SlowOutput('a')")])
+
+    outputs = _outputs(k)
+    assert len(outputs) == 1
+    assert outputs[0].output is not None
+    assert str(outputs[0].output.data) == (
+        f"a:{threading.current_thread().name}"
+    )
@@ -0,0 +1,159 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any
+
+from marimo._runtime.commands import (
+    RestoreKernelCommand,
+    UpdateUIElementCommand,
+)
+from marimo._runtime.hibernate import (
+    CHECKPOINT_FILENAME,
+    FAILED_FILENAME,
+    read_checkpoint,
+)
+from tests.conftest import MockedKernel
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from marimo._runtime.runtime import Kernel
+    from tests.conftest import ExecReqProvider
+
+
+async def _restore(
+    directory: Path,
+    *,
+    object_ids: list[str] | None = None,
+    values: list[Any] | None = None,
+) -> MockedKernel:
+    restored = MockedKernel.open()
+    await restored.k.restore(
+        RestoreKernelCommand(
+            directory=str(directory),
+            set_ui_element_value_request=UpdateUIElementCommand(
+                object_ids=object_ids or [], values=values or []
+            ),
+        )
+    )
+    return restored
+
+
+def _checkpoint(mocked: MockedKernel, directory: Path) -> None:
+    directory.mkdir()
+    assert mocked.k.checkpoint(str(directory))
+    mocked.teardown()
+
+
+async def test_restores_definitions(
+    exec_req: ExecReqProvider, tmp_path: Path
+) -> None:
+    log = tmp_path / "log.txt"
+    mocked = MockedKernel.open()
+    k = mocked.k
+    await k.run(
+        [
+            exec_req.get("import math; x = [1, 2, 3]"),
+            # Lambdas defined in the notebook can't be saved
+            exec_req.get(
+                f"f = lambda: sum(x); open(r'{log}', 'a').write('f')"
+            ),
+            exec_req.get(f"total = f(); open(r'{log}', 'a').write('total')"),
+        ]
+    )
+    assert log.read_text() == "ftotal"
+
+    directory = tmp_path / "checkpoint"
+    _checkpoint(mocked, directory)
+    checkpoint = read_checkpoint(directory)
+    assert [cell.rerun for cell in checkpoint.cells.values()] == [
+        False,
+        True,
+        False,
+    ]
+
+    restored = await _restore(directory)
+    try:
+        k = restored.k
+        assert k.globals["math"] is math
+        assert k.globals["x"] == [1, 2, 3]
+        assert k.globals["total"] == 6
+        assert k.globals["f"]() == 6
+        # Only the cell defining `f` ran again, not its descendant
+        assert log.read_text() == "ftotalf"
+        assert all(
+            cell.run_result_status == "success" and not cell.stale
+            for cell in k.graph.cells.values()
+        )
+        assert not directory.exists()
+    finally:
+        restored.teardown()
+
+
+async def test_reruns_cells_with_ui_elements(
+    exec_req: ExecReqProvider, tmp_path: Path
+) -> None:
+    mocked = MockedKernel.open()
+    await mocked.k.run(
+        [
+            exec_req.get("import marimo as mo"),
+            exec_req.get("s = mo.ui.slider(0, 10)"),
+            exec_req.get("value = s.value"),
+        ]
+    )
+    object_id = mocked.k.globals["s"]._id
+    directory = tmp_path / "checkpoint"
+    _checkpoint(mocked, directory)
+
+    # The slider comes back with the value the frontend holds
+    restored = await _restore(directory, object_ids=[object_id], values=[7])
+    try:
+        k: Kernel = restored.k
+        assert k.globals["s"]._id == object_id
+        assert k.globals["s"].value == 7
+        # Descendants keep their restored values until the user interacts
+        assert k.globals["value"] == 0
+    finally:
+        restored.teardown()
+
+
+async def test_restores_run_state(
+    exec_req: ExecReqProvider, tmp_path: Path
+) -> None:
+    mocked = MockedKernel.open()
+    await mocked.k.run(
+        [
+            exec_req.get("a = 1"),
+            exec_req.get("b = 1 / 0"),
+            exec_req.get("c = b + 1"),
+        ]
+    )
+    directory = tmp_path / "checkpoint"
+    _checkpoint(mocked, directory)
+
+    restored = await _restore(directory)
+    try:
+        k = restored.k
+        assert k.globals["a"] == 1
+        assert "b" not in k.globals
+        statuses = [cell.run_result_status for cell in k.graph.cells.values()]
+        assert statuses == ["success", "exception", "cancelled"]
+    finally:
+        restored.teardown()
+
+
+async def test_checkpoint_failure_keeps_kernel(
+    mocked_kernel: MockedKernel, exec_req: ExecReqProvider, tmp_path: Path
+) -> None:
+    k = mocked_kernel.k
+    await k.run([exec_req.get("a = 1")])
+    directory = tmp_path / "checkpoint"
+    directory.mkdir()
+    # Values can't be written
+    (directory / "values").touch()
+
+    assert not k.checkpoint(str(directory))
+    assert not (directory / CHECKPOINT_FILENAME).exists()
+    assert (directory / FAILED_FILENAME).exists()
+    assert k.globals["a"] == 1
@@ -0,0 +1,141 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+from marimo._dependencies.dependencies import DependencyManager
+from marimo._runtime.memory import (
+    MemoryMonitor,
+    estimate_memory,
+    get_rss_bytes,
+)
+
+
+def _sizes(**variables: object) -> dict[str, int]:
+    return {m.name: m.size_bytes for m in estimate_memory(variables)}
+
+
+def test_deep_size_of_containers() -> None:
+    inner = [os.urandom(1000) for _ in range(10)]
+    sizes = _sizes(outer={"values": inner})
+    assert sizes["outer"] > 10 * 1000
+    assert sizes["outer"] >= sys.getsizeof(inner) + sum(
+        sys.getsizeof(b) for b in inner
+    )
+
+
+def test_shared_objects_are_counted_once() -> None:
+    payload = b"x" * 100_000
+    sizes = _sizes(a=[payload], b=(payload,))
+    assert sizes["a"] > 100_000
+    assert sizes["b"] < 1_000
+
+
+def test_cycles_terminate() -> None:
+    xs: list[object] = []
+    xs.append(xs)
+    assert _sizes(xs=xs)["xs"] == sys.getsizeof(xs)
+
+
+def test_instances_and_slots() -> None:
+    class WithDict:
+        def __init__(self) -> None:
+            self.payload = b"x" * 10_000
+
+    class WithSlots:
+        __slots__ = ("payload",)
+
+        def __init__(self) -> None:
+            self.payload = b"x" * 10_000
+
+    sizes = _sizes(d=WithDict(), s=WithSlots())
+    assert sizes["d"] > 10_000
+    assert sizes["s"] > 10_000
+
+
+def test_modules_and_functions_are_shallow() -> None:
+    def f() -> None:
+        pass
+
+    sizes = _sizes(module=sys, f=f)
+    assert sizes["module"] == sys.getsizeof(sys)
+    assert sizes["f"] == sys.getsizeof(f)
+
+
+def test_traversal_is_bounded() -> None:
+    xs = [[i] for i in range(100)]
+    (memory,) = estimate_memory({"xs": xs}, max_objects=10)
+    assert memory.size_bytes < _sizes(xs=xs)["xs"]
+
+
+@pytest.mark.skipif(
+    not DependencyManager.numpy.has(), reason="numpy not installed"
+)
+def test_numpy_views_share_buffers() -> None:
+    import numpy as np
+
+    arr = np.zeros(1_000_000)
+    sizes = _sizes(arr=arr, view=arr[::2], copy=arr.copy())
+    assert sizes["arr"] >= arr.nbytes
+    assert sizes["view"] < 1_000
+    assert sizes["copy"] >= arr.nbytes
+
+
+@pytest.mark.skipif(
+    not DependencyManager.numpy.has(), reason="numpy not installed"
+)
+def test_numpy_object_arrays_measure_elements() -> None:
+    import numpy as np
+
+    arr = np.array([os.urandom(1000) for _ in range(5000)], dtype=object)
+    assert _sizes(arr=arr)["arr"] > 5000 * 1000
+
+
+@pytest.mark.skipif(
+    not DependencyManager.pandas.has(), reason="pandas not installed"
+)
+def test_pandas_columns_share_buffers() -> None:
+    import numpy as np
+    import pandas as pd
+
+    df = pd.DataFrame({"a": np.arange(100_000), "b": np.zeros(100_000)})
+    sizes = _sizes(df=df, column=df["a"])
+    assert sizes["df"] >= 2 * 8 * 100_000
+    assert sizes["column"] < 1_000
+
+
+@pytest.mark.skipif(
+    not DependencyManager.pyarrow.has(), reason="pyarrow not installed"
+)
+def test_pyarrow_slices_share_buffers() -> None:
+    import pyarrow as pa
+
+    table = pa.table({"a": list(range(100_000))})
+    sizes = _sizes(table=table, same=table.slice(0))
+    assert sizes["table"] >= 8 * 100_000
+    assert sizes["same"] == 0
+
+
+@pytest.mark.skipif(
+    not DependencyManager.polars.has(), reason="polars not installed"
+)
+def test_polars() -> None:
+    import polars as pl
+
+    df = pl.DataFrame({"a": list(range(100_000))})
+    assert _sizes(df=df)["df"] == df.estimated_size()
+
+
+def test_memory_monitor() -> None:
+    if get_rss_bytes() is None:
+        pytest.skip("RSS not available")
+    monitor = MemoryMonitor(max_samples=2)
+    for _ in range(3):
+        assert monitor.sample() is not None
+    samples = monitor.samples
+    assert len(samples) == 2
+    assert samples[0].timestamp <= samples[1].timestamp
+    assert all(s.rss_bytes > 0 for s in samples)
@@ -0,0 +1,69 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from marimo._messaging.notification import KernelMetricsNotification
+from marimo._runtime.metrics import Histogram
+from tests._messaging.mocks import MockStream
+
+if TYPE_CHECKING:
+    from tests.conftest import ExecReqProvider, MockedKernel
+
+
+def test_histogram() -> None:
+    histogram = Histogram((1, 2))
+    for value in (0.5, 1, 1.5, 3):
+        histogram.observe(value)
+    # Bounds are inclusive
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.count == 4
+    assert histogram.sum == 6
+
+    merged = Histogram((1, 2))
+    merged.merge(histogram.snapshot())
+    merged.merge(histogram.snapshot())
+    assert merged.counts == [4, 2, 2]
+    assert merged.sum == 12
+
+    # Snapshots with other bounds are ignored
+    merged.merge(Histogram((1,)).snapshot())
+    assert merged.counts == [4, 2, 2]
+
+
+async def test_kernel_reports_metrics(
+    mocked_kernel: MockedKernel, exec_req: ExecReqProvider
+) -> None:
+    k = mocked_kernel.k
+    await k.run(
+        [
+            exec_req.get("import marimo as mo"),
+            exec_req.get(
+                """
+                @mo.cache
+                def double(x):
+                    return 2 * x
+
+                double(1), double(1), double(2)
+                """
+            ),
+        ]
+    )
+
+    reports = [
+        op
+        for op in MockStream(k.stream).parsed_operations
+        if isinstance(op, KernelMetricsNotification)
+    ]
+    assert len(reports) == 1
+    (report,) = reports
+    assert sum(report.cell_duration.counts) == 2
+    assert report.cell_duration.sum > 0
+    hooks = {(hook.phase, hook.hook): hook.duration for hook in report.hooks}
+    assert sum(hooks["post_execution", "_broadcast_outputs"].counts) == 2
+    assert sum(hooks["on_finish", "_propagate_kernel_errors"].counts) == 1
+    assert report.cache_hits == 1
+    assert report.cache_misses == 2
+
+    # Reported timings are drained
+    assert k.metrics.report(k.globals) is None
@@ -36,6 +36,8 @@ from marimo._runtime.commands import (
     CreateNotebookCommand,
     DeleteCellCommand,
     ExecuteCellCommand,
+    GetMemoryUsageCommand,
+    PreviewVariablesCommand,
     UpdateCellConfigCommand,
     UpdateUIElementCommand,
 )
@@ -1689,19 +1691,22 @@ except NameError:
         assert "C" not in k.globals
         stream = MockStream(k.stream)
         stderr = MockStderr(k.stderr)
+        operations = [
+            op for op in stream.operations if op["op"] != "kernel-metrics"
+        ]
         if k.execution_type == "strict":
             assert (
                 "name `R` is referenced before definition."
-                in stream.operations[-4]["output"]["data"][0]["msg"]
+                in operations[-4]["output"]["data"][0]["msg"]
             )
             assert (
                 "This cell wasn't run"
-                in stream.operations[-1]["output"]["data"][0]["msg"]
+                in operations[-1]["output"]["data"][0]["msg"]
             )
         else:
             assert (
                 "Name `C` is not defined. It was expected to be defined in"
-                in stream.operations[-2]["output"]["data"][0]["msg"]
+                in operations[-2]["output"]["data"][0]["msg"]
             )
             assert "NameError" in stderr.messages[0]
             assert "NameError" in stderr.messages[-1]
@@ -4621,6 +4626,136 @@ def _filter_to_error_ops(
     ]
 
 
+class TestVariablePreviews:
+    @staticmethod
+    def _variable_values(stream: MockStream) -> list[dict[str, Any]]:
+        return [
+            variable
+            for op in stream.operations
+            if op["op"] == "variable-values"
+            for variable in op["variables"]
+        ]
+
+    @staticmethod
+    async def test_run_sends_summaries(
+        mocked_kernel: MockedKernel, exec_req: ExecReqProvider
+    ) -> None:
+        k = mocked_kernel.k
+        await k.run([exec_req.get("x = 1; xs = list(range(100))")])
+
+        values = {
+            v["name"]: v
+            for v in TestVariablePreviews._variable_values(
+                MockStream(mocked_kernel.stream)
+            )
+        }
+        assert values["x"]["value"] == "1"
+        assert values["x"]["preview_pending"] is False
+        assert values["xs"]["value"] is None
+        assert values["xs"]["datatype"] == "list"
+        assert values["xs"]["size"] == 100
+        assert values["xs"]["preview_pending"] is True
+
+    @staticmethod
+    async def test_run_sends_eager_previews(
+        mocked_kernel: MockedKernel, exec_req: ExecReqProvider
+    ) -> None:
+        # Set when no frontend will request previews, e.g. exports
+        k = mocked_kernel.k
+        k.user_config = copy.deepcopy(k.user_config)
+        k.user_config["runtime"]["eager_variable_previews"] = True  # type: ignore[typeddict-unknown-key]
+        await k.run([exec_req.get("xs = [1, 2, 3]")])
+
+        (value,) = TestVariablePreviews._variable_values(
+            MockStream(mocked_kernel.stream)
+        )
+        assert value["value"] == "[1, 2, 3]"
+        assert value["preview_pending"] is False
+
+    @staticmethod
+    async def test_preview_variables(
+        mocked_kernel: MockedKernel, exec_req: ExecReqProvider
+    ) -> None:
+        k = mocked_kernel.k
+        await k.run([exec_req.get("xs = [1, 2, 3]")])
+        mocked_kernel.stream.messages.clear()
+
+        await k.handle_message(
+            PreviewVariablesCommand(names=["xs", "missing"])
+        )
+        (value,) = TestVariablePreviews._variable_values(
+            MockStream(mocked_kernel.stream)
+        )
+        assert value["name"] == "xs"
+        assert value["value"] == "[1, 2, 3]"
+        assert value["size"] == 3
+        assert value["preview_pending"] is False
+
+    @staticmethod
+    async def test_preview_invalidated_by_referencing_cell(
+        mocked_kernel: MockedKernel, exec_req: ExecReqProvider
+    ) -> None:
+        k = mocked_kernel.k
+        await k.run([exec_req.get("xs = [1, 2, 3]")])
+        await k.handle_message(PreviewVariablesCommand(names=["xs"]))
+
+        # Mutates xs in place, without redefining it
+        await k.run([exec_req.get("xs.append(4)")])
+        mocked_kernel.stream.messages.clear()
+        await k.handle_message(PreviewVariablesCommand(names=["xs"]))
+
+        (value,) = TestVariablePreviews._variable_values(
+            MockStream(mocked_kernel.stream)
+        )
+        assert value["value"] == "[1, 2, 3, 4]"
+
+
+class TestMemoryUsage:
+    @staticmethod
+    async def test_get_memory_usage(
+        mocked_kernel: MockedKernel, exec_req: ExecReqProvider
+    ) -> None:
+        k = mocked_kernel.k
+        await k.run(
+            [
+                exec_req.get("big = b'x' * 1_000_000; small = 1"),
+                exec_req.get("alias = [big]"),
+            ]
+        )
+        mocked_kernel.stream.messages.clear()
+
+        await k.handle_message(GetMemoryUsageCommand())
+        (usage,) = [
+            op
+            for op in MockStream(mocked_kernel.stream).operations
+            if op["op"] == "memory-usage"
+        ]
+        sizes = {v["name"]: v["size_bytes"] for v in usage["variables"]}
+        # Largest first
+        assert usage["variables"][0]["name"] == "big"
+        assert sizes["big"] >= 1_000_000
+        # `big` is counted once, for the variable defined first
+        assert sizes["alias"] < 1_000
+        assert usage["total_bytes"] == sum(sizes.values())
+        assert "__builtins__" not in sizes
+
+    @staticmethod
+    async def test_get_memory_usage_of_named_variables(
+        mocked_kernel: MockedKernel, exec_req: ExecReqProvider
+    ) -> None:
+        k = mocked_kernel.k
+        await k.run([exec_req.get("x = [1, 2, 3]; y = 1")])
+        mocked_kernel.stream.messages.clear()
+
+        await k.handle_message(GetMemoryUsageCommand(names=["x", "missing"]))
+        (usage,) = [
+            op
+            for op in MockStream(mocked_kernel.stream).operations
+            if op["op"] == "memory-usage"
+        ]
+        assert [v["name"] for v in usage["variables"]] == ["x"]
+
+
 class TestLaunchKernelEventLoop:
     """Event-loop policy / factory selection in launch_kernel.
 
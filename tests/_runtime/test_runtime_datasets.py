@@ -7,6 +7,7 @@ import pytest
 from marimo._dependencies.dependencies import DependencyManager
 from marimo._messaging.notification import (
     DataSourceConnectionsNotification,
+    DataSourceTablesNotification,
     SQLDatabaseMetadata,
     SQLMetadata,
     SQLSchemaListPreviewNotification,
@@ -744,3 +745,74 @@ class TestSQLValidate:
             validate_result=None,
             error="Engine is required for validating catalog",
         )
+
+
+@pytest.mark.skipif(not HAS_SQL, reason="SQL deps not available")
+@pytest.mark.requires("sqlglot")
+class TestDuckDBDatasourceRefresh:
+    async def test_refreshes_only_changed_schema(
+        self, mocked_kernel: MockedKernel
+    ) -> None:
+        k = mocked_kernel.k
+        stream = mocked_kernel.stream
+
+        def notifications() -> list[
+            DataSourceConnectionsNotification | DataSourceTablesNotification
+        ]:
+            return [
+                op
+                for op in stream.operations
+                if isinstance(
+                    op,
+                    (
+                        DataSourceConnectionsNotification,
+                        DataSourceTablesNotification,
+                    ),
+                )
+            ]
+
+        await k.run(
+            [
+                ExecuteCellCommand(
+                    cell_id=CellId_t("0"), code="import marimo as mo"
+                ),
+                # A new schema changes the catalog's shape: full refresh
+                ExecuteCellCommand(
+                    cell_id=CellId_t("1"),
+                    code=(
+                        "mo.sql('CREATE SCHEMA IF NOT EXISTS refresh_s;"
+                        " CREATE OR REPLACE TABLE refresh_s.a (x INT)')"
+                    ),
+                ),
+            ]
+        )
+        assert isinstance(
+            notifications()[-1], DataSourceConnectionsNotification
+        )
+        count = len(notifications())
+
+        try:
+            await k.run(
+                [
+                    ExecuteCellCommand(
+                        cell_id=CellId_t("2"),
+                        code=(
+                            "mo.sql('CREATE OR REPLACE TABLE refresh_s.b"
+                            " (y INT)')"
+                        ),
+                    )
+                ]
+            )
+            new = notifications()[count:]
+            assert len(new) == 1
+            assert isinstance(new[0], DataSourceTablesNotification)
+            assert new[0].metadata == SQLMetadata(
+                connection=INTERNAL_DUCKDB_ENGINE,
+                database="memory",
+                schema="refresh_s",
+            )
+            assert [table.name for table in new[0].tables] == ["a", "b"]
+        finally:
+            import duckdb
+
+            duckdb.execute("DROP SCHEMA IF EXISTS refresh_s CASCADE")
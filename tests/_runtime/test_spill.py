@@ -0,0 +1,210 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from marimo._dependencies.dependencies import DependencyManager
+from marimo._messaging.notification import VariableValuesNotification
+from marimo._runtime.commands import (
+    DeleteCellCommand,
+    PreviewVariablesCommand,
+)
+from marimo._runtime.spill import GlobalsSpiller, SpilledValue
+from tests._messaging.mocks import MockStream
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from marimo._runtime.runtime import Kernel
+    from tests.conftest import ExecReqProvider, MockedKernel
+
+
+@pytest.fixture
+def k(mocked_kernel: MockedKernel, tmp_path: Path) -> Kernel:
+    k = mocked_kernel.k
+    k.user_config = {
+        **k.user_config,
+        "experimental": {"spill_globals": True},
+    }
+    k.globals_spiller = GlobalsSpiller(
+        threshold_bytes=10_000, directory=tmp_path
+    )
+    return k
+
+
+async def test_spills_values_no_cell_needs(
+    k: Kernel, exec_req: ExecReqProvider, tmp_path: Path
+) -> None:
+    await k.run(
+        [
+            exec_req.get("import os; raw = os.urandom(100_000)"),
+            exec_req.get("size = len(raw)"),
+        ]
+    )
+    assert isinstance(k.globals["raw"], SpilledValue)
+    assert k.globals["size"] == 100_000
+    assert (tmp_path / "raw.pickle").exists()
+
+    # Small values stay in memory
+    assert k.globals_spiller.spilled == {"raw"}
+
+
+async def test_rerunning_a_consumer_restores(
+    k: Kernel, exec_req: ExecReqProvider, tmp_path: Path
+) -> None:
+    er = exec_req.get("import os; raw = os.urandom(100_000)")
+    consumer = exec_req.get("head = raw[:10]")
+    await k.run([er, consumer])
+    assert isinstance(k.globals["raw"], SpilledValue)
+
+    await k.run([consumer])
+    assert k.errors == {}
+    assert isinstance(k.globals["head"], bytes)
+    assert len(k.globals["head"]) == 10
+    # Spilled again once the consumer has run
+    assert isinstance(k.globals["raw"], SpilledValue)
+
+    # Deleting the definition drops the spilled file
+    await k.delete_cell(DeleteCellCommand(cell_id=er.cell_id))
+    assert k.globals_spiller.spilled == set()
+    assert not (tmp_path / "raw.pickle").exists()
+
+
+async def test_scratchpad_restores(
+    k: Kernel, exec_req: ExecReqProvider
+) -> None:
+    await k.run([exec_req.get("import os; raw = os.urandom(100_000)")])
+    assert isinstance(k.globals["raw"], SpilledValue)
+
+    await k.run_scratchpad("assert len(raw) == 100_000")
+    assert isinstance(k.globals["raw"], bytes)
+
+
+async def test_pending_consumers_keep_values(
+    mocked_kernel: MockedKernel, k: Kernel, exec_req: ExecReqProvider
+) -> None:
+    mocked_kernel.k.reactive_execution_mode = "lazy"
+    er = exec_req.get("import os; raw = os.urandom(100_000)")
+    await k.run([er, exec_req.get("size = len(raw)")])
+    assert isinstance(k.globals["raw"], SpilledValue)
+
+    # Marks the consumer stale, without running it
+    await k.run([exec_req.get_with_id(er.cell_id, "raw = b'y' * 20_000")])
+    assert k.globals["raw"] == b"y" * 20_000
+
+
+async def test_lazy_readers_keep_values(
+    k: Kernel, exec_req: ExecReqProvider
+) -> None:
+    await k.run(
+        [
+            exec_req.get("import os; a = os.urandom(100_000)"),
+            exec_req.get("b = os.urandom(100_000)"),
+            exec_req.get("def f(): return len(a)"),
+            exec_req.get("g = lambda: len(b)"),
+        ]
+    )
+    assert k.globals_spiller.spilled == set()
+    assert k.globals["f"]() == 100_000
+    assert k.globals["g"]() == 100_000
+
+
+async def test_shared_values_are_not_spilled(
+    k: Kernel, exec_req: ExecReqProvider
+) -> None:
+    await k.run(
+        [
+            exec_req.get("import os; raw = os.urandom(100_000)"),
+            exec_req.get("holder = [raw]"),
+        ]
+    )
+    # Spilling `raw` wouldn't free any memory
+    assert not isinstance(k.globals["raw"], SpilledValue)
+
+
+async def test_disabled_by_default(
+    mocked_kernel: MockedKernel, exec_req: ExecReqProvider, tmp_path: Path
+) -> None:
+    k = mocked_kernel.k
+    k.globals_spiller = GlobalsSpiller(
+        threshold_bytes=10_000, directory=tmp_path
+    )
+    await k.run([exec_req.get("import os; raw = os.urandom(100_000)")])
+    assert isinstance(k.globals["raw"], bytes)
+
+
+@pytest.mark.skipif(
+    not DependencyManager.numpy.has(), reason="numpy not installed"
+)
+async def test_numpy_arrays_round_trip(
+    k: Kernel, exec_req: ExecReqProvider, tmp_path: Path
+) -> None:
+    await k.run([exec_req.get("import numpy as np; arr = np.arange(10_000)")])
+    assert isinstance(k.globals["arr"], SpilledValue)
+    assert (tmp_path / "arr.npy").exists()
+
+    await k.run([exec_req.get("total = int(arr.sum())")])
+    assert k.globals["total"] == sum(range(10_000))
+
+
+def test_placeholder_explains_itself(tmp_path: Path) -> None:
+    placeholder = SpilledValue(
+        name="df",
+        path=tmp_path / "df.pickle",
+        loader="pickle",
+        type_hint="builtins.bytes",
+        size_bytes=1024 * 1024,
+    )
+    assert repr(placeholder) == "<builtins.bytes spilled to disk (1.0 MiB)>"
+    with pytest.raises(AttributeError, match="rerun a cell"):
+        placeholder.shape  # noqa: B018
+
+
+async def test_callables_are_not_spilled(
+    k: Kernel, exec_req: ExecReqProvider
+) -> None:
+    await k.run(
+        [
+            exec_req.get(
+                """
+                import os
+
+                class Handler:
+                    def __init__(self):
+                        self.payload = os.urandom(100_000)
+
+                    def __call__(self):
+                        return len(self.payload)
+                """
+            ),
+            exec_req.get("handler = Handler()"),
+        ]
+    )
+    # May be called without the kernel knowing, e.g. as a callback
+    assert k.globals_spiller.spilled == set()
+    assert k.globals["handler"]() == 100_000
+
+
+async def test_preview_shows_spilled_values(
+    mocked_kernel: MockedKernel, k: Kernel, exec_req: ExecReqProvider
+) -> None:
+    await k.run([exec_req.get("import os; raw = os.urandom(100_000)")])
+    assert isinstance(k.globals["raw"], SpilledValue)
+    mocked_kernel.stream.messages.clear()
+
+    await k.handle_message(PreviewVariablesCommand(names=["raw"]))
+
+    (notification,) = [
+        op
+        for op in MockStream(mocked_kernel.stream).parsed_operations
+        if isinstance(op, VariableValuesNotification)
+    ]
+    (value,) = notification.variables
+    assert value.datatype == "bytes"
+    assert value.size == 100_000
+    assert value.value is not None
+    assert "spilled to disk" in value.value
+    # Previewing doesn't load the value back
+    assert isinstance(k.globals["raw"], SpilledValue)
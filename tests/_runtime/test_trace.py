@@ -277,20 +277,26 @@ class TestAppTrace:
         stream_messages = MockStream(k.stream)
         stderr_messages = MockStderr(k.stderr)
 
+        operations = [
+            op
+            for op in stream_messages.operations
+            if op["op"] != "kernel-metrics"
+        ]
+
         assert "C" not in k.globals
         if k.execution_type == "strict":
             assert (
                 "name `R` is referenced before definition."
-                in stream_messages.operations[-4]["output"]["data"][0]["msg"]
+                in operations[-4]["output"]["data"][0]["msg"]
             )
             assert (
                 "This cell wasn't run"
-                in stream_messages.operations[-1]["output"]["data"][0]["msg"]
+                in operations[-1]["output"]["data"][0]["msg"]
             )
         else:
             assert (
                 "Name `C` is not defined."
-                in stream_messages.operations[-2]["output"]["data"][0]["msg"]
+                in operations[-2]["output"]["data"][0]["msg"]
             )
             assert "NameError" in stderr_messages.messages[0]
             assert "NameError" in stderr_messages.messages[-1]
@@ -15,6 +15,9 @@ from marimo._runtime.virtual_file.virtual_file import (
     VirtualFile,
     VirtualFileLifecycleItem,
     VirtualFileRegistry,
+    content_digest,
+    content_filename,
+    random_filename,
     read_virtual_file,
 )
 from tests.conftest import ExecReqProvider, MockedKernel
@@ -82,8 +85,7 @@ async def test_cached_virtual_file_not_deleted(
                 """
                 @functools.lru_cache()
                 def create_vfile(arg):
-                    del arg
-                    bytestream = io.BytesIO(b"hello world")
+                    bytestream = io.BytesIO(f"hello world {arg}".encode())
                     return mo.pdf(bytestream)
                 """
             ),
@@ -186,6 +188,7 @@ async def test_vfile_refcount_decremented(
                 """
                 import io
                 import marimo as mo
+                import uuid
                 import gc
                 """
             ),
@@ -194,7 +197,8 @@ async def test_vfile_refcount_decremented(
                 """
                 def create_vfile(arg):
                     del arg
-                    bytestream = io.BytesIO(b"hello world")
+                    # every call creates a different file
+                    bytestream = io.BytesIO(uuid.uuid4().bytes)
                     return mo.pdf(bytestream)
                 """
             ),
@@ -229,6 +233,7 @@ async def test_cached_vfile_disposal(
                 """
                 import io
                 import marimo as mo
+                import uuid
                 import functools
                 import weakref
                 """
@@ -243,7 +248,8 @@ async def test_cached_vfile_disposal(
 
                 def create_vfile(arg):
                     del arg
-                    bytestream = io.BytesIO(b"hello world")
+                    # every call creates a different file
+                    bytestream = io.BytesIO(uuid.uuid4().bytes)
                     return mo.pdf(bytestream)
                 """
             ),
@@ -272,6 +278,43 @@ async def test_cached_vfile_disposal(
     assert vfile not in ctx.virtual_file_registry.filenames()
 
 
+async def test_identical_vfiles_are_shared(
+    execution_kernel: Kernel, exec_req: ExecReqProvider
+) -> None:
+    k = execution_kernel
+    await k.run(
+        [
+            exec_req.get("import io; import marimo as mo"),
+            first := exec_req.get("a = mo.pdf(io.BytesIO(b'hello world'))"),
+            second := exec_req.get("b = mo.pdf(io.BytesIO(b'hello world'))"),
+        ]
+    )
+    registry = get_context().virtual_file_registry
+    assert len(registry.registry) == 1
+    vfile = next(iter(registry.filenames()))
+    assert registry.owners(vfile) == 2
+    assert content_digest(vfile) is not None
+
+    # Rerunning with unchanged contents keeps the file and its URL
+    await k.run([first])
+    assert list(registry.filenames()) == [vfile]
+
+    # The file outlives the cells that created it, until the last one
+    await k.delete_cell(DeleteCellCommand(cell_id=first.cell_id))
+    assert list(registry.filenames()) == [vfile]
+    await k.delete_cell(DeleteCellCommand(cell_id=second.cell_id))
+    assert not registry.registry
+
+
+def test_content_filename() -> None:
+    filename = content_filename(b"hello world", "txt")
+    assert filename == content_filename(b"hello world", "txt")
+    assert filename != content_filename(b"hello world!", "txt")
+    assert filename.endswith(".txt")
+    assert content_digest(filename) == filename.split("-")[1].split(".")[0]
+    assert content_digest(random_filename("txt")) is None
+
+
 async def test_virtual_files_not_supported(
     execution_kernel: Kernel, exec_req: ExecReqProvider
 ) -> None:
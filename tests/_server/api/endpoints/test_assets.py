@@ -631,6 +631,50 @@ def test_vfile_download_query_param_sets_content_disposition(
         manager.storage = original_storage
 
 
+def test_vfile_content_addressed_caching(client: TestClient) -> None:
+    """Files named by their contents can be cached indefinitely and
+    revalidated without being read."""
+    from marimo._runtime.virtual_file import content_filename
+    from marimo._runtime.virtual_file.storage import (
+        InMemoryStorage,
+        VirtualFileStorageManager,
+    )
+
+    manager = VirtualFileStorageManager()
+    original_storage = manager.storage
+    storage = InMemoryStorage()
+    manager.storage = storage
+
+    try:
+        data = b"hello world"
+        filename = content_filename(data, "txt")
+        storage.store(filename, data)
+        url = f"/@file/{len(data)}-{filename}"
+
+        response = client.get(url, headers=token_header())
+        assert response.status_code == 200
+        assert response.content == data
+        etag = response.headers["etag"]
+        assert "immutable" in response.headers["cache-control"]
+
+        response = client.get(
+            url, headers={**token_header(), "If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+
+        # Other files aren't assumed to be immutable
+        storage.store("data.txt", data)
+        response = client.get(
+            f"/@file/{len(data)}-data.txt", headers=token_header()
+        )
+        assert response.status_code == 200
+        assert "etag" not in response.headers
+        assert response.headers["cache-control"] == "max-age=86400"
+    finally:
+        manager.storage = original_storage
+
+
 def test_public_file_serving(client: TestClient) -> None:
     # Setup app state with a mock notebook
     app_state = AppState.from_app(cast(Any, client.app))
@@ -20,7 +20,11 @@ from marimo._convert.markdown.flavor.base import MarkdownFlavorName
 from marimo._dependencies.dependencies import DependencyManager
 from marimo._export.requests import PDFExportRequest
 from marimo._messaging.cell_output import CellChannel, CellOutput
-from marimo._messaging.notification import CellNotification
+from marimo._messaging.notification import (
+    CellNotification,
+    CellProfileNotification,
+    CellProfileSpan,
+)
 from marimo._output.utils import uri_encode_component
 from marimo._schemas.export import (
     ExportAvailabilityResponse,
@@ -866,6 +870,65 @@ def test_export_ipynb_uses_requested_sort_mode(client: TestClient) -> None:
         assert ["".join(cell["source"]) for cell in cells] == expected_sources
 
 
+@with_session(SESSION_ID)
+def test_export_profile(client: TestClient) -> None:
+    session = get_session_manager(client).get_session(SESSION_ID)
+    assert session
+    session.app_file_manager.filename = "test.py"
+
+    response = client.post(
+        "/api/export/profile", headers=HEADERS, json={"download": False}
+    )
+    assert response.status_code == 404
+
+    session.session_view.add_notification(
+        CellProfileNotification(
+            cell_id=CellId_t("cell-1"),
+            start=10.0,
+            duration=0.25,
+            spans=[
+                CellProfileSpan(
+                    name="execute",
+                    category="execution",
+                    start=10.0,
+                    duration=0.2,
+                )
+            ],
+            stacks={"execute;f (a.py:1)": 4},
+            sample_interval=0.005,
+        )
+    )
+
+    response = client.post(
+        "/api/export/profile",
+        headers=HEADERS,
+        json={"download": True, "format": "folded"},
+    )
+    assert response.status_code == 200
+    assert response.text == "cell-cell-1;execute;f (a.py:1) 4\n"
+    assert (
+        response.headers["content-disposition"]
+        == "attachment; filename*=UTF-8''test.folded.txt"
+    )
+
+    response = client.post(
+        "/api/export/profile", headers=HEADERS, json={"download": False}
+    )
+    assert response.status_code == 200
+    events = response.json()["traceEvents"]
+    assert {e["name"] for e in events if e["ph"] == "X"} == {
+        "cell-cell-1",
+        "execute",
+    }
+
+    response = client.post(
+        "/api/export/profile",
+        headers=HEADERS,
+        json={"download": False, "cellId": "other"},
+    )
+    assert response.status_code == 404
+
+
 @pytest.mark.skipif(
     not DependencyManager.nbformat.has(), reason="nbformat not installed"
 )
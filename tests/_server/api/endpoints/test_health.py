@@ -86,6 +86,27 @@ def test_connections(client: TestClient) -> None:
     assert response.json()["active"] == 0
 
 
+def test_metrics_requires_edit_auth(client: TestClient) -> None:
+    response = client.get("/api/metrics")
+    assert response.status_code == 401, response.text
+
+
+@with_session(SESSION_ID)
+def test_metrics(client: TestClient) -> None:
+    response = client.get("/api/metrics", headers=HEADERS)
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith(
+        "text/plain; version=0.0.4"
+    )
+    lines = response.text.splitlines()
+    assert "marimo_sessions 1" in lines
+    assert "# TYPE marimo_cell_duration_seconds histogram" in lines
+    assert any(
+        line.startswith('marimo_queue_depth{queue="control"} ')
+        for line in lines
+    )
+
+
 def test_usage_no_gpu(client: TestClient) -> None:
     with patch(
         "marimo._server.api.endpoints.health._is_gpu_available",
@@ -7,13 +7,14 @@ from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 from marimo._config.manager import UserConfigManager
+from marimo._messaging.notebook.changes import SetCode, Transaction
 from marimo._messaging.notification import (
     CellNotification,
     KernelReadyNotification,
 )
 from marimo._server.workspace import DirectoryWorkspace
 from marimo._session import Session
-from marimo._types.ids import SessionId
+from marimo._types.ids import CellId_t, SessionId
 from marimo._utils.parse_dataclass import parse_raw
 from tests._server.api.endpoints.ws_helpers import (
     assert_kernel_ready_response,
@@ -157,6 +158,61 @@ def test_refresh_resumes_directory_workspace_session(
         session_manager.close_session(SessionId("dir2"))
 
 
+def test_reconnect_catches_up_document(client: TestClient) -> None:
+    with client.websocket_connect(_create_ws_url("catch-up")) as websocket:
+        data = websocket.receive_json()
+        assert data["op"] == "kernel-ready"
+        version = data["data"]["document_version"]
+
+    # The document changes while the client is disconnected
+    session = get_session(client, SessionId("catch-up"))
+    assert session
+    applied = session.document.apply(
+        Transaction(
+            changes=(SetCode(cell_id=CellId_t("Hbol"), code="x = 1"),),
+            source="kernel",
+        )
+    )
+
+    with client.websocket_connect(
+        f"{_create_ws_url('catch-up')}&document_version={version}"
+    ) as websocket:
+        data = websocket.receive_json()
+        assert data == {"op": "reconnected", "data": {"op": "reconnected"}}
+        # Only the missed transaction is sent, not the full document
+        data = websocket.receive_json()
+        assert data["op"] == "notebook-document-transaction"
+        assert data["data"]["transaction"]["version"] == applied.version
+        assert data["data"]["transaction"]["changes"] == [
+            {"type": "set-code", "cellId": "Hbol", "code": "x = 1"}
+        ]
+        data = websocket.receive_json()
+        assert data["op"] == "alert"
+
+    get_session_manager(client).close_session(SessionId("catch-up"))
+
+
+def test_reconnect_with_unknown_version_gets_document(
+    client: TestClient,
+) -> None:
+    with client.websocket_connect(_create_ws_url("catch-up")) as websocket:
+        data = websocket.receive_json()
+        assert data["op"] == "kernel-ready"
+
+    # The log doesn't cover a version the document never had
+    with client.websocket_connect(
+        f"{_create_ws_url('catch-up')}&document_version=999"
+    ) as websocket:
+        data = websocket.receive_json()
+        assert data == {"op": "reconnected", "data": {"op": "reconnected"}}
+        data = websocket.receive_json()
+        assert_kernel_ready_response(data, create_response({"resumed": True}))
+        data = websocket.receive_json()
+        assert data["op"] == "alert"
+
+    get_session_manager(client).close_session(SessionId("catch-up"))
+
+
 def test_save_session(client: TestClient) -> None:
     filename = (
         get_session_manager(client)
@@ -84,3 +84,23 @@ def test_allow_rtc_false_disables_rtc() -> None:
     )
     assert isinstance(result, ConnectionParams)
     assert result.rtc_enabled is False
+
+
+def test_document_version() -> None:
+    result = parse_connection_params(
+        _app_state(query={"session_id": "123", "document_version": "4"})
+    )
+    assert isinstance(result, ConnectionParams)
+    assert result.document_version == 4
+
+    result = parse_connection_params(_app_state(query={"session_id": "123"}))
+    assert isinstance(result, ConnectionParams)
+    assert result.document_version is None
+
+
+def test_invalid_document_version_is_ignored() -> None:
+    result = parse_connection_params(
+        _app_state(query={"session_id": "123", "document_version": "x"})
+    )
+    assert isinstance(result, ConnectionParams)
+    assert result.document_version is None
@@ -284,6 +284,32 @@ def no_auth_read_app() -> Starlette:
         sys.modules["__main__"] = main
 
 
+def test_session_cookie_shared_by_workers() -> None:
+    # Workers of one pool share a session secret, so a cookie issued by
+    # one of them authenticates on the others.
+    session_manager = get_mock_session_manager()
+
+    def worker(session_secret: str | None) -> Starlette:
+        app = create_starlette_app(base_url="", session_secret=session_secret)
+        with_server(app)
+        init_state(session_manager=session_manager).apply(app.state)
+        return app
+
+    first = TestClient(worker("shared"))
+    response = first.get("/api/status", headers=token_header("fake-token"))
+    assert response.status_code == 200, response.text
+    assert response.headers.get("Set-Cookie") is not None
+
+    second = TestClient(worker("shared"), cookies=first.cookies)
+    response = second.get("/api/status")
+    assert response.status_code == 200, response.text
+
+    # A server with a secret of its own rejects the cookie
+    other = TestClient(worker(None), cookies=first.cookies)
+    response = other.get("/api/status")
+    assert response.status_code == 401, response.text
+
+
 @pytest.fixture(params=["no_auth_read_app", "no_auth_edit_app"])
 def no_auth_app(request: Any) -> Starlette:
     return request.getfixturevalue(request.param)
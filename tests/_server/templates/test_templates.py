@@ -4,6 +4,7 @@ import json
 import shutil
 import tempfile
 import unittest
+from copy import deepcopy
 from pathlib import Path
 from typing import Literal
 from unittest.mock import patch
@@ -1166,6 +1167,43 @@ mo.md("<img src=x onerror=alert(1)>")
         )
         _assert_no_leftover_replacements(result)
 
+    def test_iter_static_notebook_template(self) -> None:
+        session_snapshot = deepcopy(self.session_snapshot)
+        session_snapshot["cells"][0]["outputs"] = [
+            DataOutput(
+                type="data",
+                data={"text/html": "<div>x</div>" * 100_000},
+            )
+        ]
+        files = {"file1": "File 1 content", "file2": None}
+
+        chunks = list(
+            templates.iter_static_notebook_template(
+                self.html,
+                self.user_config,
+                self.config_overrides,
+                self.server_token,
+                self.app_config,
+                self.filepath,
+                self.code,
+                hash_code(self.code),
+                session_snapshot,
+                self.notebook_snapshot,
+                files,
+            )
+        )
+        result = "".join(chunks)
+
+        # The session is encoded in chunks
+        assert max(len(chunk) for chunk in chunks) < len(
+            templates.json_script(session_snapshot)
+        )
+        assert templates.json_script(session_snapshot) in result
+        # Files that can't be read are left out
+        assert templates.json_script({"file1": "File 1 content"}) in result
+        assert "\\u0000marimo" not in result
+        _assert_no_leftover_replacements(result)
+
 
 class TestWasmNotebookTemplate(unittest.TestCase):
     def setUp(self) -> None:
@@ -34,6 +34,7 @@ from marimo._runtime.commands import (
     AppMetadata,
     CreateNotebookCommand,
     ExecuteCellCommand,
+    ExecuteCellsCommand,
     SyncGraphCommand,
     UpdateUIElementCommand,
 )
@@ -53,7 +54,7 @@ from marimo._session.session import (
     SessionImpl,
 )
 from marimo._session.state.session_view import SessionView
-from marimo._types.ids import ConsumerId, SessionId
+from marimo._types.ids import CellId_t, ConsumerId, SessionId
 from marimo._utils.marimo_path import MarimoPath
 
 initialize_asyncio()
@@ -1217,3 +1218,113 @@ async def test_caching_extension_respects_mode_and_config() -> None:
     session_edit_disabled.close()
     session_run_disabled.close()
     session_run_enabled.close()
+
+
+async def test_session_hibernates_and_restores() -> None:
+    from marimo._session.extensions.extensions import HibernationExtension
+    from marimo._session.types import KernelState
+
+    session_consumer: Any = MagicMock()
+    session_consumer.connection_state.return_value = ConnectionState.OPEN
+    session = SessionImpl.create(
+        initialization_id="test_session",
+        session_consumer=session_consumer,
+        mode=SessionMode.EDIT,
+        app_metadata=app_metadata,
+        app_file_manager=AppFileManager.from_app(InternalApp(App())),
+        config_manager=get_default_config_manager(current_path=None),
+        virtual_file_storage="shared_memory",
+        redirect_console_to_browser=False,
+        ttl_seconds=None,
+        auto_instantiate=True,
+        hibernate_ttl_seconds=60,
+    )
+    assert session.extensions.get(HibernationExtension) is not None
+
+    async def run(cell_id: str, code: str) -> None:
+        session.put_control_request(
+            ExecuteCellsCommand(cell_ids=[CellId_t(cell_id)], codes=[code]),
+            from_consumer_id=None,
+        )
+        for _ in range(200):
+            await asyncio.sleep(0.05)
+            notification = session.session_view.cell_notifications.get(
+                CellId_t(cell_id)
+            )
+            if notification is not None and notification.status == "idle":
+                return
+        raise AssertionError(f"Cell {cell_id} did not run")
+
+    try:
+        await run("a", "x = 41 + 1")
+        pid = session.kernel_pid()
+        assert pid is not None
+
+        assert await session.hibernate()
+        assert session.kernel_state() is KernelState.HIBERNATED
+        assert session.kernel_pid() is None
+
+        # Using the session wakes the kernel, which restores `x`
+        await run("b", "y = x + 1")
+        assert session.kernel_state() is KernelState.RUNNING
+        assert session.kernel_pid() not in (None, pid)
+        assert session.session_view.variable_values["y"].value == "43"
+    finally:
+        session.close()
+
+
+async def test_session_used_while_checkpointing() -> None:
+    from marimo._session.types import KernelState
+
+    session_consumer: Any = MagicMock()
+    session_consumer.connection_state.return_value = ConnectionState.OPEN
+    session = SessionImpl.create(
+        initialization_id="test_session",
+        session_consumer=session_consumer,
+        mode=SessionMode.EDIT,
+        app_metadata=app_metadata,
+        app_file_manager=AppFileManager.from_app(InternalApp(App())),
+        config_manager=get_default_config_manager(current_path=None),
+        virtual_file_storage="shared_memory",
+        redirect_console_to_browser=False,
+        ttl_seconds=None,
+        auto_instantiate=True,
+    )
+
+    async def wait_for(cell_id: str) -> None:
+        for _ in range(200):
+            await asyncio.sleep(0.05)
+            notification = session.session_view.cell_notifications.get(
+                CellId_t(cell_id)
+            )
+            if notification is not None and notification.status == "idle":
+                return
+        raise AssertionError(f"Cell {cell_id} did not run")
+
+    try:
+        session.put_control_request(
+            ExecuteCellsCommand(
+                cell_ids=[CellId_t("a")], codes=["x = 41 + 1"]
+            ),
+            from_consumer_id=None,
+        )
+        await wait_for("a")
+        pid = session.kernel_pid()
+
+        hibernation = asyncio.create_task(session.hibernate())
+        await asyncio.sleep(0)
+        # The command doesn't wait for the checkpoint: it is deferred
+        # until the checkpoint is written, then sent to the restored kernel.
+        session.put_control_request(
+            ExecuteCellsCommand(cell_ids=[CellId_t("b")], codes=["y = x + 1"]),
+            from_consumer_id=None,
+        )
+        assert session.kernel_pid() == pid
+
+        assert not await hibernation
+        await wait_for("b")
+        assert session.kernel_state() is KernelState.RUNNING
+        assert session.kernel_pid() not in (None, pid)
+        assert session.session_view.variable_values["y"].value == "43"
+    finally:
+        session.close()
@@ -95,3 +95,13 @@ def test_token_manager_validate_skew() -> None:
     # Invalid token should fail
     invalid_token = SkewProtectionToken.random()
     assert not manager.validate_skew(invalid_token)
+
+
+def test_token_manager_preconfigured_skew_token() -> None:
+    """Test that a provided skew token wins over the generated one."""
+    skew = SkewProtectionToken("shared")
+    for mode, code in ((SessionMode.EDIT, None), (SessionMode.RUN, "x = 1")):
+        manager = TokenManager(
+            mode=mode, source_code=code, skew_protection_token=skew
+        )
+        assert manager.validate_skew(skew)
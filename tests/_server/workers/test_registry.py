@@ -0,0 +1,51 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from marimo._server.workers.registry import SessionRegistry
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_register_and_lookup(tmp_path: Path) -> None:
+    registry = SessionRegistry(tmp_path / "sessions.db")
+    assert registry.lookup("s1") is None
+
+    registry.register("s1", "app.py", 1)
+    registry.register("s2", "app.py", 0)
+    assert registry.lookup("s1") == 1
+    assert [s.session_id for s in registry.sessions()] == ["s1", "s2"]
+
+    registry.unregister("s1")
+    assert registry.lookup("s1") is None
+    registry.close()
+
+
+def test_shared_between_connections(tmp_path: Path) -> None:
+    path = tmp_path / "sessions.db"
+    worker = SessionRegistry(path)
+    router = SessionRegistry(path)
+
+    worker.register("s1", "app.py", 3)
+    assert router.lookup("s1") == 3
+
+    # Re-registering (e.g. on resume) moves the session
+    worker.register("s1", "app.py", 2)
+    assert router.lookup("s1") == 2
+
+    worker.close()
+    router.close()
+
+
+def test_forget_worker(tmp_path: Path) -> None:
+    registry = SessionRegistry(tmp_path / "sessions.db")
+    registry.register("s1", "a.py", 0)
+    registry.register("s2", "b.py", 1)
+    registry.register("s3", "b.py", 1)
+
+    assert registry.forget_worker(1) == 2
+    assert registry.lookup("s2") is None
+    assert registry.lookup("s1") == 0
+    registry.close()
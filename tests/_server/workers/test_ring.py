@@ -0,0 +1,42 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+from collections import Counter
+
+from marimo._server.workers.ring import HashRing
+
+
+def test_empty_ring() -> None:
+    assert HashRing([]).get("session") is None
+
+
+def test_keys_are_stable() -> None:
+    ring = HashRing(range(4))
+    other = HashRing(range(4))
+    keys = [f"session-{i}" for i in range(100)]
+    assert [ring.get(k) for k in keys] == [other.get(k) for k in keys]
+
+
+def test_keys_spread_across_workers() -> None:
+    ring = HashRing(range(4))
+    counts = Counter(ring.get(f"session-{i}") for i in range(4000))
+    assert set(counts) == {0, 1, 2, 3}
+    assert min(counts.values()) > 500
+
+
+def test_removing_a_worker_only_moves_its_keys() -> None:
+    ring = HashRing(range(4))
+    keys = [f"session-{i}" for i in range(1000)]
+    before = {k: ring.get(k) for k in keys}
+
+    ring.remove(2)
+    assert ring.workers == {0, 1, 3}
+    after = {k: ring.get(k) for k in keys}
+    for key in keys:
+        if before[key] != 2:
+            assert after[key] == before[key]
+        else:
+            assert after[key] != 2
+
+    ring.add(2)
+    assert {k: ring.get(k) for k in keys} == before
@@ -0,0 +1,169 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from marimo._server.workers.registry import SessionRegistry
+from marimo._server.workers.router import (
+    WorkerRouter,
+    parse_request_head,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _head(target: str, *headers: tuple[str, str]):
+    lines = [f"GET {target} HTTP/1.1", "Host: localhost:2718"]
+    lines.extend(f"{k}: {v}" for k, v in headers)
+    return parse_request_head("\r\n".join(lines).encode())
+
+
+def _router(registry: SessionRegistry | None = None) -> WorkerRouter:
+    return WorkerRouter(
+        {i: ("127.0.0.1", 9000 + i) for i in range(4)}, registry
+    )
+
+
+def test_parse_request_head() -> None:
+    head = _head(
+        "/ws?session_id=s1&file=app.py",
+        ("Connection", "Upgrade"),
+        ("Upgrade", "websocket"),
+    )
+    assert head.method == "GET"
+    assert head.path == "/ws"
+    assert head.query_param("session_id") == "s1"
+    assert head.query_param("missing") is None
+    assert head.header("upgrade") == "websocket"
+    assert head.is_upgrade
+
+    with pytest.raises(ValueError):
+        parse_request_head(b"GET /")
+    with pytest.raises(ValueError):
+        parse_request_head(b"GET / HTTP/1.1\r\nno-colon")
+
+
+def test_encode_closes_plain_requests() -> None:
+    head = _head("/api/status", ("Connection", "keep-alive"))
+    encoded = head.encode().decode()
+    assert "keep-alive" not in encoded
+    assert encoded.endswith("Connection: close\r\n\r\n")
+
+    upgrade = _head("/ws", ("Connection", "Upgrade"))
+    assert b"Connection: Upgrade\r\n" in upgrade.encode()
+    assert b"Connection: close" not in upgrade.encode()
+
+
+def test_route_by_session() -> None:
+    router = _router()
+    by_header = router.route(
+        _head("/api/kernel/run", ("Marimo-Session-Id", "s1"))
+    )
+    by_query = router.route(_head("/ws?session_id=s1"))
+    assert by_header == by_query
+    # The file key is only used when there is no session
+    assert router.route(_head("/ws?session_id=s1&file=a.py")) == by_header
+
+
+def test_route_prefers_registry(tmp_path: Path) -> None:
+    registry = SessionRegistry(tmp_path / "sessions.db")
+    router = _router(registry)
+    hashed = router.route(_head("/ws?session_id=s1"))
+    assert hashed is not None
+    owner = (hashed + 1) % 4
+    registry.register("s1", "app.py", owner)
+    assert router.route(_head("/ws?session_id=s1")) == owner
+
+    # A dead owner is forgotten, and the session hashes elsewhere
+    router.worker_down(owner)
+    assert registry.lookup("s1") is None
+    assert router.route(_head("/ws?session_id=s1")) != owner
+    registry.close()
+
+
+def test_route_virtual_files() -> None:
+    router = _router()
+    assert router.route(_head("/@file/2008-w3_123-abcdefgh.png")) == 3
+    assert router.route(_head("/base/@file/10-w2_1-abcdefgh.txt")) == 2
+
+
+def test_route_without_key_round_robins() -> None:
+    router = _router()
+    router.worker_down(1)
+    targets = [router.route(_head("/")) for _ in range(6)]
+    assert targets == [0, 2, 3, 0, 2, 3]
+
+
+def test_route_without_workers() -> None:
+    router = _router()
+    for worker_id in range(4):
+        router.worker_down(worker_id)
+    assert router.route(_head("/")) is None
+
+
+async def test_forwards_to_worker() -> None:
+    received: list[bytes] = []
+
+    def fake_worker(worker_id: int):
+        async def handle(
+            reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+        ) -> None:
+            received.append(await reader.readuntil(b"\r\n\r\n"))
+            body = str(worker_id).encode()
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n%s"
+                % (len(body), body)
+            )
+            await writer.drain()
+            writer.close()
+
+        return handle
+
+    workers = [
+        await asyncio.start_server(fake_worker(i), "127.0.0.1", 0)
+        for i in range(2)
+    ]
+    addresses = {i: workers[i].sockets[0].getsockname()[:2] for i in range(2)}
+    router = WorkerRouter(addresses)
+    server = await router.serve("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    async def request(target: str) -> bytes:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(
+            f"GET {target} HTTP/1.1\r\nHost: x\r\n"
+            "Connection: keep-alive\r\n\r\n".encode()
+        )
+        response = await reader.read()
+        writer.close()
+        return response
+
+    expected = router.route(_head("/ws?session_id=abc"))
+    response = await request("/ws?session_id=abc")
+    assert response.endswith(str(expected).encode())
+    assert b"Connection: close" in received[-1]
+    assert b"keep-alive" not in received[-1]
+
+    # Requests for a session always reach the same worker
+    for _ in range(3):
+        assert await request("/ws?session_id=abc") == response
+
+    server.close()
+    for worker in workers:
+        worker.close()
+
+
+async def test_bad_request() -> None:
+    router = WorkerRouter({0: ("127.0.0.1", 1)})
+    server = await router.serve("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(b"nonsense\r\n\r\n")
+    response = await reader.read()
+    assert response.startswith(b"HTTP/1.1 400")
+    writer.close()
+    server.close()
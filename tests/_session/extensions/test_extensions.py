@@ -8,13 +8,21 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from marimo._messaging.notification import BannerNotification
+from marimo._messaging.notification import (
+    BannerNotification,
+    HookMetric,
+    InterruptedNotification,
+    KernelMetricsNotification,
+    MetricHistogram,
+)
+from marimo._messaging.serde import serialize_kernel_message
 from marimo._session.events import SessionEventBus
 from marimo._session.extensions.extensions import (
     CacheMode,
     CachingExtension,
     HeartbeatExtension,
     LoggingExtension,
+    MetricsExtension,
     NotificationListenerExtension,
     QueueExtension,
     ReplayExtension,
@@ -24,6 +32,8 @@ from marimo._session.extensions.types import (
     EventAwareExtension,
     ExtensionRegistry,
 )
+from marimo._session.managers.queue import QueueManagerImpl
+from marimo._session.metrics import SessionMetrics
 from marimo._session.model import ConnectionState, SessionMode
 from marimo._session.types import KernelExitInfo, KernelState
 from marimo._types.ids import CellId_t, RequestId, SessionId
@@ -458,6 +468,83 @@ class TestQueueExtension:
         extension.on_detach()
 
 
+class TestMetricsExtension:
+    """Tests for MetricsExtension."""
+
+    def test_records_notifications(self, mock_session, event_bus) -> None:
+        """Test that sent notifications and kernel reports are recorded."""
+        metrics = SessionMetrics()
+        extension = MetricsExtension(metrics)
+        extension.on_attach(mock_session, event_bus)
+
+        interrupted = serialize_kernel_message(InterruptedNotification())
+        report = KernelMetricsNotification(
+            cell_duration=MetricHistogram(counts=[1] + [0] * 14, sum=0.0005),
+            hooks=[
+                HookMetric(
+                    phase="post_execution",
+                    hook="_broadcast_outputs",
+                    duration=MetricHistogram(counts=[2] + [0] * 14, sum=0.001),
+                )
+            ],
+            cache_hits=3,
+            cache_misses=1,
+        )
+        extension.on_notification_sent(mock_session, interrupted)
+        extension.on_notification_sent(mock_session, interrupted)
+        extension.on_notification_sent(
+            mock_session, serialize_kernel_message(report)
+        )
+
+        assert metrics.notification_sizes["interrupted"].count == 2
+        assert metrics.notification_sizes["interrupted"].sum == 2 * len(
+            interrupted
+        )
+        assert metrics.notification_sizes["kernel-metrics"].count == 1
+        assert metrics.cell_duration.count == 1
+        assert (
+            metrics.hook_durations[
+                "post_execution", "_broadcast_outputs"
+            ].count
+            == 2
+        )
+        assert (extension.cache_hits, extension.cache_misses) == (3, 1)
+
+        queue_manager = QueueManagerImpl(use_multiprocessing=False)
+        queue_manager.control_queue.put(Mock())
+        session = Mock()
+        session.extensions = ExtensionRegistry()
+        session.extensions.add(extension, QueueExtension(queue_manager))
+
+        lines = metrics.render([session]).splitlines()
+        assert "# TYPE marimo_cell_duration_seconds histogram" in lines
+        assert 'marimo_cell_duration_seconds_bucket{le="0.001"} 1' in lines
+        assert 'marimo_cell_duration_seconds_bucket{le="+Inf"} 1' in lines
+        assert "marimo_cell_duration_seconds_count 1" in lines
+        assert (
+            'marimo_hook_duration_seconds_count{phase="post_execution",'
+            'hook="_broadcast_outputs"} 2'
+        ) in lines
+        assert 'marimo_notification_size_bytes_count{op="interrupted"} 2' in (
+            lines
+        )
+        assert "marimo_sessions 1" in lines
+        assert 'marimo_queue_depth{queue="control"} 1' in lines
+        assert 'marimo_queue_depth{queue="completion"} 0' in lines
+        assert "# TYPE marimo_cache_hits_total counter" in lines
+        assert "marimo_cache_hits_total 3" in lines
+        assert "marimo_cache_misses_total 1" in lines
+
+        # Cache statistics are counted once, and outlive the session
+        extension.on_notification_sent(
+            mock_session, serialize_kernel_message(report)
+        )
+        lines = metrics.render([]).splitlines()
+        assert "marimo_cache_hits_total 3" in lines
+        assert "marimo_cache_misses_total 1" in lines
+        extension.on_detach()
+
+
 class TestReplayExtension:
     """Tests for ReplayExtension."""
 
@@ -15,12 +15,16 @@ from marimo._data.models import (
     Schema,
 )
 from marimo._messaging.cell_output import CellChannel, CellOutput
+from marimo._messaging.console_output_worker import MAX_LINES
 from marimo._messaging.errors import UnknownError
 from marimo._messaging.msgspec_encoder import asdict as serialize
 from marimo._messaging.notification import (
     CellNotification,
+    CellProfileNotification,
+    CellProfileSpan,
     DatasetsNotification,
     DataSourceConnectionsNotification,
+    DataSourceTablesNotification,
     EsmSpec,
     InstallingPackageAlertNotification,
     ModelClose,
@@ -28,6 +32,7 @@ from marimo._messaging.notification import (
     ModelLifecycleNotification,
     ModelOpen,
     ModelUpdate,
+    SessionSnapshotNotification,
     SQLDatabaseMetadata,
     SQLMetadata,
     SQLSchemaListPreviewNotification,
@@ -39,15 +44,20 @@ from marimo._messaging.notification import (
     VariableValue,
     VariableValuesNotification,
 )
-from marimo._messaging.serde import serialize_kernel_message
+from marimo._messaging.serde import (
+    deserialize_kernel_message,
+    serialize_kernel_message,
+)
 from marimo._messaging.variables import create_variable_value
 from marimo._runtime.commands import (
     CreateNotebookCommand,
+    DeleteCellCommand,
     ExecuteCellCommand,
     ExecuteCellsCommand,
     ModelCommand,
     ModelCustomMessage,
     ModelUpdateMessage,
+    SyncGraphCommand,
     UpdateUIElementCommand,
 )
 from marimo._session.state.session_view import ModelReplayState, SessionView
@@ -141,6 +151,43 @@ def test_cell_notification_serialization_wire_encoding() -> None:
 
 
 # Test adding Variables to SessionView
+def test_session_view_cell_profiles(session_view: SessionView) -> None:
+    def profile(
+        duration: float, cell: CellId_t = cell_id
+    ) -> CellProfileNotification:
+        return CellProfileNotification(
+            cell_id=cell,
+            start=0.0,
+            duration=duration,
+            spans=[
+                CellProfileSpan(
+                    name="execute",
+                    category="execution",
+                    start=0.0,
+                    duration=duration,
+                )
+            ],
+            stacks={"execute;f (a.py:1)": 2},
+            sample_interval=0.005,
+        )
+
+    assert session_view.cell_profiles == {}
+    session_view.add_notification(profile(1.0))
+    session_view.add_notification(profile(2.0))
+    # Only the latest run of each cell is kept.
+    assert session_view.cell_profiles == {cell_id: profile(2.0)}
+
+    # Deleted cells' profiles are dropped
+    other = CellId_t("other")
+    session_view.add_notification(profile(1.0, other))
+    session_view.add_control_request(DeleteCellCommand(cell_id=cell_id))
+    assert session_view.cell_profiles == {other: profile(1.0, other)}
+    session_view.add_control_request(
+        SyncGraphCommand(cells={}, run_ids=[], delete_ids=[other])
+    )
+    assert session_view.cell_profiles == {}
+
+
 def test_session_view_variables(session_view: SessionView) -> None:
     # Create Variables operation
     variables_op = VariablesNotification(
@@ -715,7 +762,13 @@ def test_last_run_code(session_view: SessionView) -> None:
 def test_serialize_parse_variable_value() -> None:
     original = create_variable_value(name="var1", value=1)
     serialized = serialize(original)
-    assert serialized == {"datatype": "int", "name": "var1", "value": "1"}
+    assert serialized == {
+        "datatype": "int",
+        "name": "var1",
+        "value": "1",
+        "size": None,
+        "preview_pending": False,
+    }
     parsed = parse_raw(serialized, VariableValue)
     assert parsed == original
 
@@ -1183,6 +1236,19 @@ def test_add_sql_table_previews() -> None:
         )
     ]
 
+    # Refresh the tables of a single schema
+    session_view.add_raw_notification(
+        serialize_kernel_message(
+            DataSourceTablesNotification(
+                metadata=SQLMetadata(
+                    connection="connection1", database="db1", schema="db1"
+                ),
+                tables=[],
+            )
+        )
+    )
+    assert session_view_connections[0].databases[0].schemas[0].tables == []
+
 
 def test_add_cell_notification(session_view: SessionView) -> None:
     session_view.add_raw_notification(
@@ -1475,6 +1541,78 @@ def test_merge_with_non_string_data_not_merged(
     assert len(session_view.cell_notifications[cell_id].console) == 2
 
 
+@patch("time.time", return_value=123)
+def test_merged_console_is_bounded(
+    time_mock: Any, session_view: SessionView
+) -> None:
+    """Test that the console kept across flushes is elided to its tail."""
+    del time_mock
+
+    def flush(start: int) -> None:
+        session_view.add_notification(
+            CellNotification(
+                cell_id=cell_id,
+                console=CellOutput.stdout(
+                    "".join(f"{i}\n" for i in range(start, start + 2000))
+                ),
+                status="running",
+            )
+        )
+
+    for start in range(0, 6000, 2000):
+        flush(start)
+    (output,) = session_view.cell_notifications[cell_id].console
+    assert isinstance(output.data, str)
+    # The marker, followed by the last lines (the last one being the empty
+    # line after the trailing newline)
+    lines = output.data.split("\n")
+    assert len(lines) == MAX_LINES + 1
+    assert lines[0] == "... 1001 lines elided ..."
+    assert lines[1] == "1001"
+    assert lines[-2] == "5999"
+
+    # The marker counts the lines elided by earlier markers
+    flush(6000)
+    (output,) = session_view.cell_notifications[cell_id].console
+    assert isinstance(output.data, str)
+    lines = output.data.split("\n")
+    assert len(lines) == MAX_LINES + 1
+    assert lines[0] == "... 3001 lines elided ..."
+    assert lines[1] == "3001"
+
+
+@patch("time.time", return_value=123)
+def test_merged_console_collapses_carriage_returns(
+    time_mock: Any, session_view: SessionView
+) -> None:
+    """Test that progress updates spanning flushes are collapsed."""
+    del time_mock
+
+    # Lines before the one the updates continue are left as they were
+    session_view.add_notification(
+        CellNotification(
+            cell_id=cell_id,
+            console=CellOutput.stderr("a\rb\rc\rd\n"),
+            status="running",
+        )
+    )
+    for i in range(100):
+        session_view.add_notification(
+            CellNotification(
+                cell_id=cell_id,
+                console=CellOutput.stderr(f"\r{i}%"),
+                status="running",
+            )
+        )
+
+    (output,) = session_view.cell_notifications[cell_id].console
+    assert isinstance(output.data, str)
+    first, last = output.data.split("\n")
+    assert first == "a\rb\rc\rd"
+    assert last.count("\r") <= 2
+    assert last.endswith("\r99%")
+
+
 @patch("time.time", return_value=123)
 def test_get_cell_outputs(time_mock: Any, session_view: SessionView) -> None:
     del time_mock
@@ -1796,6 +1934,100 @@ def test_session_view_startup_logs_operations_exclude_done(
     assert len(startup_ops) == 0
 
 
+def test_session_view_snapshot_matches_notifications(
+    session_view: SessionView,
+) -> None:
+    session_view.add_notification(
+        VariablesNotification(
+            variables=[
+                VariableDeclarationNotification(
+                    name="x", declared_by=[cell_id], used_by=[]
+                )
+            ]
+        )
+    )
+    session_view.add_notification(
+        ModelLifecycleNotification(
+            model_id=WidgetModelId("model-1"),
+            message=ModelOpen(
+                state={"count": 1}, buffer_paths=[["data"]], buffers=[b"abc"]
+            ),
+        )
+    )
+    session_view.add_notification(
+        CellNotification(
+            cell_id=cell_id,
+            output=CellOutput(
+                channel=CellChannel.OUTPUT, mimetype="text/plain", data="1"
+            ),
+            status="idle",
+        )
+    )
+    session_view.add_notification(
+        StartupLogsNotification(content="Starting...", status="start")
+    )
+
+    snapshot = session_view.snapshot()
+    decoded = deserialize_kernel_message(serialize_kernel_message(snapshot))
+    assert isinstance(decoded, SessionSnapshotNotification)
+    assert decoded.version == 1
+    assert [
+        serialize(
+            deserialize_kernel_message(serialize_kernel_message(notification))
+        )
+        for notification in session_view.notifications
+    ] == [
+        serialize(deserialize_kernel_message(bytes(raw)))
+        for raw in decoded.notifications
+    ]
+
+
+def test_session_view_snapshot_reencodes_changed_cells(
+    session_view: SessionView,
+) -> None:
+    other_cell_id = CellId_t("cell_2")
+    for id_ in (cell_id, other_cell_id):
+        session_view.add_notification(
+            CellNotification(
+                cell_id=id_,
+                output=CellOutput(
+                    channel=CellChannel.OUTPUT,
+                    mimetype="text/plain",
+                    data="before",
+                ),
+                status="idle",
+            )
+        )
+    session_view.snapshot()
+
+    with patch(
+        "marimo._session.state.session_view.serialize_kernel_message",
+        wraps=serialize_kernel_message,
+    ) as encode:
+        session_view.add_notification(
+            CellNotification(
+                cell_id=cell_id,
+                output=CellOutput(
+                    channel=CellChannel.OUTPUT,
+                    mimetype="text/plain",
+                    data="after",
+                ),
+                status="idle",
+            )
+        )
+        snapshot = session_view.snapshot()
+
+    # Only the changed cell is encoded again
+    assert [call.args[0].cell_id for call in encode.call_args_list] == [
+        cell_id
+    ]
+    outputs = [
+        deserialize_kernel_message(bytes(raw)).output.data
+        for raw in snapshot.notifications
+    ]
+    assert outputs == ["after", "before"]
+
+
 def test_session_view_startup_logs_standalone_done(
     session_view: SessionView,
 ) -> None:
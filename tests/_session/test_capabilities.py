@@ -52,6 +52,15 @@ def test_required_capability_classifies_commands() -> None:
         required_capability(commands.PreviewDatasetColumnCommand)
         is Capability.READ
     )
+    # Previewing variables and estimating their memory call user methods
+    # (`__repr__`, `__sizeof__`) on arbitrary globals.
+    assert (
+        required_capability(commands.PreviewVariablesCommand)
+        is Capability.EDIT
+    )
+    assert (
+        required_capability(commands.GetMemoryUsageCommand) is Capability.EDIT
+    )
 
 
 def test_unknown_command_raises() -> None:
@@ -107,6 +116,7 @@ def test_interactor_can_interact_not_edit() -> None:
     assert consumer_can(INTERACTOR, commands.UpdateUIElementCommand) is True
     assert consumer_can(INTERACTOR, commands.InvokeFunctionCommand) is True
     assert consumer_can(INTERACTOR, commands.ExecuteCellsCommand) is False
+    assert consumer_can(INTERACTOR, commands.PreviewVariablesCommand) is False
 
 
 def test_editor_can_do_everything() -> None:
@@ -21,6 +21,7 @@ def _session_with_capabilities(
     room.get_consumer.return_value = object() if consumer_present else None
     room.get_capabilities.return_value = caps
     session.room = room
+    session._checkpoint = None
     return session, event_bus
 
 
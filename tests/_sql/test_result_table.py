@@ -0,0 +1,91 @@
+# Copyright 2026 Marimo. All rights reserved.
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from marimo._dependencies.dependencies import DependencyManager
+from marimo._runtime.commands import DeleteCellCommand, ExecuteCellCommand
+from marimo._runtime.runtime import Kernel
+from marimo._sql.result_table import (
+    RESULT_TABLE_PREFIX,
+    ResultTableLifecycleItem,
+    is_result_table,
+    is_result_table_name,
+    persist_relation,
+)
+from marimo._types.ids import CellId_t
+
+HAS_DUCKDB = DependencyManager.duckdb.has()
+
+
+def _table_exists(connection: Any, name: str) -> bool:
+    row = connection.execute(
+        "SELECT count(*) FROM duckdb_tables() WHERE table_name = ?", [name]
+    ).fetchone()
+    return row is not None and row[0] == 1
+
+
+def test_is_result_table_name() -> None:
+    assert is_result_table_name(f"{RESULT_TABLE_PREFIX}abc")
+    assert not is_result_table_name("results")
+
+
+@pytest.mark.skipif(not HAS_DUCKDB, reason="duckdb not installed")
+def test_persist_relation() -> None:
+    import duckdb
+
+    connection = duckdb.connect(":memory:")
+    relation = connection.sql("SELECT range AS x FROM range(100)")
+    assert not is_result_table(relation)
+
+    result = persist_relation(relation, connection)
+    assert is_result_table(result)
+    assert result.aggregate("count(*)").fetchone() == (100,)
+    assert result.limit(2, 10).fetchall() == [(10,), (11,)]
+    # Stored as a temporary table; the helper view is gone
+    rows = connection.execute(
+        "SELECT temporary FROM duckdb_tables() WHERE table_name = ?",
+        [result.alias],
+    ).fetchall()
+    assert rows == [(True,)]
+    assert connection.execute(
+        "SELECT count(*) FROM duckdb_views() WHERE NOT internal"
+    ).fetchone() == (0,)
+
+    item = ResultTableLifecycleItem(connection, result.alias)
+    assert item.dispose(context=None, deletion=False)  # type: ignore[arg-type]
+    assert not _table_exists(connection, result.alias)
+
+    # Disposal never fails, even if the connection is closed
+    connection.close()
+    assert item.dispose(context=None, deletion=True)  # type: ignore[arg-type]
+
+
+@pytest.mark.skipif(not HAS_DUCKDB, reason="duckdb not installed")
+async def test_result_table_dropped_with_cell(
+    k: Kernel, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import duckdb
+
+    monkeypatch.setattr(
+        "marimo._sql.engines.duckdb.get_configured_sql_output_format",
+        lambda: "duckdb-table",
+    )
+    code = "import marimo as mo; r = mo.sql('SELECT 1 AS x')"
+
+    await k.run([ExecuteCellCommand(cell_id=CellId_t("0"), code=code)])
+    first = k.globals["r"].alias
+    assert is_result_table_name(first)
+    assert _table_exists(duckdb, first)
+
+    # Re-running the cell replaces its result table
+    await k.run([ExecuteCellCommand(cell_id=CellId_t("0"), code=code)])
+    second = k.globals["r"].alias
+    assert second != first
+    assert not _table_exists(duckdb, first)
+    assert _table_exists(duckdb, second)
+
+    await k.delete_cell(DeleteCellCommand(cell_id=CellId_t("0")))
+    assert not _table_exists(duckdb, second)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import os
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
@@ -14,6 +15,7 @@ from marimo._dependencies.dependencies import Dependency, DependencyManager
 from marimo._dependencies.errors import ManyModulesNotFoundError
 from marimo._output.formatting import Plain
 from marimo._plugins import ui
+from marimo._plugins.ui._impl.table import SearchTableArgs
 from marimo._sql.engines.ibis import IbisEngine
 from marimo._sql.engines.sqlalchemy import SQLAlchemyEngine
 from marimo._sql.sql import (
@@ -158,7 +160,7 @@ def fake_sql_output(monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
     """Stub the runtime-context lookup so we can drive `sql_output` without
     spinning up a kernel.
 
-    `sql.py` and `engines/types.py` import `get_configured_sql_output_format`
+    `sql.py` and the engine modules import `get_configured_sql_output_format`
     directly, so each consumer module holds its own binding and must be
     patched independently.
     """
@@ -170,6 +172,7 @@ def fake_sql_output(monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
     for target in (
         "marimo._sql.sql.get_configured_sql_output_format",
         "marimo._sql.engines.types.get_configured_sql_output_format",
+        "marimo._sql.engines.duckdb.get_configured_sql_output_format",
     ):
         monkeypatch.setattr(target, fake_format)
     return current
@@ -258,16 +261,17 @@ class TestDefaultDuckDBDeps:
             "polars[pyarrow]",
         ]
 
-    def test_native_output_skips_df_lib(self) -> None:
+    @pytest.mark.parametrize("output", ["native", "duckdb-table"])
+    def test_native_output_skips_df_lib(self, output: SqlOutputType) -> None:
         deps = _resolve_default_duckdb_deps(
-            "native",
+            output,
             polars_installed=self._const(False),
             pandas_installed=self._const(False),
         )
         assert self._pkg_names(deps) == ["duckdb", "sqlglot"]
 
     @pytest.mark.parametrize(
-        "output", ["polars", "lazy-polars", "pandas", "native"]
+        "output", ["polars", "lazy-polars", "pandas", "native", "duckdb-table"]
     )
     def test_non_auto_outputs_skip_has_checks(
         self, output: SqlOutputType
@@ -484,6 +488,39 @@ def test_applies_limit(mock_replace: MagicMock) -> None:
     assert table._searched_manager.get_num_rows() == 25_000
 
 
+@patch("marimo._sql.sql.replace")
+@pytest.mark.requires("duckdb")
+def test_sql_duckdb_table_output(
+    mock_replace: MagicMock, fake_sql_output: dict[str, str]
+) -> None:
+    import duckdb
+
+    fake_sql_output["value"] = "duckdb-table"
+    result = sql("SELECT range AS x FROM range(1000)")
+    assert isinstance(result, duckdb.DuckDBPyRelation)
+    assert result.alias.startswith("__marimo_sql_result_")
+
+    # Counted and paged by DuckDB
+    mock_replace.assert_called_once()
+    table: ui.table = mock_replace.call_args[0][0]
+    assert table._component_args["total-rows"] == 1000
+    assert table._component_args["pagination"] is True
+    assert table._component_args["lazy"] is False
+    page = table._search(
+        SearchTableArgs(page_size=10, page_number=50, query=None)
+    )
+    assert page.total_rows == 1000
+    assert json.loads(page.data)[0] == {"x": 500}
+
+    # The default limit is applied in DuckDB too
+    mock_replace.reset_mock()
+    with patch.dict(os.environ, {"MARIMO_SQL_DEFAULT_LIMIT": "300"}):
+        result = sql("SELECT range AS x FROM range(1000)")
+    table = mock_replace.call_args[0][0]
+    assert table._component_args["total-rows"] == "too_many"
+    assert len(result) == 300
+
+
 @pytest.mark.skipif(
     DependencyManager.duckdb.has(), reason="must be missing duckdb"
 )
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from tests.mocks import snapshotter
 from tests.utils import explore_module
 
@@ -12,3 +14,57 @@ def test_api():
     results = explore_module(mo)
     assert len(results) > 0
     snapshot("api.txt", "\n".join(results))
+
+
+def _imported_modules(code: str) -> set[str]:
+    """Modules in `sys.modules` after running `code` in a fresh interpreter."""
+    import json
+    import subprocess
+    import sys
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{code}\nimport json, sys; print(json.dumps(list(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+
+def test_import_is_lazy():
+    # `import marimo` must stay cheap: public names are loaded on first
+    # access, so nothing beyond the package itself is imported.
+    modules = _imported_modules("import marimo")
+    assert {m for m in modules if m.startswith("marimo")} == {
+        "marimo",
+        "marimo._version",
+    }
+
+
+def test_lazy_attribute_loads_only_its_module():
+    modules = _imported_modules("import marimo; marimo.App")
+    assert "marimo._ast.app" in modules
+    assert "marimo._ai" not in modules
+    assert "marimo._islands" not in modules
+
+
+def test_lazy_attributes():
+    import marimo as mo
+
+    assert sorted(mo.__all__) == sorted([*mo._LAZY_ATTRIBUTES, "__version__"])
+    assert set(mo.__all__) <= set(dir(mo))
+    for name in mo.__all__:
+        assert getattr(mo, name) is not None
+    # Loaded attributes are cached on the module
+    assert "md" in vars(mo)
+
+    from marimo._output.md import md
+
+    assert mo.md is md
+
+    with pytest.raises(AttributeError, match="no attribute 'not_an_api'"):
+        mo.not_an_api  # noqa: B018